@@ -126,8 +126,8 @@ __version__ = '2.0a0'
 
 # Restrict the names imported when using "from iris import *"
 __all__ = ['load', 'load_cube', 'load_cubes', 'load_raw',
-           'save', 'Constraint', 'AttributeConstraint', 'sample_data_path',
-           'site_configuration', 'Future', 'FUTURE',
+           'save', 'Constraint', 'AttributeConstraint', 'Range',
+           'sample_data_path', 'site_configuration', 'Future', 'FUTURE',
            'IrisDeprecation']
 
 
@@ -138,6 +138,7 @@ if iris.config.IMPORT_LOGGER:
 
 Constraint = iris._constraints.Constraint
 AttributeConstraint = iris._constraints.AttributeConstraint
+Range = iris._constraints.Range
 
 
 class Future(threading.local):
@@ -285,8 +286,12 @@ def _generate_cubes(uris, callback, constraints):
 
 
 def _load_collection(uris, constraints=None, callback=None):
+    from iris.fileformats.um._fast_load import _premerged_cubes
     try:
         cubes = _generate_cubes(uris, callback, constraints)
+        # Unless raw, the cubes are merged, so UM file loads may return
+        # cubes already merged from their fields.
+        cubes = _premerged_cubes(cubes)
         result = iris.cube._CubeFilterCollection.from_cubes(cubes, constraints)
     except EOFError as e:
         raise iris.exceptions.TranslationError(
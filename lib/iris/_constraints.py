@@ -77,6 +77,12 @@ class Constraint(object):
               returning True or False if the value of the Cell is desired.
               e.g. ``model_level_number=lambda cell: 5 < cell < 10``
 
+            * :class:`iris.Range` - the range of values within which the
+              coordinate must lie.
+              e.g. ``model_level_number=iris.Range(5, 10)``
+              This is much faster than the equivalent callable for
+              coordinates with many points.
+
         The :ref:`user guide <loading_iris_cubes>` covers cube much of
         constraining in detail, however an example which uses all of the
         features of this class is given here for completeness::
@@ -214,6 +220,123 @@ class ConstraintCombination(Constraint):
                              self.rhs._CIM_extract(cube))
 
 
+class Range(object):
+    """
+    A coordinate condition, for use in a :class:`Constraint`, which matches
+    the cells of a coordinate that lie within a range of values.
+
+    For example::
+
+        Constraint(forecast_period=iris.Range(6, 12))
+
+    matches the same cells as::
+
+        Constraint(forecast_period=lambda cell: 6 <= cell < 12)
+
+    but, where the limits are numbers, it is evaluated by comparing the
+    coordinate points and bounds as arrays, rather than by calling a
+    function for every cell.
+
+    """
+    def __init__(self, minimum=None, maximum=None, min_inclusive=True,
+                 max_inclusive=False):
+        """
+        Create a condition matching the cells which lie within the given
+        limits.
+
+        Kwargs:
+
+        * minimum:
+            The lower limit of the range, or None for no lower limit.
+        * maximum:
+            The upper limit of the range, or None for no upper limit.
+        * min_inclusive:
+            Whether cells equal to the lower limit are matched.
+            Defaults to True.
+        * max_inclusive:
+            Whether cells equal to the upper limit are matched.
+            Defaults to False.
+
+        Cells are compared with the limits as described in
+        :class:`iris.coords.Cell`.
+
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.min_inclusive = min_inclusive
+        self.max_inclusive = max_inclusive
+
+    def __repr__(self):
+        return ('Range({!r}, {!r}, min_inclusive={!r}, '
+                'max_inclusive={!r})'.format(self.minimum, self.maximum,
+                                             self.min_inclusive,
+                                             self.max_inclusive))
+
+    def __call__(self, cell):
+        result = True
+        if self.minimum is not None:
+            if self.min_inclusive:
+                result = cell >= self.minimum
+            else:
+                result = cell > self.minimum
+        if result and self.maximum is not None:
+            if self.max_inclusive:
+                result = cell <= self.maximum
+            else:
+                result = cell < self.maximum
+        return result
+
+    def _match(self, coord):
+        """
+        Return a boolean array of the cells of the 1-dimensional coordinate
+        which lie within this range, or None if the limits cannot be compared
+        with the points and bounds directly.
+
+        """
+        limits = [limit for limit in (self.minimum, self.maximum)
+                  if limit is not None]
+        if not (all(_is_number(limit) for limit in limits) and
+                _has_numeric_cells(coord)):
+            return None
+
+        if (isinstance(coord, iris.coords.DimCoord) and
+                not coord.has_bounds()):
+            # The points are monotonic, so the matching cells are those
+            # between the insertion points of the limits.
+            points = coord.points
+            descending = points.size > 1 and points[0] > points[-1]
+            if descending:
+                points = points[::-1]
+            start, stop = 0, points.size
+            if self.minimum is not None:
+                side = 'left' if self.min_inclusive else 'right'
+                start = np.searchsorted(points, self.minimum, side=side)
+            if self.maximum is not None:
+                side = 'right' if self.max_inclusive else 'left'
+                stop = np.searchsorted(points, self.maximum, side=side)
+            result = np.zeros(points.shape, dtype=bool)
+            result[start:stop] = True
+            if descending:
+                result = result[::-1]
+        else:
+            # A bounded cell is greater than a number if all of it is
+            # greater, but greater than or equal to a number if any of it
+            # is, and likewise for less than.
+            lower, upper = _cell_limits(coord)
+            result = np.ones(lower.shape, dtype=bool)
+            if self.minimum is not None:
+                if self.min_inclusive:
+                    result &= upper >= self.minimum
+                else:
+                    result &= lower > self.minimum
+            if self.maximum is not None:
+                if self.max_inclusive:
+                    result &= lower <= self.maximum
+                else:
+                    result &= upper < self.maximum
+        return result
+
+
 class _CoordConstraint(object):
     """Represents the atomic elements which might build up a Constraint."""
     def __init__(self, coord_name, coord_thing):
@@ -255,6 +378,22 @@ class _CoordConstraint(object):
             msg = 'Cannot apply constraints to multidimensional coordinates'
             raise iris.exceptions.CoordinateMultiDimError(msg)
 
+        if isinstance(self._coord_thing, Range):
+            r = self._coord_thing._match(coord)
+        elif not callable(self._coord_thing):
+            r = _match_values(coord, self._coord_thing)
+        else:
+            r = None
+        if r is None:
+            r = self._match_cells(coord)
+        if dims:
+            cube_cim[dims[0]] = r
+        elif not all(r):
+            cube_cim.all_false()
+        return cube_cim
+
+    def _match_cells(self, coord):
+        # Evaluate the condition for each cell of the coordinate in turn.
         try_quick = False
         if callable(self._coord_thing):
             call_func = self._coord_thing
@@ -288,11 +427,55 @@ class _CoordConstraint(object):
                 r[i] = True
         else:
             r = np.array([call_func(cell) for cell in coord.cells()])
-        if dims:
-            cube_cim[dims[0]] = r
-        elif not all(r):
-            cube_cim.all_false()
-        return cube_cim
+        return r
+
+
+def _is_number(value):
+    # The values which a Cell compares with numerically.
+    return isinstance(value, (int, float, np.number))
+
+
+def _has_numeric_cells(coord):
+    # Whether the cells of the coordinate compare with numbers in the same
+    # way as its points and bounds.
+    return (np.issubdtype(coord.dtype, np.number) and
+            not (iris.FUTURE.cell_datetime_objects and
+                 coord.units.is_time_reference()))
+
+
+def _cell_limits(coord):
+    # The minimum and maximum extent of each cell of the coordinate.
+    if coord.has_bounds():
+        bounds = coord.bounds
+        lower, upper = bounds.min(axis=-1), bounds.max(axis=-1)
+    else:
+        lower = upper = coord.points
+    return lower, upper
+
+
+def _match_values(coord, coord_thing):
+    """
+    Return a boolean array of the cells of the 1-dimensional coordinate
+    which equal the value, or any of the values, of `coord_thing`, or None
+    if the values cannot be compared with the points and bounds directly.
+
+    """
+    if (isinstance(coord_thing, collections.Iterable) and
+            not isinstance(coord_thing,
+                           (six.string_types, iris.coords.Cell))):
+        values = list(coord_thing)
+    else:
+        values = [coord_thing]
+    if not (all(_is_number(value) for value in values) and
+            _has_numeric_cells(coord)):
+        return None
+
+    # A number equals a cell if it lies within the cell, so a cell matches
+    # if any of the sorted values lie between its limits.
+    values = np.sort(np.array(values, ndmin=1))
+    lower, upper = _cell_limits(coord)
+    return (np.searchsorted(values, lower, side='left') <
+            np.searchsorted(values, upper, side='right'))
 
 
 class _ColumnIndexManager(object):
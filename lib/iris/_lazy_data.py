@@ -72,6 +72,57 @@ def is_lazy_data(data):
 _MAX_CHUNK_SIZE = 8 * 1024 * 1024 * 2
 
 
+def _optimum_chunksize(chunks, shape, limit=_MAX_CHUNK_SIZE):
+    """
+    Adjust an initial chunk shape towards a chosen total number of points.
+
+    Chunks which are too large are reduced by splitting the earlier (outer)
+    dimensions first, keeping the later (inner) dimensions intact.
+    Chunks which are too small are grown by whole multiples of themselves,
+    expanding the later (inner) dimensions first.  This means that chunks
+    derived from a file storage layout remain aligned with it.
+
+    Args:
+
+    * chunks (tuple of int):
+        The initial chunk shape, e.g. the storage chunking of a file variable.
+    * shape (tuple of int):
+        The shape of the whole array.
+
+    Kwargs:
+
+    * limit (int):
+        The target maximum number of points in a chunk.
+        Defaults to :data:`_MAX_CHUNK_SIZE`.
+
+    Returns:
+        A tuple of int, being the adjusted chunk shape.
+
+    """
+    shape = tuple(int(size) for size in shape)
+    result = [min(int(size), dim) for size, dim in zip(chunks, shape)]
+    if 0 in shape:
+        # Nothing sensible can be done with a zero-length array.
+        return shape
+    if np.prod(result) > limit:
+        # Split the outer dimensions first.
+        i_reduce = 0
+        while np.prod(result) > limit:
+            factor = np.ceil(np.prod(result) / limit)
+            result[i_reduce] = max(int(result[i_reduce] / factor), 1)
+            i_reduce += 1
+    else:
+        # Grow the inner dimensions first, by whole multiples of the initial
+        # chunk size, never exceeding the full dimension.
+        i_expand = len(shape) - 1
+        while i_expand >= 0 and np.prod(result) < limit:
+            factor = int(limit // np.prod(result))
+            result[i_expand] = min(result[i_expand] * factor,
+                                   shape[i_expand])
+            i_expand -= 1
+    return tuple(result)
+
+
 def as_lazy_data(data, chunks=_MAX_CHUNK_SIZE):
     """
     Convert the input array `data` to a dask array.
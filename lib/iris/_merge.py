@@ -32,7 +32,8 @@ from copy import deepcopy
 import numpy as np
 import numpy.ma as ma
 
-from iris._lazy_data import (as_lazy_data, as_concrete_data, is_lazy_data,
+from iris._lazy_data import (array_masked_to_nans, as_lazy_data,
+                             convert_nans_array, is_lazy_data,
                              multidim_lazy_stack)
 import iris.cube
 import iris.coords
@@ -40,6 +41,10 @@ import iris.exceptions
 import iris.util
 
 
+# Coordinate axis ordering dictionary.
+_AXIS_DICT = {'T': 0, 'Z': 1, 'Y': 2, 'X': 3}
+
+
 #
 # Private namedtuple wrapper classes.
 #
@@ -667,6 +672,91 @@ def derive_relation_matrix(indexes):
     return relation_matrix
 
 
+def _factorise_scalar_values(scalar_values):
+    """
+    Factorise the scalar values of each candidate dimension into a
+    column of integer codes, with one code per source-cube.
+
+    Args:
+
+    * scalar_values:
+        A list containing the sequence of scalar values for each
+        source-cube.
+
+    Returns:
+        A tuple containing a dictionary of candidate dimension key to
+        its array of codes, and a dictionary of candidate dimension key
+        to its list of unique scalar values, indexed by code.
+
+    """
+    codes_by_name = {}
+    values_by_name = {}
+    count = len(scalar_values)
+
+    for name, column in enumerate(zip(*scalar_values)):
+        code_by_value = {}
+        codes = np.fromiter((code_by_value.setdefault(value,
+                                                      len(code_by_value))
+                             for value in column),
+                            dtype=np.intp, count=count)
+        values = [None] * len(code_by_value)
+        for value, code in six.iteritems(code_by_value):
+            values[code] = value
+        codes_by_name[name] = codes
+        values_by_name[name] = values
+
+    return codes_by_name, values_by_name
+
+
+def _derive_relation_matrix_from_codes(codes_by_name, values_by_name):
+    """
+    Construct the relation dictionary for each candidate dimension from
+    the factorised scalar values of the source-cubes.
+
+    This is equivalent to :func:`derive_relation_matrix`. The candidate
+    dimensions X and Y are separable if each scalar value of X maps to the
+    same set of scalar values of Y, which is the case only when every
+    combination of the values of X and Y occurs within the source-cubes.
+
+    Args:
+
+    * codes_by_name:
+        The array of codes for each candidate dimension.
+
+    * values_by_name:
+        The list of unique scalar values for each candidate dimension.
+
+    Returns:
+        The relation dictionary for each candidate dimension.
+
+    """
+    names = list(codes_by_name)
+    relation_matrix = {name: _Relation(set(), set()) for name in names}
+
+    for i, name in enumerate(names):
+        codes = codes_by_name[name]
+        size = len(values_by_name[name])
+        for other_name in names[i + 1:]:
+            other_size = len(values_by_name[other_name])
+            combinations = size * other_size
+            if size == 1 or other_size == 1:
+                separable = True
+            elif combinations > codes.size:
+                separable = False
+            else:
+                pairs = codes * other_size + codes_by_name[other_name]
+                counts = np.bincount(pairs, minlength=combinations)
+                separable = bool(np.all(counts))
+            if separable:
+                relation_matrix[name].separable.add(other_name)
+                relation_matrix[other_name].separable.add(name)
+            else:
+                relation_matrix[name].inseparable.add(other_name)
+                relation_matrix[other_name].inseparable.add(name)
+
+    return relation_matrix
+
+
 def derive_groups(relation_matrix):
     """
     Determine all related (chained) groups of inseparable candidate dimensions.
@@ -1089,6 +1179,11 @@ class ProtoCube(object):
         # Default hint ordering for candidate dimension coordinates.
         self._hints = ['time', 'forecast_reference_time', 'forecast_period',
                        'model_level_number']
+        # Coordinate hint ordering dictionary - from most preferred to least.
+        # Copes with duplicate hint entries, where the most preferred is king.
+        self._hint_dict = {name: i for i, name in
+                           zip(range(len(self._hints), 0, -1),
+                               self._hints[::-1])}
 
         # The proto-cube source.
         self._source = cube
@@ -1107,7 +1202,7 @@ class ProtoCube(object):
 
         # The list of stripped-down source-cubes relevant to this ProtoCube.
         self._skeletons = []
-        self._add_cube(cube, coord_payload)
+        self._add_cube(cube.core_data(), coord_payload.scalar)
 
         # Proto-coordinates constructed from merged scalars.
         self._dim_templates = []
@@ -1166,16 +1261,19 @@ class ProtoCube(object):
             A :class:`iris.cube.CubeList` of merged cubes.
 
         """
-        positions = [{i: v for i, v in enumerate(skeleton.scalar_values)}
-                     for skeleton in self._skeletons]
-        indexes = build_indexes(positions)
-        relation_matrix = derive_relation_matrix(indexes)
+        scalar_values = [skeleton.scalar_values
+                         for skeleton in self._skeletons]
+        positions = [dict(enumerate(values)) for values in scalar_values]
+        codes_by_name, values_by_name = \
+            _factorise_scalar_values(scalar_values)
+        relation_matrix = _derive_relation_matrix_from_codes(codes_by_name,
+                                                             values_by_name)
         groups = derive_groups(relation_matrix)
 
         function_matrix = {}
         space = derive_space(groups, relation_matrix, positions,
                              function_matrix=function_matrix)
-        self._define_space(space, positions, indexes, function_matrix)
+        self._define_space(space, positions, values_by_name, function_matrix)
         self._build_coordinates()
 
         # All the final, merged cubes will end up here.
@@ -1183,8 +1281,10 @@ class ProtoCube(object):
 
         # Collate source-cubes by the nd-index.
         group_by_nd_index = {}
-        for index, position in enumerate(positions):
-            group = group_by_nd_index.setdefault(self._nd_index(position), [])
+        position_nd_indexes = self._nd_indexes(positions, codes_by_name,
+                                               values_by_name)
+        for index, nd_index in enumerate(position_nd_indexes):
+            group = group_by_nd_index.setdefault(nd_index, [])
             group.append(index)
 
         # Determine the largest group of source-cubes that want to occupy
@@ -1198,61 +1298,88 @@ class ProtoCube(object):
 
         # Generate group-depth merged cubes from the source-cubes.
         for level in range(group_depth):
-            # Track the largest dtype of the data to be merged.
-            # Unfortunately, da.stack() is not symmetric with regards
-            # to dtypes. So stacking float + int yields a float, but
-            # stacking an int + float yields an int! We need to ensure
-            # that the largest dtype prevails i.e. float, in order to
-            # support the masked case for dask.
-            # Reference https://github.com/dask/dask/issues/2273.
-            dtype = None
-            # Stack up all the data from all of the relevant source
-            # cubes in a single dask "stacked" array.
-            # If it turns out that all the source cubes already had
-            # their data loaded then at the end we convert the stack back
-            # into a plain numpy array.
-            stack = np.empty(self._stack_shape, 'object')
-            all_have_data = True
+            # Get the data of the current existing or last known
+            # good source-cube for each nd-index.
+            datas = []
             for nd_index in nd_indexes:
-                # Get the data of the current existing or last known
-                # good source-cube
                 group = group_by_nd_index[nd_index]
                 offset = min(level, len(group) - 1)
-                data = self._skeletons[group[offset]].data
-                # Ensure the data is represented as a dask array and
-                # slot that array into the stack.
-                if is_lazy_data(data):
-                    all_have_data = False
-                else:
-                    data = as_lazy_data(data, chunks=data.shape)
-                stack[nd_index] = data
-                # Determine the largest dtype.
-                if dtype is None:
-                    dtype = data.dtype
-                else:
-                    dtype = np.promote_types(data.dtype, dtype)
-
-            # Coerce to the largest dtype.
-            for nd_index in nd_indexes:
-                stack[nd_index] = stack[nd_index].astype(dtype)
+                datas.append(self._skeletons[group[offset]].data)
 
-            merged_data = multidim_lazy_stack(stack)
-            if all_have_data:
-                # All inputs were concrete, so turn the result back into a
-                # normal array.
-                dtype = self._cube_signature.data_type
-                merged_data = as_concrete_data(merged_data,
-                                               nans_replacement=ma.masked,
-                                               result_dtype=dtype)
-                # Unmask the array if it has no masked points.
-                if (ma.isMaskedArray(merged_data) and
-                        not ma.is_masked(merged_data)):
-                    merged_data = merged_data.data
+            if any(is_lazy_data(data) for data in datas):
+                merged_data = self._lazy_stack(nd_indexes, datas)
+            else:
+                # All inputs are concrete, so stack them directly into a
+                # normal array rather than by way of a dask graph.
+                merged_data = self._concrete_stack(nd_indexes, datas)
             merged_cube = self._get_cube(merged_data)
             merged_cubes.append(merged_cube)
 
         return merged_cubes
 
+    def _lazy_stack(self, nd_indexes, datas):
+        """
+        Stack up the data from all of the relevant source-cubes, at least
+        one of which is lazy, in a single dask "stacked" array.
+
+        """
+        # Track the largest dtype of the data to be merged.
+        # Unfortunately, da.stack() is not symmetric with regards
+        # to dtypes. So stacking float + int yields a float, but
+        # stacking an int + float yields an int! We need to ensure
+        # that the largest dtype prevails i.e. float, in order to
+        # support the masked case for dask.
+        # Reference https://github.com/dask/dask/issues/2273.
+        dtype = None
+        stack = np.empty(self._stack_shape, 'object')
+        for nd_index, data in zip(nd_indexes, datas):
+            # Ensure the data is represented as a dask array and
+            # slot that array into the stack.
+            if not is_lazy_data(data):
+                data = as_lazy_data(data, chunks=data.shape)
+            stack[nd_index] = data
+            # Determine the largest dtype.
+            if dtype is None:
+                dtype = data.dtype
+            else:
+                dtype = np.promote_types(data.dtype, dtype)
+
+        # Coerce to the largest dtype, where necessary.
+        for nd_index in nd_indexes:
+            if stack[nd_index].dtype != dtype:
+                stack[nd_index] = stack[nd_index].astype(dtype)
+
+        return multidim_lazy_stack(stack)
+
+    def _concrete_stack(self, nd_indexes, datas):
+        """
+        Stack up the data from all of the relevant source-cubes, all of
+        which are concrete, in a single numpy array.
+
+        Masked data is treated exactly as it would be within a dask
+        "stacked" array, so the result is the same as realising the
+        equivalent :meth:`_lazy_stack`.
+
+        """
+        datas = [array_masked_to_nans(data) for data in datas]
+        dtype = datas[0].dtype
+        for data in datas[1:]:
+            dtype = np.promote_types(data.dtype, dtype)
+
+        shape = tuple(self._stack_shape) + datas[0].shape
+        merged_data = np.empty(shape, dtype=dtype)
+        for nd_index, data in zip(nd_indexes, datas):
+            merged_data[nd_index] = data
+
+        merged_data = convert_nans_array(
+            merged_data, nans_replacement=ma.masked,
+            result_dtype=self._cube_signature.data_type)
+        # Unmask the array if it has no masked points.
+        if ma.isMaskedArray(merged_data) and not ma.is_masked(merged_data):
+            merged_data = merged_data.data
+
+        return merged_data
+
     def register(self, cube, error_on_mismatch=False):
         """
         Add a compatible :class:`iris.cube.Cube` as a source-cube for
@@ -1296,7 +1423,36 @@ class ProtoCube(object):
                                                   error_on_mismatch)
         if match:
             # Register the cube as a source-cube for this ProtoCube.
-            self._add_cube(cube, coord_payload)
+            self._add_cube(cube.core_data(), coord_payload.scalar)
+        return match
+
+    def _register_scalars(self, scalar_payload, data):
+        """
+        Register a source-cube given as its scalar coordinate payload and
+        its data.
+
+        The source-cube must share the cube signature, the vector
+        coordinates and the factories of this ProtoCube, so that only its
+        scalar coordinates need to be checked.  This lets a loader which
+        already holds the pieces of each source-cube add them without
+        building the cube.
+
+        Args:
+
+        * scalar_payload:
+            The :class:`_ScalarCoordPayload` of the source-cube, in the
+            order given by :meth:`_coord_sort_key`.
+        * data:
+            The real or lazy data of the source-cube.
+
+        Returns:
+            True iff the scalar coordinates of the source-cube are
+            compatible with this :class:`ProtoCube`.
+
+        """
+        match = scalar_payload.defns == self._coord_signature.scalar_defns
+        if match:
+            self._add_cube(data, scalar_payload)
         return match
 
     def _guess_axis(self, name):
@@ -1344,7 +1500,8 @@ class ProtoCube(object):
             scalar value pairs for each source-cube.
 
         * indexes:
-            A cross-reference dictionary for each candidate dimension.
+            A dictionary containing the unique scalar values for each
+            candidate dimension.
 
         * function_matrix:
             The function mapping dictionary for each candidate dimension that
@@ -1541,6 +1698,29 @@ class ProtoCube(object):
 
         return tuple(index)
 
+    def _nd_indexes(self, positions, codes_by_name, values_by_name):
+        """
+        Returns the n-dimensional index of every source-cube (position),
+        within the merged cube, using the factorised scalar values of the
+        source-cubes.
+
+        """
+        if any(_is_combination(name) for name in self._nd_names):
+            return [self._nd_index(position) for position in positions]
+
+        if not self._nd_names:
+            return [()] * len(positions)
+
+        columns = []
+        for name in self._nd_names:
+            cache = self._cache_by_name[name]
+            index_by_code = np.array([cache[value]
+                                      for value in values_by_name[name]],
+                                     dtype=np.intp)
+            columns.append(index_by_code[codes_by_name[name]])
+
+        return [tuple(index) for index in np.column_stack(columns).tolist()]
+
     def _build_coordinates(self):
         """
         Build the dimension and auxiliary coordinates for the final
@@ -1637,16 +1817,58 @@ class ProtoCube(object):
         return _CubeSignature(cube.metadata, cube.shape, cube.dtype,
                               fill_value, cube._cell_measures_and_dims)
 
-    def _add_cube(self, cube, coord_payload):
+    def _add_cube(self, data, scalar_payload):
         """Create and add the source-cube skeleton to the ProtoCube."""
-        skeleton = _Skeleton(coord_payload.scalar.values,
-                             cube.core_data())
+        skeleton = _Skeleton(scalar_payload.values, data)
         # Attempt to do something sensible with mixed scalar dtypes.
-        for i, metadata in enumerate(coord_payload.scalar.metadata):
+        for i, metadata in enumerate(scalar_payload.metadata):
             if metadata.points_dtype > self._coord_metadata[i].points_dtype:
                 self._coord_metadata[i] = metadata
         self._skeletons.append(skeleton)
 
+    def _coord_sort_key(self, coord):
+        """
+        Return the key which orders a coordinate by hints, axis, and
+        definition.
+
+        NB. This makes use of two properties which don't end up in
+        the CoordDefn used by the scalar definitions: `coord.points.dtype`
+        and `type(coord)`.
+
+        """
+        hint_dict = self._hint_dict
+        points_dtype = coord.dtype
+        return (not np.issubdtype(points_dtype, np.number),
+                not isinstance(coord, iris.coords.DimCoord),
+                hint_dict.get(coord.name(), len(hint_dict) + 1),
+                _AXIS_DICT.get(iris.util.guess_coord_axis(coord),
+                               len(_AXIS_DICT) + 1),
+                coord._as_defn())
+
+    @staticmethod
+    def _scalar_coord_payload(coord):
+        """
+        Return the definition, cell and metadata of a scalar coordinate.
+
+        """
+        # Because we know there's a single Cell in the
+        # coordinate, it's quicker to roll our own than use
+        # Coord.cell().
+        points = coord.points
+        bounds = coord.bounds
+        points_dtype = points.dtype
+        if bounds is not None:
+            bounds_dtype = bounds.dtype
+            bounds = bounds[0]
+        else:
+            bounds_dtype = None
+        value = iris.coords.Cell(points[0], bounds)
+        kwargs = {}
+        if isinstance(coord, iris.coords.DimCoord):
+            kwargs['circular'] = coord.circular
+        metadata = _CoordMetaData(points_dtype, bounds_dtype, kwargs)
+        return coord._as_defn(), value, metadata
+
     def _extract_coord_payload(self, cube):
         """
         Extract all relevant coordinate data and metadata from the cube.
@@ -1672,48 +1894,14 @@ class ProtoCube(object):
         coords = cube.dim_coords + cube_aux_coords
         cube_aux_coord_ids = {id(coord) for coord in cube_aux_coords}
 
-        # Coordinate hint ordering dictionary - from most preferred to least.
-        # Copes with duplicate hint entries, where the most preferred is king.
-        hint_dict = {name: i for i, name in zip(range(len(self._hints), 0, -1),
-                                                self._hints[::-1])}
-        # Coordinate axis ordering dictionary.
-        axis_dict = {'T': 0, 'Z': 1, 'Y': 2, 'X': 3}
-
-        # Coordinate sort function.
-        # NB. This makes use of two properties which don't end up in
-        # the CoordDefn used by scalar_defns: `coord.points.dtype` and
-        # `type(coord)`.
-        def key_func(coord):
-            points_dtype = coord.dtype
-            return (not np.issubdtype(points_dtype, np.number),
-                    not isinstance(coord, iris.coords.DimCoord),
-                    hint_dict.get(coord.name(), len(hint_dict) + 1),
-                    axis_dict.get(iris.util.guess_coord_axis(coord),
-                                  len(axis_dict) + 1),
-                    coord._as_defn())
-
         # Order the coordinates by hints, axis, and definition.
-        for coord in sorted(coords, key=key_func):
+        for coord in sorted(coords, key=self._coord_sort_key):
             if not cube.coord_dims(coord) and coord.shape == (1,):
                 # Extract the scalar coordinate data and metadata.
-                scalar_defns.append(coord._as_defn())
-                # Because we know there's a single Cell in the
-                # coordinate, it's quicker to roll our own than use
-                # Coord.cell().
-                points = coord.points
-                bounds = coord.bounds
-                points_dtype = points.dtype
-                if bounds is not None:
-                    bounds_dtype = bounds.dtype
-                    bounds = bounds[0]
-                else:
-                    bounds_dtype = None
-                scalar_values.append(iris.coords.Cell(points[0], bounds))
-                kwargs = {}
-                if isinstance(coord, iris.coords.DimCoord):
-                    kwargs['circular'] = coord.circular
-                scalar_metadata.append(_CoordMetaData(points_dtype,
-                                                      bounds_dtype, kwargs))
+                defn, value, metadata = self._scalar_coord_payload(coord)
+                scalar_defns.append(defn)
+                scalar_values.append(value)
+                scalar_metadata.append(metadata)
             else:
                 # Extract the vector coordinate and metadata.
                 if id(coord) in cube_aux_coord_ids:
@@ -681,6 +681,35 @@ class PercentileAggregator(_Aggregator):
 
         return _Aggregator.aggregate(self, data, axis, **kwargs)
 
+    def lazy_aggregate(self, data, axis, **kwargs):
+        """
+        Perform the percentile aggregation over the given lazy data.
+
+        Args:
+
+        * data (array):
+            A lazy array (:class:`dask.array.Array`).
+
+        * axis (int or list of int):
+            The dimensions to aggregate over.
+
+        Kwargs:
+
+        * kwargs:
+            All keyword arguments are passed through to the data aggregation
+            function.
+
+        Returns:
+            A lazy array representing the aggregated data.
+
+        """
+        msg = '{} aggregator requires the mandatory keyword argument {!r}.'
+        for arg in self._args:
+            if arg not in kwargs:
+                raise ValueError(msg.format(self.name(), arg))
+
+        return _Aggregator.lazy_aggregate(self, data, axis, **kwargs)
+
     def post_process(self, collapsed_cube, data_result, coords, **kwargs):
         """
         Process the result from :func:`iris.analysis.Aggregator.aggregate`.
@@ -736,7 +765,11 @@ class PercentileAggregator(_Aggregator):
         # cube.
         if self.aggregate_shape(**kwargs):
             # Roll the last additive dimension to be the first.
-            data_result = np.rollaxis(data_result, -1)
+            # NOTE: use the 'transpose' method, which does not realise a
+            # lazy result.
+            ndim = data_result.ndim
+            data_result = data_result.transpose([ndim - 1] +
+                                                list(range(ndim - 1)))
 
         # Marry the collapsed cube and the data payload together.
         result = _Aggregator.post_process(self, collapsed_cube, data_result,
@@ -1008,6 +1041,10 @@ class WeightedAggregator(Aggregator):
         if kwargs.get('returned', False):
             # Package the data into the cube and return a tuple
             collapsed_cube.data, collapsed_weights = data_result
+            # The weights are always returned as a real array, even when
+            # the data of the cube is lazy.
+            collapsed_weights = iris_lazy_data.as_concrete_data(
+                collapsed_weights)
             result = (collapsed_cube, collapsed_weights)
         else:
             result = Aggregator.post_process(self, collapsed_cube,
@@ -1241,6 +1278,11 @@ def _sum(array, **kwargs):
     if returned_in:
         if weights_in is None:
             weights = np.ones_like(array)
+        elif ma.isMaskedArray(array):
+            # Only the weights of the points which are not masked count.
+            weights = ma.masked_array(
+                np.broadcast_to(weights_in, array.shape),
+                mask=ma.getmaskarray(array))
         else:
             weights = weights_in
         rvalue = (wsum, ma.sum(weights, axis=axis_in))
@@ -1350,11 +1392,248 @@ def _peak(array, **kwargs):
     return data
 
 
+def _axes_list(axis, ndim):
+    # Return a sorted list of non-negative dimension indices, from an 'axis'
+    # argument which may be a single dimension or a sequence of them.
+    if not isinstance(axis, collections.Iterable):
+        axis = [axis]
+    return sorted(dim % ndim for dim in axis)
+
+
+def _build_dask_mdtol_function(dask_stats_function):
+    """
+    Make a wrapped dask statistic function that supports the 'mdtol' keyword.
+
+    'dask_stats_function' must be a statistical function that treats NaNs as
+    missing data, and which has the basic call signature
+    "dask_stats_function(data, axis, **kwargs)".  It may return a tuple of
+    (statistic, weights), and the statistic may have additional trailing
+    dimensions, as for several percentiles.
+
+    The returned value is a new function operating on dask arrays.
+    It has the call signature "stat(data, axis=-1, mdtol=None, *kwargs)".
+
+    """
+    @wraps(dask_stats_function)
+    def inner_stat(array, axis=-1, mdtol=None, **kwargs):
+        dask_result = dask_stats_function(array, axis=axis, **kwargs)
+        if mdtol is None:
+            result = dask_result
+        else:
+            point_counts = np.prod([array.shape[dim]
+                                    for dim in _axes_list(axis, array.ndim)])
+            point_mask_counts = da.sum(da.isnan(array), axis=axis)
+            masked_point_fractions = (point_mask_counts + 0.0) / point_counts
+            # Note: the +0.0 forces a floating-point divide.
+            boolean_mask = masked_point_fractions > mdtol
+            returned = isinstance(dask_result, tuple)
+            stat = dask_result[0] if returned else dask_result
+            extra_ndim = stat.ndim - boolean_mask.ndim
+            if extra_ndim:
+                boolean_mask = boolean_mask.reshape(boolean_mask.shape +
+                                                    (1,) * extra_ndim)
+            stat = da.where(boolean_mask, np.nan, stat)
+            result = (stat, dask_result[1]) if returned else stat
+        return result
+    return inner_stat
+
+
+def _build_dask_blockwise_function(function):
+    """
+    Make a dask statistic function from one which operates on real arrays.
+
+    'function' must have the basic call signature
+    "function(data, axis, **kwargs)", and must handle masked data.
+    A 'weights' keyword, if given, must be an array of the same shape as the
+    data.
+
+    The returned value is a new function operating on dask arrays.
+    It has the call signature "stat(data, axis=-1, **kwargs)".
+    The data is rechunked so that each chunk spans the whole of the collapsed
+    dimensions, and 'function' is then applied to each chunk in turn, with
+    any NaNs converted to masked points.  This keeps the memory use bounded
+    by the chunk size, for statistics which cannot be combined from partial
+    results, such as the median.
+
+    """
+    @wraps(function)
+    def inner_stat(array, axis=-1, weights=None, **kwargs):
+        if kwargs.get('returned', False):
+            raise TypeError('The "returned" keyword is not supported for '
+                            'lazy operation.')
+        axes = _axes_list(axis, array.ndim)
+        other_dims = [dim for dim in range(array.ndim) if dim not in axes]
+        other_shape = tuple(array.shape[dim] for dim in other_dims)
+        collapsed_shape = tuple(array.shape[dim] for dim in axes)
+        collapsed_size = int(np.prod(collapsed_shape))
+        # Split the other dimensions such that each chunk, spanning all of
+        # the collapsed dimensions, is of a manageable size.
+        limit = max(iris_lazy_data._MAX_CHUNK_SIZE // max(collapsed_size, 1),
+                    1)
+        other_chunks = iris_lazy_data._optimum_chunksize(
+            [max(array.chunks[dim]) for dim in other_dims], other_shape,
+            limit=limit)
+
+        def regroup(data):
+            # Form a single last dimension from all the collapsed dimensions.
+            data = data.transpose(other_dims + axes)
+            data = data.rechunk(tuple(other_chunks) + collapsed_shape)
+            return data.reshape(other_shape + (collapsed_size,))
+
+        arrays = [regroup(array)]
+        if weights is not None:
+            if weights.shape != array.shape:
+                raise TypeError('Lazy operation requires weights of the '
+                                'same shape as the data.')
+            weights = iris_lazy_data.as_lazy_data(weights,
+                                                  chunks=array.chunks)
+            arrays.append(regroup(weights))
+
+        def collapse_block(data, weights=None):
+            if data.dtype.kind == 'f' and np.any(np.isnan(data)):
+                data = ma.masked_invalid(data)
+            block_kwargs = dict(kwargs)
+            if weights is not None:
+                block_kwargs['weights'] = weights
+            result = function(data, axis=-1, **block_kwargs)
+            result = iris_lazy_data.array_masked_to_nans(
+                ma.asanyarray(result))
+            return result.astype(dtype)
+
+        # Apply the function to a small sample of data, to determine the
+        # dtype of the result, and any additional dimension it has, as for
+        # several percentiles.  This also checks that any keywords are
+        # appropriate, before any real data is processed.
+        sample_kwargs = dict(kwargs)
+        if weights is not None:
+            sample_kwargs['weights'] = np.ones((2, 2))
+        sample = np.asanyarray(function(np.ones((2, 2), dtype=array.dtype),
+                                        axis=-1, **sample_kwargs))
+        dtype = iris_lazy_data.nan_array_type(sample.dtype)
+        extra_shape = sample.shape[1:]
+        if len(extra_shape) > 1:
+            raise TypeError('Lazy operation does not support statistics '
+                            'with more than one additional dimension.')
+        if extra_shape:
+            chunks = arrays[0].chunks[:-1] + (extra_shape,)
+            result = da.map_blocks(collapse_block, *arrays, chunks=chunks,
+                                   dtype=dtype)
+        else:
+            result = da.map_blocks(collapse_block, *arrays,
+                                   drop_axis=len(other_shape), dtype=dtype)
+        return result
+    return inner_stat
+
+
+def _lazy_weights(weights, array):
+    # Return weights as a dask array chunked in the same way as 'array',
+    # or unit weights if there are none.
+    if weights is None:
+        weights = da.ones(array.shape, chunks=array.chunks)
+    else:
+        if weights.shape != array.shape:
+            raise TypeError('Lazy operation requires weights of the same '
+                            'shape as the data.')
+        weights = iris_lazy_data.as_lazy_data(weights, chunks=array.chunks)
+    return weights
+
+
+def _lazy_valid_sum(array, axis, values=None):
+    # Sum 'values' (by default, ones) over the points of 'array' which are
+    # not missing.
+    valid = ~da.isnan(array)
+    if values is None:
+        result = da.sum(valid, axis=axis)
+    else:
+        result = da.sum(da.where(valid, values, 0), axis=axis)
+    return result
+
+
+def _lazy_count(array, axis=-1, function=None, **kwargs):
+    if not callable(function):
+        raise ValueError('function must be a callable. Got %s.'
+                         % type(function))
+    selected = function(array)
+    is_float = array.dtype.kind == 'f'
+    if is_float:
+        # Missing points never count.
+        selected = selected & ~da.isnan(array)
+    result = da.sum(selected, axis=axis, **kwargs)
+    if is_float:
+        # As for the real count, a group with no valid points is missing.
+        result = da.where(_lazy_valid_sum(array, axis) == 0, np.nan, result)
+    return result
+
+
+def _lazy_proportion(array, axis=-1, function=None, **kwargs):
+    numerator = _lazy_count(array, axis=axis, function=function, **kwargs)
+    total_non_missing = _lazy_valid_sum(array, axis)
+    return da.where(total_non_missing == 0, np.nan,
+                    numerator / da.maximum(total_non_missing, 1))
+
+
+def _lazy_mean(array, axis=-1, weights=None, returned=False, **kwargs):
+    if weights is None and not returned:
+        return da.nanmean(array, axis=axis, **kwargs)
+    lazy_weights = _lazy_weights(weights, array)
+    weights_sum = _lazy_valid_sum(array, axis, values=lazy_weights)
+    wsum = da.nansum(array * lazy_weights, axis=axis, **kwargs)
+    result = da.where(weights_sum == 0, np.nan,
+                      wsum / da.where(weights_sum == 0, 1, weights_sum))
+    if returned:
+        result = (result, weights_sum)
+    return result
+
+
+def _lazy_rms(array, axis=-1, **kwargs):
+    if kwargs.get('returned', False):
+        raise TypeError('The "returned" keyword is not supported for '
+                        'lazy operation.')
+    return da.sqrt(_lazy_mean(array * array, axis=axis, **kwargs))
+
+
+def _lazy_sum(array, axis=-1, weights=None, returned=False, **kwargs):
+    if weights is None:
+        wsum = da.nansum(array, axis=axis, **kwargs)
+    else:
+        wsum = da.nansum(array * _lazy_weights(weights, array), axis=axis,
+                         **kwargs)
+    if array.dtype.kind == 'f':
+        # Missing points sum to a missing result, as for masked data.
+        wsum = da.where(_lazy_valid_sum(array, axis) == 0, np.nan, wsum)
+    if returned:
+        # Only the weights of the points which are not missing count.
+        weights_sum = _lazy_valid_sum(array, axis,
+                                      values=_lazy_weights(weights, array))
+        wsum = (wsum, weights_sum)
+    return wsum
+
+
+def _lazy_gmean(array, axis=-1, **kwargs):
+    return da.exp(da.nanmean(da.log(array), axis=axis, **kwargs))
+
+
+def _check_hmean_block(block):
+    # The harmonic mean is undefined for values which are not positive, so
+    # reject them as scipy.stats.mstats.hmean does. Missing points (NaNs)
+    # never compare as less than or equal to zero.
+    if np.any(block <= 0):
+        raise ValueError('Harmonic mean only defined if all elements '
+                         'greater than zero')
+    return block
+
+
+def _lazy_hmean(array, axis=-1, **kwargs):
+    array = array.map_blocks(_check_hmean_block, dtype=array.dtype)
+    return 1.0 / da.nanmean(1.0 / array, axis=axis, **kwargs)
+
+
 #
 # Common partial Aggregation class constructors.
 #
 COUNT = Aggregator('count', _count,
-                   units_func=lambda units: 1)
+                   units_func=lambda units: 1,
+                   lazy_func=_build_dask_mdtol_function(_lazy_count))
 """
 An :class:`~iris.analysis.Aggregator` instance that counts the number
 of :class:`~iris.cube.Cube` data occurrences that satisfy a particular
@@ -1376,12 +1655,17 @@ To compute the number of *ensemble members* with precipitation exceeding 10
 
 .. seealso:: The :func:`~iris.analysis.PROPORTION` aggregator.
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.sum`.
+
 This aggregator handles masked data.
 
 """
 
 
-GMEAN = Aggregator('geometric_mean', scipy.stats.mstats.gmean)
+GMEAN = Aggregator('geometric_mean', scipy.stats.mstats.gmean,
+                   lazy_func=_build_dask_mdtol_function(_lazy_gmean))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 geometric mean over a :class:`~iris.cube.Cube`, as computed by
@@ -1393,12 +1677,18 @@ To compute zonal geometric means over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.GMEAN)
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.nanmean` of the
+    logarithm of the data.
+
 This aggregator handles masked data.
 
 """
 
 
-HMEAN = Aggregator('harmonic_mean', scipy.stats.mstats.hmean)
+HMEAN = Aggregator('harmonic_mean', scipy.stats.mstats.hmean,
+                   lazy_func=_build_dask_mdtol_function(_lazy_hmean))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 harmonic mean over a :class:`~iris.cube.Cube`, as computed by
@@ -1415,12 +1705,19 @@ To compute zonal harmonic mean over the *longitude* axis of a cube::
     The harmonic mean is only valid if all data values are greater
     than zero.
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.nanmean` of the
+    reciprocal of the data. Any values which are not greater than zero
+    raise a ValueError when the lazy result is computed.
+
 This aggregator handles masked data.
 
 """
 
 
-MAX = Aggregator('maximum', ma.max)
+MAX = Aggregator('maximum', ma.max,
+                 lazy_func=_build_dask_mdtol_function(da.nanmax))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the maximum over a :class:`~iris.cube.Cube`, as computed by
@@ -1432,41 +1729,17 @@ To compute zonal maximums over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.MAX)
 
-This aggregator handles masked data.
-
-"""
-
+.. note::
 
-def _build_dask_mdtol_function(dask_nanfunction):
-    """
-    Make a wrapped dask statistic function that supports the 'mdtol' keyword.
+    Lazy operation is supported, via :func:`dask.array.nanmax`.
 
-    'dask_nanfunction' must be a statistical function that treats NaNs as
-    missing data, and which has the basic call signature
-    "dask_nanfunction(data, axis, **kwargs)".
-
-    The returned value is a new function operating on dask arrays.
-    It has the call signature "stat(data, axis=-1, mdtol=None, *kwargs)".
+This aggregator handles masked data.
 
-    """
-    @wraps(dask_nanfunction)
-    def inner_stat(array, axis=-1, mdtol=None, **kwargs):
-        dask_result = dask_nanfunction(array, axis=axis, **kwargs)
-        if mdtol is None:
-            result = dask_result
-        else:
-            point_counts = np.sum(np.ones(array.shape), axis=axis)
-            point_mask_counts = da.sum(da.isnan(array), axis=axis)
-            masked_point_fractions = (point_mask_counts + 0.0) / point_counts
-            # Note: the +0.0 forces a floating-point divide.
-            boolean_mask = masked_point_fractions > mdtol
-            result = da.where(boolean_mask, np.nan, dask_result)
-        return result
-    return inner_stat
+"""
 
 
 MEAN = WeightedAggregator('mean', ma.average,
-                          lazy_func=_build_dask_mdtol_function(da.nanmean))
+                          lazy_func=_build_dask_mdtol_function(_lazy_mean))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the mean over a :class:`~iris.cube.Cube`, as computed by
@@ -1506,14 +1779,17 @@ To compute a weighted area average::
 
 .. note::
 
-    Lazy operation is supported, via :func:`dask.array.nanmean`.
+    Lazy operation is supported, via :func:`dask.array.nanmean`, or
+    :func:`dask.array.nansum` when weights are given.
 
 This aggregator handles masked data.
 
 """
 
 
-MEDIAN = Aggregator('median', ma.median)
+MEDIAN = Aggregator('median', ma.median,
+                    lazy_func=_build_dask_mdtol_function(
+                        _build_dask_blockwise_function(ma.median)))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the median over a :class:`~iris.cube.Cube`, as computed by
@@ -1525,12 +1801,19 @@ To compute zonal medians over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.MEDIAN)
 
+.. note::
+
+    Lazy operation is supported, by rechunking the data so that each chunk
+    spans the whole of the collapsed dimensions, and calculating the
+    median of each chunk in turn.
+
 This aggregator handles masked data.
 
 """
 
 
-MIN = Aggregator('minimum', ma.min)
+MIN = Aggregator('minimum', ma.min,
+                 lazy_func=_build_dask_mdtol_function(da.nanmin))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the minimum over a :class:`~iris.cube.Cube`, as computed by
@@ -1542,12 +1825,18 @@ To compute zonal minimums over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.MIN)
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.nanmin`.
+
 This aggregator handles masked data.
 
 """
 
 
-PEAK = Aggregator('peak', _peak)
+PEAK = Aggregator('peak', _peak,
+                  lazy_func=_build_dask_mdtol_function(
+                      _build_dask_blockwise_function(_peak)))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the peak value derived from a spline interpolation over a
@@ -1568,12 +1857,21 @@ To compute the peak over the *time* axis of a cube::
 
     result = cube.collapsed('time', iris.analysis.PEAK)
 
+.. note::
+
+    Lazy operation is supported, by rechunking the data so that each chunk
+    spans the whole of the collapsed dimensions, and calculating the
+    peak of each chunk in turn.
+
 This aggregator handles masked data.
 
 """
 
 
-PERCENTILE = PercentileAggregator(alphap=1, betap=1)
+PERCENTILE = PercentileAggregator(
+    alphap=1, betap=1,
+    lazy_func=_build_dask_mdtol_function(
+        _build_dask_blockwise_function(_percentile)))
 """
 An :class:`~iris.analysis.PercentileAggregator` instance that calculates the
 percentile over a :class:`~iris.cube.Cube`, as computed by
@@ -1599,6 +1897,12 @@ To compute the 10th and 90th percentile over *time*::
 
     result = cube.collapsed('time', iris.analysis.PERCENTILE, percent=[10, 90])
 
+.. note::
+
+    Lazy operation is supported, by rechunking the data so that each chunk
+    spans the whole of the collapsed dimensions, and calculating the
+    percentiles of each chunk in turn.
+
 This aggregator handles masked data.
 
 """
@@ -1606,7 +1910,9 @@ This aggregator handles masked data.
 
 PROPORTION = Aggregator('proportion',
                         _proportion,
-                        units_func=lambda units: 1)
+                        units_func=lambda units: 1,
+                        lazy_func=_build_dask_mdtol_function(
+                            _lazy_proportion))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 proportion, as a fraction, of :class:`~iris.cube.Cube` data occurrences
@@ -1635,12 +1941,17 @@ Similarly, the proportion of *time* precipitation exceeded 10
 
 .. seealso:: The :func:`~iris.analysis.COUNT` aggregator.
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.sum`.
+
 This aggregator handles masked data.
 
 """
 
 
-RMS = WeightedAggregator('root mean square', _rms)
+RMS = WeightedAggregator('root mean square', _rms,
+                         lazy_func=_build_dask_mdtol_function(_lazy_rms))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the root mean square over a :class:`~iris.cube.Cube`, as computed by
@@ -1659,6 +1970,11 @@ To compute the zonal root mean square over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.RMS)
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.nanmean` of the
+    squared data.
+
 This aggregator handles masked data.
 
 """
@@ -1696,7 +2012,8 @@ This aggregator handles masked data.
 """
 
 
-SUM = WeightedAggregator('sum', _sum)
+SUM = WeightedAggregator('sum', _sum,
+                         lazy_func=_build_dask_mdtol_function(_lazy_sum))
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the sum over a :class:`~iris.cube.Cube`, as computed by :func:`numpy.ma.sum`.
@@ -1724,6 +2041,10 @@ To compute a weighted rolling sum e.g. to apply a digital filter::
     result = cube.rolling_window('time', iris.analysis.SUM,
                                  len(weights), weights=weights)
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.nansum`.
+
 This aggregator handles masked data.
 
 """
@@ -1764,7 +2085,9 @@ This aggregator handles masked data.
 """
 
 
-WPERCENTILE = WeightedPercentileAggregator()
+WPERCENTILE = WeightedPercentileAggregator(
+    lazy_func=_build_dask_mdtol_function(
+        _build_dask_blockwise_function(_weighted_percentile)))
 """
 An :class:`~iris.analysis.WeightedPercentileAggregator` instance that
 calculates the weighted percentile over a :class:`~iris.cube.Cube`.
@@ -1791,9 +2114,141 @@ Additional kwargs associated with the use of this aggregator:
     :func:`scipy.interpolate.interp1d` Defaults to "linear", which is
     equivalent to alphap=0.5, betap=0.5 in `iris.analysis.PERCENTILE`
 
+.. note::
+
+    Lazy operation is supported, by rechunking the data so that each chunk
+    spans the whole of the collapsed dimensions, and calculating the
+    weighted percentiles of each chunk in turn.
+
 """
 
 
+def _reduceat_aggregate(aggregator, data, axis, groups, **kwargs):
+    """
+    Aggregate groups of points along one dimension of real, unmasked data,
+    all at once, with a ufunc "reduceat" operation.
+
+    This is only possible for the :data:`SUM`, :data:`MEAN`, :data:`MAX`
+    and :data:`MIN` aggregators, without weights.
+
+    Args:
+
+    * aggregator (:class:`Aggregator`):
+        The aggregator to apply to each group.
+    * data (array):
+        The data to aggregate.
+    * axis (int):
+        The dimension of the data over which the groups are formed.
+    * groups (list of slice or tuple of int):
+        The points of each group, as generated by :meth:`_Groupby.group`.
+
+    Kwargs:
+
+    * kwargs:
+        Aggregation function keyword arguments.
+
+    Returns:
+        The aggregated data, with one point for each group in place of the
+        'axis' dimension.  Or None, if the aggregation cannot be done in this
+        way.
+
+    """
+    ufuncs = {SUM: np.add, MEAN: np.add, MAX: np.maximum, MIN: np.minimum}
+    ufunc = ufuncs.get(aggregator)
+    if (ufunc is None or ma.isMaskedArray(data) or
+            data.dtype.kind not in 'biuf' or
+            set(kwargs) - set(['mdtol'])):
+        return None
+
+    indices = [np.arange(group.start, group.stop)
+               if isinstance(group, slice) else np.array(group)
+               for group in groups]
+    lengths = np.array([len(group_indices) for group_indices in indices])
+    order = np.concatenate(indices)
+    if not np.array_equal(order, np.arange(data.shape[axis])):
+        # Sort the points so that each group is contiguous.
+        data = data.take(order, axis=axis)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    if aggregator is MEAN:
+        result = np.add.reduceat(data, starts, axis=axis, dtype=np.float64)
+        lengths_shape = [1] * data.ndim
+        lengths_shape[axis] = lengths.size
+        result /= lengths.reshape(lengths_shape)
+        # Match the result type of the separate group aggregations.
+        dtype = data.dtype if data.dtype.kind == 'f' else np.dtype('f8')
+        result = result.astype(dtype)
+    elif aggregator is SUM:
+        # Promote small integer types, as for a sum of each group.
+        dtype = np.sum(np.zeros(1, dtype=data.dtype)).dtype
+        result = ufunc.reduceat(data, starts, axis=axis, dtype=dtype)
+    else:
+        result = ufunc.reduceat(data, starts, axis=axis)
+    return result
+
+
+def _running_sum_aggregate(aggregator, data, axis, window, **kwargs):
+    """
+    Aggregate rolling windows of points along one dimension of real,
+    unmasked data, from cumulative sums along that dimension.
+
+    This costs O(n) rather than O(n * window) operations, but is only
+    possible for the :data:`SUM` and :data:`MEAN` aggregators, without
+    weights, over data with only finite values.
+
+    Args:
+
+    * aggregator (:class:`Aggregator`):
+        The aggregator to apply to each window.
+    * data (array):
+        The data to aggregate.
+    * axis (int):
+        The dimension of the data over which the windows roll.
+    * window (int):
+        The number of points in each window.
+
+    Kwargs:
+
+    * kwargs:
+        Aggregation function keyword arguments.
+
+    Returns:
+        The aggregated data, with one point for each window in place of the
+        'axis' dimension.  Or None, if the aggregation cannot be done in this
+        way.
+
+    """
+    if (aggregator not in (SUM, MEAN) or ma.isMaskedArray(data) or
+            data.dtype.kind not in 'biuf' or
+            set(kwargs) - set(['mdtol'])):
+        return None
+    if data.dtype.kind == 'f' and not np.all(np.isfinite(data)):
+        # Non-finite values would spoil all the subsequent sums.
+        return None
+
+    if aggregator is SUM:
+        # Promote small integer types, as for a sum of each window.
+        dtype = np.sum(np.zeros(1, dtype=data.dtype)).dtype
+    else:
+        dtype = data.dtype if data.dtype.kind == 'f' else np.dtype('f8')
+    sum_dtype = np.float64 if dtype.kind == 'f' else dtype
+
+    zeros_shape = list(data.shape)
+    zeros_shape[axis] = 1
+    sums = np.concatenate([np.zeros(zeros_shape, dtype=sum_dtype),
+                           np.cumsum(data, axis=axis, dtype=sum_dtype)],
+                          axis=axis)
+    n_windows = data.shape[axis] - window + 1
+    ends = [slice(None)] * data.ndim
+    ends[axis] = slice(window, window + n_windows)
+    starts = [slice(None)] * data.ndim
+    starts[axis] = slice(0, n_windows)
+    result = sums[tuple(ends)] - sums[tuple(starts)]
+    if aggregator is MEAN:
+        result = result / window
+    return result.astype(dtype)
+
+
 class _Groupby(object):
     """
     Convenience class to determine group slices over one or more group-by
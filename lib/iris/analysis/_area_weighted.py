@@ -75,6 +75,10 @@ class AreaWeightedRegridder(object):
         # current usage of the experimental regrid function.
         self._target_grid_cube_cache = None
 
+        # The area weights, calculated on the first call and re-used with
+        # every subsequent cube on the source grid.
+        self._regrid_info = None
+
     @property
     def _target_grid_cube(self):
         if self._target_grid_cube_cache is None:
@@ -94,6 +98,9 @@ class AreaWeightedRegridder(object):
         The given cube must be defined with the same grid as the source
         grid used to create this :class:`AreaWeightedRegridder`.
 
+        If the given cube has lazy data, the result will also have lazy
+        data.
+
         Args:
 
         * cube:
@@ -109,5 +116,9 @@ class AreaWeightedRegridder(object):
         if get_xy_dim_coords(cube) != self._src_grid:
             raise ValueError('The given cube is not defined on the same '
                              'source grid as this regridder.')
-        return eregrid.regrid_area_weighted_rectilinear_src_and_grid(
-            cube, self._target_grid_cube, mdtol=self._mdtol)
+        if self._regrid_info is None:
+            self._regrid_info = eregrid.\
+                _regrid_area_weighted_rectilinear_src_and_grid__prepare(
+                    cube, self._target_grid_cube)
+        return eregrid._regrid_area_weighted_rectilinear_src_and_grid__perform(
+            cube, self._regrid_info, self._mdtol)
@@ -76,22 +76,11 @@ def _cartesian_sample_points(sample_points, sample_point_coord_names):
     if i_lat is None or i_lon is None:
         return sample_points.transpose()
 
-    num_points = len(sample_points[0])
-    cartesian_points = [None] * num_points
-
-    # Get the point coordinates without the latlon
-    for p in range(num_points):
-        cartesian_points[p] = [sample_points[c][p] for c in i_non_latlon]
-
-    # Add cartesian xyz coordinates from latlon
+    # Get the point coordinates without the latlon, plus cartesian xyz
+    # coordinates from latlon.
     x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
-    for p in range(num_points):
-        cartesian_point = cartesian_points[p]
-        cartesian_point.append(x[p])
-        cartesian_point.append(y[p])
-        cartesian_point.append(z[p])
-
-    return cartesian_points
+    cartesian_points = [sample_points[c] for c in i_non_latlon] + [x, y, z]
+    return np.array(cartesian_points).transpose()
 
 
 def nearest_neighbour_indices(cube, sample_points):
@@ -285,13 +274,20 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
         kdtree = cache[cube]
     else:
         # Create a "sample space position" for each datum: sample_space_data_positions[coord_index][datum_index]
-        sample_space_data_positions = np.empty((len(sample_space_coords_and_dims), sample_space_cube.data.size), dtype=float)
-        for d, ndi in enumerate(np.ndindex(sample_space_cube.data.shape)):
-            for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
-                # Index of this datum along this coordinate (could be nD).
-                keys = tuple(ndi[ind] for ind in coord_dims) if coord_dims else slice(None, None)
-                # Position of this datum along this coordinate.
-                sample_space_data_positions[c][d] = coord.points[keys]
+        sample_space_shape = sample_space_cube.shape
+        sample_space_data_positions = np.empty((len(sample_space_coords_and_dims), int(np.prod(sample_space_shape))), dtype=float)
+        for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
+            # Broadcast the points of this coordinate (could be nD) over the
+            # whole sample space, to get the position of every datum.
+            points = coord.points
+            if coord_dims:
+                points = points.transpose(np.argsort(coord_dims))
+            points_shape = [1] * len(sample_space_shape)
+            for dim in coord_dims:
+                points_shape[dim] = sample_space_shape[dim]
+            points = points.reshape(points_shape)
+            sample_space_data_positions[c] = np.broadcast_to(
+                points, sample_space_shape).ravel()
 
         # Convert to cartesian coordinates. Flatten for kdtree compatibility.
         cartesian_space_data_coords = _cartesian_sample_points(sample_space_data_positions, sample_point_coord_names)
@@ -316,7 +312,7 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
 
     # Convert flat indices back into multidimensional sample-space indices.
     sample_space_dimension_indices = np.unravel_index(
-        datum_index_lists, sample_space_cube.data.shape)
+        datum_index_lists, sample_space_cube.shape)
     # Convert this from "pointwise list of index arrays for each dimension",
     # to "list of cube indices for each point".
     sample_space_ndis = np.array(sample_space_dimension_indices).transpose()
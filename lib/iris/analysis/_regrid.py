@@ -19,21 +19,390 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+from collections import namedtuple
 import copy
-import functools
 import warnings
 
+import dask.array as da
 import numpy as np
 import numpy.ma as ma
+from scipy.sparse import csr_matrix
 
+from iris._lazy_data import array_masked_to_nans, nan_array_type
 from iris.analysis._interpolation import (EXTRAPOLATION_MODES,
-                                          extend_circular_coord_and_data,
+                                          extend_circular_coord,
+                                          extend_circular_data,
                                           get_xy_dim_coords, snapshot_grid)
 from iris.analysis._scipy_interpolate import _RegularGridInterpolator
 import iris.cube
 from iris.util import _meshgrid
 
 
+class _RegridOperator(namedtuple('RegridOperator',
+                                 ['method', 'x_points', 'y_points',
+                                  'reverse_x', 'reverse_y', 'circular',
+                                  'sample_grid_x', 'sample_grid_y',
+                                  'weights', 'out_of_bounds', 'error_dim'])):
+    """
+    The nearest-neighbour or linear interpolation operator from a
+    rectilinear source grid to a 2-dimensional sample grid.
+
+    The operator does not depend on the data, so it may be computed once
+    and then applied to any data defined on the source grid.
+
+    Args:
+
+    * method:
+        Either 'linear' or 'nearest'.
+    * x_points:
+        The ascending X points of the source grid, extended by one point
+        when the X coordinate is circular.
+    * y_points:
+        The ascending Y points of the source grid.
+    * reverse_x:
+        Whether the X coordinate of the source grid is descending.
+    * reverse_y:
+        Whether the Y coordinate of the source grid is descending.
+    * circular:
+        Whether the X coordinate of the source grid is circular.
+    * sample_grid_x:
+        A 2-dimensional array of sample X values.
+    * sample_grid_y:
+        A 2-dimensional array of sample Y values.
+    * weights:
+        For 'linear', a :class:`scipy.sparse.csr_matrix` of the weight of
+        each source grid point for each sample point. For 'nearest', an
+        array of the X and Y source grid indices of each sample point.
+    * out_of_bounds:
+        A boolean array flagging the sample points outside of the source
+        grid.
+    * error_dim:
+        The first source grid dimension which any sample point is not
+        within, or None.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_grids(cls, src_x_coord, src_y_coord, sample_grid_x,
+                   sample_grid_y, method):
+        """
+        Compute the operator from the source grid to the sample grid.
+
+        Args:
+
+        * src_x_coord:
+            The X :class:`iris.coords.DimCoord`.
+        * src_y_coord:
+            The Y :class:`iris.coords.DimCoord`.
+        * sample_grid_x:
+            A 2-dimensional array of sample X values.
+        * sample_grid_y:
+            A 2-dimensional array of sample Y values.
+        * method:
+            Either 'linear' or 'nearest'.
+
+        Returns:
+            A :class:`_RegridOperator`.
+
+        """
+        if sample_grid_x.shape != sample_grid_y.shape:
+            raise ValueError('Inconsistent sample grid shapes.')
+        if sample_grid_x.ndim != 2:
+            raise ValueError('Sample grid must be 2-dimensional.')
+
+        # The interpolation class requires monotonically increasing
+        # coordinates, so flip the coordinate(s) if they aren't.
+        reverse_x = bool(src_x_coord.points[0] > src_x_coord.points[1])
+        reverse_y = bool(src_y_coord.points[0] > src_y_coord.points[1])
+        if reverse_x:
+            src_x_coord = src_x_coord[::-1]
+        if reverse_y:
+            src_y_coord = src_y_coord[::-1]
+
+        circular = bool(src_x_coord.circular)
+        if circular:
+            x_points = extend_circular_coord(src_x_coord, src_x_coord.points)
+        else:
+            x_points = src_x_coord.points
+        y_points = src_y_coord.points
+
+        # Construct the interpolator, purely to compute the weights. We
+        # will fill in any values out of bounds manually.
+        values = np.empty((x_points.size, y_points.size))
+        interpolator = _RegularGridInterpolator([x_points, y_points],
+                                                values, method=method,
+                                                bounds_error=False,
+                                                fill_value=None)
+
+        # Construct the target coordinate points array.
+        interp_coords = [sample_grid_x.astype(np.float64)[..., np.newaxis],
+                         sample_grid_y.astype(np.float64)[..., np.newaxis]]
+
+        # Map all the requested values into the range of the source
+        # data (centred over the centre of the source data to allow
+        # extrapolation where required).
+        min_x, max_x = x_points.min(), x_points.max()
+        if src_x_coord.units.modulus:
+            modulus = src_x_coord.units.modulus
+            offset = (max_x + min_x - modulus) * 0.5
+            interp_coords[0] -= offset
+            interp_coords[0] = (interp_coords[0] % modulus) + offset
+
+        interp_coords = np.dstack(interp_coords)
+
+        error_dim = None
+        for dim, (grid, points) in enumerate(zip(interpolator.grid,
+                                                 interp_coords.T)):
+            if not np.all((grid[0] <= points) & (points <= grid[-1])):
+                error_dim = dim
+                break
+
+        prepared = interpolator.compute_interp_weights(interp_coords)
+        _, _, indices, norm_distances, out_of_bounds = prepared
+        if method == 'linear':
+            weights = indices
+        else:
+            weights = np.array([np.where(distances <= .5, index, index + 1)
+                                for index, distances in zip(indices,
+                                                            norm_distances)])
+
+        return cls(method, x_points, y_points, reverse_x, reverse_y,
+                   circular, sample_grid_x, sample_grid_y, weights,
+                   out_of_bounds, error_dim)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load an operator saved with :meth:`save`.
+
+        Args:
+
+        * filename:
+            The name of, or open file containing, the saved operator.
+
+        Returns:
+            A :class:`_RegridOperator`.
+
+        """
+        with np.load(filename) as saved:
+            method = str(saved['method'])
+            if method == 'linear':
+                weights = csr_matrix((saved['weights_data'],
+                                      saved['weights_indices'],
+                                      saved['weights_indptr']),
+                                     shape=tuple(saved['weights_shape']))
+            else:
+                weights = saved['weights']
+            error_dim = int(saved['error_dim'])
+            return cls(method, saved['x_points'], saved['y_points'],
+                       bool(saved['reverse_x']), bool(saved['reverse_y']),
+                       bool(saved['circular']), saved['sample_grid_x'],
+                       saved['sample_grid_y'], weights,
+                       saved['out_of_bounds'],
+                       None if error_dim < 0 else error_dim)
+
+    def save(self, filename):
+        """
+        Save this operator to a file, in :func:`numpy.savez` format.
+
+        Args:
+
+        * filename:
+            The name of, or open file to contain, the saved operator.
+
+        """
+        arrays = self._asdict()
+        arrays['error_dim'] = -1 if self.error_dim is None else self.error_dim
+        if self.method == 'linear':
+            weights = arrays.pop('weights')
+            arrays.update(weights_data=weights.data,
+                          weights_indices=weights.indices,
+                          weights_indptr=weights.indptr,
+                          weights_shape=weights.shape)
+        np.savez(filename, **arrays)
+
+    def _interpolate(self, values, fill_value):
+        # Interpolate the values of shape (X, Y, N) to the sample grid.
+        if self.method == 'linear':
+            result = self.weights * values.reshape(-1, values.shape[-1])
+        else:
+            result = values[self.weights[0], self.weights[1]]
+        if fill_value is not None:
+            result[self.out_of_bounds] = fill_value
+        return result.reshape(self.sample_grid_x.shape + values.shape[2:])
+
+    def _extrapolation_mode(self, extrapolation_mode):
+        # Return the named extrapolation mode, checking that it can be
+        # applied to this operator.
+        try:
+            mode = EXTRAPOLATION_MODES[extrapolation_mode]
+        except KeyError:
+            raise ValueError('Invalid extrapolation mode.')
+        if mode.bounds_error and self.error_dim is not None:
+            msg = 'One of the requested xi is out of bounds in dimension {}'
+            raise ValueError(msg.format(self.error_dim))
+        return mode
+
+    def result_dtype(self, dtype):
+        """
+        Return the dtype of the data regridded from data of the given dtype.
+
+        """
+        dtype = np.dtype(dtype)
+        if self.method == 'linear':
+            # If we're given integer values, convert them to the smallest
+            # possible float dtype that can accurately preserve the values.
+            if dtype.kind == 'i':
+                dtype = np.promote_types(dtype, np.float16)
+        return dtype
+
+    def lazy(self, src_data, x_dim, y_dim, extrapolation_mode='nanmask',
+             src_dtype=None):
+        """
+        Lazily regrid the given dask array from the source grid to the
+        sample grid.
+
+        The data is regridded chunk by chunk over the dimensions other than
+        X and Y, so only a single chunk need be in memory at any one time.
+        As for all lazy data, masked values are represented by NaNs.  The
+        values underlying masked points are therefore taken to be zero, which
+        only matters for linear extrapolation from masked points.
+
+        Args:
+
+        * src_data:
+            An N-dimensional dask array.
+        * x_dim:
+            The X dimension within `src_data`.
+        * y_dim:
+            The Y dimension within `src_data`.
+
+        Kwargs:
+
+        * extrapolation_mode:
+            As for :meth:`__call__`.
+        * src_dtype:
+            The intended dtype of the realised `src_data`, for lazy masked
+            integer data. Defaults to the dtype of `src_data`.
+
+        Returns:
+            The regridded data as an N-dimensional dask array.
+
+        """
+        # Check the extrapolation mode now, rather than when computing.
+        self._extrapolation_mode(extrapolation_mode)
+
+        # Each chunk must hold the whole of the source grid.
+        chunks = list(src_data.chunks)
+        new_chunks = list(src_data.chunks)
+        grid_shape = self.sample_grid_x.shape
+        for dim, size in ((y_dim, grid_shape[0]), (x_dim, grid_shape[1])):
+            chunks[dim] = (src_data.shape[dim],)
+            new_chunks[dim] = (size,)
+        src_data = src_data.rechunk(tuple(chunks))
+        if src_dtype is None:
+            src_dtype = src_data.dtype
+        dtype = nan_array_type(self.result_dtype(src_dtype))
+
+        def regrid_block(data):
+            if data.dtype.kind == 'f':
+                mask = np.isnan(data)
+                if np.any(mask):
+                    # Zero the masked points, as a NaN would spoil any
+                    # interpolated values which have a zero weight for it.
+                    data = ma.masked_array(np.where(mask, 0, data), mask=mask)
+            result = self(data, x_dim, y_dim, extrapolation_mode)
+            return array_masked_to_nans(result).astype(dtype, copy=False)
+
+        return da.map_blocks(regrid_block, src_data, chunks=tuple(new_chunks),
+                             dtype=dtype)
+
+    def __call__(self, src_data, x_dim, y_dim, extrapolation_mode='nanmask'):
+        """
+        Regrid the given data from the source grid to the sample grid.
+
+        The whole of the data is interpolated in one step, whatever the
+        number of dimensions other than X and Y.
+
+        Args:
+
+        * src_data:
+            An N-dimensional NumPy array or MaskedArray.
+        * x_dim:
+            The X dimension within `src_data`.
+        * y_dim:
+            The Y dimension within `src_data`.
+
+        Kwargs:
+
+        * extrapolation_mode:
+            One of the extrapolation modes supported by
+            :meth:`RectilinearRegridder._regrid`. The default mode of
+            extrapolation is 'nanmask'.
+
+        Returns:
+            The regridded data as an N-dimensional NumPy array. The
+            lengths of the X and Y dimensions will now match those of the
+            sample grid.
+
+        """
+        assert src_data.shape[x_dim] == self.x_points.size - self.circular
+        assert src_data.shape[y_dim] == self.y_points.size
+
+        mode = self._extrapolation_mode(extrapolation_mode)
+        dtype = self.result_dtype(src_data.dtype)
+
+        # Flip the data to match the ascending source grid.
+        flip_index = [slice(None)] * src_data.ndim
+        if self.reverse_x:
+            flip_index[x_dim] = slice(None, None, -1)
+        if self.reverse_y:
+            flip_index[y_dim] = slice(None, None, -1)
+        src_data = src_data[tuple(flip_index)]
+        if self.circular:
+            src_data = extend_circular_data(src_data, x_dim)
+
+        # Move the X and Y dimensions to the front and flatten all the
+        # others, so all of the data is interpolated with a single product.
+        other_dims = [dim for dim in range(src_data.ndim)
+                      if dim not in (x_dim, y_dim)]
+        src_data = src_data.transpose([x_dim, y_dim] + other_dims)
+        other_shape = src_data.shape[2:]
+        src_data = src_data.reshape(src_data.shape[:2] + (-1,))
+
+        # The interpolation is performed with a floating point dtype.
+        values_dtype = src_data.dtype
+        if not np.issubdtype(values_dtype, np.inexact):
+            values_dtype = np.dtype(float)
+        fill_value = None if mode.bounds_error else mode.fill_value
+        data = self._interpolate(ma.getdata(src_data).astype(values_dtype),
+                                 fill_value)
+
+        # Restore the order of the dimensions.
+        order = [None] * (len(other_dims) + 2)
+        order[y_dim] = 0
+        order[x_dim] = 1
+        for index, dim in enumerate(other_dims):
+            order[dim] = index + 2
+        shape = self.sample_grid_x.shape + other_shape
+        data = np.ascontiguousarray(data.reshape(shape).transpose(order),
+                                    dtype=dtype)
+
+        if ma.isMaskedArray(src_data) or mode.force_mask:
+            # NB. np.ma.getmaskarray returns an array of `False` if
+            # `src_data` is not a masked array.
+            src_mask = ma.getmaskarray(src_data).astype(values_dtype)
+            fill_value = None if mode.bounds_error else mode.mask_fill_value
+            mask_fraction = self._interpolate(src_mask, fill_value)
+            new_mask = mask_fraction.reshape(shape).transpose(order) > 0
+            if ma.isMaskedArray(src_data) or np.any(new_mask):
+                data = ma.MaskedArray(data, mask=new_mask)
+
+        return data
+
+
 class RectilinearRegridder(object):
     """
     This class provides support for performing nearest-neighbour or
@@ -92,6 +461,8 @@ class RectilinearRegridder(object):
             msg = 'Invalid extrapolation mode {!r}'
             raise ValueError(msg.format(extrapolation_mode))
         self._extrapolation_mode = extrapolation_mode
+        # The interpolation operator, which is computed on first use.
+        self._operator = None
 
     @property
     def method(self):
@@ -101,6 +472,78 @@ class RectilinearRegridder(object):
     def extrapolation_mode(self):
         return self._extrapolation_mode
 
+    def _regrid_operator(self):
+        """
+        Return the interpolation operator from the source grid to the
+        target grid, computing it only once for this regridder.
+
+        """
+        if self._operator is None:
+            src_x_coord, src_y_coord = self._src_grid
+            grid_x_coord, grid_y_coord = self._tgt_grid
+            # Convert the grid to a 2D sample grid in the src CRS.
+            sample_grid_x, sample_grid_y = self._sample_grid(
+                src_x_coord.coord_system, grid_x_coord, grid_y_coord)
+            self._operator = _RegridOperator.from_grids(
+                src_x_coord, src_y_coord, sample_grid_x, sample_grid_y,
+                self._method)
+        return self._operator
+
+    def save_operator(self, filename):
+        """
+        Save the interpolation operator of this regridder to a file.
+
+        The operator may then be loaded by another regridder, with the
+        same source and target grids and method, using
+        :meth:`load_operator`.
+
+        Args:
+
+        * filename:
+            The name of, or open file to contain, the saved operator.
+
+        """
+        self._regrid_operator().save(filename)
+
+    def load_operator(self, filename):
+        """
+        Load an interpolation operator, previously saved with
+        :meth:`save_operator`, for use by this regridder.
+
+        Args:
+
+        * filename:
+            The name of, or open file containing, the saved operator.
+
+        """
+        operator = _RegridOperator.load(filename)
+        src_x_coord, src_y_coord = self._src_grid
+        grid_x_coord, grid_y_coord = self._tgt_grid
+        sample_grid_x, sample_grid_y = self._sample_grid(
+            src_x_coord.coord_system, grid_x_coord, grid_y_coord)
+        # The operator holds the source points in ascending order, so
+        # restore their original order before comparing them.
+        x_points = operator.x_points[:operator.x_points.size -
+                                     operator.circular]
+        y_points = operator.y_points
+        if operator.reverse_x:
+            x_points = x_points[::-1]
+        if operator.reverse_y:
+            y_points = y_points[::-1]
+        reverse_x = bool(src_x_coord.points[0] > src_x_coord.points[1])
+        reverse_y = bool(src_y_coord.points[0] > src_y_coord.points[1])
+        if (operator.method != self._method or
+                operator.reverse_x != reverse_x or
+                operator.reverse_y != reverse_y or
+                operator.circular != bool(src_x_coord.circular) or
+                not np.array_equal(operator.sample_grid_x, sample_grid_x) or
+                not np.array_equal(operator.sample_grid_y, sample_grid_y) or
+                not np.array_equal(x_points, src_x_coord.points) or
+                not np.array_equal(y_points, src_y_coord.points)):
+            raise ValueError('The loaded operator is not for the same '
+                             'grids and method as this regridder.')
+        self._operator = operator
+
     @staticmethod
     def _sample_grid(src_coord_system, grid_x_coord, grid_y_coord):
         """
@@ -204,143 +647,15 @@ class RectilinearRegridder(object):
         # XXX: At the moment requires to be a static method as used by
         # experimental regrid_area_weighted_rectilinear_src_and_grid
         #
-        if sample_grid_x.shape != sample_grid_y.shape:
-            raise ValueError('Inconsistent sample grid shapes.')
-        if sample_grid_x.ndim != 2:
-            raise ValueError('Sample grid must be 2-dimensional.')
-
-        # Prepare the result data array
-        shape = list(src_data.shape)
-        assert shape[x_dim] == src_x_coord.shape[0]
-        assert shape[y_dim] == src_y_coord.shape[0]
-
-        shape[y_dim] = sample_grid_x.shape[0]
-        shape[x_dim] = sample_grid_x.shape[1]
-
-        dtype = src_data.dtype
-        if method == 'linear':
-            # If we're given integer values, convert them to the smallest
-            # possible float dtype that can accurately preserve the values.
-            if dtype.kind == 'i':
-                dtype = np.promote_types(dtype, np.float16)
-
-        if ma.isMaskedArray(src_data):
-            data = ma.empty(shape, dtype=dtype)
-            data.mask = np.zeros(data.shape, dtype=np.bool)
-        else:
-            data = np.empty(shape, dtype=dtype)
-
-        # The interpolation class requires monotonically increasing
-        # coordinates, so flip the coordinate(s) and data if the aren't.
-        reverse_x = src_x_coord.points[0] > src_x_coord.points[1]
-        reverse_y = src_y_coord.points[0] > src_y_coord.points[1]
-        flip_index = [slice(None)] * src_data.ndim
-        if reverse_x:
-            src_x_coord = src_x_coord[::-1]
-            flip_index[x_dim] = slice(None, None, -1)
-        if reverse_y:
-            src_y_coord = src_y_coord[::-1]
-            flip_index[y_dim] = slice(None, None, -1)
-        src_data = src_data[tuple(flip_index)]
-
-        if src_x_coord.circular:
-            x_points, src_data = extend_circular_coord_and_data(src_x_coord,
-                                                                src_data,
-                                                                x_dim)
-        else:
-            x_points = src_x_coord.points
-
-        # Slice out the first full 2D piece of data for construction of the
-        # interpolator.
-        index = [0] * src_data.ndim
-        index[x_dim] = index[y_dim] = slice(None)
-        initial_data = src_data[tuple(index)]
-        if y_dim < x_dim:
-            initial_data = initial_data.T
-
-        # Construct the interpolator, we will fill in any values out of bounds
-        # manually.
-        interpolator = _RegularGridInterpolator([x_points, src_y_coord.points],
-                                                initial_data, method=method,
-                                                bounds_error=False,
-                                                fill_value=None)
-        # The constructor of the _RegularGridInterpolator class does
-        # some unnecessary checks on these values, so we set them
-        # afterwards instead. Sneaky. ;-)
-        try:
-            mode = EXTRAPOLATION_MODES[extrapolation_mode]
-        except KeyError:
-            raise ValueError('Invalid extrapolation mode.')
-        interpolator.bounds_error = mode.bounds_error
-        interpolator.fill_value = mode.fill_value
-
-        # Construct the target coordinate points array, suitable for passing to
-        # the interpolator multiple times.
-        interp_coords = [sample_grid_x.astype(np.float64)[..., np.newaxis],
-                         sample_grid_y.astype(np.float64)[..., np.newaxis]]
-
-        # Map all the requested values into the range of the source
-        # data (centred over the centre of the source data to allow
-        # extrapolation where required).
-        min_x, max_x = x_points.min(), x_points.max()
-        min_y, max_y = src_y_coord.points.min(), src_y_coord.points.max()
-        if src_x_coord.units.modulus:
-            modulus = src_x_coord.units.modulus
-            offset = (max_x + min_x - modulus) * 0.5
-            interp_coords[0] -= offset
-            interp_coords[0] = (interp_coords[0] % modulus) + offset
-
-        interp_coords = np.dstack(interp_coords)
-
-        weights = interpolator.compute_interp_weights(interp_coords)
-
-        def interpolate(data):
-            # Update the interpolator for this data slice.
-            data = data.astype(interpolator.values.dtype)
-            if y_dim < x_dim:
-                data = data.T
-            interpolator.values = data
-            data = interpolator.interp_using_pre_computed_weights(weights)
-            if y_dim > x_dim:
-                data = data.T
-            return data
-
-        # Build up a shape suitable for passing to ndindex, inside the loop we
-        # will insert slice(None) on the data indices.
-        iter_shape = list(shape)
-        iter_shape[x_dim] = iter_shape[y_dim] = 1
-
-        # Iterate through each 2d slice of the data, updating the interpolator
-        # with the new data as we go.
-        for index in np.ndindex(tuple(iter_shape)):
-            index = list(index)
-            index[x_dim] = index[y_dim] = slice(None)
-
-            src_subset = src_data[tuple(index)]
-            interpolator.fill_value = mode.fill_value
-            data[tuple(index)] = interpolate(src_subset)
-
-            if ma.isMaskedArray(data) or mode.force_mask:
-                # NB. np.ma.getmaskarray returns an array of `False` if
-                # `src_subset` is not a masked array.
-                src_mask = np.ma.getmaskarray(src_subset)
-                interpolator.fill_value = mode.mask_fill_value
-                mask_fraction = interpolate(src_mask)
-                new_mask = (mask_fraction > 0)
-
-                if np.ma.isMaskedArray(data):
-                    data.mask[tuple(index)] = new_mask
-                elif np.any(new_mask):
-                    # Set mask=False to ensure we have an expanded mask array.
-                    data = np.ma.MaskedArray(data, mask=False)
-                    data.mask[tuple(index)] = new_mask
-
-        return data
+        operator = _RegridOperator.from_grids(src_x_coord, src_y_coord,
+                                              sample_grid_x, sample_grid_y,
+                                              method)
+        return operator(src_data, x_dim, y_dim, extrapolation_mode)
 
     @staticmethod
     def _create_cube(data, src, x_dim, y_dim, src_x_coord, src_y_coord,
                      grid_x_coord, grid_y_coord, sample_grid_x, sample_grid_y,
-                     regrid_callback):
+                     regrid_callback, dtype=None):
         """
         Return a new Cube for the result of regridding the source Cube onto
         the new grid.
@@ -355,7 +670,7 @@ class RectilinearRegridder(object):
         Args:
 
         * data:
-            The regridded data as an N-dimensional NumPy array.
+            The regridded data as an N-dimensional NumPy or dask array.
         * src:
             The source Cube.
         * x_dim:
@@ -380,6 +695,12 @@ class RectilinearRegridder(object):
             The routine that will be used to calculate the interpolated
             values of any reference surfaces.
 
+        Kwargs:
+
+        * dtype:
+            The intended dtype of lazy `data`, as for
+            :class:`iris.cube.Cube`.
+
         Returns:
             The new, regridded Cube.
 
@@ -389,7 +710,7 @@ class RectilinearRegridder(object):
         # experimental regrid_area_weighted_rectilinear_src_and_grid
         #
         # Create a result cube with the appropriate metadata
-        result = iris.cube.Cube(data)
+        result = iris.cube.Cube(data, dtype=dtype)
         result.metadata = copy.deepcopy(src.metadata)
         result.fill_value = src.fill_value
 
@@ -523,25 +844,30 @@ class RectilinearRegridder(object):
         for coord in (src_x_coord, src_y_coord):
             self._check_units(coord)
 
-        # Convert the grid to a 2D sample grid in the src CRS.
-        sample_grid = self._sample_grid(src_cs, grid_x_coord, grid_y_coord)
-        sample_grid_x, sample_grid_y = sample_grid
-
-        # Compute the interpolated data values.
+        # Compute the interpolated data values, re-using the operator for
+        # every cube on the source grid.
+        operator = self._regrid_operator()
         x_dim = src.coord_dims(src_x_coord)[0]
         y_dim = src.coord_dims(src_y_coord)[0]
-        data = self._regrid(src.data, x_dim, y_dim,
-                            src_x_coord, src_y_coord,
-                            sample_grid_x, sample_grid_y,
-                            self._method, self._extrapolation_mode)
+        if src.has_lazy_data():
+            # Regrid lazily, so a lazy result is produced chunk by chunk.
+            data = operator.lazy(src.lazy_data(), x_dim, y_dim,
+                                 self._extrapolation_mode, src.dtype)
+            dtype = operator.result_dtype(src.dtype)
+            if dtype.kind not in 'biu':
+                dtype = None
+        else:
+            data = operator(src.data, x_dim, y_dim, self._extrapolation_mode)
+            dtype = None
 
         # Wrap up the data as a Cube.
-        regrid_callback = functools.partial(self._regrid,
-                                            method=self._method,
-                                            extrapolation_mode='nan')
+        def regrid_callback(src_data, x_dim, y_dim, *args):
+            return operator(src_data, x_dim, y_dim, extrapolation_mode='nan')
+
         result = self._create_cube(data, src, x_dim, y_dim,
                                    src_x_coord, src_y_coord,
                                    grid_x_coord, grid_y_coord,
-                                   sample_grid_x, sample_grid_y,
-                                   regrid_callback)
+                                   operator.sample_grid_x,
+                                   operator.sample_grid_y,
+                                   regrid_callback, dtype=dtype)
         return result
@@ -24,18 +24,26 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+import itertools
 import math
 
+import dask.array as da
 import numpy as np
+import numpy.ma as ma
 
 from cf_units import Unit
 import iris.analysis
 import iris.coord_systems
 import iris.coords
+import iris.util
 
 from iris.analysis._interpolate_private import \
-    _nearest_neighbour_indices_ndcoords, linear as linear_regrid
-from iris.analysis._interpolation import snapshot_grid
+    _nearest_neighbour_indices_ndcoords
+from iris.analysis._interpolation import (_DEFAULT_DTYPE,
+                                          _canonical_sample_points,
+                                          extend_circular_coord,
+                                          snapshot_grid,
+                                          wrap_circular_points)
 from iris.util import _meshgrid
 
 
@@ -194,9 +202,25 @@ def interpolate(cube, sample_points, method=None):
     new_data_shape = [size for dim, size in remaining]
     new_data_shape.append(trajectory_size)
 
+    # Are the given coords all 1-dimensional? (can we do linear interp?)
+    for coord, values in sample_points:
+        if coord.ndim > 1:
+            if method == "linear":
+                msg = "Cannot currently perform linear interpolation for " \
+                      "multi-dimensional coordinates."
+                raise iris.exceptions.CoordinateMultiDimError(msg)
+            method = "nearest"
+            break
+
     # Start with empty data and then fill in the "column" of values for each
     # trajectory point.
-    new_cube = iris.cube.Cube(np.empty(new_data_shape))
+    if cube.has_lazy_data():
+        # The whole of the data will be replaced by a lazy result, so avoid
+        # allocating it here.
+        new_data = da.empty(new_data_shape, chunks=new_data_shape)
+    else:
+        new_data = np.empty(new_data_shape)
+    new_cube = iris.cube.Cube(new_data)
     new_cube.metadata = cube.metadata
 
     # Derive the mapping from the non-trajectory source dimensions to their
@@ -243,30 +267,71 @@ def interpolate(cube, sample_points, method=None):
     for factory in cube.aux_factories:
         new_cube.add_aux_factory(factory.updated(coord_mapping))
 
-    # Are the given coords all 1-dimensional? (can we do linear interp?)
-    for coord, values in sample_points:
-        if coord.ndim > 1:
-            if method == "linear":
-                msg = "Cannot currently perform linear interpolation for " \
-                      "multi-dimensional coordinates."
-                raise iris.exceptions.CoordinateMultiDimError(msg)
-            method = "nearest"
-            break
-
     if method in ["linear", None]:
-        for i in range(trajectory_size):
-            point = [(coord, values[i]) for coord, values in sample_points]
-            column = linear_regrid(cube, point)
-            new_cube.data[..., i] = column.data
-            # Fill in the empty squashed (non derived) coords.
-            for column_coord in column.dim_coords + column.aux_coords:
-                src_dims = cube.coord_dims(column_coord)
-                if not squish_my_dims.isdisjoint(src_dims):
-                    if len(column_coord.points) != 1:
-                        msg = "Expected to find exactly one point. Found {}."
-                        raise Exception(msg.format(column_coord.points))
-                    new_cube.coord(column_coord.name()).points[i] = \
-                        column_coord.points[0]
+        # Work out the bracketing source indices and weights of all the
+        # trajectory points at once, for each of the sampled dimensions.
+        sample_coords = [coord for coord, values in sample_points]
+        sample_dims = [dim for coord in sample_coords
+                       for dim in cube.coord_dims(coord)]
+        if len(set(sample_dims)) != len(sample_coords):
+            raise ValueError('Coordinates repeat a data dimension - the '
+                             'interpolation would be over-specified.')
+        sample_values = _canonical_sample_points(
+            sample_coords, [values for coord, values in sample_points])
+        point_weights = _linear_point_weights(sample_coords, sample_values)
+        weights = [weight for lower, upper, weight in point_weights]
+
+        # Fetch only the region of the source data spanned by the points,
+        # with the sampled dimensions moved last, in sample coord order.
+        region_slices = [slice(None)] * cube.ndim
+        region_indices = []
+        for dim, (lower, upper, weight) in zip(sample_dims, point_weights):
+            start = min(lower.min(), upper.min())
+            stop = 1 + max(lower.max(), upper.max())
+            region_slices[dim] = slice(start, stop)
+            region_indices.append((lower - start, upper - start))
+        source_data = cube.core_data()[tuple(region_slices)]
+        source_data = source_data.transpose(remaining_dims + sample_dims)
+
+        dtype = np.result_type(_DEFAULT_DTYPE, cube.dtype)
+        if cube.has_lazy_data():
+            new_cube.data = _lazy_linear_point_values(
+                source_data, region_indices, weights, dtype)
+        else:
+            # NOTE: as before, any masked points are interpolated from the
+            # underlying data values, giving an unmasked result.
+            new_cube.data[:] = _linear_point_values(
+                ma.getdata(source_data), region_indices, weights, dtype)
+
+        # Fill in the empty squashed (non derived) coords, by interpolating
+        # their points with the same weights.
+        sample_coord_ids = [id(coord) for coord in sample_coords]
+        for coord in cube.dim_coords + cube.aux_coords:
+            src_dims = cube.coord_dims(coord)
+            if squish_my_dims.isdisjoint(src_dims):
+                continue
+            if id(coord) in sample_coord_ids:
+                points = sample_values[sample_coord_ids.index(id(coord))]
+            else:
+                # Arrange the coord points like the source data.
+                coord_dims = [dim for dim in remaining_dims + sample_dims
+                              if dim in src_dims]
+                points = coord.points.transpose(
+                    [src_dims.index(dim) for dim in coord_dims])
+                shape = [cube.shape[dim] if dim in src_dims else 1
+                         for dim in sample_dims]
+                if points.size != np.prod(shape):
+                    msg = "Expected to find exactly one point. Found {}."
+                    raise Exception(msg.format(coord.points))
+                points = points.reshape(shape)
+                indices = [(lower, upper) if dim in src_dims else (0, 0)
+                           for dim, (lower, upper, weight) in
+                           zip(sample_dims, point_weights)]
+                points = _linear_point_values(
+                    points, indices, weights,
+                    np.result_type(_DEFAULT_DTYPE, coord.dtype))
+            new_coord = coord_mapping[id(coord)]
+            new_coord.points = np.asarray(points, dtype=new_coord.dtype)
 
     elif method == "nearest":
         # Use a cache with _nearest_neighbour_indices_ndcoords()
@@ -274,38 +339,32 @@ def interpolate(cube, sample_points, method=None):
         column_indexes = _nearest_neighbour_indices_ndcoords(
             cube, sample_points, cache=cache)
 
-        # Construct "fancy" indexes, so we can create the result data array in
-        # a single numpy indexing operation.
+        # Gather the point indices of each sampled dimension into an array,
+        # so we can create the result data array in a single numpy indexing
+        # operation.
         # ALSO: capture the index range in each dimension, so that we can fetch
         # only a required (square) sub-region of the source data.
+        all_point_indices = np.array(column_indexes, dtype=object)
         fancy_source_indices = []
         region_slices = []
-        n_index_length = len(column_indexes[0])
-        dims_reduced = [False] * n_index_length
+        n_index_length = cube.ndim
+        dims_reduced = [dim in squish_my_dims for dim in range(cube.ndim)]
         for i_ind in range(n_index_length):
-            contents = [column_index[i_ind]
-                        for column_index in column_indexes]
-            each_used = [content != slice(None) for content in contents]
-            if np.all(each_used):
-                # This dimension is addressed : use a list of indices.
-                dims_reduced[i_ind] = True
+            if dims_reduced[i_ind]:
+                # This dimension is addressed : use an array of indices.
+                contents = all_point_indices[:, i_ind].astype(int)
                 # Select the region by min+max indices.
-                start_ind = np.min(contents)
-                stop_ind = 1 + np.max(contents)
+                start_ind = contents.min()
+                stop_ind = 1 + contents.max()
                 region_slice = slice(start_ind, stop_ind)
                 # Record point indices with start subtracted from all of them.
-                fancy_index = list(np.array(contents) - start_ind)
-            elif not np.any(each_used):
+                fancy_index = contents - start_ind
+            else:
                 # This dimension is not addressed by the operation.
                 # Use a ":" as the index.
                 fancy_index = slice(None)
                 # No sub-region selection for this dimension.
                 region_slice = slice(None)
-            else:
-                # Should really never happen, if _ndcoords is right.
-                msg = ('Internal error in trajectory interpolation : point '
-                       'selection indices should all have the same form.')
-                raise ValueError(msg)
 
             fancy_source_indices.append(fancy_index)
             region_slices.append(region_slice)
@@ -315,7 +374,7 @@ def interpolate(cube, sample_points, method=None):
         # points used, but it avoids creating a sub-cube for each point,
         # which is very slow, especially when points are re-used a lot ...
         source_area_indices = tuple(region_slices)
-        source_data = cube[source_area_indices].data
+        source_data = cube[source_area_indices].core_data()
 
         # Transpose source data before indexing it to get the final result.
         # Because.. the fancy indexing will replace the indexed (horizontal)
@@ -328,28 +387,38 @@ def interpolate(cube, sample_points, method=None):
         dims_order = np.concatenate((dims_order[~dims_reduced],
                                      dims_order[dims_reduced]))
         # Rearrange the data dimensions and the fancy indices into that order.
-        source_data = source_data.transpose(dims_order)
+        source_data = source_data.transpose(tuple(dims_order))
         fancy_source_indices = [fancy_source_indices[i_dim]
                                 for i_dim in dims_order]
 
-        # Apply the fancy indexing to get all the result data points.
-        source_data = source_data[fancy_source_indices]
-
-        # "Fix" problems with missing datapoints producing odd values
-        # when copied from a masked into an unmasked array.
-        # TODO: proper masked data handling.
-        if np.ma.isMaskedArray(source_data):
-            # This is **not** proper mask handling, because we cannot produce a
-            # masked result, but it ensures we use a "filled" version of the
-            # input in this case.
-            if cube.fill_value is not None:
-                source_data.fill_value = cube.fill_value
-            source_data = source_data.filled()
-        new_cube.data[:] = source_data
-        # NOTE: we assign to "new_cube.data[:]" and *not* just "new_cube.data",
-        # because the existing code produces a default dtype from 'np.empty'
-        # instead of preserving the input dtype.
-        # TODO: maybe this should be fixed -- i.e. to preserve input dtype ??
+        if cube.has_lazy_data():
+            # Select the points chunk by chunk, giving a lazy result.
+            fill_value = cube.fill_value
+            if fill_value is None:
+                fill_value = ma.default_fill_value(cube.dtype)
+            n_reduced = np.count_nonzero(dims_reduced)
+            new_cube.data = _lazy_point_values(
+                source_data, fancy_source_indices[-n_reduced:], fill_value)
+        else:
+            # Apply the fancy indexing to get all the result data points.
+            source_data = source_data[tuple(fancy_source_indices)]
+
+            # "Fix" problems with missing datapoints producing odd values
+            # when copied from a masked into an unmasked array.
+            # TODO: proper masked data handling.
+            if np.ma.isMaskedArray(source_data):
+                # This is **not** proper mask handling, because we cannot
+                # produce a masked result, but it ensures we use a "filled"
+                # version of the input in this case.
+                if cube.fill_value is not None:
+                    source_data.fill_value = cube.fill_value
+                source_data = source_data.filled()
+            new_cube.data[:] = source_data
+            # NOTE: we assign to "new_cube.data[:]" and *not* just
+            # "new_cube.data", because the existing code produces a default
+            # dtype from 'np.empty' instead of preserving the input dtype.
+            # TODO: maybe this should be fixed -- i.e. to preserve input
+            # dtype ??
 
         # Fill in the empty squashed (non derived) coords.
         column_coords = [coord
@@ -358,7 +427,6 @@ def interpolate(cube, sample_points, method=None):
                              cube.coord_dims(coord))]
         new_cube_coords = [new_cube.coord(column_coord.name())
                            for column_coord in column_coords]
-        all_point_indices = np.array(column_indexes)
         single_point_test_cube = cube[column_indexes[0]]
         for new_cube_coord, src_coord in zip(new_cube_coords, column_coords):
             # Check structure of the indexed coord (at one selected point).
@@ -373,8 +441,9 @@ def interpolate(cube, sample_points, method=None):
             # single point for each coord, but this is very inefficient.
             # So here, we translate cube indexes into *coord* indexes.
             src_coord_dims = cube.coord_dims(src_coord)
-            fancy_coord_index_arrays = [list(all_point_indices[:, src_dim])
-                                        for src_dim in src_coord_dims]
+            fancy_coord_index_arrays = tuple(
+                all_point_indices[:, src_dim].astype(int)
+                for src_dim in src_coord_dims)
 
             # Fill the new coord with all the correct points from the old one.
             new_cube_coord.points = src_coord.points[fancy_coord_index_arrays]
@@ -386,6 +455,152 @@ def interpolate(cube, sample_points, method=None):
     return new_cube
 
 
+def _linear_point_weights(coords, sample_values):
+    """
+    Calculate the linear interpolation weights of many points at once.
+
+    For each of the 1-dimensional `coords`, returns a tuple of the lower and
+    upper source indices bracketing each of its `sample_values`, and the
+    fractional distance of each value from the lower to the upper point.
+    This follows :class:`iris.analysis._interpolation.RectilinearInterpolator`
+    with linear extrapolation : descending and circular coordinates are
+    supported, and single-valued coordinates have a gradient of zero.
+
+    """
+    for coord in coords:
+        if (not isinstance(coord, iris.coords.DimCoord) and
+                not iris.util.monotonic(coord.points, strict=True)):
+            msg = 'Cannot interpolate over the non-monotonic coordinate {}.'
+            raise ValueError(msg.format(coord.name()))
+
+    # The sample values of all the coordinates share a common dtype.
+    dtype = np.result_type(_DEFAULT_DTYPE, *[coord.dtype for coord in coords])
+    result = []
+    for coord, values in zip(coords, sample_values):
+        values = np.array(values, dtype=dtype, ndmin=1)
+        points = coord.points
+        size = points.size
+        decreasing = size > 1 and points[1] < points[0]
+        if decreasing:
+            points = points[::-1]
+        circular = getattr(coord, 'circular', False)
+        modulus = getattr(coord.units, 'modulus', 0)
+        if circular:
+            points = extend_circular_coord(coord, points)
+        if circular or modulus:
+            offset = 0.5 * (points.max() + points.min() - modulus)
+            values = wrap_circular_points(values, offset,
+                                          modulus).astype(dtype)
+
+        if size == 1:
+            lower = np.zeros(values.shape, dtype=int)
+            weight = np.zeros(values.shape, dtype=dtype)
+        else:
+            lower = np.clip(np.searchsorted(points, values) - 1,
+                            0, points.size - 2)
+            weight = ((values - points[lower]) /
+                      (points[lower + 1] - points[lower]))
+        upper = lower + 1
+
+        # Convert to indices of the original coordinate points.
+        indices = []
+        for index in (lower, upper):
+            index = index % size
+            if decreasing:
+                index = size - 1 - index
+            indices.append(index)
+        result.append((indices[0], indices[1], weight))
+    return result
+
+
+def _linear_point_values(data, point_indices, weights, dtype):
+    """
+    Linearly interpolate the trailing dimensions of an array at many points.
+
+    Each trailing dimension has a pair of lower and upper `point_indices`,
+    and the `weights` of the upper points.  These dimensions are replaced by
+    a single dimension over the points.  The result has the given `dtype`.
+
+    """
+    data = data.astype(dtype, copy=False)
+    result = 0
+    for corner in itertools.product((0, 1), repeat=len(weights)):
+        index = [Ellipsis]
+        corner_weight = 1
+        for upper, indices, weight in zip(corner, point_indices, weights):
+            index.append(indices[upper])
+            corner_weight = corner_weight * (weight if upper else 1 - weight)
+        result = result + data[tuple(index)] * corner_weight
+    return result.astype(dtype)
+
+
+def _lazy_linear_point_values(data, point_indices, weights, dtype):
+    """
+    Lazily interpolate the trailing dimensions of a dask array at many points.
+
+    As :func:`_linear_point_values`, but chunk by chunk over the other
+    dimensions.  Any result point which depends on a masked (NaN) source
+    point is itself masked, and the result is float64.
+
+    """
+    n_other = data.ndim - len(point_indices)
+    grid_shape = data.shape[n_other:]
+    # Each chunk must hold the whole of the interpolated dimensions.  These
+    # are flattened, so that each block maps to a block of the result.
+    chunks = data.chunks[:n_other] + tuple((size,) for size in grid_shape)
+    data = data.rechunk(chunks)
+    data = data.reshape(data.shape[:n_other] + (int(np.prod(grid_shape)),))
+
+    def interpolate_block(block):
+        block = block.reshape(block.shape[:-1] + grid_shape)
+        mask = np.isnan(block) if block.dtype.kind == 'f' else None
+        if mask is not None and np.any(mask):
+            result = _linear_point_values(np.where(mask, 0, block),
+                                          point_indices, weights, dtype)
+            mask_fraction = _linear_point_values(mask, point_indices,
+                                                 weights, dtype)
+            result[mask_fraction > 0] = np.nan
+        else:
+            result = _linear_point_values(block, point_indices, weights,
+                                          dtype)
+        return result.astype(np.float64)
+
+    chunks = data.chunks[:n_other] + ((weights[0].size,),)
+    return da.map_blocks(interpolate_block, data, chunks=chunks,
+                         dtype=np.float64)
+
+
+def _lazy_point_values(data, point_indices, fill_value):
+    """
+    Lazily select points from the trailing dimensions of a dask array.
+
+    The dimensions indexed by `point_indices` are replaced by a single
+    dimension over the selected points, chunk by chunk over the other
+    dimensions.  As for real data in :func:`interpolate`, any masked points
+    are filled with `fill_value`, giving an unmasked float64 result.
+
+    """
+    n_other = data.ndim - len(point_indices)
+    grid_shape = data.shape[n_other:]
+    # Each chunk must hold the whole of the indexed dimensions.  These are
+    # then flattened, so the points are selected with a single index.
+    chunks = data.chunks[:n_other] + tuple((size,) for size in grid_shape)
+    data = data.rechunk(chunks)
+    data = data.reshape(data.shape[:n_other] + (int(np.prod(grid_shape)),))
+    flat_indices = np.ravel_multi_index(point_indices, grid_shape)
+
+    def select_block(block):
+        if block.dtype.kind == 'f' and np.any(np.isnan(block)):
+            block = ma.masked_invalid(block)
+        result = block[..., flat_indices]
+        if ma.isMaskedArray(result):
+            result = result.filled(fill_value)
+        return result.astype(np.float64)
+
+    chunks = data.chunks[:n_other] + ((flat_indices.size,),)
+    return da.map_blocks(select_block, data, chunks=chunks, dtype=np.float64)
+
+
 class UnstructuredNearestNeigbourRegridder(object):
     """
     Encapsulate the operation of :meth:`iris.analysis.trajectory.interpolate`
@@ -542,7 +757,8 @@ class UnstructuredNearestNeigbourRegridder(object):
         # The shape is that of the basic result, minus the trajectory (last)
         # dimension, plus the target grid dimensions.
         target_shape = result_trajectory_cube.shape[:-1] + self.tgt_grid_shape
-        data_2d_x_and_y = result_trajectory_cube.data.reshape(target_shape)
+        data_2d_x_and_y = result_trajectory_cube.core_data().reshape(
+            target_shape)
 
         # Make a new result cube with the reshaped data.
         result_cube = iris.cube.Cube(data_2d_x_and_y)
@@ -39,6 +39,12 @@ defined by :mod:`ConfigParser`.
     directory supports the subset of Iris unit tests that require data.
     Directory contents accessed via :func:`iris.tests.get_data_path`.
 
+.. py:data:: iris.config.HEADER_INDEX_DIR
+
+    The [optional] directory in which the decoded field headers of PP and
+    FieldsFiles are cached, so that later loads of the same unchanged files
+    need not scan them again.  Defaults to None, meaning no caching.
+
 .. py:data:: iris.config.PALETTE_PATH
 
     The full path to the Iris palette configuration directory
@@ -140,6 +146,8 @@ if override:
     if os.path.isdir(os.path.expanduser(override)):
         TEST_DATA_DIR = os.path.abspath(override)
 
+HEADER_INDEX_DIR = get_dir_option(_RESOURCE_SECTION, 'header_index_dir')
+
 PALETTE_PATH = get_dir_option(_RESOURCE_SECTION, 'palette_path',
                               os.path.join(CONFIG_PATH, 'palette'))
 
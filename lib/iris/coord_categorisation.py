@@ -104,27 +104,190 @@ def add_categorised_coord(cube, name, from_coord, category_function,
 # coordinates only
 #
 
-# Private "helper" function
-def _pt_date(coord, time):
+# The time units, and their lengths in microseconds, of the time coordinates
+# whose dates can be computed with array arithmetic.
+_MICROSECONDS_PER_UNIT = dict(
+    [(name, 86400 * 10 ** 6) for name in ('days', 'day', 'd')] +
+    [(name, 3600 * 10 ** 6) for name in ('hours', 'hour', 'hrs', 'hr', 'h')] +
+    [(name, 60 * 10 ** 6) for name in ('minutes', 'minute', 'mins', 'min')] +
+    [(name, 10 ** 6) for name in ('seconds', 'second', 'secs', 'sec', 's')])
+
+# The lengths of the months, for the calendars whose years all have the same
+# length.
+_FIXED_YEAR_MONTH_LENGTHS = {
+    '360_day': [30] * 12,
+    '365_day': [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+    '366_day': [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]}
+_FIXED_YEAR_MONTH_LENGTHS['noleap'] = _FIXED_YEAR_MONTH_LENGTHS['365_day']
+_FIXED_YEAR_MONTH_LENGTHS['all_leap'] = _FIXED_YEAR_MONTH_LENGTHS['366_day']
+
+# The Gregorian calendars, which numpy datetimes follow.  The "standard"
+# calendar is only Gregorian from 1582-10-15 onwards.
+_GREGORIAN_CALENDARS = ('standard', 'gregorian', 'proleptic_gregorian')
+_GREGORIAN_START = np.datetime64('1582-10-15')
+
+
+def _calendar_components(points, units):
     """
-    Return the date of a time-coordinate point.
+    Calculate the date components of time points with array arithmetic.
 
-    Args:
+    Returns a dictionary of integer arrays, with the same shape as the
+    points, or None if the units or calendar are not supported.
+
+    """
+    name, _, _ = str(units.origin).partition(' since ')
+    step = _MICROSECONDS_PER_UNIT.get(name.strip().lower())
+    calendar = units.calendar
+    if (step is None or not np.all(np.isfinite(points)) or
+            (calendar not in _GREGORIAN_CALENDARS and
+             calendar not in _FIXED_YEAR_MONTH_LENGTHS)):
+        return None
+    origin = units.num2date(0)
+    origin_time = (((origin.hour * 60 + origin.minute) * 60 + origin.second) *
+                   10 ** 6 + origin.microsecond)
+    times = np.asarray(points, dtype=np.float64) * step + origin_time
+    if points.size and np.max(np.abs(times)) > 2 ** 62:
+        return None
+    # Split the times, rounded to the nearest microsecond, into whole days
+    # from the origin date and the time of day.
+    days, times = np.divmod(np.round(times).astype(np.int64),
+                            86400 * 10 ** 6)
+    components = {'hour': times // (3600 * 10 ** 6)}
+
+    if calendar in _GREGORIAN_CALENDARS:
+        if origin.year < 1:
+            return None
+        start = np.datetime64('{:04d}-{:02d}-{:02d}'.format(
+            origin.year, origin.month, origin.day))
+        dates = start + days.astype('m8[D]')
+        if calendar != 'proleptic_gregorian' and (
+                start < _GREGORIAN_START or
+                (dates.size and dates.min() < _GREGORIAN_START)):
+            return None
+        years = dates.astype('M8[Y]')
+        months = dates.astype('M8[M]')
+        components['year'] = years.astype(np.int64) + 1970
+        components['month'] = months.astype(np.int64) % 12 + 1
+        components['day'] = (dates - months).astype(np.int64) + 1
+        components['day_of_year'] = (dates - years).astype(np.int64) + 1
+        # 1970-01-01 was a Thursday.
+        components['weekday'] = (dates.astype(np.int64) + 3) % 7
+    else:
+        month_lengths = np.array(_FIXED_YEAR_MONTH_LENGTHS[calendar])
+        month_starts = np.cumsum(month_lengths) - month_lengths
+        year_length = month_lengths.sum()
+        days = days + (origin.year * year_length +
+                       month_starts[origin.month - 1] + origin.day - 1)
+        years, days = np.divmod(days, year_length)
+        months = np.searchsorted(month_starts, days, side='right')
+        components['year'] = years
+        components['month'] = months
+        components['day'] = days - month_starts[months - 1] + 1
+        components['day_of_year'] = days + 1
+    return components
+
+
+# The getters of date components from single dates.
+_DATE_GETTERS = {
+    'year': lambda date: date.year,
+    'month': lambda date: date.month,
+    'day': lambda date: date.day,
+    'hour': lambda date: date.hour,
+    # Note: netcdftime.datetime objects return a normal tuple from
+    # timetuple(), unlike datetime.datetime objects that return a namedtuple.
+    # Index the time tuple (element 7 is day of year) instead of using named
+    # element tm_yday.
+    'day_of_year': lambda date: date.timetuple()[7],
+    'weekday': lambda date: date.weekday()}
 
-    * coord (Coord):
-        coordinate (must be Time-type)
-    * time (float):
-        value of a coordinate point
 
-    Returns:
-        datetime.date
+class _DateComponents(object):
     """
-    # NOTE: All of the currently defined categorisation functions are
-    # calendar operations on Time coordinates.
-    #  - All these currently depend on Unit::num2date, which is deprecated (!!)
-    #  - We will want to do better, when we sort out our own Calendars.
-    #  - For now, just make sure these all call through this one function.
-    return coord.units.num2date(time)
+    The calendar date components of all the points of a time coordinate.
+
+    Each component is an integer array, with the same shape as the points.
+    Where possible these are calculated with array arithmetic, otherwise
+    from the date of each point.
+
+    """
+    def __init__(self, coord):
+        self.points = coord.points.copy()
+        self.units = coord.units
+        self._components = _calendar_components(self.points,
+                                                self.units) or {}
+        self._dates = None
+
+    def matches(self, coord):
+        """Return whether these are the date components of the coord."""
+        return (coord.units == self.units and
+                coord.units.calendar == self.units.calendar and
+                coord.points.shape == self.points.shape and
+                np.array_equal(coord.points, self.points))
+
+    def __getitem__(self, name):
+        result = self._components.get(name)
+        if result is None:
+            if self._dates is None:
+                # NOTE: This depends on Unit::num2date, which is deprecated.
+                # We will want to do better, when we sort out our own
+                # Calendars.
+                self._dates = self.units.num2date(self.points.ravel())
+            getter = _DATE_GETTERS[name]
+            result = np.array([getter(date) for date in self._dates],
+                              dtype=np.int64).reshape(self.points.shape)
+            self._components[name] = result
+        return result
+
+
+# The date components of the most recently categorised time coordinate, so
+# that several categorisations of one coordinate share them.
+_DATE_COMPONENTS_CACHE = []
+
+
+def _date_components(coord):
+    """Return the :class:`_DateComponents` of a time coordinate."""
+    for components in _DATE_COMPONENTS_CACHE:
+        if components.matches(coord):
+            return components
+    components = _DateComponents(coord)
+    _DATE_COMPONENTS_CACHE[:] = [components]
+    return components
+
+
+def _add_date_categorised_coord(cube, name, from_coord, category_function,
+                                units='1'):
+    """
+    Add a new coordinate to a cube, by categorising the dates of a time
+    coordinate.
+
+    As :func:`add_categorised_coord`, except that `category_function` is
+    called once for all the points, with their :class:`_DateComponents`,
+    and returns an array of the category values.
+
+    """
+    # Interpret coord, if given as a name
+    if isinstance(from_coord, six.string_types):
+        from_coord = cube.coord(from_coord)
+
+    if len(cube.coords(name)) > 0:
+        msg = 'A coordinate "%s" already exists in the cube.' % name
+        raise ValueError(msg)
+
+    values = np.asarray(category_function(_date_components(from_coord)))
+    if values.dtype.kind in 'SU':
+        # Use the common type for string arrays of add_categorised_coord.
+        values = values.astype('|S64' if six.PY2 else '|U64')
+    new_coord = iris.coords.AuxCoord(values, units=units,
+                                     attributes=from_coord.attributes.copy())
+    new_coord.rename(name)
+
+    # Add into the cube
+    cube.add_aux_coord(new_coord, cube.coord_dims(from_coord))
+
+
+def _lookup(values, indices):
+    """Return an array of the values at the given indices."""
+    return np.array(list(values))[indices]
 
 
 # --------------------------------------------
@@ -132,39 +295,39 @@ def _pt_date(coord, time):
 
 def add_year(cube, coord, name='year'):
     """Add a categorical calendar-year coordinate."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).year)
+        lambda dates: dates['year'])
 
 
 def add_month_number(cube, coord, name='month_number'):
     """Add a categorical month coordinate, values 1..12."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).month)
+        lambda dates: dates['month'])
 
 
 def add_month_fullname(cube, coord, name='month_fullname'):
     """Add a categorical month coordinate, values 'January'..'December'."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: calendar.month_name[_pt_date(coord, x).month],
+        lambda dates: _lookup(calendar.month_name, dates['month']),
         units='no_unit')
 
 
 def add_month(cube, coord, name='month'):
     """Add a categorical month coordinate, values 'Jan'..'Dec'."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: calendar.month_abbr[_pt_date(coord, x).month],
+        lambda dates: _lookup(calendar.month_abbr, dates['month']),
         units='no_unit')
 
 
 def add_day_of_month(cube, coord, name='day_of_month'):
     """Add a categorical day-of-month coordinate, values 1..31."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).day)
+        lambda dates: dates['day'])
 
 
 def add_day_of_year(cube, coord, name='day_of_year'):
@@ -173,13 +336,9 @@ def add_day_of_year(cube, coord, name='day_of_year'):
     (1..366 in leap years).
 
     """
-    # Note: netcdftime.datetime objects return a normal tuple from timetuple(),
-    # unlike datetime.datetime objects that return a namedtuple.
-    # Index the time tuple (element 7 is day of year) instead of using named
-    # element tm_yday.
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).timetuple()[7])
+        lambda dates: dates['day_of_year'])
 
 
 # --------------------------------------------
@@ -187,24 +346,24 @@ def add_day_of_year(cube, coord, name='day_of_year'):
 
 def add_weekday_number(cube, coord, name='weekday_number'):
     """Add a categorical weekday coordinate, values 0..6  [0=Monday]."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).weekday())
+        lambda dates: dates['weekday'])
 
 
 def add_weekday_fullname(cube, coord, name='weekday_fullname'):
     """Add a categorical weekday coordinate, values 'Monday'..'Sunday'."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: calendar.day_name[_pt_date(coord, x).weekday()],
+        lambda dates: _lookup(calendar.day_name, dates['weekday']),
         units='no_unit')
 
 
 def add_weekday(cube, coord, name='weekday'):
     """Add a categorical weekday coordinate, values 'Mon'..'Sun'."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: calendar.day_abbr[_pt_date(coord, x).weekday()],
+        lambda dates: _lookup(calendar.day_abbr, dates['weekday']),
         units='no_unit')
 
 
@@ -213,9 +372,9 @@ def add_weekday(cube, coord, name='weekday'):
 
 def add_hour(cube, coord, name='hour'):
     """Add a categorical hour coordinate, values 0..23."""
-    add_categorised_coord(
+    _add_date_categorised_coord(
         cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).hour)
+        lambda dates: dates['hour'])
 
 
 # ----------------------------------------------
@@ -326,12 +485,12 @@ def add_season(cube, coord, name='season',
     month_season_numbers = _month_season_numbers(seasons)
 
     # Define a categorisation function.
-    def _season(coord, value):
-        dt = _pt_date(coord, value)
-        return seasons[month_season_numbers[dt.month]]
+    def _season(dates):
+        season_numbers = _lookup(month_season_numbers[1:], dates['month'] - 1)
+        return _lookup(seasons, season_numbers)
 
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season, units='no_unit')
+    _add_date_categorised_coord(cube, name, coord, _season, units='no_unit')
 
 
 def add_season_number(cube, coord, name='season_number',
@@ -365,12 +524,11 @@ def add_season_number(cube, coord, name='season_number',
     month_season_numbers = _month_season_numbers(seasons)
 
     # Define a categorisation function.
-    def _season_number(coord, value):
-        dt = _pt_date(coord, value)
-        return month_season_numbers[dt.month]
+    def _season_number(dates):
+        return _lookup(month_season_numbers[1:], dates['month'] - 1)
 
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season_number)
+    _add_date_categorised_coord(cube, name, coord, _season_number)
 
 
 def add_season_year(cube, coord, name='season_year',
@@ -403,14 +561,12 @@ def add_season_year(cube, coord, name='season_year',
     month_year_adjusts = _month_year_adjusts(seasons)
 
     # Define a categorisation function.
-    def _season_year(coord, value):
-        dt = _pt_date(coord, value)
-        year = dt.year
-        year += month_year_adjusts[dt.month]
-        return year
+    def _season_year(dates):
+        adjusts = _lookup(month_year_adjusts[1:], dates['month'] - 1)
+        return dates['year'] + adjusts
 
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season_year)
+    _add_date_categorised_coord(cube, name, coord, _season_year)
 
 
 def add_season_membership(cube, coord, season, name='season_membership'):
@@ -439,10 +595,7 @@ def add_season_membership(cube, coord, season, name='season_membership'):
     """
     months = _months_in_season(season)
 
-    def _season_membership(coord, value):
-        dt = _pt_date(coord, value)
-        if dt.month in months:
-            return True
-        return False
+    def _season_membership(dates):
+        return np.in1d(dates['month'], months).reshape(dates['month'].shape)
 
-    add_categorised_coord(cube, name, coord, _season_membership)
+    _add_date_categorised_coord(cube, name, coord, _season_membership)
@@ -383,6 +383,142 @@ class Cell(collections.namedtuple('Cell', ['point', 'bound'])):
         return np.min(self.bound) <= point <= np.max(self.bound)
 
 
+class _NearestNeighbourSearch(object):
+    """
+    A search index of the cells of a one-dimensional coordinate, to find the
+    nearest cells to any number of points at once.
+
+    This gives the same results as the original cell-by-cell scan of
+    :meth:`Coord.nearest_neighbour_index`, but with a binary search.
+
+    """
+    def __init__(self, coord):
+        if coord.ndim != 1:
+            raise ValueError('Nearest-neighbour is currently limited'
+                             ' to one-dimensional coordinates.')
+        points = coord.points
+        bounds = coord.bounds if coord.has_bounds() else np.array([])
+        self.wrap_modulus = None
+        if getattr(coord, 'circular', False):
+            self.wrap_modulus = coord.units.modulus
+            # Points are wrapped to a range based on the lowest points or
+            # bounds value.
+            self.wrap_origin = np.min(np.hstack((points, bounds.flatten())))
+
+        # The algorithm:  given a single value (V),
+        #   if coord has bounds,
+        #     make bounds cells complete and non-overlapping
+        #     return first cell containing V
+        #   else (no bounds),
+        #     find the point which is closest to V
+        #     or if two are equally close, return the lowest index
+        self.bounds = None
+        if coord.has_bounds():
+            # make bounds ranges complete+separate, so point is in at least one
+            increasing = bounds[0, 1] > bounds[0, 0]
+            # sort the bounds cells by their centre values
+            self.sort_inds = np.argsort(np.mean(bounds, axis=1))
+            bounds = bounds[self.sort_inds]
+            # replace all adjacent bounds with their averages
+            if increasing:
+                mid_bounds = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
+                bounds[:-1, 1] = mid_bounds
+                bounds[1:, 0] = mid_bounds
+            else:
+                mid_bounds = 0.5 * (bounds[:-1, 0] + bounds[1:, 1])
+                bounds[:-1, 0] = mid_bounds
+                bounds[1:, 1] = mid_bounds
+            self.bounds = bounds
+            # Where the cells are contiguous and in order, the first cell
+            # containing a point is the first whose upper limit is not
+            # below it.  Otherwise, the cells must all be checked.
+            lower = np.min(bounds, axis=1)
+            upper = np.max(bounds, axis=1)
+            self.upper = None
+            if (bounds.shape[1] == 2 and np.all(lower[1:] == upper[:-1]) and
+                    np.all(np.diff(upper) >= 0)):
+                self.upper = upper
+        else:
+            indices = np.arange(points.size)
+            if self.wrap_modulus:
+                # add an extra, wrapped max point (simpler than bounds case)
+                # NOTE: circular implies a DimCoord, so *must* be monotonic
+                if points[-1] >= points[0]:
+                    # ascending value order : add wrapped lowest value to end
+                    points = np.hstack((points, points[0] + self.wrap_modulus))
+                    indices = np.hstack((indices, 0))
+                else:
+                    # descending order : add wrapped lowest value at start
+                    points = np.hstack((points[-1] + self.wrap_modulus,
+                                        points))
+                    indices = np.hstack((indices[-1], indices))
+            # Sort the distinct point values, recording where each first
+            # occurs, so that equally close points resolve to the first.
+            self.values, self.positions = np.unique(points,
+                                                    return_index=True)
+            self.indices = indices[self.positions]
+
+    def __call__(self, points):
+        """
+        Return the indices of the cells nearest to the given points.
+
+        Args:
+
+        * points:
+            An array of point values.
+
+        Returns:
+            An integer array of cell indices, of the same shape as the
+            points.
+
+        """
+        points = np.asarray(points)
+        if points.dtype.kind not in 'biuf':
+            raise TypeError('Nearest-neighbour points must be numeric, '
+                            'got {!r}.'.format(points.dtype))
+        if self.wrap_modulus:
+            points = (self.wrap_origin +
+                      (points - self.wrap_origin) % self.wrap_modulus)
+        shape = points.shape
+        points = points.ravel()
+
+        if self.bounds is not None:
+            if self.upper is not None:
+                result = np.searchsorted(self.upper, points)
+                result = np.minimum(result, len(self.upper) - 1)
+            else:
+                # Check all the cells, extending the end cells to include
+                # any points which lie beyond them.
+                cells = np.empty((points.size,) + self.bounds.shape,
+                                 dtype=np.result_type(self.bounds, points))
+                cells[:] = self.bounds
+                cells[:, 0, 0] = np.minimum(points, cells[:, 0, 0])
+                cells[:, -1, 1] = np.maximum(points, cells[:, -1, 1])
+                inside_cells = np.logical_and(
+                    points[:, np.newaxis] >= np.min(cells, axis=2),
+                    points[:, np.newaxis] <= np.max(cells, axis=2))
+                # get index of first-occurring cell that contains the point
+                result = np.argmax(inside_cells, axis=1)
+            # return the original index of the cell (before the bounds sort)
+            result = self.sort_inds[result]
+        else:
+            # The nearest point value is one of those either side of where
+            # the point would be inserted.
+            n_values = len(self.values)
+            above = np.minimum(np.searchsorted(self.values, points),
+                               n_values - 1)
+            below = np.maximum(above - 1, 0)
+            above_distances = np.abs(self.values[above] - points)
+            below_distances = np.abs(self.values[below] - points)
+            use_above = np.logical_or(
+                above_distances < below_distances,
+                np.logical_and(above_distances == below_distances,
+                               self.positions[above] < self.positions[below]))
+            result = self.indices[np.where(use_above, above, below)]
+
+        return result.reshape(shape)
+
+
 class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
     """
     Abstract superclass for coordinates.
@@ -1365,75 +1501,41 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         .. note:: For circular coordinates, the 'nearest' point can wrap around
             to the other end of the values.
 
+        .. seealso:: :meth:`nearest_neighbour_indices`, to find the nearest
+            cells to many points at once.
+
         """
-        points = self.points
-        bounds = self.bounds if self.has_bounds() else np.array([])
-        if self.ndim != 1:
-            raise ValueError('Nearest-neighbour is currently limited'
-                             ' to one-dimensional coordinates.')
-        do_circular = getattr(self, 'circular', False)
-        if do_circular:
-            wrap_modulus = self.units.modulus
-            # wrap 'point' to a range based on lowest points or bounds value.
-            wrap_origin = np.min(np.hstack((points, bounds.flatten())))
-            point = wrap_origin + (point - wrap_origin) % wrap_modulus
-
-        # Calculate the nearest neighbour.
-        # The algorithm:  given a single value (V),
-        #   if coord has bounds,
-        #     make bounds cells complete and non-overlapping
-        #     return first cell containing V
-        #   else (no bounds),
-        #     find the point which is closest to V
-        #     or if two are equally close, return the lowest index
-        if self.has_bounds():
-            # make bounds ranges complete+separate, so point is in at least one
-            increasing = self.bounds[0, 1] > self.bounds[0, 0]
-            bounds = bounds.copy()
-            # sort the bounds cells by their centre values
-            sort_inds = np.argsort(np.mean(bounds, axis=1))
-            bounds = bounds[sort_inds]
-            # replace all adjacent bounds with their averages
-            if increasing:
-                mid_bounds = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
-                bounds[:-1, 1] = mid_bounds
-                bounds[1:, 0] = mid_bounds
-            else:
-                mid_bounds = 0.5 * (bounds[:-1, 0] + bounds[1:, 1])
-                bounds[:-1, 0] = mid_bounds
-                bounds[1:, 1] = mid_bounds
+        return self.nearest_neighbour_indices(point)[()]
 
-            # if point lies beyond either end, fix the end cell to include it
-            bounds[0, 0] = min(point, bounds[0, 0])
-            bounds[-1, 1] = max(point, bounds[-1, 1])
-            # get index of first-occurring cell that contains the point
-            inside_cells = np.logical_and(point >= np.min(bounds, axis=1),
-                                          point <= np.max(bounds, axis=1))
-            result_index = np.where(inside_cells)[0][0]
-            # return the original index of the cell (before the bounds sort)
-            result_index = sort_inds[result_index]
+    def nearest_neighbour_indices(self, points):
+        """
+        Returns the indices of the cells nearest to each of the given points.
 
-        # Or, if no bounds, we always have points ...
-        else:
-            if do_circular:
-                # add an extra, wrapped max point (simpler than bounds case)
-                # NOTE: circular implies a DimCoord, so *must* be monotonic
-                if points[-1] >= points[0]:
-                    # ascending value order : add wrapped lowest value to end
-                    index_offset = 0
-                    points = np.hstack((points, points[0] + wrap_modulus))
-                else:
-                    # descending order : add wrapped lowest value at start
-                    index_offset = 1
-                    points = np.hstack((points[-1] + wrap_modulus, points))
-            # return index of first-occurring nearest point
-            distances = np.abs(points - point)
-            result_index = np.where(distances == np.min(distances))[0][0]
-            if do_circular:
-                # convert index back from circular-adjusted points
-                result_index = (result_index - index_offset) % self.shape[0]
+        This is equivalent to calling :meth:`nearest_neighbour_index` for
+        each point, but is much faster for many points.
 
-        return result_index
+        Only works for one-dimensional coordinates.
+
+        For example:
+
+        >>> coord = iris.coords.DimCoord([0, 10, 20, 30])
+        >>> coord.nearest_neighbour_indices([2, 14, 26, 100])
+        array([0, 1, 3, 3])
+
+        Args:
+
+        * points:
+            An array of point values.
+
+        Returns:
+            An integer array of cell indices, of the same shape as `points`.
+
+        """
+        return self._nearest_neighbour_search()(points)
+
+    def _nearest_neighbour_search(self):
+        # Return a search index of the cells of this coordinate.
+        return _NearestNeighbourSearch(self)
 
     def xml_element(self, doc):
         """Return a DOM element describing this Coord."""
@@ -1676,7 +1778,19 @@ class DimCoord(Coord):
         if len(points) > 1 and not iris.util.monotonic(points, strict=True):
             raise ValueError('The points array must be strictly monotonic.')
 
+    def _nearest_neighbour_search(self):
+        # The points and bounds of a DimCoord are read-only, so the search
+        # index can be kept until they are replaced.
+        key = (self.circular, self.units.modulus)
+        cache = getattr(self, '_nearest_neighbour_cache', None)
+        if cache is None or cache[0] != key:
+            cache = (key, _NearestNeighbourSearch(self))
+            self._nearest_neighbour_cache = cache
+        return cache[1]
+
     def _points_setter(self, points):
+        # Discard any search index of the previous points.
+        self._nearest_neighbour_cache = None
         # DimCoord always realises the points, to allow monotonicity checks.
         copy = is_lazy_data(points)
         points = as_concrete_data(points)
@@ -1736,6 +1850,8 @@ class DimCoord(Coord):
                                  'consistent across all bounds')
 
     def _bounds_setter(self, bounds):
+        # Discard any search index of the previous bounds.
+        self._nearest_neighbour_cache = None
         if bounds is not None:
             # Ensure we have a realised array of new bounds values.
             copy = is_lazy_data(bounds)
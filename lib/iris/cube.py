@@ -748,6 +748,8 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         self._dim_coords_and_dims = []
         self._aux_coords_and_dims = []
         self._aux_factories = []
+        # The lazy coordinates made by the factories, by factory id.
+        self._derived_coords_cache = {}
 
         # Cell Measures
         self._cell_measures_and_dims = []
@@ -1049,6 +1051,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
     def remove_aux_factory(self, aux_factory):
         """Removes the given auxiliary coordinate factory from the cube."""
         self._aux_factories.remove(aux_factory)
+        self._derived_coords_cache.pop(id(aux_factory), None)
 
     def _remove_coord(self, coord):
         self._dim_coords_and_dims = [(coord_, dim) for coord_, dim in
@@ -1366,7 +1369,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         # coords so they can be returned
         def extract_coord(coord_or_factory):
             if isinstance(coord_or_factory, iris.aux_factory.AuxCoordFactory):
-                coord = coord_or_factory.make_coord(self.coord_dims)
+                coord = self._derived_coord(coord_or_factory)
             elif isinstance(coord_or_factory, iris.coords.Coord):
                 coord = coord_or_factory
             else:
@@ -1718,10 +1721,46 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         factories.
 
         """
-        return tuple(factory.make_coord(self.coord_dims) for factory in
+        return tuple(self._derived_coord(factory) for factory in
                      sorted(self.aux_factories,
                             key=lambda factory: factory.name()))
 
+    def _derived_coord(self, factory):
+        """
+        Return a new coordinate made by the given factory.
+
+        A coordinate with lazy points and bounds is cached, so that the
+        factory only needs to build it again once the factory metadata, or
+        any of its dependencies, their cube dimensions, points or bounds are
+        changed.  Each call returns a new coordinate sharing the cached lazy
+        arrays, so no values are calculated until they are actually read.
+
+        """
+        # Record the state that the derived coordinate depends on : values
+        # that must compare equal, and objects that must be identical.
+        values = [deepcopy(factory._as_defn())]
+        objects = [factory]
+        for key, coord in sorted(six.iteritems(factory.dependencies)):
+            if coord is not None:
+                values.append((key, self.coord_dims(coord)))
+                objects.extend([coord, coord.core_points(),
+                                coord.core_bounds()])
+
+        cached = self._derived_coords_cache.get(id(factory))
+        if (cached is None or cached[0] != values or
+                len(cached[1]) != len(objects) or
+                any(old is not new for old, new in zip(cached[1], objects))):
+            coord = factory.make_coord(self.coord_dims)
+            if not (coord.has_lazy_points() and
+                    (coord.core_bounds() is None or
+                     coord.has_lazy_bounds())):
+                # Only lazy arrays can be safely shared between the results.
+                return coord
+            cached = (values, objects, coord)
+            self._derived_coords_cache[id(factory)] = cached
+        coord = cached[2]
+        return type(coord).from_coord(coord)
+
     @property
     def aux_factories(self):
         """Return a tuple of all the coordinate factories."""
@@ -3061,6 +3100,16 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         return result
 
+    def __getstate__(self):
+        # Do not pickle the cached derived coordinates.
+        state = self.__dict__.copy()
+        state['_derived_coords_cache'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_derived_coords_cache', {})
+
     # Must supply __ne__, Python does not defer to __eq__ for negative equality
     def __ne__(self, other):
         result = self.__eq__(other)
@@ -3302,13 +3351,16 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             new_shape = untouched_shape + collapsed_shape
 
             array_dims = untouched_dims + dims_to_collapse
-            unrolled_data = np.transpose(
-                self.data, array_dims).reshape(new_shape)
+            if (aggregator.lazy_func is not None and self.has_lazy_data()):
+                unrolled_data = self.lazy_data().transpose(array_dims)
+                aggregate = aggregator.lazy_aggregate
+            else:
+                unrolled_data = np.transpose(
+                    self.data, array_dims).reshape(new_shape)
+                aggregate = aggregator.aggregate
 
             for dim in dims_to_collapse:
-                unrolled_data = aggregator.aggregate(unrolled_data,
-                                                     axis=-1,
-                                                     **kwargs)
+                unrolled_data = aggregate(unrolled_data, axis=-1, **kwargs)
             data_result = unrolled_data
 
         # Perform the aggregation in lazy form if possible.
@@ -3388,7 +3440,8 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         .. note::
 
-            This operation does not yet have support for lazy evaluation.
+            If the aggregator supports lazy evaluation, and this cube has
+            lazy data, the resulting cube will also have lazy data.
 
         For example:
 
@@ -3475,29 +3528,65 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         data_shape[dimension_to_groupby] = len(groupby)
 
         # Aggregate the group-by data.
-        cube_slice = [slice(None, None)] * len(data_shape)
-
-        for i, groupby_slice in enumerate(groupby.group()):
-            # Slice the cube with the group-by slice to create a group-by
-            # sub-cube.
-            cube_slice[dimension_to_groupby] = groupby_slice
-            groupby_sub_cube = self[tuple(cube_slice)]
-            # Perform the aggregation over the group-by sub-cube and
-            # repatriate the aggregated data into the aggregate-by cube data.
-            cube_slice[dimension_to_groupby] = i
-            result = aggregator.aggregate(groupby_sub_cube.data,
-                                          axis=dimension_to_groupby,
-                                          **kwargs)
-
-            # Determine aggregation result data type for the aggregate-by cube
-            # data on first pass.
-            if i == 0:
-                if ma.isMaskedArray(self.data):
-                    aggregateby_data = ma.zeros(data_shape, dtype=result.dtype)
-                else:
-                    aggregateby_data = np.zeros(data_shape, dtype=result.dtype)
+        groupby_slices = list(groupby.group())
+        aggregateby_data = None
+
+        # Perform the aggregation in lazy form if possible.
+        if self.has_lazy_data() and aggregator.lazy_func is not None:
+            # Aggregate each group lazily, and stack the group results to
+            # form a single lazy array.
+            data = self.lazy_data()
+            cube_slice = [slice(None, None)] * self.ndim
+            results = []
+            try:
+                for groupby_slice in groupby_slices:
+                    if not isinstance(groupby_slice, slice):
+                        groupby_slice = list(groupby_slice)
+                    cube_slice[dimension_to_groupby] = groupby_slice
+                    results.append(aggregator.lazy_aggregate(
+                        data[tuple(cube_slice)], axis=dimension_to_groupby,
+                        **kwargs))
+            except TypeError:
+                # TypeError - when unexpected keywords passed through.
+                pass
+            else:
+                aggregateby_data = da.stack(results,
+                                            axis=dimension_to_groupby)
+
+        # Otherwise, aggregate all the groups at once, if the aggregator
+        # supports it.
+        if aggregateby_data is None:
+            aggregateby_data = iris.analysis._reduceat_aggregate(
+                aggregator, self.data, dimension_to_groupby, groupby_slices,
+                **kwargs)
+
+        # Otherwise, aggregate each group in turn.
+        if aggregateby_data is None:
+            data = self.data
+            cube_slice = [slice(None, None)] * self.ndim
+            result_slice = [slice(None, None)] * len(data_shape)
+            for i, groupby_slice in enumerate(groupby_slices):
+                # Slice the data with the group-by slice.
+                cube_slice[dimension_to_groupby] = groupby_slice
+                groupby_sub_data = data[tuple(cube_slice)]
+                # Perform the aggregation over the group-by data and
+                # repatriate the aggregated data into the aggregate-by data.
+                result_slice[dimension_to_groupby] = i
+                result = aggregator.aggregate(groupby_sub_data,
+                                              axis=dimension_to_groupby,
+                                              **kwargs)
+
+                # Determine aggregation result data type for the aggregate-by
+                # cube data on first pass.
+                if i == 0:
+                    if ma.isMaskedArray(data):
+                        aggregateby_data = ma.zeros(data_shape,
+                                                    dtype=result.dtype)
+                    else:
+                        aggregateby_data = np.zeros(data_shape,
+                                                    dtype=result.dtype)
 
-            aggregateby_data[tuple(cube_slice)] = result
+                aggregateby_data[tuple(result_slice)] = result
 
         # Add the aggregation meta data to the aggregate-by cube.
         aggregator.update_metadata(aggregateby_cube,
@@ -3550,7 +3639,8 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         .. note::
 
-            This operation does not yet have support for lazy evaluation.
+            If the aggregator supports lazy evaluation, and this cube has
+            lazy data, the resulting cube will also have lazy data.
 
         For example:
 
@@ -3630,22 +3720,38 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                 'must map to one data dimension.' % coord.name())
         dimension = dimension[0]
 
+        if window > self.shape[dimension]:
+            raise ValueError('`window` is too long.')
+
         # Use indexing to get a result-cube of the correct shape.
-        # NB. This indexes the data array which is wasted work.
-        # As index-to-get-shape-then-fiddle is a common pattern, perhaps
-        # some sort of `cube.prepare()` method would be handy to allow
-        # re-shaping with given data, and returning a mapping of
-        # old-to-new-coords (to avoid having to use metadata identity)?
+        # NB. Index a copy of the cube with placeholder lazy data, so that
+        # the data array itself is not indexed, which would be wasted work.
         key = [slice(None, None)] * self.ndim
         key[dimension] = slice(None, self.shape[dimension] - window + 1)
-        new_cube = self[tuple(key)]
-
-        # take a view of the original data using the rolling_window function
-        # this will add an extra dimension to the data at dimension + 1 which
-        # represents the rolled window (i.e. will have a length of window)
-        rolling_window_data = iris.util.rolling_window(self.data,
-                                                       window=window,
-                                                       axis=dimension)
+        placeholder = da.zeros(self.shape, dtype=self.dtype,
+                               chunks=self.shape)
+        new_cube = self.copy(data=placeholder, dtype=None)[tuple(key)]
+
+        lazy_aggregation = (self.has_lazy_data() and
+                            aggregator.lazy_func is not None)
+        if lazy_aggregation:
+            # Stack offset slices of the lazy data, to add an extra dimension
+            # at dimension + 1 which represents the rolled window.
+            data = self.lazy_data()
+            n_windows = self.shape[dimension] - window + 1
+            offset_slices = []
+            for offset in range(window):
+                key[dimension] = slice(offset, offset + n_windows)
+                offset_slices.append(data[tuple(key)])
+            rolling_window_data = da.stack(offset_slices, axis=dimension + 1)
+        else:
+            # take a view of the original data using the rolling_window
+            # function this will add an extra dimension to the data at
+            # dimension + 1 which represents the rolled window (i.e. will
+            # have a length of window)
+            rolling_window_data = iris.util.rolling_window(self.data,
+                                                           window=window,
+                                                           axis=dimension)
 
         # now update all of the coordinates to reflect the aggregation
         for coord_ in self.coords(dimensions=dimension):
@@ -3687,6 +3793,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             **kwargs)
         # and perform the data transformation, generating weights first if
         # needed
+        window_kwargs = kwargs
         if isinstance(aggregator, iris.analysis.WeightedAggregator) and \
                 aggregator.uses_weighting(**kwargs):
             if 'weights' in kwargs:
@@ -3695,12 +3802,32 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                     raise ValueError('Weights for rolling window aggregation '
                                      'must be a 1d array with the same length '
                                      'as the window.')
-                kwargs = dict(kwargs)
-                kwargs['weights'] = iris.util.broadcast_to_shape(
+                window_kwargs = dict(kwargs)
+                window_kwargs['weights'] = iris.util.broadcast_to_shape(
                     weights, rolling_window_data.shape, (dimension + 1,))
-        data_result = aggregator.aggregate(rolling_window_data,
-                                           axis=dimension + 1,
-                                           **kwargs)
+
+        data_result = None
+        if lazy_aggregation:
+            try:
+                data_result = aggregator.lazy_aggregate(rolling_window_data,
+                                                        axis=dimension + 1,
+                                                        **window_kwargs)
+            except TypeError:
+                # TypeError - when unexpected keywords passed through.
+                rolling_window_data = iris.util.rolling_window(
+                    self.data, window=window, axis=dimension)
+
+        if data_result is None:
+            # Calculate running sums along the dimension, if the aggregator
+            # supports it, which costs much less than aggregating every
+            # window separately.
+            data_result = iris.analysis._running_sum_aggregate(
+                aggregator, self.data, dimension, window, **kwargs)
+
+        if data_result is None:
+            data_result = aggregator.aggregate(rolling_window_data,
+                                               axis=dimension + 1,
+                                               **window_kwargs)
         result = aggregator.post_process(new_cube, data_result, [coord],
                                          **kwargs)
         return result
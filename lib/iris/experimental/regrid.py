@@ -23,19 +23,21 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
-from collections import namedtuple
 import copy
 import functools
 import warnings
 
 import cartopy.crs as ccrs
 import cf_units
+import dask.array as da
 import numpy as np
 import numpy.ma as ma
 import scipy.interpolate
-from scipy.sparse import csc_matrix, diags as sparse_diags
+from scipy.sparse import (coo_matrix, csc_matrix, diags as sparse_diags,
+                          kron as sparse_kron)
 import six
 
+from iris._lazy_data import array_masked_to_nans
 import iris.analysis.cartography
 from iris.analysis._interpolation import (get_xy_dim_coords, get_xy_coords,
                                           snapshot_grid)
@@ -45,11 +47,6 @@ import iris.cube
 from iris.util import _meshgrid, promote_aux_coord_to_dim_coord
 
 
-_Version = namedtuple('Version', ('major', 'minor', 'micro'))
-_NP_VERSION = _Version(*(int(val) for val in
-                         np.version.version.split('.') if val.isdigit()))
-
-
 def _get_xy_coords(cube):
     """
     Return the x and y coordinates from a cube.
@@ -157,260 +154,171 @@ def _within_bounds(src_bounds, tgt_bounds, orderswap=False):
             ((upper <= max_bound) * (upper >= min_bound)))
 
 
-def _cropped_bounds(bounds, lower, upper):
-    """
-    Return a new bounds array and corresponding slice object (or indices) of
-    the original data array, resulting from cropping the provided bounds
-    between the specified lower and upper values. The bounds at the
-    extremities will be truncated so that they start and end with lower and
-    upper.
-
-    This function will return an empty NumPy array and slice if there is no
-    overlap between the region covered by bounds and the region from lower to
-    upper.
-
-    If lower > upper the resulting bounds may not be contiguous and the
-    indices object will be a tuple of indices rather than a slice object.
-
-    Args:
-
-    * bounds:
-        An (n, 2) shaped array of monotonic contiguous bounds.
-    * lower:
-        Lower bound at which to crop the bounds array.
-    * upper:
-        Upper bound at which to crop the bounds array.
+def _get_bounds_in_units(coord, units, dtype):
+    """Return a copy of coord's bounds in the specified units and dtype."""
+    # The bounds are cast to dtype before conversion to prevent issues when
+    # mixing float32 and float64 types.
+    return coord.units.convert(coord.bounds.astype(dtype), units).astype(dtype)
 
-    Returns:
-        A tuple of the new bounds array and the corresponding slice object or
-        indices from the zeroth axis of the original array.
 
+def _overlap_weights(src_bounds, grid_bounds, grid_decreasing, length_func,
+                     circular=False):
     """
-    reversed_flag = False
-    # Ensure order is increasing.
-    if bounds[0, 0] > bounds[-1, 0]:
-        # Reverse bounds
-        bounds = bounds[::-1, ::-1]
-        reversed_flag = True
-
-    # Number of bounds.
-    n = bounds.shape[0]
-
-    if lower <= upper:
-        if lower > bounds[-1, 1] or upper < bounds[0, 0]:
-            new_bounds = bounds[0:0]
-            indices = slice(0, 0)
-        else:
-            # A single region lower->upper.
-            if lower < bounds[0, 0]:
-                # Region extends below bounds so use first lower bound.
-                l = 0
-                lower = bounds[0, 0]
-            else:
-                # Index of last lower bound less than or equal to lower.
-                l = np.nonzero(bounds[:, 0] <= lower)[0][-1]
-            if upper > bounds[-1, 1]:
-                # Region extends above bounds so use last upper bound.
-                u = n - 1
-                upper = bounds[-1, 1]
-            else:
-                # Index of first upper bound greater than or equal to
-                # upper.
-                u = np.nonzero(bounds[:, 1] >= upper)[0][0]
-            # Extract the bounds in our region defined by lower->upper.
-            new_bounds = np.copy(bounds[l:(u + 1), :])
-            # Replace first and last values with specified bounds.
-            new_bounds[0, 0] = lower
-            new_bounds[-1, 1] = upper
-            if reversed_flag:
-                indices = slice(n - (u + 1), n - l)
-            else:
-                indices = slice(l, u + 1)
-    else:
-        # Two regions [0]->upper, lower->[-1]
-        # [0]->upper
-        if upper < bounds[0, 0]:
-            # Region outside src bounds.
-            new_bounds_left = bounds[0:0]
-            indices_left = tuple()
-            slice_left = slice(0, 0)
-        else:
-            if upper > bounds[-1, 1]:
-                # Whole of bounds.
-                u = n - 1
-                upper = bounds[-1, 1]
-            else:
-                # Index of first upper bound greater than or equal to upper.
-                u = np.nonzero(bounds[:, 1] >= upper)[0][0]
-            # Extract the bounds in our region defined by [0]->upper.
-            new_bounds_left = np.copy(bounds[0:(u + 1), :])
-            # Replace last value with specified bound.
-            new_bounds_left[-1, 1] = upper
-            if reversed_flag:
-                indices_left = tuple(range(n - (u + 1), n))
-                slice_left = slice(n - (u + 1), n)
-            else:
-                indices_left = tuple(range(0, u + 1))
-                slice_left = slice(0, u + 1)
-        # lower->[-1]
-        if lower > bounds[-1, 1]:
-            # Region is outside src bounds.
-            new_bounds_right = bounds[0:0]
-            indices_right = tuple()
-            slice_right = slice(0, 0)
-        else:
-            if lower < bounds[0, 0]:
-                # Whole of bounds.
-                l = 0
-                lower = bounds[0, 0]
-            else:
-                # Index of last lower bound less than or equal to lower.
-                l = np.nonzero(bounds[:, 0] <= lower)[0][-1]
-            # Extract the bounds in our region defined by lower->[-1].
-            new_bounds_right = np.copy(bounds[l:, :])
-            # Replace first value with specified bound.
-            new_bounds_right[0, 0] = lower
-            if reversed_flag:
-                indices_right = tuple(range(0, n - l))
-                slice_right = slice(0, n - l)
-            else:
-                indices_right = tuple(range(l, n))
-                slice_right = slice(l, None)
-
-        if reversed_flag:
-            # Flip everything around.
-            indices_left, indices_right = indices_right, indices_left
-            slice_left, slice_right = slice_right, slice_left
-
-        # Combine regions.
-        new_bounds = np.concatenate((new_bounds_left, new_bounds_right))
-        # Use slices if possible, but if we have two regions use indices.
-        if indices_left and indices_right:
-            indices = indices_left + indices_right
-        elif indices_left:
-            indices = slice_left
-        elif indices_right:
-            indices = slice_right
-        else:
-            indices = slice(0, 0)
-
-    if reversed_flag:
-        new_bounds = new_bounds[::-1, ::-1]
-
-    return new_bounds, indices
+    Return the overlap of each cell of the new grid with each cell of the
+    source grid, along a single axis.
 
+    Args:
 
-def _cartesian_area(y_bounds, x_bounds):
-    """
-    Return an array of the areas of each cell given two arrays
-    of cartesian bounds.
+    * src_bounds:
+        An (n, 2) shaped array of monotonic contiguous source bounds.
+    * grid_bounds:
+        An (m, 2) shaped array of the bounds of the new grid.
+    * grid_decreasing:
+        Boolean indicating whether the new grid is in descending order.
+    * length_func:
+        A function that returns the length of each interval, given arrays
+        of the lower and upper values of the intervals.
 
-    Args:
+    Kwargs:
 
-    * y_bounds:
-        An (n, 2) shaped NumPy array.
-    * x_bounds:
-        An (m, 2) shaped NumPy array.
+    * circular:
+        A boolean indicating whether the `src_bounds` are periodic. Default
+        is False.
 
     Returns:
-        An (n, m) shaped Numpy array of areas.
+        A tuple of an (m, n) shaped :class:`scipy.sparse.csr_matrix` of
+        overlaps, and a boolean array indicating which cells of the new grid
+        wrap around the source grid, and so cannot be calculated.
 
     """
-    heights = y_bounds[:, 1] - y_bounds[:, 0]
-    widths = x_bounds[:, 1] - x_bounds[:, 0]
-    return np.abs(np.outer(heights, widths))
-
-
-def _spherical_area(y_bounds, x_bounds, radius=1.0):
+    src_lower = src_bounds.min(axis=1)
+    src_upper = src_bounds.max(axis=1)
+    order = np.argsort(src_lower)
+    sorted_lower = src_lower[order]
+    sorted_upper = src_upper[order]
+
+    # Reverse lower and upper if the new grid is decreasing.
+    if grid_decreasing:
+        upper, lower = grid_bounds.T
+    else:
+        lower, upper = grid_bounds.T
+    # If lower > upper then we want [0]->upper and lower->[-1] in the case
+    # of wrapped longitudes. However if the src grid is not global (i.e.
+    # circular) this new cell would include a region outside of the extent
+    # of the src grid.
+    split = lower > upper
+    rows = np.arange(grid_bounds.shape[0])
+    rows = np.concatenate([rows, rows[split]])
+    lower = np.concatenate([np.where(split, -np.inf, lower), lower[split]])
+    upper = np.concatenate([upper, np.full(np.count_nonzero(split),
+                                           np.inf)])
+
+    # Determine the range of source cells that overlap each interval.
+    start = np.searchsorted(sorted_upper, lower, side='right')
+    stop = np.searchsorted(sorted_lower, upper, side='left')
+    counts = np.maximum(stop - start, 0)
+    offsets = np.cumsum(counts) - counts
+    rows = np.repeat(rows, counts)
+    cols = (np.arange(counts.sum()) - np.repeat(offsets, counts) +
+            np.repeat(start, counts))
+    cols = order[cols]
+    overlaps = length_func(
+        np.maximum(np.repeat(lower, counts), src_lower[cols]),
+        np.minimum(np.repeat(upper, counts), src_upper[cols]))
+
+    shape = (grid_bounds.shape[0], src_bounds.shape[0])
+    weights = coo_matrix((overlaps, (rows, cols)), shape=shape).tocsr()
+    outside_extent = split & (not circular)
+    return weights, outside_extent
+
+
+def _cartesian_lengths(lower, upper):
+    """Return the lengths of the given intervals."""
+    return upper - lower
+
+
+def _spherical_lengths(lower, upper):
     """
-    Return an array of the areas of each cell on a sphere
-    given two arrays of latitude and longitude bounds in radians.
-
-    Args:
-
-    * y_bounds:
-        An (n, 2) shaped NumPy array of latitide bounds in radians.
-    * x_bounds:
-        An (m, 2) shaped NumPy array of longitude bounds in radians.
-    * radius:
-        Radius of the sphere. Default is 1.0.
-
-    Returns:
-        An (n, m) shaped Numpy array of areas.
+    Return the lengths of the given latitude intervals, in radians,
+    projected onto the polar axis of a unit sphere. The area of a
+    latitude-longitude cell is the product of these lengths with its
+    longitude extent.
 
     """
-    return iris.analysis.cartography._quadrant_area(
-        y_bounds, x_bounds, radius)
-
-
-def _get_bounds_in_units(coord, units, dtype):
-    """Return a copy of coord's bounds in the specified units and dtype."""
-    # The bounds are cast to dtype before conversion to prevent issues when
-    # mixing float32 and float64 types.
-    return coord.units.convert(coord.bounds.astype(dtype), units).astype(dtype)
+    return np.sin(upper.astype(np.float64)) - np.sin(lower.astype(np.float64))
 
 
-def _weighted_mean_with_mdtol(data, weights, axis=None, mdtol=0):
+def _regrid_area_weighted_weights(src_x_bounds, src_y_bounds,
+                                  grid_x_bounds, grid_y_bounds,
+                                  grid_x_decreasing, grid_y_decreasing,
+                                  spherical, circular=False):
     """
-    Return the weighted mean of an array over the specified axis
-    using the provided weights (if any) and a permitted fraction of
-    masked data.
+    Return the area weights of each cell of the source grid within each
+    cell of the new grid.
 
     Args:
 
-    * data (array-like):
-        Data to be averaged.
-
-    * weights (array-like):
-        An array of the same shape as the data that specifies the contribution
-        of each corresponding data element to the calculated mean.
+    * src_x_bounds:
+        A NumPy array of bounds along the X axis defining the source grid.
+    * src_y_bounds:
+        A NumPy array of bounds along the Y axis defining the source grid.
+    * grid_x_bounds:
+        A NumPy array of bounds along the X axis defining the new grid.
+    * grid_y_bounds:
+        A NumPy array of bounds along the Y axis defining the new grid.
+    * grid_x_decreasing:
+        Boolean indicating whether the X coordinate of the new grid is
+        in descending order.
+    * grid_y_decreasing:
+        Boolean indicating whether the Y coordinate of the new grid is
+        in descending order.
+    * spherical:
+        Boolean indicating whether the bounds are latitudes and longitudes
+        in radians, rather than cartesian.
 
     Kwargs:
 
-    * axis (int or tuple of ints):
-        Axis along which the mean is computed. The default is to compute
-        the mean of the flattened array.
-
-    * mdtol (float):
-        Tolerance of missing data. The value returned in each element of the
-        returned array will be masked if the fraction of masked data exceeds
-        mdtol. This fraction is weighted by the `weights` array if one is
-        provided. mdtol=0 means no missing data is tolerated
-        while mdtol=1 will mean the resulting element will be masked if and
-        only if all the contributing elements of data are masked.
-        Defaults to 0.
+    * circular:
+        A boolean indicating whether the `src_x_bounds` are periodic. Default
+        is False.
 
     Returns:
-        Numpy array (possibly masked) or scalar.
+        A tuple of a :class:`scipy.sparse.csr_matrix` of weights, with a row
+        for each cell of the flattened (Y, X) new grid and a column for each
+        cell of the flattened (Y, X) source grid, and a boolean array of the
+        shape of the new grid indicating which cells lie either partially
+        or entirely outside of the extent of the source grid.
 
     """
-    res = ma.average(data, weights=weights, axis=axis)
-    if ma.isMaskedArray(data) and mdtol < 1:
-        weights_total = weights.sum(axis=axis)
-        masked_weights = weights.copy()
-        masked_weights[~ma.getmaskarray(data)] = 0
-        masked_weights_total = masked_weights.sum(axis=axis)
-        frac_masked = np.true_divide(masked_weights_total, weights_total)
-        mask_pt = frac_masked > mdtol
-        if np.any(mask_pt):
-            if np.isscalar(res):
-                res = ma.masked
-            elif ma.isMaskedArray(res):
-                res.mask |= mask_pt
-            else:
-                res = ma.masked_array(res, mask=mask_pt)
-    return res
-
-
-def _regrid_area_weighted_array(src_data, x_dim, y_dim,
-                                src_x_bounds, src_y_bounds,
-                                grid_x_bounds, grid_y_bounds,
-                                grid_x_decreasing, grid_y_decreasing,
-                                area_func, circular=False, mdtol=0):
+    y_length_func = _spherical_lengths if spherical else _cartesian_lengths
+    y_weights, y_outside = _overlap_weights(src_y_bounds, grid_y_bounds,
+                                            grid_y_decreasing, y_length_func,
+                                            circular=True)
+    x_weights, x_outside = _overlap_weights(src_x_bounds, grid_x_bounds,
+                                            grid_x_decreasing,
+                                            _cartesian_lengths,
+                                            circular=circular)
+    # Areas are separable into the product of the Y and X lengths.
+    weights = sparse_kron(y_weights, x_weights, format='csr')
+
+    # Determine which grid bounds are within src extent.
+    y_within_bounds = _within_bounds(src_y_bounds, grid_y_bounds,
+                                     grid_y_decreasing) & ~y_outside
+    x_within_bounds = _within_bounds(src_x_bounds, grid_x_bounds,
+                                     grid_x_decreasing) & ~x_outside
+    outside_extent = ~np.outer(y_within_bounds, x_within_bounds)
+    return weights, outside_extent
+
+
+def _regrid_area_weighted_array(src_data, x_dim, y_dim, weights_info,
+                                mdtol=0):
     """
     Regrid the given data from its source grid to a new grid using
     an area weighted mean to determine the resulting data values.
 
+    All of the dimensions other than X and Y are regridded together, in a
+    single sparse matrix product.
+
     .. note::
 
         Elements in the returned array that lie either partially
@@ -425,30 +333,12 @@ def _regrid_area_weighted_array(src_data, x_dim, y_dim,
         The X dimension within `src_data`.
     * y_dim:
         The Y dimension within `src_data`.
-    * src_x_bounds:
-        A NumPy array of bounds along the X axis defining the source grid.
-    * src_y_bounds:
-        A NumPy array of bounds along the Y axis defining the source grid.
-    * grid_x_bounds:
-        A NumPy array of bounds along the X axis defining the new grid.
-    * grid_y_bounds:
-        A NumPy array of bounds along the Y axis defining the new grid.
-    * grid_x_decreasing:
-        Boolean indicating whether the X coordinate of the new grid is
-        in descending order.
-    * grid_y_decreasing:
-        Boolean indicating whether the Y coordinate of the new grid is
-        in descending order.
-    * area_func:
-        A function that returns an (p, q) array of weights given an (p, 2)
-        shaped array of Y bounds and an (q, 2) shaped array of X bounds.
+    * weights_info:
+        The weights and extent of the new grid, as returned by
+        :func:`_regrid_area_weighted_weights`.
 
     Kwargs:
 
-    * circular:
-        A boolean indicating whether the `src_x_bounds` are periodic. Default
-        is False.
-
     * mdtol:
         Tolerance of missing data. The value returned in each element of the
         returned array will be masked if the fraction of missing data exceeds
@@ -464,161 +354,98 @@ def _regrid_area_weighted_array(src_data, x_dim, y_dim,
         grid.
 
     """
-    # Create empty data array to match the new grid.
-    # Note that dtype is not preserved and that the array is
-    # masked to allow for regions that do not overlap.
-    new_shape = list(src_data.shape)
-    if x_dim is not None:
-        new_shape[x_dim] = grid_x_bounds.shape[0]
-    if y_dim is not None:
-        new_shape[y_dim] = grid_y_bounds.shape[0]
+    weights, outside_extent = weights_info
+    grid_shape = outside_extent.shape
 
     # Flag to indicate whether the original data was a masked array.
     src_masked = ma.isMaskedArray(src_data)
     if src_masked:
-        new_data = ma.zeros(new_shape, fill_value=src_data.fill_value)
-    else:
-        new_data = ma.zeros(new_shape)
-    # Assign to mask to explode it, allowing indexed assignment.
-    new_data.mask = False
+        fill_value = src_data.fill_value
+
+    # Give any scalar X or Y coordinate a dimension of length one.
+    ndim = src_data.ndim
+    if x_dim is None:
+        src_data = src_data[..., np.newaxis]
+        x_dim = src_data.ndim - 1
+    if y_dim is None:
+        src_data = src_data[..., np.newaxis]
+        y_dim = src_data.ndim - 1
+
+    # Move the Y and X dimensions to the end and flatten all the others,
+    # giving an (N, M) array of M source grids.
+    dims = [dim for dim in range(src_data.ndim)
+            if dim not in (x_dim, y_dim)] + [y_dim, x_dim]
+    src_data = src_data.transpose(dims)
+    other_shape = src_data.shape[:-2]
+    src_data = src_data.reshape(-1, src_data.shape[-2] * src_data.shape[-1])
+    src_data = src_data.T
+
+    weights_total = np.asarray(weights.sum(axis=1))
+    mask = outside_extent.reshape(-1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if src_masked:
+            src_mask = ma.getmaskarray(src_data)
+            data = np.where(src_mask, 0, ma.getdata(src_data))
+            valid_total = weights * (~src_mask).astype(weights.dtype)
+            new_data = (weights * data) / valid_total
+            # Mask where all the contributing data is masked, or where the
+            # fraction of masked data exceeds the tolerance.
+            mask = mask | (valid_total == 0)
+            if mdtol < 1:
+                masked_total = weights * src_mask.astype(weights.dtype)
+                mask = mask | (masked_total / weights_total > mdtol)
+        else:
+            new_data = (weights * src_data) / weights_total
+    new_data = new_data.astype(np.float64)
+    mask = np.broadcast_to(mask, new_data.shape)
+
+    # Restore the shape and order of the dimensions.
+    def restore(array):
+        array = array.T.reshape(other_shape + grid_shape)
+        array = array.transpose(np.argsort(dims))
+        # Remove any dimensions given to scalar X or Y coordinates.
+        return np.ascontiguousarray(array[(Ellipsis,) +
+                                          (0,) * (array.ndim - ndim)])
+
+    new_data = restore(new_data)
+    mask = restore(mask)
+    if src_masked:
+        new_data = ma.masked_array(new_data, mask=mask,
+                                   fill_value=fill_value)
+    elif mask.any():
+        new_data = ma.masked_array(new_data, mask=mask)
 
-    indices = [slice(None)] * new_data.ndim
+    return new_data
 
-    # Determine which grid bounds are within src extent.
-    y_within_bounds = _within_bounds(src_y_bounds, grid_y_bounds,
-                                     grid_y_decreasing)
-    x_within_bounds = _within_bounds(src_x_bounds, grid_x_bounds,
-                                     grid_x_decreasing)
-
-    # Cache which src_bounds are within grid bounds
-    cached_x_bounds = []
-    cached_x_indices = []
-    for (x_0, x_1) in grid_x_bounds:
-        if grid_x_decreasing:
-            x_0, x_1 = x_1, x_0
-        x_bounds, x_indices = _cropped_bounds(src_x_bounds, x_0, x_1)
-        cached_x_bounds.append(x_bounds)
-        cached_x_indices.append(x_indices)
-
-    # Simple for loop approach.
-    for j, (y_0, y_1) in enumerate(grid_y_bounds):
-        # Reverse lower and upper if dest grid is decreasing.
-        if grid_y_decreasing:
-            y_0, y_1 = y_1, y_0
-        y_bounds, y_indices = _cropped_bounds(src_y_bounds, y_0, y_1)
-        for i, (x_0, x_1) in enumerate(grid_x_bounds):
-            # Reverse lower and upper if dest grid is decreasing.
-            if grid_x_decreasing:
-                x_0, x_1 = x_1, x_0
-            x_bounds = cached_x_bounds[i]
-            x_indices = cached_x_indices[i]
-
-            # Determine whether to mask element i, j based on overlap with
-            # src.
-            # If x_0 > x_1 then we want [0]->x_1 and x_0->[0] + mod in the case
-            # of wrapped longitudes. However if the src grid is not global
-            # (i.e. circular) this new cell would include a region outside of
-            # the extent of the src grid and should therefore be masked.
-            outside_extent = x_0 > x_1 and not circular
-            if (outside_extent or not y_within_bounds[j] or not
-                    x_within_bounds[i]):
-                # Mask out element(s) in new_data
-                if x_dim is not None:
-                    indices[x_dim] = i
-                if y_dim is not None:
-                    indices[y_dim] = j
-                new_data[tuple(indices)] = ma.masked
-            else:
-                # Calculate weighted mean of data points.
-                # Slice out relevant data (this may or may not be a view()
-                # depending on x_indices being a slice or not).
-                if x_dim is not None:
-                    indices[x_dim] = x_indices
-                if y_dim is not None:
-                    indices[y_dim] = y_indices
-                if isinstance(x_indices, tuple) and \
-                        isinstance(y_indices, tuple):
-                    raise RuntimeError('Cannot handle split bounds '
-                                       'in both x and y.')
-                data = src_data[tuple(indices)]
-
-                # Calculate weights based on areas of cropped bounds.
-                weights = area_func(y_bounds, x_bounds)
-
-                # Numpy 1.7 allows the axis keyword arg to be a tuple.
-                # If the version of NumPy is less than 1.7 manipulate the axes
-                # of the data so the x and y dimensions can be flattened.
-                if _NP_VERSION.minor < 7:
-                    if y_dim is not None and x_dim is not None:
-                        flattened_shape = list(data.shape)
-                        if y_dim > x_dim:
-                            data = np.rollaxis(data, y_dim, data.ndim)
-                            data = np.rollaxis(data, x_dim, data.ndim)
-                            del flattened_shape[y_dim]
-                            del flattened_shape[x_dim]
-                        else:
-                            data = np.rollaxis(data, x_dim, data.ndim)
-                            data = np.rollaxis(data, y_dim, data.ndim)
-                            del flattened_shape[x_dim]
-                            del flattened_shape[y_dim]
-                            weights = weights.T
-                        flattened_shape.append(-1)
-                        data = data.reshape(*flattened_shape)
-                    elif y_dim is not None:
-                        flattened_shape = list(data.shape)
-                        del flattened_shape[y_dim]
-                        flattened_shape.append(-1)
-                        data = data.swapaxes(y_dim, -1).reshape(
-                            *flattened_shape)
-                    elif x_dim is not None:
-                        flattened_shape = list(data.shape)
-                        del flattened_shape[x_dim]
-                        flattened_shape.append(-1)
-                        data = data.swapaxes(x_dim, -1).reshape(
-                            *flattened_shape)
-                    weights = weights.ravel()
-                    axis = -1
-                else:
-                    # Transpose weights to match dim ordering in data.
-                    weights_shape_y = weights.shape[0]
-                    weights_shape_x = weights.shape[1]
-                    if x_dim is not None and y_dim is not None and \
-                            x_dim < y_dim:
-                        weights = weights.T
-                    # Broadcast the weights array to allow numpy's ma.average
-                    # to be called.
-                    weights_padded_shape = [1] * data.ndim
-                    axes = []
-                    if y_dim is not None:
-                        weights_padded_shape[y_dim] = weights_shape_y
-                        axes.append(y_dim)
-                    if x_dim is not None:
-                        weights_padded_shape[x_dim] = weights_shape_x
-                        axes.append(x_dim)
-                    # Assign new shape to raise error on copy.
-                    weights.shape = weights_padded_shape
-                    # Broadcast weights to match shape of data.
-                    _, weights = np.broadcast_arrays(data, weights)
-                    # Axes of data over which the weighted mean is calculated.
-                    axis = tuple(axes)
-
-                # Calculate weighted mean taking into account missing data.
-                new_data_pt = _weighted_mean_with_mdtol(
-                    data, weights=weights, axis=axis, mdtol=mdtol)
-
-                # Insert data (and mask) values into new array.
-                if x_dim is not None:
-                    indices[x_dim] = i
-                if y_dim is not None:
-                    indices[y_dim] = j
-                new_data[tuple(indices)] = new_data_pt
-
-    # Remove new mask if original data was not masked
-    # and no values in the new array are masked.
-    if not src_masked and not new_data.mask.any():
-        new_data = new_data.data
 
-    return new_data
+def _lazy_regrid_area_weighted_array(src_data, x_dim, y_dim, weights_info,
+                                     mdtol=0):
+    """
+    Lazily regrid the given dask array, chunk by chunk over the dimensions
+    other than X and Y, with :func:`_regrid_area_weighted_array`.
+
+    As for all lazy data, masked values are represented by NaNs.
+
+    """
+    grid_shape = weights_info[1].shape
+    # Each chunk must hold the whole of the source grid.
+    chunks = list(src_data.chunks)
+    new_chunks = list(src_data.chunks)
+    for dim, size in ((y_dim, grid_shape[0]), (x_dim, grid_shape[1])):
+        if dim is not None:
+            chunks[dim] = (src_data.shape[dim],)
+            new_chunks[dim] = (size,)
+    src_data = src_data.rechunk(tuple(chunks))
+
+    def regrid_block(data):
+        if data.dtype.kind == 'f' and np.any(np.isnan(data)):
+            data = ma.masked_invalid(data)
+        result = _regrid_area_weighted_array(data, x_dim, y_dim,
+                                             weights_info, mdtol)
+        return array_masked_to_nans(result)
+
+    return da.map_blocks(regrid_block, src_data, chunks=tuple(new_chunks),
+                         dtype=np.float64)
 
 
 def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
@@ -663,9 +490,26 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
     Returns:
         A new :class:`iris.cube.Cube` instance.
 
+    """
+    regrid_info = _regrid_area_weighted_rectilinear_src_and_grid__prepare(
+        src_cube, grid_cube)
+    result = _regrid_area_weighted_rectilinear_src_and_grid__perform(
+        src_cube, regrid_info, mdtol)
+    return result
+
+
+def _regrid_area_weighted_rectilinear_src_and_grid__prepare(src_grid_cube,
+                                                            grid_cube):
+    """
+    First (setup) part of 'regrid_area_weighted_rectilinear_src_and_grid'.
+
+    Check inputs and calculate the sparse area weights and related info.
+    The 'regrid info' returned can be re-used over many cubes on the same
+    source grid.
+
     """
     # Get the 1d monotonic (or scalar) src and grid coordinates.
-    src_x, src_y = _get_xy_coords(src_cube)
+    src_x, src_y = _get_xy_coords(src_grid_cube)
     grid_x, grid_y = _get_xy_coords(grid_cube)
 
     # Condition 1: All x and y coordinates must have contiguous bounds to
@@ -683,22 +527,6 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
                          "and grid cubes must have the same coordinate "
                          "system.")
 
-    # Condition 3: cannot create vector coords from scalars.
-    src_x_dims = src_cube.coord_dims(src_x)
-    src_x_dim = None
-    if src_x_dims:
-        src_x_dim = src_x_dims[0]
-    src_y_dims = src_cube.coord_dims(src_y)
-    src_y_dim = None
-    if src_y_dims:
-        src_y_dim = src_y_dims[0]
-    if src_x_dim is None and grid_x.shape[0] != 1 or \
-            src_y_dim is None and grid_y.shape[0] != 1:
-        raise ValueError('The horizontal grid coordinates of source cube '
-                         'includes scalar coordinates, but the new grid does '
-                         'not. The new grid must not require additional data '
-                         'dimensions to be created.')
-
     # Determine whether to calculate flat or spherical areas.
     # Don't only rely on coord system as it may be None.
     spherical = (isinstance(src_cs, (iris.coord_systems.GeogCS,
@@ -738,24 +566,62 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
     # Determine whether the src_x coord has periodic boundary conditions.
     circular = getattr(src_x, 'circular', False)
 
-    # Use simple cartesian area function or one that takes into
-    # account the curved surface if coord system is spherical.
-    if spherical:
-        area_func = _spherical_area
-    else:
-        area_func = _cartesian_area
+    # Calculate the area weights, taking into account the curved surface
+    # if the coord system is spherical.
+    weights_info = _regrid_area_weighted_weights(src_x_bounds, src_y_bounds,
+                                                 grid_x_bounds, grid_y_bounds,
+                                                 grid_x_decreasing,
+                                                 grid_y_decreasing,
+                                                 spherical, circular)
+
+    # Create 2d meshgrids as required by _create_cube func.
+    meshgrid_x, meshgrid_y = _meshgrid(grid_x.points, grid_y.points)
+
+    regrid_info = (grid_x, grid_y, meshgrid_x, meshgrid_y, weights_info)
+    return regrid_info
+
+
+def _regrid_area_weighted_rectilinear_src_and_grid__perform(src_cube,
+                                                            regrid_info,
+                                                            mdtol):
+    """
+    Second (regrid) part of 'regrid_area_weighted_rectilinear_src_and_grid'.
+
+    Perform the prepared regrid calculation on a cube. Lazy data is
+    regridded lazily, chunk by chunk over the dimensions other than X
+    and Y.
+
+    """
+    grid_x, grid_y, meshgrid_x, meshgrid_y, weights_info = regrid_info
+    src_x, src_y = _get_xy_coords(src_cube)
+
+    # Condition 3: cannot create vector coords from scalars.
+    src_x_dims = src_cube.coord_dims(src_x)
+    src_x_dim = None
+    if src_x_dims:
+        src_x_dim = src_x_dims[0]
+    src_y_dims = src_cube.coord_dims(src_y)
+    src_y_dim = None
+    if src_y_dims:
+        src_y_dim = src_y_dims[0]
+    if src_x_dim is None and grid_x.shape[0] != 1 or \
+            src_y_dim is None and grid_y.shape[0] != 1:
+        raise ValueError('The horizontal grid coordinates of source cube '
+                         'includes scalar coordinates, but the new grid does '
+                         'not. The new grid must not require additional data '
+                         'dimensions to be created.')
 
     # Calculate new data array for regridded cube.
-    new_data = _regrid_area_weighted_array(src_cube.data, src_x_dim, src_y_dim,
-                                           src_x_bounds, src_y_bounds,
-                                           grid_x_bounds, grid_y_bounds,
-                                           grid_x_decreasing,
-                                           grid_y_decreasing,
-                                           area_func, circular, mdtol)
+    if src_cube.has_lazy_data():
+        new_data = _lazy_regrid_area_weighted_array(src_cube.lazy_data(),
+                                                    src_x_dim, src_y_dim,
+                                                    weights_info, mdtol)
+    else:
+        new_data = _regrid_area_weighted_array(src_cube.data,
+                                               src_x_dim, src_y_dim,
+                                               weights_info, mdtol)
 
     # Wrap up the data as a Cube.
-    # Create 2d meshgrids as required by _create_cube func.
-    meshgrid_x, meshgrid_y = _meshgrid(grid_x.points, grid_y.points)
     regrid_callback = RectilinearRegridder._regrid
     new_cube = RectilinearRegridder._create_cube(new_data, src_cube,
                                                  src_x_dim, src_y_dim,
@@ -29,6 +29,7 @@ import numpy as np
 
 from iris.exceptions import NotYetImplementedError
 from iris.fileformats._ff_cross_references import STASH_TRANS
+from iris.fileformats import _header_index
 from . import pp
 
 
@@ -674,14 +675,29 @@ class FF2PP(object):
 
             yield field
 
-    def _extract_field(self):
-        # FF table pointer initialisation based on FF LOOKUP table
-        # configuration.
+    def _lookup_headers(self):
+        """
+        Return the valid FF LOOKUP table entries, as a structured array of
+        PP headers.
+
+        The entries are read from the header index cache when possible, see
+        :mod:`iris.fileformats._header_index`.
+
+        """
+        table_index, table_entry_depth, table_count = \
+            self._ff_header.lookup_table
+        arrays, _ = _header_index.cached_index(
+            self._ff_header.ff_filename, 'ff', _scan_lookup_table,
+            word_depth=self._word_depth, table_index=int(table_index),
+            table_entry_depth=int(table_entry_depth),
+            table_count=int(table_count))
+        return arrays['headers']
 
-        lookup_table = self._ff_header.lookup_table
-        table_index, table_entry_depth, table_count = lookup_table
-        table_offset = (table_index - 1) * self._word_depth       # in bytes
-        table_entry_depth = table_entry_depth * self._word_depth  # in bytes
+    def _extract_field(self):
+        # Read all the valid FF LOOKUP table entries.
+        headers = self._lookup_headers()
+        header_longs = headers['longs']
+        header_floats = headers['floats']
         # Open the FF for processing.
         with open(self._ff_header.ff_filename, 'rb') as ff_file:
             ff_file_seek = ff_file.seek
@@ -690,28 +706,10 @@ class FF2PP(object):
 
             grid = self._ff_header.grid()
 
-            # Process each FF LOOKUP table entry.
-            while table_count:
-                table_count -= 1
-                # Move file pointer to the start of the current FF LOOKUP
-                # table entry.
-                ff_file_seek(table_offset, os.SEEK_SET)
-
-                # Read the current PP header entry from the FF LOOKUP table.
-                header_longs = np.fromfile(
-                    ff_file, dtype='>i{0}'.format(self._word_depth),
-                    count=pp.NUM_LONG_HEADERS)
-                # Check whether the current FF LOOKUP table entry is valid.
-                if header_longs[0] == _FF_LOOKUP_TABLE_TERMINATE:
-                    # There are no more FF LOOKUP table entries to read.
-                    break
-                header_floats = np.fromfile(
-                    ff_file, dtype='>f{0}'.format(self._word_depth),
-                    count=pp.NUM_FLOAT_HEADERS)
-                header = tuple(header_longs) + tuple(header_floats)
-
-                # Calculate next FF LOOKUP table entry.
-                table_offset += table_entry_depth
+            # Process each valid FF LOOKUP table entry.
+            for i_entry in range(len(headers)):
+                header = (tuple(header_longs[i_entry]) +
+                          tuple(header_floats[i_entry]))
 
                 # Construct a PPField object and populate using the header_data
                 # read from the current FF LOOKUP table.
@@ -802,6 +800,31 @@ class FF2PP(object):
         return pp._interpret_fields(self._extract_field())
 
 
+def _scan_lookup_table(filename, word_depth, table_index, table_entry_depth,
+                       table_count):
+    # Read the FF LOOKUP table, up to the first terminating entry, as a
+    # structured array of PP headers in native byte order.
+    header_dtype = np.dtype(
+        [('longs', '>i{}'.format(word_depth), (pp.NUM_LONG_HEADERS,)),
+         ('floats', '>f{}'.format(word_depth), (pp.NUM_FLOAT_HEADERS,))])
+    table_offset = (table_index - 1) * word_depth             # in bytes
+    table_entry_depth = table_entry_depth * word_depth        # in bytes
+    with open(filename, 'rb') as ff_file:
+        ff_file.seek(table_offset, os.SEEK_SET)
+        table = ff_file.read(table_entry_depth * table_count)
+    table_count = min(table_count, len(table) // table_entry_depth)
+    # Each entry may be longer than a PP header, so step over the entries.
+    headers = np.ndarray(table_count, dtype=header_dtype, buffer=table,
+                         strides=(table_entry_depth,))
+    terminated, = np.nonzero(headers['longs'][:, 0] ==
+                             _FF_LOOKUP_TABLE_TERMINATE)
+    if terminated.size:
+        # There are no more FF LOOKUP table entries to read.
+        headers = headers[:terminated[0]]
+    headers = headers.astype(header_dtype.newbyteorder('='))
+    return {'headers': headers}, None
+
+
 def load_cubes(filenames, callback, constraints=None):
     """
     Loads cubes from a list of fields files filenames.
@@ -827,8 +850,8 @@ def load_cubes(filenames, callback, constraints=None):
             :func:`iris.fileformats.ff.load_cubes`.
 
     """
-    return pp._load_cubes_variable_loader(filenames, callback, FF2PP,
-                                          constraints=constraints)
+    from iris.fileformats.um import load_cubes as um_load_cubes
+    return um_load_cubes(filenames, callback, constraints=constraints)
 
 
 def load_cubes_32bit_ieee(filenames, callback, constraints=None):
@@ -845,6 +868,5 @@ def load_cubes_32bit_ieee(filenames, callback, constraints=None):
             in place of :func:`iris.fileformats.ff.load_cubes_32bit_ieee`.
 
     """
-    return pp._load_cubes_variable_loader(filenames, callback, FF2PP,
-                                          {'word_depth': 4},
-                                          constraints=constraints)
+    from iris.fileformats.um import load_cubes_32bit_ieee as um_load_cubes
+    return um_load_cubes(filenames, callback, constraints=constraints)
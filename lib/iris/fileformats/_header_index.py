@@ -0,0 +1,295 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+A persistent, on-disk cache of the decoded field headers of PP and
+FieldsFiles.
+
+Loading a PP or FieldsFile first scans the file to decode all of its field
+headers.  When a cache directory is configured, the resulting header arrays
+are saved there, and later loads of the same unchanged file read them back
+instead of scanning the file again.
+
+The cache directory is set by the ``header_index_dir`` option of the
+``[Resources]`` section of the Iris ``site.cfg``, or with
+:meth:`_CacheControl.context`.  Caching is disabled when no directory is set.
+
+A cached index is only used if the indexed file still has the same absolute
+path, size and modification time, and the index was made by the same
+version of the index format, with the same reading options.  Otherwise the
+file is scanned again and its cached index replaced.  Unreadable cache
+entries are ignored.  The cache directory is created if it does not exist,
+and if it cannot be written then indexes are not cached, with a warning.
+
+Indexes can be built in advance for all the PP and FieldsFiles in a
+directory tree, with :func:`build_indexes` or the command::
+
+    python -m iris.fileformats._header_index [--cache-dir DIR] PATH [PATH ...]
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+import six
+
+import argparse
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+
+import numpy as np
+
+import iris.config
+
+
+#: The version of the cached index format.  Cached indexes made by any other
+#: version are ignored.
+INDEX_VERSION = 1
+
+# The key of the index description within a cache file.
+_DESCRIPTION_KEY = '__description__'
+
+# The cache directories which could not be written, and have been warned of.
+_UNWRITABLE_DIRS = set()
+
+
+class _CacheControl(threading.local):
+    """The current header index cache settings."""
+    def __init__(self):
+        #: The cache directory, or None if caching is disabled.
+        self.cache_dir = iris.config.HEADER_INDEX_DIR
+
+    @contextmanager
+    def context(self, cache_dir):
+        """
+        A context manager to temporarily set the cache directory.
+
+        Args:
+
+        * cache_dir (string or None):
+            The directory in which to store cached indexes, or None to
+            disable caching.
+
+        """
+        old_cache_dir = self.cache_dir
+        self.cache_dir = cache_dir
+        try:
+            yield
+        finally:
+            self.cache_dir = old_cache_dir
+
+
+CACHE_CONTROL = _CacheControl()
+
+
+def _cache_path(cache_dir, path, kind):
+    # The name of the cache file for a file is a hash of its absolute path.
+    digest = hashlib.sha1(path.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, '{}.{}.npz'.format(digest, kind))
+
+
+def _description(path, kind, params):
+    # Describe a file and how it was indexed, as a cached index must match.
+    stat = os.stat(path)
+    return {'version': INDEX_VERSION, 'path': path, 'kind': kind,
+            'size': stat.st_size, 'mtime': stat.st_mtime,
+            'params': params}
+
+
+def _read(cache_path, description):
+    # Return the cached arrays and message, or None if unusable.
+    result = None
+    try:
+        with np.load(cache_path, allow_pickle=False) as cached:
+            cached_description = json.loads(str(cached[_DESCRIPTION_KEY]))
+            message = cached_description.pop('message')
+            if cached_description == description:
+                arrays = {name: cached[name] for name in cached.files
+                          if name != _DESCRIPTION_KEY}
+                result = arrays, message
+    except Exception:
+        # Any unreadable cache file is simply ignored.
+        pass
+    return result
+
+
+def _write(cache_path, description, arrays, message):
+    # Write a cache file atomically, so that concurrent readers only ever
+    # see complete files.
+    description = dict(description, message=message)
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        # N.B. os.makedirs has no 'exist_ok' in Python 2.
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        handle, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except (IOError, OSError) as err:
+        if cache_dir not in _UNWRITABLE_DIRS:
+            _UNWRITABLE_DIRS.add(cache_dir)
+            warnings.warn('Unable to write to the header index cache '
+                          'directory {!r}: {}'.format(cache_dir, err))
+        return
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            contents = dict(arrays)
+            contents[_DESCRIPTION_KEY] = np.array(json.dumps(description))
+            np.savez(temp_file, **contents)
+        # N.B. os.rename does not replace an existing file on Windows.
+        if os.path.exists(cache_path) and os.name == 'nt':
+            os.remove(cache_path)
+        os.rename(temp_path, cache_path)
+    except (IOError, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def cached_index(filename, kind, scan, **params):
+    """
+    Return the header index arrays of a file, using the cache if possible.
+
+    Args:
+
+    * filename (string):
+        The file to index.
+    * kind (string):
+        An identifier of the type of index, e.g. 'pp'.
+    * scan (callable):
+        The function which indexes a file, as ``scan(filename, **params)``.
+        This returns a dictionary of named arrays, and a warning message
+        describing any problem with the file, or None.
+
+    Kwargs:
+
+    * params:
+        Any options which affect the resulting index.  These must be JSON
+        serialisable.
+
+    Returns:
+        The dictionary of named arrays, and the warning message.
+
+    """
+    cache_dir = CACHE_CONTROL.cache_dir
+    result = None
+    if cache_dir is not None and os.path.isfile(filename):
+        path = os.path.abspath(filename)
+        cache_path = _cache_path(cache_dir, path, kind)
+        description = _description(path, kind, params)
+        result = _read(cache_path, description)
+        if result is None:
+            result = scan(filename, **params)
+            _write(cache_path, description, *result)
+    if result is None:
+        result = scan(filename, **params)
+    return result
+
+
+def build_indexes(paths, cache_dir=None):
+    """
+    Build the cached header indexes of PP and FieldsFiles.
+
+    Args:
+
+    * paths (string or list of string):
+        Files, or directories which are searched recursively.  Files which
+        are not PP or FieldsFiles are ignored.
+
+    Kwargs:
+
+    * cache_dir (string):
+        The cache directory.  Defaults to the currently configured one.
+        It is created if it does not exist.
+
+    Returns:
+        A list of the files which were indexed.
+
+    """
+    from iris.fileformats import FORMAT_AGENT
+    from iris.fileformats.pp import load_cubes as pp_load_cubes
+    from iris.fileformats.pp import load_cubes_little_endian
+    from iris.fileformats.pp import _index_fields
+    from iris.fileformats._ff import FF2PP
+    from iris.fileformats.um import load_cubes as ff_load_cubes
+    from iris.fileformats.um import load_cubes_32bit_ieee
+
+    if cache_dir is None:
+        cache_dir = CACHE_CONTROL.cache_dir
+    if cache_dir is None:
+        raise ValueError('No header index cache directory is configured.')
+    if isinstance(paths, six.string_types):
+        paths = [paths]
+    # Create the cache directory here, so that any failure is an error
+    # rather than a warning.
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    def iter_files():
+        for path in paths:
+            if os.path.isdir(path):
+                for dirpath, _, filenames in os.walk(path):
+                    for filename in sorted(filenames):
+                        yield os.path.join(dirpath, filename)
+            else:
+                yield path
+
+    indexed = []
+    with CACHE_CONTROL.context(cache_dir):
+        for filename in iter_files():
+            try:
+                with open(filename, 'rb') as fh:
+                    handler = FORMAT_AGENT.get_spec(
+                        os.path.basename(filename), fh).handler
+            except (EOFError, IOError, OSError, ValueError):
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                if handler is pp_load_cubes:
+                    _index_fields(filename)
+                elif handler is load_cubes_little_endian:
+                    _index_fields(filename, little_ended=True)
+                elif handler is ff_load_cubes:
+                    FF2PP(filename)._lookup_headers()
+                elif handler is load_cubes_32bit_ieee:
+                    FF2PP(filename, word_depth=4)._lookup_headers()
+                else:
+                    continue
+            indexed.append(filename)
+    return indexed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m iris.fileformats._header_index',
+        description='Build the cached header indexes of PP and FieldsFiles.')
+    parser.add_argument('paths', nargs='+', metavar='PATH',
+                        help='a file, or a directory to search recursively')
+    parser.add_argument('--cache-dir',
+                        help='the cache directory (default: the '
+                             'header_index_dir configured for Iris)')
+    args = parser.parse_args(args)
+    try:
+        indexed = build_indexes(args.paths, cache_dir=args.cache_dir)
+    except ValueError as err:
+        parser.error(str(err))
+    for filename in indexed:
+        print(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+A compiled translation of the CF->cube rules of the netCDF loader.
+
+The forward chaining rules of the PyKE rule base
+``iris/fileformats/_pyke_rules/fc_rules_cf.krb`` are applied here as plain
+Python, in the order in which the PyKE inference engine runs them, rather
+than by inference.  The helper functions and constants of the ``fc_extras``
+section of the rule base, which build the cube metadata, coordinate systems,
+coordinates and cell measures, are compiled from the rule base itself, just
+as PyKE compiles them, so both translations share a single implementation
+of each.
+
+An :class:`Engine` stands in for the PyKE knowledge engine of
+:func:`iris.fileformats.netcdf._load_cube`.  It is used for the cubes of one
+file, and classifies each CF-netCDF variable of that file only once.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+import six
+
+from collections import defaultdict, namedtuple
+import os.path
+import textwrap
+import types
+
+import iris.fileformats.pp
+
+
+# The PyKE rule base that is translated.
+_RULE_BASE_PATH = os.path.join(os.path.dirname(__file__), '_pyke_rules',
+                               'fc_rules_cf.krb')
+
+# The module of the helper functions and constants of the rule base, once
+# compiled.
+_HELPERS = None
+
+# The grid mapping rules, in rule base order.  Each gives the kind of
+# coordinate system provided, and the names in the rule base of its grid
+# mapping name constant, its coordinate system builder and any check of its
+# parameters.
+_GRID_MAPPING_RULES = (
+    ('rotated_latitude_longitude', 'CF_GRID_MAPPING_ROTATED_LAT_LON',
+     'build_rotated_coordinate_system', None),
+    ('latitude_longitude', 'CF_GRID_MAPPING_LAT_LON',
+     'build_coordinate_system', None),
+    ('transverse_mercator', 'CF_GRID_MAPPING_TRANSVERSE',
+     'build_transverse_mercator_coordinate_system', None),
+    ('mercator', 'CF_GRID_MAPPING_MERCATOR',
+     'build_mercator_coordinate_system',
+     'has_supported_mercator_parameters'),
+    ('stereographic', 'CF_GRID_MAPPING_STEREO',
+     'build_stereographic_coordinate_system',
+     'has_supported_stereographic_parameters'),
+    ('lambert_conformal', 'CF_GRID_MAPPING_LAMBERT_CONFORMAL',
+     'build_lambert_conformal_coordinate_system', None),
+    ('lambert_azimuthal_equal_area', 'CF_GRID_MAPPING_LAMBERT_AZIMUTHAL',
+     'build_lambert_azimuthal_equal_area_coordinate_system', None),
+)
+
+# The rules which classify the CF coordinates, in rule base order, as the
+# rule name, the kind of coordinate provided and the name of its check.
+_COORDINATE_RULES = (
+    ('fc_provides_coordinate_latitude', 'latitude', 'is_latitude'),
+    ('fc_provides_coordinate_longitude', 'longitude', 'is_longitude'),
+    ('fc_provides_projection_x_coordinate', 'projection_x_coordinate',
+     'is_projection_x_coordinate'),
+    ('fc_provides_projection_y_coordinate', 'projection_y_coordinate',
+     'is_projection_y_coordinate'),
+    ('fc_provides_coordinate_time', 'time', 'is_time'),
+    ('fc_provides_coordinate_time_period', 'time_period', 'is_time_period'),
+)
+
+# The CF auxiliary coordinate rules, in rule base order, as the rule name,
+# the checks which must hold, as pairs of check name and expected result,
+# and the name of any coordinate name constant.
+_AUX_COORDINATE_RULES = (
+    ('fc_build_auxiliary_coordinate_time', (('is_time', True),), None),
+    ('fc_build_auxiliary_coordinate_time_period',
+     (('is_time_period', True),), None),
+    ('fc_build_auxiliary_coordinate_latitude',
+     (('is_latitude', True), ('is_rotated_latitude', False)),
+     'CF_VALUE_STD_NAME_LAT'),
+    ('fc_build_auxiliary_coordinate_latitude_rotated',
+     (('is_latitude', True), ('is_rotated_latitude', True)),
+     'CF_VALUE_STD_NAME_GRID_LAT'),
+    ('fc_build_auxiliary_coordinate_longitude',
+     (('is_longitude', True), ('is_rotated_longitude', False)),
+     'CF_VALUE_STD_NAME_LON'),
+    ('fc_build_auxiliary_coordinate_longitude_rotated',
+     (('is_longitude', True), ('is_rotated_longitude', True)),
+     'CF_VALUE_STD_NAME_GRID_LON'),
+    ('fc_build_auxiliary_coordinate',
+     (('is_time', False), ('is_time_period', False), ('is_latitude', False),
+      ('is_longitude', False)),
+     None),
+)
+
+# The coordinate system requirement of the dimension coordinate rules which
+# apply only when there is no latitude-longitude coordinate system, rotated
+# or otherwise.
+_NO_LAT_LON_CS = 'no_lat_lon_cs'
+
+# The CF coordinate rules, in rule base order, as the rule name, the kind of
+# coordinate, the kind of coordinate system required, if any, the rotation
+# check which must hold, if any, and the name of any coordinate name
+# constant.  Where a kind of coordinate system is required, it is also the
+# coordinate system of the coordinate.
+_DIM_COORDINATE_RULES = (
+    ('fc_build_coordinate_latitude', 'latitude', 'latitude_longitude',
+     ('is_rotated_latitude', False), 'CF_VALUE_STD_NAME_LAT'),
+    ('fc_build_coordinate_latitude_rotated', 'latitude',
+     'rotated_latitude_longitude', ('is_rotated_latitude', True),
+     'CF_VALUE_STD_NAME_GRID_LAT'),
+    ('fc_build_coordinate_longitude', 'longitude', 'latitude_longitude',
+     ('is_rotated_longitude', False), 'CF_VALUE_STD_NAME_LON'),
+    ('fc_build_coordinate_longitude_rotated', 'longitude',
+     'rotated_latitude_longitude', ('is_rotated_longitude', True),
+     'CF_VALUE_STD_NAME_GRID_LON'),
+    ('fc_build_coordinate_latitude_nocs', 'latitude', _NO_LAT_LON_CS, None,
+     'CF_VALUE_STD_NAME_LAT'),
+    ('fc_build_coordinate_longitude_nocs', 'longitude', _NO_LAT_LON_CS, None,
+     'CF_VALUE_STD_NAME_LON'),
+) + tuple(
+    ('fc_build_coordinate_projection_{}_{}'.format(axis, cs_kind),
+     'projection_{}_coordinate'.format(axis), cs_kind, None,
+     'CF_VALUE_STD_NAME_PROJ_{}'.format(axis.upper()))
+    for cs_kind in ('transverse_mercator', 'lambert_conformal', 'mercator',
+                    'stereographic', 'lambert_azimuthal_equal_area')
+    for axis in ('x', 'y')
+) + (
+    ('fc_build_coordinate_time', 'time', None, None, None),
+    ('fc_build_coordinate_time_period', 'time_period', None, None, None),
+)
+
+# The formula types recognised from the standard name of a formula root, in
+# rule base order.
+_FORMULA_TYPES = ('atmosphere_hybrid_height_coordinate',
+                  'atmosphere_hybrid_sigma_pressure_coordinate',
+                  'ocean_sigma_z_coordinate',
+                  'ocean_sigma_coordinate',
+                  'ocean_s_coordinate',
+                  'ocean_s_coordinate_g1',
+                  'ocean_s_coordinate_g2')
+
+# The names of all the rules, in rule base order.
+_RULE_NAMES = (
+    ('fc_default',) +
+    tuple('fc_provides_grid_mapping_{}'.format(cs_kind)
+          for cs_kind, _, _, _ in _GRID_MAPPING_RULES) +
+    tuple(rule for rule, _, _ in _COORDINATE_RULES) +
+    ('fc_build_label_coordinate',) +
+    tuple(rule for rule, _, _ in _AUX_COORDINATE_RULES) +
+    ('fc_build_cell_measure',) +
+    tuple(rule for rule, _, _, _, _ in _DIM_COORDINATE_RULES) +
+    ('fc_default_coordinate', 'fc_attribute_ukmo__um_stash_source',
+     'fc_attribute_ukmo__process_flags') +
+    tuple('fc_formula_type_{}'.format(formula_type)
+          for formula_type in _FORMULA_TYPES) +
+    ('fc_formula_terms',))
+
+# A view of the facts of an engine, as used by the netCDF loader statistics.
+_FactBase = namedtuple('_FactBase', 'entity_lists')
+_FactList = namedtuple('_FactList', 'case_specific_facts')
+
+
+def _helpers():
+    """
+    Return a module of the helper functions and constants of the
+    ``fc_extras`` section of the rule base, compiling it on first use.
+
+    """
+    global _HELPERS
+    if _HELPERS is None:
+        with open(_RULE_BASE_PATH) as rule_base:
+            lines = rule_base.read().expandtabs().splitlines()
+        start = lines.index('fc_extras') + 1
+        # Pad with blank lines, so that tracebacks give the line numbers of
+        # the rule base.
+        source = '\n' * start + textwrap.dedent('\n'.join(lines[start:]))
+        module = types.ModuleType('fc_rules_cf_extras')
+        six.exec_(compile(source, _RULE_BASE_PATH, 'exec'), module.__dict__)
+        _HELPERS = module
+    return _HELPERS
+
+
+class Engine(object):
+    """
+    Translates CF-netCDF data variables into cubes with the rules of
+    ``fc_rules_cf.krb``, in place of a PyKE knowledge engine.
+
+    """
+    def __init__(self):
+        #: The rule base helper functions and constants.
+        self.helpers = _helpers()
+        # The results of the checks of the CF-netCDF variables of the file,
+        # by check name, variable name and any further check arguments.
+        self._checks = {}
+        self.reset()
+
+    def reset(self):
+        """Discard all the facts about the current CF-netCDF variable."""
+        self.facts = defaultdict(list)
+
+    def add_case_specific_fact(self, kb_name, fact_name, args):
+        """Assert a fact about the current CF-netCDF variable."""
+        facts = self.facts[fact_name]
+        if args not in facts:
+            facts.append(args)
+
+    def check(self, check_name, cf_name, *args):
+        """
+        Return the result of a rule base check of a CF-netCDF variable of
+        the file.
+
+        """
+        key = (check_name, cf_name) + args
+        if key not in self._checks:
+            check = getattr(self.helpers, check_name)
+            self._checks[key] = check(self, cf_name, *args)
+        return self._checks[key]
+
+    def activate(self, rb_name):
+        """Apply all the rules to the current CF-netCDF variable."""
+        _apply_rules(self)
+
+    def get_kb(self, kb_name):
+        """Return the facts about the current CF-netCDF variable."""
+        return _FactBase({name: _FactList(facts)
+                          for name, facts in six.iteritems(self.facts)})
+
+    def print_stats(self):
+        """Print the statistics of the current CF-netCDF variable."""
+        print('Compiled rules: {} triggered'.format(
+            len(self.rule_triggered)))
+
+
+def _provides(engine, *args):
+    return args in engine.facts['provides']
+
+
+def _apply_rules(engine):
+    """Apply the rules of the rule base, in the order PyKE runs them."""
+    helpers = engine.helpers
+    cf_var = engine.cf_var
+    cf_group = cf_var.cf_group
+    facts = engine.facts
+    triggered = engine.rule_triggered.add
+
+    helpers.build_cube_metadata(engine)
+    triggered('fc_default')
+
+    for cs_kind, mapping, builder, supported in _GRID_MAPPING_RULES:
+        for grid_mapping, in facts['grid_mapping']:
+            if not engine.check('is_grid_mapping', grid_mapping,
+                                getattr(helpers, mapping)):
+                continue
+            if supported is not None and \
+                    not getattr(helpers, supported)(engine, grid_mapping):
+                continue
+            cf_grid_var = cf_group.grid_mappings[grid_mapping]
+            build = getattr(helpers, builder)
+            # Only the latitude-longitude builder does without the engine.
+            if cs_kind == 'latitude_longitude':
+                coord_system = build(cf_grid_var)
+            else:
+                coord_system = build(engine, cf_grid_var)
+            engine.provides['coordinate_system'] = coord_system
+            engine.add_case_specific_fact(
+                None, 'provides', ('coordinate_system', cs_kind))
+            triggered('fc_provides_grid_mapping_{}'.format(cs_kind))
+
+    for rule, kind, check in _COORDINATE_RULES:
+        for coordinate, in facts['coordinate']:
+            if engine.check(check, coordinate):
+                engine.add_case_specific_fact(
+                    None, 'provides', ('coordinate', kind, coordinate))
+                triggered(rule)
+
+    for coordinate, in facts['label']:
+        helpers.build_auxiliary_coordinate(engine, cf_group.labels[coordinate])
+        triggered('fc_build_label_coordinate')
+
+    for rule, checks, coord_name in _AUX_COORDINATE_RULES:
+        if coord_name is not None:
+            coord_name = getattr(helpers, coord_name)
+        for coordinate, in facts['auxiliary_coordinate']:
+            if all(engine.check(check, coordinate) == expected
+                   for check, expected in checks):
+                cf_coord_var = cf_group.auxiliary_coordinates[coordinate]
+                helpers.build_auxiliary_coordinate(engine, cf_coord_var,
+                                                   coord_name=coord_name)
+                triggered(rule)
+
+    for coordinate, in facts['cell_measure']:
+        helpers.build_cell_measures(engine, cf_group.cell_measures[coordinate])
+        triggered('fc_build_cell_measure')
+
+    for rule, kind, cs_kind, rotation, coord_name in _DIM_COORDINATE_RULES:
+        if cs_kind == _NO_LAT_LON_CS:
+            if _provides(engine, 'coordinate_system', 'latitude_longitude') \
+                    or _provides(engine, 'coordinate_system',
+                                 'rotated_latitude_longitude'):
+                continue
+        elif cs_kind is not None:
+            if not _provides(engine, 'coordinate_system', cs_kind):
+                continue
+        if coord_name is not None:
+            coord_name = getattr(helpers, coord_name)
+        for fact in facts['provides']:
+            if fact[:2] != ('coordinate', kind):
+                continue
+            coordinate = fact[2]
+            if rotation is not None:
+                check, expected = rotation
+                if engine.check(check, coordinate) != expected:
+                    continue
+            coord_system = None
+            if cs_kind not in (None, _NO_LAT_LON_CS):
+                coord_system = engine.provides['coordinate_system']
+            helpers.build_dimension_coordinate(
+                engine, cf_group.coordinates[coordinate],
+                coord_name=coord_name, coord_system=coord_system)
+            triggered(rule)
+
+    for coordinate, in facts['coordinate']:
+        if any(fact[0] == 'coordinate' and fact[2] == coordinate
+               for fact in facts['provides']):
+            continue
+        helpers.build_dimension_coordinate(
+            engine, cf_group.coordinates[coordinate])
+        engine.add_case_specific_fact(
+            None, 'provides', ('coordinate', 'miscellaneous', coordinate))
+        triggered('fc_default_coordinate')
+
+    if hasattr(cf_var, 'ukmo__um_stash_source') or \
+            hasattr(cf_var, 'um_stash_source'):
+        attr_value = getattr(cf_var, 'um_stash_source', None) or \
+            getattr(cf_var, 'ukmo__um_stash_source')
+        engine.cube.attributes['STASH'] = \
+            iris.fileformats.pp.STASH.from_msi(attr_value)
+        triggered('fc_attribute_ukmo__um_stash_source')
+
+    if hasattr(cf_var, 'ukmo__process_flags'):
+        attr_value = cf_var.ukmo__process_flags
+        engine.cube.attributes['ukmo__process_flags'] = tuple(
+            [x.replace('_', ' ') for x in attr_value.split(' ')])
+        triggered('fc_attribute_ukmo__process_flags')
+
+    for formula_type in _FORMULA_TYPES:
+        for coordinate, in facts['formula_root']:
+            if getattr(cf_group[coordinate], 'standard_name') == \
+                    formula_type:
+                engine.requires['formula_type'] = formula_type
+                engine.add_case_specific_fact(None, 'formula_type',
+                                              (formula_type,))
+                triggered('fc_formula_type_{}'.format(formula_type))
+
+    for coordinate, in facts['formula_root']:
+        for var_name, root, term in facts['formula_term']:
+            if root == coordinate:
+                engine.requires.setdefault('formula_terms', {})[term] = \
+                    var_name
+                triggered('fc_formula_terms')
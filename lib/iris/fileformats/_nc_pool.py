@@ -0,0 +1,219 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+A process-wide pool of open, read-only netCDF4 datasets.
+
+Lazy netCDF data is read through many small
+:class:`iris.fileformats.netcdf.NetCDFDataProxy` accesses, typically one per
+dask chunk.  Opening a dataset parses the whole file header, so instead of
+opening and closing the file for every access, datasets are kept open in a
+least-recently-used pool, shared with :class:`iris.fileformats.cf.CFReader`.
+
+The pool is thread-safe.  Accesses to the same dataset are serialised, as the
+netCDF library is not itself thread-safe.  After a fork, a child process
+discards the datasets inherited from its parent and opens its own.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import os
+import threading
+
+import netCDF4
+
+
+#: The default maximum number of datasets held open by the pool.
+MAX_OPEN_DATASETS = 64
+
+
+class _PoolEntry(object):
+    # An open dataset, with its own lock and a count of current users.
+    __slots__ = ('dataset', 'lock', 'users', 'stamp')
+
+    def __init__(self, dataset, stamp):
+        self.dataset = dataset
+        self.lock = threading.RLock()
+        self.users = 0
+        self.stamp = stamp
+
+
+def _file_stamp(path):
+    # Identify the state of a file, so that changes on disk can be detected.
+    # Remote (e.g. OPeNDAP) resources have no stamp.
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        result = None
+    else:
+        result = (stat.st_ino, stat.st_mtime, stat.st_size)
+    return result
+
+
+class DatasetPool(object):
+    """
+    A thread-safe, least-recently-used pool of open netCDF4 datasets,
+    keyed by path.
+
+    Datasets which are in use are never closed by the pool, so the number of
+    open datasets may temporarily exceed :attr:`max_open`.
+
+    """
+    def __init__(self, max_open=MAX_OPEN_DATASETS):
+        #: The maximum number of unused datasets to keep open.
+        self.max_open = max_open
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._pid = os.getpid()
+
+    def __getstate__(self):
+        # Open datasets cannot be pickled : an unpickled pool starts empty.
+        return {'max_open': self.max_open}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(path):
+        path = os.path.expanduser(path)
+        if os.path.exists(path):
+            path = os.path.abspath(path)
+        return path
+
+    def _check_pid(self):
+        # Datasets inherited across a fork share file state with the parent
+        # process, so are abandoned rather than used or closed.
+        pid = os.getpid()
+        if pid != self._pid:
+            self._lock = threading.RLock()
+            self._entries = OrderedDict()
+            self._pid = pid
+
+    def _close_unused(self, max_open):
+        # Close least-recently-used datasets, down to the given number.
+        excess = len(self._entries) - max_open
+        if excess > 0:
+            for key, entry in list(self._entries.items()):
+                if excess <= 0:
+                    break
+                if entry.users == 0:
+                    del self._entries[key]
+                    entry.dataset.close()
+                    excess -= 1
+
+    def _acquire(self, path):
+        # Return the pool entry for a path, marking it as in use.
+        self._check_pid()
+        key = self._key(path)
+        stamp = _file_stamp(key)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry.stamp != stamp and \
+                    entry.users == 0:
+                # The file has changed since it was opened.
+                entry.dataset.close()
+                entry = None
+            if entry is None:
+                dataset = netCDF4.Dataset(key, mode='r')
+                entry = _PoolEntry(dataset, stamp)
+            entry.users += 1
+            # (Re-)insert as the most recently used entry.
+            self._entries[key] = entry
+            self._close_unused(self.max_open)
+        return entry
+
+    def acquire(self, path):
+        """
+        Return the open dataset for a path, marking it as in use.
+
+        Each call must be paired with a call to :meth:`release`.
+
+        """
+        return self._acquire(path).dataset
+
+    def release(self, path):
+        """Mark the dataset for a path as no longer in use by the caller."""
+        self._check_pid()
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.users > 0:
+                entry.users -= 1
+            self._close_unused(self.max_open)
+
+    @contextmanager
+    def dataset(self, path):
+        """
+        A context manager providing exclusive use of the open dataset for a
+        path.
+
+        """
+        entry = self._acquire(path)
+        try:
+            with entry.lock:
+                yield entry.dataset
+        finally:
+            self.release(path)
+
+    def lock(self, path):
+        """
+        Return the lock which serialises accesses to the dataset for a path.
+
+        The dataset must be in use by the caller, i.e. acquired with
+        :meth:`acquire`.
+
+        """
+        self._check_pid()
+        key = self._key(path)
+        with self._lock:
+            return self._entries[key].lock
+
+    def discard(self, path):
+        """
+        Close the dataset for a path, if it is open.
+
+        This is needed before a file can be re-opened for writing.  An
+        IOError is raised if the dataset is in use.
+
+        """
+        self._check_pid()
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.users > 0:
+                    msg = 'Cannot replace {!r}, as it is currently open ' \
+                        'for reading.'.format(key)
+                    raise IOError(msg)
+                del self._entries[key]
+                entry.dataset.close()
+
+    def clear(self):
+        """Close all unused datasets."""
+        self._check_pid()
+        with self._lock:
+            self._close_unused(0)
+
+
+#: The process-wide dataset pool.
+DATASET_POOL = DatasetPool()
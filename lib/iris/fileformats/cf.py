@@ -40,6 +40,7 @@ import numpy as np
 import numpy.ma as ma
 
 from iris._deprecation import warn_deprecated
+from iris.fileformats._nc_pool import DATASET_POOL
 import iris.util
 
 
@@ -934,18 +935,21 @@ class CFReader(object):
         #: Collection of CF-netCDF variables associated with this netCDF file
         self.cf_group = CFGroup()
 
-        self._dataset = netCDF4.Dataset(self._filename, mode='r')
-
-        # Issue load optimisation warning.
-        if warn and self._dataset.file_format in ['NETCDF3_CLASSIC', 'NETCDF3_64BIT']:
-            warnings.warn('Optimise CF-netCDF loading by converting data from NetCDF3 ' \
-                          'to NetCDF4 file format using the "nccopy" command.')
+        self._dataset = DATASET_POOL.acquire(self._filename)
 
         self._check_monotonic = monotonic
 
-        self._translate()
-        self._build_cf_groups()
-        self._reset()
+        # The pooled dataset may also be read concurrently by lazy data
+        # proxies, so hold its lock while reading the file metadata.
+        with DATASET_POOL.lock(self._filename):
+            # Issue load optimisation warning.
+            if warn and self._dataset.file_format in ['NETCDF3_CLASSIC', 'NETCDF3_64BIT']:
+                warnings.warn('Optimise CF-netCDF loading by converting data from NetCDF3 ' \
+                              'to NetCDF4 file format using the "nccopy" command.')
+
+            self._translate()
+            self._build_cf_groups()
+            self._reset()
 
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self._filename)
@@ -962,13 +966,27 @@ class CFReader(object):
         coords = CFCoordinateVariable.identify(self._dataset.variables,
                                                monotonic=self._check_monotonic)
         self.cf_group.update(coords)
-        coordinate_names = list(self.cf_group.coordinates.keys())
+        coordinate_names = set(self.cf_group.coordinates.keys())
+
+        # Identify all CF variables EXCEPT for the "special cases", in a
+        # single pass over the netCDF variables. The variables referenced by
+        # each netCDF variable are recorded, by CF variable type, for reuse
+        # when building the CF groups.
+        self._references = {}
+        for nc_var_name in netcdf_variable_names:
+            references = {}
+            for variable_type in self._variable_types:
+                match = variable_type.identify(self._dataset.variables,
+                                               target=nc_var_name)
+                if match:
+                    references[variable_type] = match
+            self._references[nc_var_name] = references
 
-        # Identify all CF variables EXCEPT for the "special cases".
         for variable_type in self._variable_types:
-            # Prevent grid mapping variables being mis-identified as CF coordinate variables.
-            ignore = None if issubclass(variable_type, CFGridMappingVariable) else coordinate_names
-            self.cf_group.update(variable_type.identify(self._dataset.variables, ignore=ignore))
+            for nc_var_name in netcdf_variable_names:
+                match = self._referenced(nc_var_name, variable_type,
+                                         coordinate_names)
+                self.cf_group.update(match)
 
         # Identify global netCDF attributes.
         attr_dict = {attr_name: _getncattr(self._dataset, attr_name, '') for
@@ -1000,17 +1018,19 @@ class CFReader(object):
     def _build_cf_groups(self):
         """Build the first order relationships between CF-netCDF variables."""
 
+        # The CF group membership is fixed from here on, so determine the
+        # CF coordinate and formula terms variables once only.
+        coordinates = self.cf_group.coordinates
+        coordinate_names = set(coordinates)
+        formula_terms = self.cf_group.formula_terms
+
         def _build(cf_variable):
-            coordinate_names = list(self.cf_group.coordinates.keys())
             cf_group = CFGroup()
 
             # Build CF variable relationships.
             for variable_type in self._variable_types:
-                # Prevent grid mapping variables being mis-identified as
-                # CF coordinate variables.
-                ignore = None if issubclass(variable_type, CFGridMappingVariable) else coordinate_names
-                match = variable_type.identify(self._dataset.variables, ignore=ignore,
-                                               target=cf_variable.cf_name, warn=False)
+                match = self._referenced(cf_variable.cf_name, variable_type,
+                                         coordinate_names)
                 # Sanity check dimensionality coverage.
                 for cf_name, cf_var in six.iteritems(match):
                     if cf_var.spans(cf_variable):
@@ -1034,14 +1054,14 @@ class CFReader(object):
                 # Add appropriate "dimensioned" CF coordinate variables.
                 cf_group.update({cf_name: self.cf_group[cf_name] for cf_name
                                     in cf_variable.dimensions if cf_name in
-                                    self.cf_group.coordinates})
+                                    coordinates})
                 # Add appropriate "dimensionless" CF coordinate variables.
                 coordinates_attr = getattr(cf_variable, 'coordinates', '')
                 cf_group.update({cf_name: self.cf_group[cf_name] for cf_name
                                     in coordinates_attr.split() if cf_name in
-                                    self.cf_group.coordinates})
+                                    coordinates})
                 # Add appropriate formula terms.
-                for cf_var in six.itervalues(self.cf_group.formula_terms):
+                for cf_var in six.itervalues(formula_terms):
                     for cf_root in cf_var.cf_terms_by_root:
                         if cf_root in cf_group and cf_var.cf_name not in cf_group:
                             # Sanity check dimensionality.
@@ -1077,7 +1097,7 @@ class CFReader(object):
         if iris.FUTURE.netcdf_promote:
             # Restrict promotion to only those formula terms
             # that are reference surface/phenomenon.
-            for cf_var in six.itervalues(self.cf_group.formula_terms):
+            for cf_var in six.itervalues(formula_terms):
                 for cf_root, cf_term in six.iteritems(cf_var.cf_terms_by_root):
                     cf_root_var = self.cf_group[cf_root]
                     name = cf_root_var.standard_name or cf_root_var.long_name
@@ -1110,6 +1130,20 @@ class CFReader(object):
         else:
             _netcdf_promote_warning()
 
+    def _referenced(self, nc_var_name, variable_type, coordinate_names):
+        """
+        Return the CF-netCDF variables of the given type that are referenced
+        by a netCDF variable, excluding any CF coordinate variables.
+
+        """
+        match = self._references[nc_var_name].get(variable_type, {})
+        # Prevent grid mapping variables being mis-identified as CF
+        # coordinate variables.
+        if match and not issubclass(variable_type, CFGridMappingVariable):
+            match = {cf_name: cf_var
+                     for cf_name, cf_var in six.iteritems(match)
+                     if cf_name not in coordinate_names}
+        return match
 
     def _reset(self):
         """Reset the attribute touch history of each variable."""
@@ -1117,8 +1151,9 @@ class CFReader(object):
             self.cf_group[nc_var_name].cf_attrs_reset()
 
     def __del__(self):
-        # Explicitly close dataset to prevent file remaining open.
-        self._dataset.close()
+        # Return the dataset to the pool, which closes unused files as needed.
+        if hasattr(self, '_dataset'):
+            DATASET_POOL.release(self._filename)
 
 
 def _getncattr(dataset, attr, default=None):
@@ -30,11 +30,13 @@ from six.moves import zip_longest  # Previous line may not be tampered with!
 import six
 
 import collections
+from contextlib import contextmanager
 from itertools import repeat
 import os
 import os.path
 import re
 import string
+import threading
 import warnings
 
 import dask.array as da
@@ -53,11 +55,13 @@ import iris.coords
 import iris.cube
 import iris.exceptions
 import iris.fileformats.cf
+from iris.fileformats._nc_pool import DATASET_POOL
+import iris.fileformats._nc_load_rules
 import iris.fileformats._pyke_rules
 import iris.io
 import iris.util
-from iris._lazy_data import (array_masked_to_nans, as_lazy_data,
-                             convert_nans_array, nan_array_type)
+from iris._lazy_data import (_optimum_chunksize, array_masked_to_nans,
+                             as_lazy_data, convert_nans_array, nan_array_type)
 
 # Show Pyke inference engine statistics.
 DEBUG = False
@@ -344,8 +348,22 @@ class CFNameCoordMap(object):
         return result
 
 
+# The PyKE knowledge engine of each thread, which is reused by all the loads
+# made from that thread.
+_PYKE_KB_ENGINES = threading.local()
+
+
 def _pyke_kb_engine():
     """Return the PyKE knowledge engine for CF->cube conversion."""
+    engine = getattr(_PYKE_KB_ENGINES, 'engine', None)
+    if engine is None:
+        engine = _make_pyke_kb_engine()
+        _PYKE_KB_ENGINES.engine = engine
+    return engine
+
+
+def _make_pyke_kb_engine():
+    """Create a PyKE knowledge engine for CF->cube conversion."""
 
     pyke_dir = os.path.join(os.path.dirname(__file__), '_pyke_rules')
     compile_dir = os.path.join(pyke_dir, 'compiled_krb')
@@ -388,13 +406,10 @@ class NetCDFDataProxy(object):
         return len(self.shape)
 
     def __getitem__(self, keys):
-        dataset = netCDF4.Dataset(self.path)
-        try:
+        with DATASET_POOL.dataset(self.path) as dataset:
             variable = dataset.variables[self.variable_name]
             # Get the NetCDF variable data and slice.
             var = variable[keys]
-        finally:
-            dataset.close()
         if ma.isMaskedArray(var):
             if self.dtype.kind in 'biu':
                 msg = "NetCDF variable {!r} has masked data, which is not " \
@@ -418,6 +433,166 @@ class NetCDFDataProxy(object):
             setattr(self, key, value)
 
 
+class _ChunkControl(threading.local):
+    # A thread-safe object to control the dask chunking of loaded variables.
+    #
+    # Inheriting from 'threading.local' provides a *separate* set of the
+    # object properties for each thread.
+    def __init__(self):
+        # Mapping of netCDF variable name, or None for "all variables", to a
+        # mapping of netCDF dimension name to the requested chunk size.
+        self.var_dim_chunksizes = {}
+
+    @contextmanager
+    def context(self, dim_chunksizes, var_names=None):
+        # Snapshot current state, for restoration afterwards.
+        old_var_dim_chunksizes = self.var_dim_chunksizes
+        try:
+            if var_names is None:
+                var_names = [None]
+            elif isinstance(var_names, six.string_types):
+                var_names = [var_names]
+            new_var_dim_chunksizes = dict(old_var_dim_chunksizes)
+            for var_name in var_names:
+                dim_chunks = dict(new_var_dim_chunksizes.get(var_name, {}))
+                dim_chunks.update(dim_chunksizes)
+                new_var_dim_chunksizes[var_name] = dim_chunks
+            self.var_dim_chunksizes = new_var_dim_chunksizes
+            # Yield to caller operation.
+            yield
+        finally:
+            # Restore entry state.
+            self.var_dim_chunksizes = old_var_dim_chunksizes
+
+    def dim_chunksizes(self, var_name):
+        # Return the requested chunk sizes, by dimension name, for a variable.
+        result = dict(self.var_dim_chunksizes.get(None, {}))
+        result.update(self.var_dim_chunksizes.get(var_name, {}))
+        return result
+
+
+# A singleton chunk-control object.
+# Used in :func:`_get_cf_var_data`.
+_CHUNK_CONTROL = _ChunkControl()
+
+
+@contextmanager
+def load_chunks(dim_chunksizes, var_names=None):
+    """
+    Control the dask chunking of data loaded from netCDF files.
+
+    By default, the lazy data of each loaded cube is divided into dask chunks
+    derived from the on-disk chunking of its netCDF variable, grown or
+    reduced towards a chunk size which suits dask.  Within the scope of this
+    context manager, specific chunk sizes can instead be requested for
+    particular netCDF dimensions, and this affects all the standard Iris load
+    functions when loading netCDF files.
+
+    Args:
+
+    * dim_chunksizes (dict):
+        A mapping of netCDF dimension name to the chunk size to use for that
+        dimension.  A size of -1 means the full length of the dimension.
+        Any dimension not named keeps its default chunking.
+
+    Kwargs:
+
+    * var_names (string or list of string):
+        The netCDF names of the data variables the chunk sizes apply to.
+        Defaults to all variables.
+
+    For example:
+
+        >>> import iris
+        >>> from iris.fileformats.netcdf import load_chunks
+        >>> filepath = iris.sample_data_path('E1_north_america.nc')
+        >>> with load_chunks({'time': 1}):
+        ...     cube = iris.load_cube(filepath)
+        ...
+
+    Nested calls combine, with the innermost setting for a dimension taking
+    priority.
+
+    """
+    with _CHUNK_CONTROL.context(dim_chunksizes, var_names=var_names):
+        yield
+
+
+class _RulesControl(threading.local):
+    # A thread-safe object to select how loaded variables are translated
+    # into cubes.
+    def __init__(self):
+        # Whether to apply the compiled rules, rather than to run the PyKE
+        # inference engine.
+        self.compiled = False
+
+    @contextmanager
+    def context(self):
+        # Snapshot current state, for restoration afterwards.
+        old_compiled = self.compiled
+        try:
+            self.compiled = True
+            # Yield to caller operation.
+            yield
+        finally:
+            # Restore entry state.
+            self.compiled = old_compiled
+
+
+# A singleton rules-control object.
+# Used in :func:`load_cubes`.
+_RULES_CONTROL = _RulesControl()
+
+
+@contextmanager
+def compiled_rules():
+    """
+    Translate netCDF variables into cubes with compiled rules.
+
+    By default, each CF-netCDF data variable is translated into a cube by the
+    PyKE inference engine, with the rules of the CF rule base.  Within the
+    scope of this context manager, the same rules are instead applied by
+    compiled Python, which avoids the cost of inference for every variable
+    and classifies the variables of each file only once.  This affects all
+    the standard Iris load functions when loading netCDF files, and gives
+    the same cubes.
+
+    For example:
+
+        >>> import iris
+        >>> from iris.fileformats.netcdf import compiled_rules
+        >>> filepath = iris.sample_data_path('E1_north_america.nc')
+        >>> with compiled_rules():
+        ...     cube = iris.load_cube(filepath)
+        ...
+
+    """
+    with _RULES_CONTROL.context():
+        yield
+
+
+def _get_cf_var_data(cf_var, filename, dtype):
+    # Return the lazy data of a CF-netCDF variable, with dask chunks chosen
+    # from its on-disk chunking and any user chunk control settings.
+    fill_value = getattr(cf_var.cf_data, '_FillValue', None)
+    proxy = NetCDFDataProxy(cf_var.shape, dtype,
+                            filename, cf_var.cf_name, fill_value)
+    shape = cf_var.shape
+    file_chunks = cf_var.cf_data.chunking()
+    if file_chunks is None or file_chunks == 'contiguous':
+        # Contiguous storage (including all netCDF3 files) favours splitting
+        # over the outer dimensions.
+        file_chunks = shape
+    chunks = list(_optimum_chunksize(file_chunks, shape))
+    dim_chunksizes = _CHUNK_CONTROL.dim_chunksizes(cf_var.cf_name)
+    if dim_chunksizes:
+        for i_dim, dim_name in enumerate(cf_var.dimensions):
+            size = dim_chunksizes.get(dim_name)
+            if size is not None:
+                chunks[i_dim] = shape[i_dim] if size == -1 else size
+    return as_lazy_data(proxy, chunks=tuple(chunks))
+
+
 def _assert_case_specific_facts(engine, cf, cf_group):
     # Initialise pyke engine "provides" hooks.
     engine.provides['coordinates'] = []
@@ -511,9 +686,7 @@ def _load_cube(engine, cf, cf_var, filename):
     fill_value = getattr(cf_var.cf_data, '_FillValue', None)
 
     dtype = nan_array_type(dummy_data.dtype)
-    proxy = NetCDFDataProxy(cf_var.shape, dtype,
-                            filename, cf_var.cf_name, fill_value)
-    data = as_lazy_data(proxy, chunks=cf_var.shape)
+    data = _get_cf_var_data(cf_var, filename, dtype)
     cube = iris.cube.Cube(data, fill_value=fill_value, dtype=dummy_data.dtype)
 
     # Reset the pyke inference engine.
@@ -689,8 +862,10 @@ def load_cubes(filenames, callback=None):
         Generator of loaded NetCDF :class:`iris.cubes.Cube`.
 
     """
-    # Initialise the pyke inference engine.
-    engine = _pyke_kb_engine()
+    compiled = _RULES_CONTROL.compiled
+    if not compiled:
+        # Initialise the pyke inference engine.
+        engine = _pyke_kb_engine()
 
     if isinstance(filenames, six.string_types):
         filenames = [filenames]
@@ -699,18 +874,39 @@ def load_cubes(filenames, callback=None):
         # Ingest the netCDF file.
         cf = iris.fileformats.cf.CFReader(filename)
 
+        if compiled:
+            # The compiled rules keep what they learn of the variables of
+            # the file, so apply them afresh for each file.
+            engine = iris.fileformats._nc_load_rules.Engine()
+
+        # The lazy arrays of the auxiliary coordinate, bounds and cell
+        # measure variables of the file, by variable name, which are shared
+        # by all the cubes loaded from it.
+        cf_var_arrays = {}
+
+        # The dimension coordinates built for the cubes of the file, by
+        # variable name and coordinate name, which are copied to any other
+        # cubes that share them.
+        cf_dim_coords = {}
+
         # Process each CF data variable.
         data_variables = (list(cf.cf_group.data_variables.values()) +
                           list(cf.cf_group.promoted.values()))
         for cf_var in data_variables:
-            cube = _load_cube(engine, cf, cf_var, filename)
-
-            # Process any associated formula terms and attach
-            # the corresponding AuxCoordFactory.
-            try:
-                _load_aux_factory(engine, cube)
-            except ValueError as e:
-                warnings.warn('{}'.format(e))
+            # A PyKE engine is shared by all the loads of this thread, so
+            # attach the state of this file to it afresh for each cube.
+            engine.cf_var_arrays = cf_var_arrays
+            engine.cf_dim_coords = cf_dim_coords
+            # Hold the lock of the pooled dataset while its metadata is read.
+            with DATASET_POOL.lock(filename):
+                cube = _load_cube(engine, cf, cf_var, filename)
+
+                # Process any associated formula terms and attach
+                # the corresponding AuxCoordFactory.
+                try:
+                    _load_aux_factory(engine, cube)
+                except ValueError as e:
+                    warnings.warn('{}'.format(e))
 
             # Perform any user registered callback function.
             cube = iris.io.run_callback(callback, cube, cf_var, filename)
@@ -750,6 +946,41 @@ def _setncattr(variable, name, attribute):
     return variable.setncattr(name, attribute)
 
 
+def _aligned_chunks(data, cf_var):
+    """
+    Rechunk a lazy array, as required, so that its chunk boundaries lie on
+    the HDF5 chunk boundaries of the netCDF variable it is to be written to.
+
+    This prevents each HDF5 chunk of the variable being written, and
+    compressed, more than once.
+
+    """
+    chunking = cf_var.chunking()
+    if not isinstance(chunking, list) or len(chunking) != data.ndim:
+        # A contiguous variable, or one that is not chunked by HDF5.
+        return data
+
+    chunks = []
+    for dim_chunks, var_chunk in zip(data.chunks, chunking):
+        if all(offset % var_chunk == 0
+               for offset in np.cumsum(dim_chunks[:-1])):
+            chunks.append(dim_chunks)
+        else:
+            # Use the largest whole number of variable chunks that fit
+            # within the existing chunks, or a single variable chunk.
+            size = max(dim_chunks)
+            size = max(var_chunk, size - size % var_chunk)
+            length = sum(dim_chunks)
+            dim_chunks = (size,) * (length // size)
+            if length % size:
+                dim_chunks += (length % size,)
+            chunks.append(dim_chunks)
+    chunks = tuple(chunks)
+    if chunks != data.chunks:
+        data = data.rechunk(chunks)
+    return data
+
+
 class Saver(object):
     """A manager for saving netcdf files."""
 
@@ -777,6 +1008,9 @@ class Saver(object):
                 for cube in cubes:
                     sman.write(cube)
 
+        The lazy data payloads of all the cubes written are computed, and
+        streamed to the file together, on exiting the context of the saver.
+
         """
         if netcdf_format not in ['NETCDF4', 'NETCDF4_CLASSIC',
                                  'NETCDF3_CLASSIC', 'NETCDF3_64BIT']:
@@ -794,6 +1028,12 @@ class Saver(object):
         self._existing_dim = {}
         #: A dictionary, mapping formula terms to owner cf variable name
         self._formula_terms_cache = {}
+        #: List of lazy data payloads and their target cf variables, which
+        #: are streamed to the file together when it is closed
+        self._deferred_stores = []
+        # Close any pooled read-only handle on the file being replaced.
+        if isinstance(filename, six.string_types):
+            DATASET_POOL.discard(filename)
         #: NetCDF dataset
         try:
             self._dataset = netCDF4.Dataset(filename, mode='w',
@@ -814,9 +1054,29 @@ class Saver(object):
 
     def __exit__(self, type, value, traceback):
         """Flush any buffered data to the CF-netCDF file before closing."""
+        try:
+            # Only stream the lazy data payloads of a successful save.
+            if type is None:
+                self._store_deferred()
+        finally:
+            self._dataset.sync()
+            self._dataset.close()
 
-        self._dataset.sync()
-        self._dataset.close()
+    def _store_deferred(self):
+        """
+        Stream all the lazy data payloads written so far to the CF-netCDF
+        file, with a single dask store operation.
+
+        Computing the payloads together allows dask to share the evaluation
+        of any source data common to several cubes. The computation is
+        performed by the current dask scheduler, as chosen with
+        :func:`dask.set_options`.
+
+        """
+        if self._deferred_stores:
+            sources, targets = zip(*self._deferred_stores)
+            self._deferred_stores = []
+            da.store(list(sources), list(targets))
 
     def write(self, cube, local_keys=None, unlimited_dimensions=None,
               zlib=False, complevel=4, shuffle=True, fletcher32=False,
@@ -1967,13 +2227,15 @@ class Saver(object):
                 **kwargs)
             set_packing_ncattrs(cf_var)
 
-            # Now stream the cube data payload straight to the netCDF
-            # data variable within the netCDF file, where any NaN values
-            # are replaced with the specified cube fill_value.
+            # The cube data payload is streamed straight to the netCDF
+            # data variable within the netCDF file when the file is closed,
+            # where any NaN values are replaced with the specified cube
+            # fill_value.
             data = da.map_blocks(convert_nans_array, cube.lazy_data(),
                                  nans_replacement=cube.fill_value,
                                  result_dtype=cube.dtype)
-            da.store([data], [cf_var])
+            data = _aligned_chunks(data, cf_var)
+            self._deferred_stores.append((data, cf_var))
 
         if cube.standard_name:
             _setncattr(cf_var, 'standard_name', cube.standard_name)
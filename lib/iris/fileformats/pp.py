@@ -39,9 +39,10 @@ import numpy.ma as ma
 import netcdftime
 
 from iris._deprecation import warn_deprecated
-from iris._lazy_data import (array_masked_to_nans, as_concrete_data,
-                             as_lazy_data, is_lazy_data)
+from iris._lazy_data import (_optimum_chunksize, array_masked_to_nans,
+                             as_concrete_data, as_lazy_data, is_lazy_data)
 import iris.config
+from iris.fileformats import _header_index
 import iris.fileformats.rules
 import iris.fileformats.pp_rules
 import iris.coord_systems
@@ -873,7 +874,27 @@ class PPDataProxy(object):
     def ndim(self):
         return len(self.shape)
 
+    @property
+    def is_unpacked(self):
+        """
+        Whether the payload is a plain array, with no packing or compression,
+        which can be read directly from a memory-map of the file.
+
+        """
+        return _is_unpacked_payload(self._lbpack, self.boundary_packing,
+                                    self.shape, self.src_dtype, self.data_len)
+
     def __getitem__(self, keys):
+        if self.is_unpacked:
+            # Read only the requested points, converting to native byte order
+            # and the result dtype in a single copy.
+            mapped = np.memmap(self.path, dtype=self.src_dtype, mode='r',
+                               offset=self.offset, shape=self.shape)
+            data = np.array(mapped[keys], dtype=self.dtype)
+            del mapped
+            _mdi_to_nan(data, self.mdi)
+            return data
+
         with open(self.path, 'rb') as pp_file:
             pp_file.seek(self.offset, os.SEEK_SET)
             data_bytes = pp_file.read(self.data_len)
@@ -918,6 +939,144 @@ class PPDataProxy(object):
         return result
 
 
+class PPFieldsDataProxy(object):
+    """
+    A reference to the data payloads of an array of unpacked PP fields,
+    all with the same shape and type, from a single file.
+
+    The proxy has the shape of the array of fields followed by the shape of
+    a single field.  An access to several fields is made through a single
+    memory-map of the file region spanning them, so that reading neighbouring
+    fields coalesces into one contiguous I/O.
+
+    """
+
+    __slots__ = ('offsets', 'mdis', 'field_shape', 'src_dtype', 'path')
+
+    def __init__(self, offsets, mdis, field_shape, src_dtype, path):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.mdis = np.asarray(mdis)
+        self.field_shape = tuple(field_shape)
+        self.src_dtype = src_dtype
+        self.path = path
+
+    @property
+    def shape(self):
+        return self.offsets.shape + self.field_shape
+
+    @property
+    def dtype(self):
+        return np.dtype('f8') if self.src_dtype.kind == 'i' \
+                 else self.src_dtype.newbyteorder('=')
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, keys):
+        keys = iris.util._build_full_slice_given_keys(keys, self.ndim)
+        n_stack_dims = self.offsets.ndim
+        stack_keys = tuple(keys[:n_stack_dims])
+        field_keys = tuple(keys[n_stack_dims:])
+        offsets = self.offsets[stack_keys]
+        mdis = np.broadcast_to(self.mdis, self.offsets.shape)[stack_keys]
+        field_result_shape = np.broadcast_to(
+            0, self.field_shape)[field_keys].shape
+        result = np.empty(offsets.shape + field_result_shape,
+                          dtype=self.dtype)
+        if result.size:
+            field_nbytes = int(np.prod(self.field_shape) *
+                               self.src_dtype.itemsize)
+            start = int(offsets.min())
+            span = int(offsets.max()) + field_nbytes - start
+            mapped = np.memmap(self.path, dtype=np.uint8, mode='r',
+                               offset=start, shape=(span,))
+            for index in np.ndindex(offsets.shape):
+                field = np.ndarray(self.field_shape, dtype=self.src_dtype,
+                                   buffer=mapped,
+                                   offset=int(offsets[index]) - start)
+                result[index] = field[field_keys]
+            del field, mapped
+            mdis = mdis.astype(self.dtype).reshape(
+                mdis.shape + (1,) * len(field_result_shape))
+            missing = result == mdis
+            if np.any(missing):
+                result[missing] = np.nan
+        return result
+
+    def __repr__(self):
+        fmt = '<{self.__class__.__name__} shape={self.shape}' \
+              ' src_dtype={self.src_dtype!r} path={self.path!r}>'
+        return fmt.format(self=self)
+
+    def __getstate__(self):
+        # Because we have __slots__, this is needed to support Pickle.dump()
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        # Because we have __slots__, this is needed to support Pickle.load()
+        # (Use setattr, as there is no object dictionary.)
+        for (key, value) in state:
+            setattr(self, key, value)
+
+
+def _is_unpacked_payload(lbpack, boundary_packing, data_shape, data_type,
+                         data_len):
+    """
+    Whether a field data payload is a plain array of the field shape, with no
+    packing, compression or boundary condition layout.
+
+    """
+    size = np.prod(data_shape)
+    return (int(lbpack) % 100 == 0 and boundary_packing is None and
+            size > 0 and data_len == size * data_type.itemsize)
+
+
+def _mdi_to_nan(data, mdi):
+    """Replace missing data indicator values in a float array with NaN."""
+    if data.ndim == 0:
+        if data == mdi:
+            data[()] = np.nan
+    else:
+        data[data == mdi] = np.nan
+
+
+def _stacked_fields_lazy_data(fields, stack_shape):
+    """
+    Return the lazy data of an array of fields, as a single dask array.
+
+    Args:
+
+    * fields (list of :class:`PPField`):
+        The fields, in array order.
+    * stack_shape (tuple of int):
+        The shape of the array of fields.
+
+    Returns:
+        A dask array of shape `stack_shape` + the field shape, or None if the
+        fields are not all unpacked, deferred fields with the same shape and
+        type from a single file.
+
+    """
+    proxies = [getattr(field, '_data_proxy', None) for field in fields]
+    proxy = proxies[0]
+    if proxy is None:
+        return None
+    for other in proxies:
+        if (other is None or not other.is_unpacked or
+                other.path != proxy.path or other.shape != proxy.shape or
+                other.src_dtype != proxy.src_dtype):
+            return None
+    offsets = np.array([other.offset for other in proxies]).reshape(
+        stack_shape)
+    mdis = np.array([other.mdi for other in proxies]).reshape(stack_shape)
+    fields_proxy = PPFieldsDataProxy(offsets, mdis, proxy.shape,
+                                     proxy.src_dtype, proxy.path)
+    shape = fields_proxy.shape
+    chunks = _optimum_chunksize((1,) * len(stack_shape) + proxy.shape, shape)
+    return as_lazy_data(fields_proxy, chunks=chunks)
+
+
 def _data_bytes_to_shaped_array(data_bytes, lbpack, boundary_packing,
                                 data_shape, data_type, mdi,
                                 mask=None):
@@ -1081,7 +1240,8 @@ def _pp_attribute_names(header_defn):
     special_headers = list('_' + name for name in _SPECIAL_HEADERS)
     extra_data = list(EXTRA_DATA.values())
     special_attributes = ['_raw_header', 'raw_lbtim', 'raw_lbpack',
-                          'boundary_packing', '_realised_dtype']
+                          'boundary_packing', '_realised_dtype',
+                          '_data_proxy']
     return normal_headers + special_headers + extra_data + special_attributes
 
 
@@ -1115,6 +1275,7 @@ class PPField(six.with_metaclass(abc.ABCMeta, object)):
         self.raw_lbpack = None
         self.boundary_packing = None
         self._realised_dtype = None
+        self._data_proxy = None
         if header is not None:
             self.raw_lbtim = header[self.HEADER_DICT['lbtim'][0]]
             self.raw_lbpack = header[self.HEADER_DICT['lbpack'][0]]
@@ -1294,6 +1455,7 @@ class PPField(six.with_metaclass(abc.ABCMeta, object)):
     @data.setter
     def data(self, value):
         self._data = value
+        self._data_proxy = None
 
     def core_data(self):
         return self._data
@@ -1657,6 +1819,9 @@ class PPField(six.with_metaclass(abc.ABCMeta, object)):
         if isinstance(other, PPField):
             result = True
             for attr in self.__slots__:
+                if attr == '_data_proxy':
+                    # The data source does not affect equality.
+                    continue
                 attrs = [hasattr(self, attr), hasattr(other, attr)]
                 if all(attrs):
                     self_attr = getattr(self, attr)
@@ -1800,7 +1965,7 @@ def make_pp_field(header):
 LoadedArrayBytes = collections.namedtuple('LoadedArrayBytes', 'bytes, dtype')
 
 
-def load(filename, read_data=False, little_ended=False):
+def load(filename, read_data=False, little_ended=False, pp_filter=None):
     """
     Return an iterator of PPFields given a filename.
 
@@ -1818,15 +1983,23 @@ def load(filename, read_data=False, little_ended=False):
     * little_ended - boolean
         If True, file contains all little-ended words (header and data).
 
+    * pp_filter - callable
+        If given, only the fields for which ``pp_filter(field)`` is True are
+        returned.
+
     To iterate through all of the fields in a pp file::
 
         for field in iris.fileformats.pp.load(filename):
             print(field)
 
     """
-    return _interpret_fields(_field_gen(filename,
-                                        read_data_bytes=read_data,
-                                        little_ended=little_ended))
+    fields = _interpret_fields(_field_gen(filename,
+                                          read_data_bytes=read_data,
+                                          little_ended=little_ended,
+                                          pp_filter=pp_filter))
+    if pp_filter is not None:
+        fields = (field for field in fields if pp_filter(field))
+    return fields
 
 
 def _interpret_fields(fields):
@@ -1903,9 +2076,234 @@ def _create_field_data(field, data_shape, land_mask):
         field.realised_dtype = dtype.newbyteorder('=')
         block_shape = data_shape if 0 not in data_shape else (1, 1)
         field.data = as_lazy_data(proxy, chunks=block_shape)
+        # Keep the proxy, to support reading many fields at once.
+        field._data_proxy = proxy
+
+
+# Zero-based positions of the header words used to index a file, which are
+# common to all header releases.
+_LBLREC_POSITION = 14
+_LBEXT_POSITION = 19
+_LBREL_POSITION = 21
+_LBUSER_SLICE = slice(38, 45)
+
+# The number of headers gathered at once when indexing a file.
+_INDEX_BLOCK_SIZE = 4096
+
 
+def _header_dtype(little_ended=False):
+    # The structured dtype of a complete header record, i.e. the long (int)
+    # header words followed by the float header words.
+    endian = '<' if little_ended else '>'
+    return np.dtype([('longs', '{}i{}'.format(endian, PP_WORD_DEPTH),
+                      (NUM_LONG_HEADERS,)),
+                     ('floats', '{}f{}'.format(endian, PP_WORD_DEPTH),
+                      (NUM_FLOAT_HEADERS,))])
 
-def _field_gen(filename, read_data_bytes, little_ended=False):
+
+class _FieldIndex(object):
+    """
+    The decoded headers and payload locations of the fields in a PP file.
+
+    Indexing a _FieldIndex with a key, e.g. a boolean mask, selects a subset
+    of its fields.
+
+    """
+    def __init__(self, filename, headers, data_offsets, data_lens,
+                 little_ended=False):
+        #: The name of the indexed file.
+        self.filename = filename
+        #: A structured array of the headers of all the fields, with 'longs'
+        #: and 'floats' subarray fields in native byte order.
+        self.headers = headers
+        #: The file offset of the payload of each field.
+        self.data_offsets = data_offsets
+        #: The length in bytes of the payload plus any extra data.
+        self.data_lens = data_lens
+        #: Whether the file contains little-ended words.
+        self.little_ended = little_ended
+
+    def __len__(self):
+        return len(self.headers)
+
+    def __getitem__(self, keys):
+        return _FieldIndex(self.filename, self.headers[keys],
+                           self.data_offsets[keys], self.data_lens[keys],
+                           little_ended=self.little_ended)
+
+    @property
+    def lbuser(self):
+        """The LBUSER header words of all the fields, as a 2-d array."""
+        return self.headers['longs'][:, _LBUSER_SLICE]
+
+    def stash_codes(self):
+        """
+        Return the distinct STASH codes of the fields, and the position of
+        each field's code within them.
+
+        Returns:
+            A list of :class:`STASH`, and an array of indices into it.
+
+        """
+        lbuser = self.lbuser
+        pairs = np.empty(len(self), dtype=[('model', 'i4'), ('code', 'i4')])
+        pairs['model'] = lbuser[:, 6]
+        pairs['code'] = lbuser[:, 3]
+        unique_pairs, inverse = np.unique(pairs, return_inverse=True)
+        stashes = [STASH(model, code // 1000, code % 1000)
+                   for model, code in unique_pairs.tolist()]
+        return stashes, inverse
+
+    def fields(self, read_data_bytes):
+        """
+        Return a generator of "half-formed" PPField instances, as described
+        in :func:`_field_gen`, for the indexed fields.
+
+        """
+        little_ended = self.little_ended
+        longs = self.headers['longs']
+        floats = self.headers['floats']
+        with open(self.filename, 'rb') as pp_file:
+            for i_field in range(len(self)):
+                header = tuple(longs[i_field]) + tuple(floats[i_field])
+                pp_field = make_pp_field(header)
+
+                # Derive size and datatype of payload.
+                extra_len = pp_field.lbext * PP_WORD_DEPTH
+                data_offset = int(self.data_offsets[i_field])
+                data_len = int(self.data_lens[i_field]) - extra_len
+                dtype = LBUSER_DTYPE_LOOKUP.get(
+                    pp_field.lbuser[0], LBUSER_DTYPE_LOOKUP['default'])
+                if little_ended:
+                    # Change data dtype for a little-ended file.
+                    dtype = str(dtype)
+                    if dtype[0] != '>':
+                        msg = ("Unexpected dtype {!r} can't be converted to "
+                               "little-endian")
+                        raise ValueError(msg)
+
+                    dtype = np.dtype('<' + dtype[1:])
+
+                if read_data_bytes:
+                    # Read the actual bytes. This can then be converted to a
+                    # numpy array at a higher level.
+                    pp_file.seek(data_offset)
+                    pp_field.data = LoadedArrayBytes(pp_file.read(data_len),
+                                                     dtype)
+                else:
+                    # Provide enough context to read the data bytes later on.
+                    pp_field.data = (self.filename, data_offset, data_len,
+                                     dtype)
+
+                # Do we have any extra data to deal with?
+                if extra_len:
+                    pp_file.seek(data_offset + data_len)
+                    pp_field._read_extra_data(pp_file, pp_file.read,
+                                              extra_len,
+                                              little_ended=little_ended)
+                yield pp_field
+
+
+def _index_fields(filename, little_ended=False):
+    """
+    Returns a :class:`_FieldIndex` of all the fields in the given filename.
+
+    The index is read from the header index cache when possible, see
+    :mod:`iris.fileformats._header_index`.
+
+    Any field with an unsupported header release number, or with an LBLREC
+    value which disagrees with its record length, ends the index with a
+    warning.
+
+    """
+    arrays, msg = _header_index.cached_index(filename, 'pp', _scan_fields,
+                                             little_ended=little_ended)
+    if msg is not None:
+        warnings.warn(msg)
+    return _FieldIndex(filename, arrays['headers'], arrays['data_offsets'],
+                       arrays['data_lens'], little_ended=little_ended)
+
+
+def _scan_fields(filename, little_ended=False):
+    """
+    Decodes the headers and payload locations of all the fields in the given
+    filename, as the arrays of a :class:`_FieldIndex`.
+
+    The file is memory-mapped, and its records are located from the record
+    length words alone.  All the headers are then decoded together.
+
+    Returns:
+        A dictionary of the index arrays, and a message describing the first
+        invalid field, or None.
+
+    """
+    endian = '<' if little_ended else '>'
+    header_dtype = _header_dtype(little_ended)
+    # The leading header length word, header, trailing header length word
+    # and leading data length word.
+    header_record_len = PP_HEADER_DEPTH + 3 * PP_WORD_DEPTH
+    header_offsets = []
+    data_lens = []
+    file_size = os.path.getsize(filename)
+    mapped = None
+    if file_size:
+        mapped = np.memmap(filename, dtype=np.uint8, mode='r')
+        read_word = struct.Struct('{}L'.format(endian)).unpack_from
+        position = 0
+        while position + PP_WORD_DEPTH + PP_HEADER_DEPTH <= file_size:
+            header_offsets.append(position + PP_WORD_DEPTH)
+            if position + header_record_len > file_size:
+                # A truncated record, which can never match its LBLREC.
+                data_lens.append(-1)
+                break
+            data_len, = read_word(mapped,
+                                  position + header_record_len - PP_WORD_DEPTH)
+            data_lens.append(data_len)
+            # Skip the data and the trailing data length word.
+            position += header_record_len + data_len + PP_WORD_DEPTH
+
+    header_offsets = np.array(header_offsets, dtype=np.int64)
+    data_lens = np.array(data_lens, dtype=np.int64)
+    headers = np.empty(len(header_offsets), dtype=header_dtype)
+    header_bytes = headers.view(np.uint8).reshape(-1, PP_HEADER_DEPTH)
+    byte_indices = np.arange(PP_HEADER_DEPTH)
+    for start in range(0, len(headers), _INDEX_BLOCK_SIZE):
+        stop = start + _INDEX_BLOCK_SIZE
+        header_bytes[start:stop] = mapped[header_offsets[start:stop, None] +
+                                          byte_indices]
+    del mapped
+    # Convert the headers to native byte order.
+    headers = headers.astype(headers.dtype.newbyteorder('='))
+
+    # Check the headers, and stop at the first invalid field.
+    longs = headers['longs']
+    bad_release = ~np.in1d(longs[:, _LBREL_POSITION], list(PP_CLASSES))
+    bad_lblrec = longs[:, _LBLREC_POSITION] * PP_WORD_DEPTH != data_lens
+    i_bad, = np.nonzero(bad_release | bad_lblrec)
+    msg = None
+    if i_bad.size:
+        n_fields = i_bad[0]
+        if bad_release[n_fields]:
+            msg = ('Unable to interpret field {}. Unsupported header release '
+                   'number: {}. Skipping the remainder of the '
+                   'file.'.format(n_fields, longs[n_fields, _LBREL_POSITION]))
+        else:
+            msg = ('LBLREC has a different value to the integer recorded '
+                   'after the header in the file ({} and {}). '
+                   'Skipping the remainder of the file.').format(
+                longs[n_fields, _LBLREC_POSITION] * PP_WORD_DEPTH,
+                data_lens[n_fields])
+        headers = headers[:n_fields]
+        header_offsets = header_offsets[:n_fields]
+        data_lens = data_lens[:n_fields]
+
+    data_offsets = header_offsets + PP_HEADER_DEPTH + 2 * PP_WORD_DEPTH
+    arrays = {'headers': headers, 'data_offsets': data_offsets,
+              'data_lens': data_lens}
+    return arrays, msg
+
+
+def _field_gen(filename, read_data_bytes, little_ended=False, pp_filter=None):
     """
     Returns a generator of "half-formed" PPField instances derived from
     the given filename.
@@ -1918,98 +2316,17 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
     sufficient information within the field to determine the final
     two-dimensional shape of the data.
 
-    """
-    dtype_endian_char = '<' if little_ended else '>'
-    with open(filename, 'rb') as pp_file:
-        # Get a reference to the seek method on the file
-        # (this is accessed 3* #number of headers so can provide a small
-        # performance boost)
-        pp_file_seek = pp_file.seek
-        pp_file_read = pp_file.read
-
-        field_count = 0
-        # Keep reading until we reach the end of file
-        while True:
-            # Move past the leading header length word
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            # Get the LONG header entries
-            dtype = '%ci%d' % (dtype_endian_char, PP_WORD_DEPTH)
-            header_longs = np.fromfile(pp_file, dtype=dtype,
-                                       count=NUM_LONG_HEADERS)
-            # Nothing returned => EOF
-            if len(header_longs) == 0:
-                break
-            # Get the FLOAT header entries
-            dtype = '%cf%d' % (dtype_endian_char, PP_WORD_DEPTH)
-            header_floats = np.fromfile(pp_file, dtype=dtype,
-                                        count=NUM_FLOAT_HEADERS)
-            header = tuple(header_longs) + tuple(header_floats)
-
-            # Make a PPField of the appropriate sub-class (depends on header
-            # release number)
-            try:
-                pp_field = make_pp_field(header)
-            except ValueError as e:
-                msg = 'Unable to interpret field {}. {}. Skipping ' \
-                      'the remainder of the file.'.format(field_count,
-                                                          str(e))
-                warnings.warn(msg)
-                break
-
-            # Skip the trailing 4-byte word containing the header length
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-
-            # Read the word telling me how long the data + extra data is
-            # This value is # of bytes
-            len_of_data_plus_extra = struct.unpack_from(
-                '%cL' % dtype_endian_char,
-                pp_file_read(PP_WORD_DEPTH))[0]
-            if len_of_data_plus_extra != pp_field.lblrec * PP_WORD_DEPTH:
-                wmsg = ('LBLREC has a different value to the integer recorded '
-                        'after the header in the file ({} and {}). '
-                        'Skipping the remainder of the file.')
-                warnings.warn(wmsg.format(pp_field.lblrec * PP_WORD_DEPTH,
-                                          len_of_data_plus_extra))
-                break
-
-            # calculate the extra length in bytes
-            extra_len = pp_field.lbext * PP_WORD_DEPTH
-
-            # Derive size and datatype of payload
-            data_len = len_of_data_plus_extra - extra_len
-            dtype = LBUSER_DTYPE_LOOKUP.get(pp_field.lbuser[0],
-                                            LBUSER_DTYPE_LOOKUP['default'])
-            if little_ended:
-                # Change data dtype for a little-ended file.
-                dtype = str(dtype)
-                if dtype[0] != '>':
-                    msg = ("Unexpected dtype {!r} can't be converted to "
-                           "little-endian")
-                    raise ValueError(msg)
-
-                dtype = np.dtype('<' + dtype[1:])
-
-            if read_data_bytes:
-                # Read the actual bytes. This can then be converted to a numpy
-                # array at a higher level.
-                pp_field.data = LoadedArrayBytes(pp_file.read(data_len),
-                                                 dtype)
-            else:
-                # Provide enough context to read the data bytes later on.
-                pp_field.data = (filename, pp_file.tell(), data_len, dtype)
-                # Seek over the actual data payload.
-                pp_file_seek(data_len, os.SEEK_CUR)
+    If `pp_filter` provides an ``index_mask`` method, e.g. as made by
+    :func:`_convert_constraints`, only the fields of the file index selected
+    by it are created.
 
-            # Do we have any extra data to deal with?
-            if extra_len:
-                pp_field._read_extra_data(pp_file, pp_file_read, extra_len,
-                                          little_ended=little_ended)
-
-            # Skip that last 4 byte record telling me the length of the field I
-            # have already read
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            field_count += 1
-            yield pp_field
+    """
+    index = _index_fields(filename, little_ended=little_ended)
+    index_mask = getattr(pp_filter, 'index_mask', None)
+    if index_mask is not None:
+        index = index[index_mask(index)]
+    for field in index.fields(read_data_bytes):
+        yield field
 
 
 def reset_load_rules():
@@ -2087,17 +2404,36 @@ def reset_save_rules():
 # Stash codes not to be filtered (reference altitude and pressure fields).
 _STASH_ALLOW = [STASH(1, 0, 33), STASH(1, 0, 1)]
 
+# The STASH of land-sea mask fields.
+_LAND_MASK_STASH = STASH(1, 0, 30)
+
 
-def _convert_constraints(constraints):
+def _convert_constraints(constraints, coords=True):
     """
     Converts known constraints from Iris semantics to PP semantics
     ignoring all unknown constraints.
 
+    STASH attribute constraints are converted, as are constraints on the
+    coordinates which are made from header words alone, i.e. those of
+    :data:`_FILTER_COORDS`, unless `coords` is False.  A field is selected
+    if it may contribute to a cube which matches any of the constraints.
+
     """
     constraints = iris._constraints.list_of_constraints(constraints)
-    pp_constraints = {}
-    unhandled_constraints = False
+    conditions = [_field_condition(con, coords) for con in constraints]
+    if conditions and None not in conditions:
+        result = _PPFieldFilter(conditions)
+    else:
+        result = None
+    return result
+
 
+def _field_condition(constraint, coords=True):
+    """
+    Return a :class:`_FieldCondition` selecting the fields which may match
+    the constraint, or None if no selection can be made.
+
+    """
     def _make_func(stashobj):
         """
         Provides unique name-space for each lambda function's stashobj
@@ -2105,13 +2441,21 @@ def _convert_constraints(constraints):
         """
         return lambda stash: stash == stashobj
 
-    for con in constraints:
-        if isinstance(con, iris.AttributeConstraint) and \
-                list(con._attributes.keys()) == ['STASH']:
+    stash_funcs = []
+    coord_constraints = []
+    if isinstance(constraint, iris._constraints.ConstraintCombination):
+        # Both halves of a combination must be matched.
+        for con in (constraint.lhs, constraint.rhs):
+            condition = _field_condition(con, coords)
+            if condition is not None:
+                stash_funcs.extend(condition.stash_funcs)
+                coord_constraints.extend(condition.coord_constraints)
+    elif isinstance(constraint, iris.AttributeConstraint):
+        if 'STASH' in constraint._attributes:
             # Convert a STASH constraint.
             # The attribute can be a STASH object, a stashcode string, or a
             # callable.
-            stashobj = con._attributes['STASH']
+            stashobj = constraint._attributes['STASH']
             if callable(stashobj):
                 call_func = stashobj
             elif isinstance(stashobj, (six.string_types, STASH)):
@@ -2119,39 +2463,180 @@ def _convert_constraints(constraints):
             else:
                 raise TypeError("STASH constraints should be either a"
                                 " callable, string or STASH object")
+            stash_funcs.append(call_func)
+    elif type(constraint) is iris.Constraint and coords:
+        coord_constraints = [coord_constraint for coord_constraint
+                             in constraint._coord_constraints
+                             if coord_constraint.coord_name in _FILTER_COORDS]
+
+    if stash_funcs or coord_constraints:
+        result = _FieldCondition(stash_funcs, coord_constraints)
+    else:
+        result = None
+    return result
 
-            if 'stash' not in pp_constraints:
-                pp_constraints['stash'] = [call_func]
-            else:
-                pp_constraints['stash'].append(call_func)
-        else:
-            # only keep the pp constraints set if they are all handled as
-            # pp constraints
-            unhandled_constraints = True
 
-    def pp_filter(field):
+def _filter_time_coords(field):
+    if len(field.lbcode) == 5 or (field.lbtim.ib == 2 and field.lbyr == 0 and
+                                  field.lbyrd == 0):
+        # Cross-sections and climatological fields have time coordinates
+        # made from other information.
+        return None
+    return iris.fileformats.pp_rules._convert_time_coords(
+        lbcode=field.lbcode, lbtim=field.lbtim,
+        epoch_hours_unit=field.time_unit('hours'),
+        t1=field.t1, t2=field.t2, lbft=field.lbft)
+
+
+def _filter_vertical_coords(field):
+    if len(field.lbcode) == 5:
+        # Cross-sections have vertical coordinates made from other
+        # information.
+        return None
+    coords_and_dims, _ = iris.fileformats.pp_rules._convert_vertical_coords(
+        lbcode=field.lbcode, lbvc=field.lbvc, blev=field.blev,
+        lblev=field.lblev, stash=field.stash, bhlev=field.bhlev,
+        bhrlev=field.bhrlev, brsvd1=field.brsvd[0], brsvd2=field.brsvd[1],
+        brlev=field.brlev)
+    return coords_and_dims
+
+
+def _filter_realization_coords(field):
+    return iris.fileformats.pp_rules._convert_scalar_realization_coords(
+        lbrsvd4=field.lbrsvd[3])
+
+
+_FilterCoords = collections.namedtuple(
+    '_FilterCoords', 'long_positions float_positions coords_func')
+
+_FILTER_TIME = _FilterCoords(list(range(14)) + [15, _LBREL_POSITION], [],
+                             _filter_time_coords)
+_FILTER_VERTICAL = _FilterCoords([15, _LBREL_POSITION, 25, 32, 41, 44],
+                                 [0, 1, 6, 7, 8, 9], _filter_vertical_coords)
+_FILTER_REALIZATION = _FilterCoords([36], [], _filter_realization_coords)
+
+#: The coordinates which can be selected on from the field headers.
+#: For each coordinate name, the zero-based positions of the long and float
+#: header words which determine the coordinate, and a function returning the
+#: coordinates and dimensions made from a field, or None if they cannot be
+#: known from the header words alone.
+_FILTER_COORDS = {'time': _FILTER_TIME,
+                  'forecast_period': _FILTER_TIME,
+                  'forecast_reference_time': _FILTER_TIME,
+                  'model_level_number': _FILTER_VERTICAL,
+                  'pressure': _FILTER_VERTICAL,
+                  'realization': _FILTER_REALIZATION}
+
+
+class _FieldCondition(object):
+    """
+    The part of a constraint which can be decided from the field headers.
+
+    A field meets the condition if its STASH matches all of the STASH
+    callables, and its coordinates, as made from the headers, match all of
+    the coordinate constraints.
+
+    """
+    def __init__(self, stash_funcs, coord_constraints):
+        #: The callables of a STASH string which select wanted fields.
+        self.stash_funcs = stash_funcs
+        #: The :class:`iris._constraints._CoordConstraint` instances on
+        #: coordinates of :data:`_FILTER_COORDS`.
+        self.coord_constraints = coord_constraints
+
+    def stash_wanted(self, stash):
+        return all(call_func(str(stash)) for call_func in self.stash_funcs)
+
+    def coord_wanted(self, coord_constraint, field):
+        filter_coords = _FILTER_COORDS[coord_constraint.coord_name]
+        coords_and_dims = filter_coords.coords_func(field)
+        if coords_and_dims is None:
+            return True
+        cube = iris.cube.Cube(0)
+        for coord, _ in coords_and_dims:
+            cube.add_aux_coord(coord)
+        return coord_constraint.extract(cube).as_slice() is not None
+
+    def __call__(self, field):
+        return (self.stash_wanted(field.stash) and
+                all(self.coord_wanted(coord_constraint, field)
+                    for coord_constraint in self.coord_constraints))
+
+    def index_mask(self, index, stashes, inverse):
         """
-        return True if field is to be kept,
-        False if field does not match filter
+        Return a boolean array selecting the fields of a :class:`_FieldIndex`
+        which meet the condition.
+
+        The STASH and coordinates are only decided once for each distinct
+        set of the header words which determine them.
 
         """
-        res = True
-        if field.stash not in _STASH_ALLOW:
-            if pp_constraints.get('stash'):
+        wanted = np.array([self.stash_wanted(stash) for stash in stashes],
+                          dtype=bool)[inverse]
+        for coord_constraint in self.coord_constraints:
+            i_wanted, = np.nonzero(wanted)
+            if not i_wanted.size:
+                break
+            wanted[i_wanted] = self._index_coord_mask(coord_constraint,
+                                                      index[i_wanted])
+        return wanted
+
+    def _index_coord_mask(self, coord_constraint, index):
+        filter_coords = _FILTER_COORDS[coord_constraint.coord_name]
+        longs = index.headers['longs']
+        floats = index.headers['floats']
+        words = np.concatenate(
+            [longs[:, filter_coords.long_positions],
+             floats[:, filter_coords.float_positions].view(longs.dtype)],
+            axis=1)
+        # Identify the fields with the same header words.
+        words = np.ascontiguousarray(words)
+        keys = words.view(np.dtype((np.void,
+                                    words.dtype.itemsize * words.shape[1])))
+        _, i_firsts, inverse = np.unique(keys[:, 0], return_index=True,
+                                         return_inverse=True)
+        wanted = [self.coord_wanted(coord_constraint,
+                                    make_pp_field(tuple(longs[i_field]) +
+                                                  tuple(floats[i_field])))
+                  for i_field in i_firsts]
+        return np.array(wanted, dtype=bool)[inverse]
+
+
+class _PPFieldFilter(object):
+    """
+    A field filter converted from constraints.
 
-                    res = False
-                    for call_func in pp_constraints['stash']:
+    Calling the filter with a PPField returns True if the field is to be
+    kept, or False if it does not match the filter.
 
-                        if call_func(str(field.stash)):
-                            res = True
-                            break
-        return res
+    The same selection can also be made from the headers of a
+    :class:`_FieldIndex`, so that unwanted fields need never be created.
 
-    if pp_constraints and not unhandled_constraints:
-        result = pp_filter
-    else:
-        result = None
-    return result
+    """
+    def __init__(self, conditions):
+        #: The :class:`_FieldCondition` instances, one of which a field must
+        #: meet to be kept.
+        self.conditions = conditions
+
+    def __call__(self, field):
+        return (field.stash in _STASH_ALLOW or
+                any(condition(field) for condition in self.conditions))
+
+    def index_mask(self, index):
+        """
+        Return a boolean array selecting the wanted fields of a
+        :class:`_FieldIndex`.
+
+        Land-sea mask fields are always selected, as they are needed to
+        decompress other fields.
+
+        """
+        stashes, inverse = index.stash_codes()
+        wanted = np.array([stash == _LAND_MASK_STASH or stash in _STASH_ALLOW
+                           for stash in stashes], dtype=bool)[inverse]
+        for condition in self.conditions:
+            wanted |= condition.index_mask(index, stashes, inverse)
+        return wanted
 
 
 def load_cubes(filenames, callback=None, constraints=None):
@@ -2261,28 +2746,38 @@ def _load_cubes_variable_loader(filenames, callback, loading_function,
     import iris.fileformats.um._fast_load as um_fast_load
     pp_filter = None
     if constraints is not None:
-        pp_filter = _convert_constraints(constraints)
+        # Coordinate constraints can only be decided from the field headers
+        # when a callback cannot change the coordinates of the cubes.
+        pp_filter = _convert_constraints(constraints,
+                                         coords=callback is None)
+    # Pass the pp_filter function as an extra keyword to the low-level
+    # generator function, which can then avoid creating unwanted fields.
+    loading_function_kwargs = dict(loading_function_kwargs or {})
+    loading_function_kwargs['pp_filter'] = pp_filter
     if um_fast_load.STRUCTURED_LOAD_CONTROLS.loads_use_structured:
-        # For structured loads, pass down the pp_filter function as an extra
-        # keyword to the low-level generator function.
-        loading_function_kwargs = loading_function_kwargs or {}
-        loading_function_kwargs['pp_filter'] = pp_filter
-        # Also do *not* use this filter in generic rules processing, as for
-        # structured loading, the 'field' of rules processing is no longer a
-        # PPField but a FieldCollation.
-        pp_filter = None
         # Make a loader object for the generic rules code.
+        # For structured loads, the 'field' of rules processing is no longer
+        # a PPField but a FieldCollation.
+        # The loading function, which suits the format of these files, is
+        # passed down to read the fields to be collated.
+        loading_function_kwargs['fields_loader'] = loading_function
         loader = iris.fileformats.rules.Loader(
             um_fast_load._basic_load_function,
             loading_function_kwargs,
             um_fast_load._convert_collation)
     else:
+        # The fields of a load share much of their conversion, which is
+        # re-used rather than repeated for every field.
         loader = iris.fileformats.rules.Loader(
-            loading_function, loading_function_kwargs or {},
-            iris.fileformats.pp_rules.convert)
+            loading_function, loading_function_kwargs,
+            iris.fileformats.pp_rules._CachingConverter())
 
-    result = iris.fileformats.rules.load_cubes(filenames, callback, loader,
-                                               pp_filter)
+    if um_fast_load._can_premerge(callback, constraints):
+        # The fields which provably merge are returned as merged cubes.
+        result = um_fast_load._load_premerged_cubes(filenames, loader)
+    else:
+        result = iris.fileformats.rules.load_cubes(filenames, callback,
+                                                   loader)
 
     if um_fast_load.STRUCTURED_LOAD_CONTROLS.loads_use_structured:
         # We need an additional concatenate-like operation to combine cubes
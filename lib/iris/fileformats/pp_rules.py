@@ -699,6 +699,149 @@ def convert(f):
                               dim_coords_and_dims, aux_coords_and_dims)
 
 
+# The names of the header words which determine each part of the conversion
+# of a field.
+_DATE_HEADERS = frozenset(['lbyr', 'lbmon', 'lbdat', 'lbhr', 'lbmin', 'lbday',
+                           'lbsec', 'lbyrd', 'lbmond', 'lbdatd', 'lbhrd',
+                           'lbmind', 'lbdayd', 'lbsecd', 'lbft'])
+_TIME_HEADERS = _DATE_HEADERS | frozenset(['lbtim', 'lbcode'])
+_VERTICAL_HEADERS = frozenset(['lbcode', 'lbvc', 'lblev', 'lbuser', 'brsvd',
+                               'blev', 'brlev', 'bhlev', 'bhrlev'])
+_REALIZATION_HEADERS = frozenset(['lbrsvd'])
+_PSEUDO_LEVEL_HEADERS = frozenset(['lbuser'])
+# The header words which the "other" rules never use.  They only use the
+# date words for climatological and cross-section fields.
+_NOT_OTHER_HEADERS = frozenset(['lblrec', 'lbvc', 'lbegin', 'lbnrec', 'lblev',
+                                'lbrsvd', 'brsvd', 'blev', 'brlev', 'bhlev',
+                                'bhrlev'])
+
+
+class _CachingConverter(object):
+    """
+    Converts PP fields into the corresponding items of Cube metadata, as
+    :func:`convert`, re-using the parts of the conversion made for earlier
+    fields with the same values of the header words which they depend on.
+
+    This avoids repeating the same conversions for the many fields of a
+    file which share their times, levels or phenomenon.  The coordinates
+    returned are always new objects.
+
+    """
+    def __init__(self):
+        self._results = {}
+        self._header_names = {}
+
+    def _key(self, field, header_names):
+        # The values of the named header words of the field.
+        cls = type(field)
+        names = self._header_names.get((cls, header_names))
+        if names is None:
+            names = [name for name, _ in field.HEADER_DEFN
+                     if name in header_names]
+            self._header_names[(cls, header_names)] = names
+        values = []
+        for name in names:
+            value = getattr(field, name)
+            if isinstance(value, iris.fileformats.pp.SplittableInt):
+                value = int(value)
+            values.append(value)
+        return (cls, header_names) + tuple(values)
+
+    def _result(self, field, header_names, func):
+        key = self._key(field, header_names)
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = func(field)
+        return result
+
+    def _other_header_names(self, field):
+        # The names of the header words which the "other" rules use, or
+        # None if the rules also use the extra data of the field.
+        if any(hasattr(field, name)
+               for name in iris.fileformats.pp.EXTRA_DATA.values()):
+            return None
+        all_names = frozenset(name for name, _ in field.HEADER_DEFN)
+        header_names = all_names - _NOT_OTHER_HEADERS
+        if field.lbtim.ib not in (2, 3) and len(field.lbcode) != 5:
+            header_names = header_names - _DATE_HEADERS
+        return header_names
+
+    def _other_key(self, field):
+        """
+        Return a key which is equal for fields which share the result of
+        the "other" rules, i.e. their phenomenon and horizontal grid, or
+        None if the result cannot be shared.
+
+        """
+        header_names = self._other_header_names(field)
+        if header_names is not None:
+            header_names = self._key(field, header_names)
+        return header_names
+
+    def _other_rules(self, field):
+        header_names = self._other_header_names(field)
+        if header_names is None:
+            # The rules also use the extra data of the field.
+            return _all_other_rules(field)
+        return self._result(field, header_names, _all_other_rules)
+
+    def _parts(self, f):
+        """
+        Return the shared results of each part of the conversion of the
+        field, as a tuple of its time coordinates, its vertical
+        coordinates and factories, its realization coordinates, its
+        pseudo-level coordinates and the result of the "other" rules.
+
+        The results are the cached objects themselves, so fields which
+        share a part of their conversion return the identical object.
+        They must not be modified.
+
+        """
+        time_coords_and_dims = self._result(
+            f, _TIME_HEADERS,
+            lambda f: _convert_time_coords(
+                lbcode=f.lbcode, lbtim=f.lbtim,
+                epoch_hours_unit=f.time_unit('hours'),
+                t1=f.t1, t2=f.t2, lbft=f.lbft))
+        vertical = self._result(
+            f, _VERTICAL_HEADERS,
+            lambda f: _convert_vertical_coords(
+                lbcode=f.lbcode, lbvc=f.lbvc, blev=f.blev, lblev=f.lblev,
+                stash=f.stash, bhlev=f.bhlev, bhrlev=f.bhrlev,
+                brsvd1=f.brsvd[0], brsvd2=f.brsvd[1], brlev=f.brlev))
+        realization_coords_and_dims = self._result(
+            f, _REALIZATION_HEADERS,
+            lambda f: _convert_scalar_realization_coords(
+                lbrsvd4=f.lbrsvd[3]))
+        pseudo_level_coords_and_dims = self._result(
+            f, _PSEUDO_LEVEL_HEADERS,
+            lambda f: _convert_scalar_pseudo_level_coords(
+                lbuser5=f.lbuser[4]))
+        return (time_coords_and_dims, vertical, realization_coords_and_dims,
+                pseudo_level_coords_and_dims, self._other_rules(f))
+
+    def __call__(self, f):
+        def copy_coords(coords_and_dims):
+            return [(coord.copy(), dims) for coord, dims in coords_and_dims]
+
+        time_coords_and_dims, vertical, realization_coords_and_dims, \
+            pseudo_level_coords_and_dims, other = self._parts(f)
+        vertical_coords_and_dims, vertical_factories = vertical
+        references, standard_name, long_name, units, attributes, \
+            cell_methods, dim_coords_and_dims, other_aux_coords_and_dims = \
+            other
+
+        aux_coords_and_dims = copy_coords(
+            time_coords_and_dims + vertical_coords_and_dims +
+            realization_coords_and_dims + pseudo_level_coords_and_dims +
+            other_aux_coords_and_dims)
+        return ConversionMetadata(list(vertical_factories), list(references),
+                                  standard_name, long_name, units,
+                                  dict(attributes), list(cell_methods),
+                                  copy_coords(dim_coords_and_dims),
+                                  aux_coords_and_dims)
+
+
 def _all_other_rules(f):
     """
     This deals with all the other rules that have not been factored into any of
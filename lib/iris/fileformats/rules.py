@@ -1018,14 +1018,13 @@ def load_cubes(filenames, user_callback, loader, filter_function=None):
     if isinstance(filenames, six.string_types):
         filenames = [filenames]
 
-    def _generate_all_fields_and_filenames():
-        for filename in filenames:
-            for field in loader.field_generator(
-                    filename, **loader.field_generator_kwargs):
-                # evaluate field against format specific desired attributes
-                # load if no format specific desired attributes are violated
-                if filter_function is None or filter_function(field):
-                    yield (field, filename)
+    def _generate_fields_and_filenames(filename):
+        for field in loader.field_generator(
+                filename, **loader.field_generator_kwargs):
+            # evaluate field against format specific desired attributes
+            # load if no format specific desired attributes are violated
+            if filter_function is None or filter_function(field):
+                yield (field, filename)
 
     def loadcubes_user_callback_wrapper(cube, field, filename):
         # First run any custom user-provided rules.
@@ -1040,7 +1039,11 @@ def load_cubes(filenames, user_callback, loader, filter_function=None):
             result = user_callback(cube, field, filename)
         return result
 
-    all_fields_and_filenames = _generate_all_fields_and_filenames()
+    # Within iris.io.parallel_loading, the files are read concurrently.
+    # The fields are always converted here, in file order, as the conversion
+    # is not thread-safe.
+    all_fields_and_filenames = iris.io._chain_files(
+        _generate_fields_and_filenames, filenames)
     for cube, field in _load_pairs_from_fields_and_filenames(
             all_fields_and_filenames,
             converter=loader.converter,
@@ -30,15 +30,22 @@ the 'normal' calls with 'structured' loading.
 At present, there is *no* public low-level fields-to-cube interface, equivalent
 to the pp "as_pairs" functions.
 
+This module also supports the "merged" loading used by :meth:`iris.load` and
+its associates, other than :meth:`iris.load_raw`, when structured loading is
+not enabled.  There, the fields of each phenomenon which provably merge into a
+single cube are returned as that merged cube, which is built directly from the
+shared parts of their conversions rather than from a cube for every field.
+
 """
 
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+from collections import defaultdict, OrderedDict
 from contextlib import contextmanager
+import functools
 import threading
-import os.path
 
 # Be minimal about what we import from iris, to avoid circular imports.
 # Below, other parts of iris.fileformats are accessed via deferred imports.
@@ -53,7 +60,8 @@ _FF_SPEC_NAME = 'UM Fieldsfile'
 _PP_SPEC_NAME = 'UM Post Processing file'
 
 
-def _basic_load_function(filename, pp_filter=None, **kwargs):
+def _basic_load_function(filename, pp_filter=None, fields_loader=None,
+                         **kwargs):
     # The low-level 'fields from filename' loader.
     #
     # This is the 'loader.generator' in the control structure passed to the
@@ -70,7 +78,12 @@ def _basic_load_function(filename, pp_filter=None, **kwargs):
     # operation that speeds up phenomenon selection.
     # Therefore, the actual loader will pass this as the 'pp_filter' keyword,
     # when it is present.
-    # Additional load keywords are 'passed on' to the lower-level function.
+    # This, and any additional load keywords, are 'passed on' to the
+    # lower-level function.
+    #
+    # The lower-level function itself is passed as the 'fields_loader'
+    # keyword, as the format handler which calls the loader already knows the
+    # file format.  If it is not given, it is chosen from the file format.
     from iris.fileformats.um._fast_load_structured_fields import \
         group_structured_fields
 
@@ -79,15 +92,12 @@ def _basic_load_function(filename, pp_filter=None, **kwargs):
         # Return the PPfield loading function for a file name.
         #
         # This decides whether the underlying file is an FF or PP file.
-        # Because it would be too awkward to modify the whole iris loading
-        # callchain to "pass down" the file format, this function instead
-        # 'recreates' that information by calling the format picker again.
-        # NOTE: this may be inefficient, especially for web resources.
+        # The format picker remembers the format of each file it has already
+        # identified, so this does not normally re-open the file.
         from iris.fileformats import FORMAT_AGENT
         from iris.fileformats.pp import load as pp_load
         from iris.fileformats.um import um_to_pp
-        with open(fname, 'rb') as fh:
-            spec = FORMAT_AGENT.get_spec(os.path.basename(fname), fh)
+        spec = FORMAT_AGENT.get_file_spec(fname)
         if spec.name.startswith(_FF_SPEC_NAME):
             loader = um_to_pp
         elif spec.name.startswith(_PP_SPEC_NAME):
@@ -97,10 +107,9 @@ def _basic_load_function(filename, pp_filter=None, **kwargs):
             raise ValueError(emsg.format(fname))
         return loader
 
-    loader = _select_raw_fields_loader(filename)
-    fields = iter(field
-                  for field in loader(filename, **kwargs)
-                  if pp_filter is None or pp_filter(field))
+    if fields_loader is None:
+        fields_loader = _select_raw_fields_loader(filename)
+    fields = fields_loader(filename, pp_filter=pp_filter, **kwargs)
     return group_structured_fields(fields)
 
 
@@ -266,26 +275,36 @@ class StructuredLoadFlags(threading.local):
         self.loads_use_structured = False
         # Control whether structured load 'combine' is enabled.
         self.structured_load_is_raw = False
+        # Control whether loads may return cubes merged from many fields.
+        # When enabled, this is a dictionary, to which such a load adds a
+        # function returning the unmerged cubes of each merged cube, keyed
+        # by the id of the merged cube.
+        self.premerged_cubes = None
 
     @contextmanager
     def context(self,
                 loads_use_structured=None,
-                structured_load_is_raw=None):
+                structured_load_is_raw=None,
+                premerged_cubes=None):
         # Snapshot current states, for restoration afterwards.
         old_structured = self.loads_use_structured
         old_raw_load = self.structured_load_is_raw
+        old_premerged = self.premerged_cubes
         try:
             # Set flags for duration, as requested.
             if loads_use_structured is not None:
                 self.loads_use_structured = loads_use_structured
             if structured_load_is_raw is not None:
                 self.structured_load_is_raw = structured_load_is_raw
+            if premerged_cubes is not None:
+                self.premerged_cubes = premerged_cubes
             # Yield to caller operation.
             yield
         finally:
             # Restore entry state of flags.
             self.loads_use_structured = old_structured
             self.structured_load_is_raw = old_raw_load
+            self.premerged_cubes = old_premerged
 
 
 # A singleton structured-load-control object.
@@ -444,3 +463,317 @@ def _raw_structured_loading():
     """
     with STRUCTURED_LOAD_CONTROLS.context(structured_load_is_raw=True):
         yield
+
+
+#
+# Merged loading.
+#
+# A merging load, i.e. :func:`iris.load` and its associates other than
+# :func:`iris.load_raw`, makes a cube from every field only to merge most of
+# them straight back together.  Where the fields of a phenomenon provably
+# merge into a single cube, it is instead built directly from the shared
+# parts of the field conversions, as made by
+# :class:`iris.fileformats.pp_rules._CachingConverter`.
+#
+def _is_cube_wide(constraint):
+    # Whether a constraint selects either all of a cube or none of it, and
+    # so selects a merged cube exactly when it selects its source cubes.
+    if isinstance(constraint, iris._constraints.ConstraintCombination):
+        result = (_is_cube_wide(constraint.lhs) and
+                  _is_cube_wide(constraint.rhs))
+    elif constraint._coord_constraints:
+        result = False
+    elif isinstance(constraint, iris.AttributeConstraint):
+        result = True
+    else:
+        result = (type(constraint) is iris.Constraint and
+                  constraint._cube_func is None)
+    return result
+
+
+def _can_premerge(callback, constraints):
+    # Whether a UM file load may return merged cubes.
+    #
+    # This needs a merging load which is not structured, has no callback to
+    # change the cube of each field, and whose constraints do not depend on
+    # the coordinates of the cubes.
+    controls = STRUCTURED_LOAD_CONTROLS
+    return (controls.premerged_cubes is not None and
+            not controls.loads_use_structured and
+            callback is None and
+            all(_is_cube_wide(constraint) for constraint in
+                iris._constraints.list_of_constraints(constraints)))
+
+
+def _same_metadata(metadata, other):
+    try:
+        result = bool(metadata == other)
+    except ValueError:
+        # Array-valued attributes can't be compared like this, so assume
+        # the worst.
+        result = True
+    return result
+
+
+def _clashing_cubes(cubes, candidate_ids):
+    # Return the ids of those candidate cubes which share their phenomenon
+    # metadata with another of the cubes, and so may merge with it.
+    cubes_by_name = defaultdict(list)
+    for cube in cubes:
+        name = (cube.standard_name, cube.long_name, cube.var_name)
+        cubes_by_name[name].append(cube)
+    result = set()
+    for named_cubes in cubes_by_name.values():
+        for cube in named_cubes:
+            if id(cube) in candidate_ids and any(
+                    other is not cube and
+                    _same_metadata(cube.metadata, other.metadata)
+                    for other in named_cubes):
+                result.add(id(cube))
+    return result
+
+
+def _scalar_items(coords_and_dims, proto_cube):
+    # The merge sort key, definition, cell and metadata of each coordinate,
+    # or None if any of them is not a scalar coordinate.
+    items = []
+    for coord, dims in coords_and_dims:
+        if dims or coord.shape != (1,):
+            return None
+        items.append((proto_cube._coord_sort_key(coord),) +
+                     proto_cube._scalar_coord_payload(coord))
+    return items
+
+
+def _premerge_fields(fields, converter):
+    # Return the single cube which the cubes of the fields merge into,
+    # built without making the cube of each field, or None unless the
+    # fields provably merge like that.
+    #
+    # The fields must share the result of the "other" conversion rules,
+    # which decide the phenomenon and the horizontal grid.  The merge is
+    # made by :class:`iris._merge.ProtoCube` itself, from the scalar
+    # coordinates of each field, so the result is the same.
+    from iris._merge import ProtoCube, _ScalarCoordPayload
+    from iris.fileformats.rules import _make_cube
+
+    template, factories, references = _make_cube(fields[0], converter)
+    if factories or references or 'invalid_units' in template.attributes:
+        # These need the cube of each field.
+        return None
+    proto_cube = ProtoCube(template)
+    other = converter._parts(fields[0])[-1]
+    other_aux_coords_and_dims = other[-1]
+    other_items = _scalar_items(
+        [(coord, dims) for coord, dims in other_aux_coords_and_dims
+         if not dims], proto_cube)
+    if other_items is None:
+        return None
+    items_by_part = {}
+    payloads = {}
+    for i, field in enumerate(fields):
+        time, vertical, realization, pseudo, field_other = \
+            converter._parts(field)
+        vertical, factories = vertical
+        data = field.core_data()
+        if (field_other is not other or factories or
+                data.shape != template.shape or
+                field.realised_dtype != template.dtype or
+                (template.fill_value is not None and
+                 field.bmdi != template.fill_value)):
+            return None
+
+        parts = (time, vertical, realization, pseudo)
+        key = tuple(id(part) for part in parts)
+        payload = payloads.get(key)
+        if payload is None:
+            items = list(other_items)
+            for part in parts:
+                if id(part) not in items_by_part:
+                    items_by_part[id(part)] = _scalar_items(part, proto_cube)
+                part_items = items_by_part[id(part)]
+                if part_items is None:
+                    return None
+                items.extend(part_items)
+            items.sort(key=lambda item: item[0])
+            sort_keys = [item[0] for item in items]
+            if any(key1 == key2
+                   for key1, key2 in zip(sort_keys[:-1], sort_keys[1:])):
+                # The order of the coordinates is not decided by their keys.
+                return None
+            payload = payloads[key] = _ScalarCoordPayload(
+                [item[1] for item in items], [item[2] for item in items],
+                [item[3] for item in items])
+
+        if i == 0:
+            # The template was registered as the ProtoCube was made.  Check
+            # that its scalar coordinates were found in the same way.
+            signature = proto_cube._coord_signature
+            if (payload.defns != signature.scalar_defns or
+                    payload.values != proto_cube._skeletons[0].scalar_values):
+                return None
+        elif not proto_cube._register_scalars(payload, data):
+            return None
+
+    cubes = proto_cube.merge(unique=False)
+    if len(cubes) != 1:
+        return None
+    return cubes[0]
+
+
+def _unmerged_cubes(fields, converter):
+    # The cubes of the fields, as they would be loaded without merging.
+    from iris.fileformats.rules import _make_cube
+    return [_make_cube(field, converter)[0] for field in fields]
+
+
+def _convert_fields(fields_and_filenames, indices, converter):
+    # Convert the fields with the given indices to cubes, as
+    # :func:`iris.fileformats.rules.load_cubes`.  Return a list of the
+    # cube, the field index, and whether the cube was only made after all
+    # the fields were read, as it awaited a reference.
+    from iris.fileformats.rules import _load_pairs_from_fields_and_filenames
+
+    all_read = []
+
+    def selected_fields_and_filenames():
+        for index in indices:
+            yield fields_and_filenames[index]
+        all_read.append(True)
+
+    index_of = {id(field): index
+                for index, (field, _) in enumerate(fields_and_filenames)}
+    return [(cube, index_of[id(field)], bool(all_read))
+            for cube, field in _load_pairs_from_fields_and_filenames(
+                selected_fields_and_filenames(), converter)]
+
+
+def _load_premerged_cubes(filenames, loader):
+    """
+    Load cubes from UM files, as :func:`iris.fileformats.rules.load_cubes`
+    with no callback, but with the fields of each phenomenon which
+    provably merge into a single cube returned as that merged cube.
+
+    A merged cube takes the place of the first of its fields, so a merge
+    of the result gives the same cubes, in the same order, as a merge of
+    the cubes of all the fields.  The fields of a phenomenon are only
+    merged when no other loaded cube shares its metadata.  The unmerged
+    cubes of each merged cube are recorded in
+    `STRUCTURED_LOAD_CONTROLS.premerged_cubes`, in case it may merge with
+    cubes loaded from other files.
+
+    Args:
+
+    * filenames:
+        One or more filenames.
+    * loader:
+        A :class:`iris.fileformats.rules.Loader` whose converter is a
+        :class:`iris.fileformats.pp_rules._CachingConverter`.
+
+    Returns:
+        A list of cubes.
+
+    """
+    if isinstance(filenames, six.string_types):
+        filenames = [filenames]
+
+    def _generate_fields_and_filenames(filename):
+        for field in loader.field_generator(
+                filename, **loader.field_generator_kwargs):
+            yield (field, filename)
+
+    fields_and_filenames = list(iris.io._chain_files(
+        _generate_fields_and_filenames, filenames))
+    fields = [field for field, _ in fields_and_filenames]
+    converter = loader.converter
+
+    # Group the fields which share their phenomenon and grid, and merge
+    # each group where possible.
+    groups = OrderedDict()
+    for index, field in enumerate(fields):
+        key = converter._other_key(field)
+        if key is not None:
+            groups.setdefault(key, []).append(index)
+    merged = {}
+    for indices in groups.values():
+        if len(indices) > 1:
+            cube = _premerge_fields([fields[index] for index in indices],
+                                    converter)
+            if cube is not None:
+                merged[indices[0]] = (cube, indices)
+
+    while True:
+        # Convert the other fields as usual.
+        merged_indices = set(index for _, indices in merged.values()
+                             for index in indices)
+        converted = _convert_fields(
+            fields_and_filenames,
+            [index for index in range(len(fields))
+             if index not in merged_indices],
+            converter)
+        # Any merged cube whose cubes might merge with another cube must be
+        # left to the merge of the load.
+        merged_cubes = [cube for cube, _ in merged.values()]
+        clashes = _clashing_cubes(
+            merged_cubes + [cube for cube, _, _ in converted],
+            set(id(cube) for cube in merged_cubes))
+        if not clashes:
+            break
+        merged = {first: (cube, indices)
+                  for first, (cube, indices) in merged.items()
+                  if id(cube) not in clashes}
+
+    premerged_cubes = STRUCTURED_LOAD_CONTROLS.premerged_cubes
+    firsts = sorted(merged, reverse=True)
+    result = []
+
+    def add_merged_cube():
+        cube, indices = merged[firsts.pop()]
+        premerged_cubes[id(cube)] = functools.partial(
+            _unmerged_cubes, [fields[index] for index in indices], converter)
+        result.append(cube)
+
+    for cube, index, awaited_reference in converted:
+        while firsts and (awaited_reference or firsts[-1] < index):
+            add_merged_cube()
+        result.append(cube)
+    while firsts:
+        add_merged_cube()
+    return result
+
+
+def _premerged_cubes(cubes):
+    """
+    Return the cubes of a merging load, allowing the UM file loads which
+    produce them to return cubes merged from many fields.
+
+    Any merged cube which shares its metadata with a cube loaded from
+    another file format is replaced by its unmerged cubes, so that the
+    merge of the load is unchanged.
+
+    Args:
+
+    * cubes:
+        An iterable which loads the cubes.
+
+    Returns:
+        An iterable of cubes.
+
+    """
+    controls = STRUCTURED_LOAD_CONTROLS
+    if controls.structured_load_is_raw:
+        return cubes
+    premerged_cubes = {}
+    with controls.context(premerged_cubes=premerged_cubes):
+        cubes = list(cubes)
+    if premerged_cubes:
+        clashes = _clashing_cubes(cubes, set(premerged_cubes))
+        if clashes:
+            result = []
+            for cube in cubes:
+                if id(cube) in clashes:
+                    result.extend(premerged_cubes[id(cube)]())
+                else:
+                    result.append(cube)
+            cubes = result
+    return cubes
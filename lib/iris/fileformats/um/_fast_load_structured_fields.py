@@ -32,6 +32,7 @@ from netCDF4 import netcdftime
 import numpy as np
 
 from iris._lazy_data import as_lazy_data, multidim_lazy_stack
+from iris.fileformats.pp import _stacked_fields_lazy_data
 from iris.fileformats.um._optimal_array_structuring import \
     optimal_array_structure
 
@@ -86,12 +87,17 @@ class FieldCollation(object):
         if not self._structure_calculated:
             self._calculate_structure()
         if self._data_cache is None:
-            stack = np.empty(self.vector_dims_shape, 'object')
-            for nd_index, field in zip(np.ndindex(self.vector_dims_shape),
-                                       self.fields):
-                stack[nd_index] = as_lazy_data(field._data,
-                                               chunks=field._data.shape)
-            self._data_cache = multidim_lazy_stack(stack)
+            # Unpacked fields from a single file are read in batches.
+            data = _stacked_fields_lazy_data(self.fields,
+                                             self.vector_dims_shape)
+            if data is None:
+                stack = np.empty(self.vector_dims_shape, 'object')
+                for nd_index, field in zip(
+                        np.ndindex(self.vector_dims_shape), self.fields):
+                    stack[nd_index] = as_lazy_data(field._data,
+                                                   chunks=field._data.shape)
+                data = multidim_lazy_stack(stack)
+            self._data_cache = data
         return self._data_cache
 
     def core_data(self):
@@ -30,7 +30,7 @@ from iris.fileformats._ff import FF2PP
 from iris.fileformats.pp import _load_cubes_variable_loader
 
 
-def um_to_pp(filename, read_data=False, word_depth=None):
+def um_to_pp(filename, read_data=False, word_depth=None, pp_filter=None):
     """
     Extract the individual PPFields from within a UM file.
 
@@ -48,6 +48,10 @@ def um_to_pp(filename, read_data=False, word_depth=None):
         Specify whether to read the associated PPField data within
         the FieldsFile.  Default value is False.
 
+    * pp_filter (callable):
+        If given, only the fields for which ``pp_filter(field)`` is True are
+        returned.
+
     Returns:
         Iteration of :class:`iris.fileformats.pp.PPField`\s.
 
@@ -65,7 +69,10 @@ def um_to_pp(filename, read_data=False, word_depth=None):
 
     # Note: unlike the original wrapped case, we will return an actual
     # iterator, rather than an object that can provide an iterator.
-    return iter(ff2pp)
+    result = iter(ff2pp)
+    if pp_filter is not None:
+        result = (field for field in result if pp_filter(field))
+    return result
 
 
 def load_cubes(filenames, callback, constraints=None,
@@ -90,7 +97,7 @@ def load_cubes(filenames, callback, constraints=None,
 
     """
     return _load_cubes_variable_loader(
-        filenames, callback, FF2PP, constraints=constraints,
+        filenames, callback, um_to_pp, constraints=constraints,
         loading_function_kwargs=_loader_kwargs)
 
 
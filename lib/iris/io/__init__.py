@@ -24,9 +24,13 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 import glob
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 import os.path
 import re
 import collections
+from contextlib import contextmanager
+import threading
 
 import iris.fileformats
 import iris.cube
@@ -168,6 +172,91 @@ def expand_filespecs(file_specs):
     return sum(value_lists, [])
 
 
+class _ParallelLoadControl(threading.local):
+    """The current settings of :func:`parallel_loading`."""
+    def __init__(self):
+        #: The number of worker threads, or None for serial loading.
+        self.workers = None
+
+
+_PARALLEL_LOAD_CONTROL = _ParallelLoadControl()
+
+
+@contextmanager
+def parallel_loading(workers=None):
+    """
+    A context manager which makes loads within it read multiple files
+    concurrently, in a pool of worker threads.
+
+    For each file, the format identification and, for field-based formats
+    such as PP and FieldsFiles, the reading and decoding of the fields are
+    then done in a worker thread.  The fields are still converted to cubes
+    in the calling thread, in file order, so the cubes produced are the
+    same, and in the same order, as for an ordinary load.
+
+    Kwargs:
+
+    * workers (int):
+        The number of worker threads.  Defaults to the number of CPUs.
+
+    For example::
+
+        with iris.io.parallel_loading(workers=8):
+            cubes = iris.load(filenames)
+
+    """
+    if workers is None:
+        workers = cpu_count()
+    old_workers = _PARALLEL_LOAD_CONTROL.workers
+    _PARALLEL_LOAD_CONTROL.workers = workers
+    try:
+        yield
+    finally:
+        _PARALLEL_LOAD_CONTROL.workers = old_workers
+
+
+def _load_controls():
+    # The thread-specific controls which affect loading.  Their settings are
+    # copied into the worker threads of a parallel load.
+    from iris.fileformats import _header_index
+    from iris.fileformats import netcdf
+    from iris.fileformats.um import _fast_load
+    return [iris.FUTURE, _header_index.CACHE_CONTROL, netcdf._CHUNK_CONTROL,
+            netcdf._RULES_CONTROL, _fast_load.STRUCTURED_LOAD_CONTROLS]
+
+
+def _chain_files(function, filenames):
+    """
+    Return an iterator over all the items of ``function(filename)``, for
+    each of the filenames in turn.
+
+    Within :func:`parallel_loading`, the items for each file are gathered
+    concurrently, in worker threads.  Otherwise they are produced lazily.
+
+    """
+    workers = _PARALLEL_LOAD_CONTROL.workers
+    if workers is None:
+        for filename in filenames:
+            for item in function(filename):
+                yield item
+    else:
+        states = [(control, control.__dict__.copy())
+                  for control in _load_controls()]
+
+        def gather(filename):
+            for control, state in states:
+                control.__dict__.update(state)
+            return list(function(filename))
+
+        pool = ThreadPool(workers)
+        try:
+            for items in pool.imap(gather, filenames):
+                for item in items:
+                    yield item
+        finally:
+            pool.terminate()
+
+
 def load_files(filenames, callback, constraints=None):
     """
     Takes a list of filenames which may also be globs, and optionally a
@@ -182,12 +271,13 @@ def load_files(filenames, callback, constraints=None):
     """
     all_file_paths = expand_filespecs(filenames)
 
+    def identify(fn):
+        yield iris.fileformats.FORMAT_AGENT.get_file_spec(fn), fn
+
     # Create default dict mapping iris format handler to its associated filenames
     handler_map = collections.defaultdict(list)
-    for fn in all_file_paths:
-        with open(fn, 'rb') as fh:
-            handling_format_spec = iris.fileformats.FORMAT_AGENT.get_spec(os.path.basename(fn), fh)
-            handler_map[handling_format_spec].append(fn)
+    for handling_format_spec, fn in _chain_files(identify, all_file_paths):
+        handler_map[handling_format_spec].append(fn)
 
     # Call each iris format handler with the approriate filenames
     for handling_format_spec in sorted(handler_map):
@@ -59,6 +59,7 @@ import collections
 import functools
 import os
 import struct
+import threading
 
 
 import iris.io
@@ -79,15 +80,27 @@ class FormatAgent(object):
         agent = FormatAgent(NetCDF_specification)
 
     """
+    #: The maximum number of file paths whose specifications are remembered
+    #: by :meth:`get_file_spec`.
+    max_cached_files = 10000
+
     def __init__(self, format_specs=None):
         """ """
         self._format_specs = list(format_specs or [])
         self._format_specs.sort()
+        self._file_specs = collections.OrderedDict()
+        self._file_specs_lock = threading.Lock()
 
     def add_spec(self, format_spec):
         """Add a FormatSpecification instance to this agent for format consideration."""
         self._format_specs.append(format_spec)
         self._format_specs.sort()
+        self.clear_file_specs()
+
+    def clear_file_specs(self):
+        """Forget the specifications remembered by :meth:`get_file_spec`."""
+        with self._file_specs_lock:
+            self._file_specs.clear()
 
     def __repr__(self):
         return 'FormatAgent(%r)' % self._format_specs
@@ -151,6 +164,32 @@ class FormatAgent(object):
                ' File element cache:\n {}'.format(printable_values))
         raise ValueError(msg)
 
+    def get_file_spec(self, filename):
+        """
+        Pick the first FormatSpecification which can handle the given file.
+
+        The result for each file path is remembered, and re-used for as long
+        as the file's modification time and size are unchanged, so that
+        identifying the same file again does not re-open it.
+
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime, stat.st_size)
+        with self._file_specs_lock:
+            cached = self._file_specs.pop(path, None)
+            if cached is not None and cached[0] == stamp:
+                # Re-insert as the most recently used file.
+                self._file_specs[path] = cached
+                return cached[1]
+        with open(filename, 'rb') as fh:
+            spec = self.get_spec(os.path.basename(filename), fh)
+        with self._file_specs_lock:
+            self._file_specs[path] = (stamp, spec)
+            while len(self._file_specs) > self.max_cached_files:
+                self._file_specs.popitem(last=False)
+        return spec
+
 
 @functools.total_ordering
 class FormatSpecification(object):
@@ -0,0 +1,143 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Integration tests for loading PP files with the fields of each phenomenon
+already merged, as done by :func:`iris.load` and its associates.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from cf_units import Unit
+import numpy as np
+
+import iris
+from iris.coord_systems import GeogCS
+from iris.coords import DimCoord
+from iris.cube import Cube, CubeList
+from iris.fileformats.pp import EARTH_RADIUS, STASH
+import iris.fileformats.rules
+from iris.tests import mock
+
+
+def _field_cube(day, level, item=4, nlat=3):
+    # A cube which saves as a single PP field.
+    data = np.arange(nlat * 5, dtype=np.float32).reshape(nlat, 5)
+    cube = Cube(data + day + 10 * level, units='K')
+    cs = GeogCS(EARTH_RADIUS)
+    cube.add_dim_coord(DimCoord(np.linspace(-45, 45, nlat), 'latitude',
+                                units='degrees', coord_system=cs), 0)
+    cube.add_dim_coord(DimCoord(np.linspace(0, 288, 5), 'longitude',
+                                units='degrees', coord_system=cs), 1)
+    # The PP save rules keep the time coordinates of a 360-day calendar.
+    time_unit = Unit('hours since 1970-01-01', calendar='360_day')
+    cube.add_aux_coord(DimCoord(24.0 * day, 'time', units=time_unit))
+    cube.add_aux_coord(DimCoord(0.0, 'forecast_reference_time',
+                                units=time_unit))
+    cube.add_aux_coord(DimCoord(24.0 * day, 'forecast_period',
+                                units='hours'))
+    cube.add_aux_coord(DimCoord(10.0 * level, 'height', units='m'))
+    cube.attributes['STASH'] = STASH(1, 0, item)
+    return cube
+
+
+class Test(tests.IrisTest):
+    def _check(self, field_cubes, constraints=None, n_cubes=None,
+               premerged=True, shape=None):
+        # Check that a load gives the same cubes as merging the cubes of
+        # all the fields, and whether it made the cube of each field.
+        with self.temp_filename('.pp') as path:
+            iris.save(CubeList(field_cubes), path)
+            make_cube = mock.Mock(wraps=iris.fileformats.rules._make_cube)
+            with mock.patch('iris.fileformats.rules._make_cube', make_cube):
+                result = iris.load(path, constraints)
+            expected = iris.load_raw(path, constraints).merge(unique=False)
+            self.assertEqual(result, expected)
+        if n_cubes is not None:
+            self.assertEqual(len(result), n_cubes)
+        if shape is not None:
+            self.assertEqual(result[0].shape, shape)
+        if premerged:
+            self.assertLess(make_cube.call_count, len(field_cubes))
+        else:
+            self.assertGreaterEqual(make_cube.call_count, len(field_cubes))
+
+    def test_times_and_levels(self):
+        field_cubes = [_field_cube(day, level)
+                       for day in range(3) for level in [1, 2]]
+        self._check(field_cubes, n_cubes=1, shape=(3, 2, 3, 5))
+
+    def test_phenomena(self):
+        field_cubes = [_field_cube(day, level, item)
+                       for day in range(3) for level in [2, 1]
+                       for item in [10, 4]]
+        self._check(field_cubes, n_cubes=2)
+
+    def test_irregular(self):
+        field_cubes = [_field_cube(day, level)
+                       for day, level in [(0, 1), (0, 2), (1, 1)]]
+        self._check(field_cubes, n_cubes=1)
+
+    def test_duplicates(self):
+        field_cubes = [_field_cube(day, 1) for day in [0, 1, 1]]
+        self._check(field_cubes, n_cubes=2, premerged=False)
+
+    def test_grids(self):
+        # The same phenomenon on two grids is left to the merge of the load.
+        field_cubes = [_field_cube(day, 1, nlat=nlat)
+                       for nlat in [3, 2] for day in range(3)]
+        self._check(field_cubes, n_cubes=2, premerged=False)
+
+    def test_name_constraint(self):
+        field_cubes = [_field_cube(day, level, item)
+                       for day in range(3) for level in [1, 2]
+                       for item in [4, 10]]
+        self._check(field_cubes, 'specific_humidity', n_cubes=1)
+
+    def test_coord_constraint(self):
+        field_cubes = [_field_cube(day, level)
+                       for day in range(3) for level in [1, 2]]
+        self._check(field_cubes, iris.Constraint(height=10.0), n_cubes=1,
+                    premerged=False)
+
+    def test_files(self):
+        field_cubes = [_field_cube(day, 1) for day in range(4)]
+        with self.temp_filename('.pp') as path1, \
+                self.temp_filename('.pp') as path2:
+            iris.save(CubeList(field_cubes[2:] + [_field_cube(0, 1, 10)]),
+                      path1)
+            iris.save(CubeList(field_cubes[:2]), path2)
+            result = iris.load([path1, path2])
+            expected = iris.load_raw([path1, path2]).merge(unique=False)
+            self.assertEqual(result, expected)
+        self.assertEqual(result[0].shape, (4, 3, 5))
+
+    def test_load_raw(self):
+        field_cubes = [_field_cube(day, 1) for day in range(3)]
+        with self.temp_filename('.pp') as path:
+            iris.save(CubeList(field_cubes), path)
+            result = iris.load_raw(path)
+        self.assertEqual(len(result), 3)
+
+
+if __name__ == '__main__':
+    tests.main()
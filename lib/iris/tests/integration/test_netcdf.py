@@ -35,9 +35,12 @@ import numpy as np
 import numpy.ma as ma
 
 import iris
-from iris.coords import CellMethod
+from iris.coord_systems import GeogCS, TransverseMercator
+from iris.coords import AuxCoord, CellMeasure, CellMethod, DimCoord
 from iris.cube import Cube, CubeList
 from iris.fileformats.netcdf import CF_CONVENTIONS_VERSION
+from iris.fileformats.netcdf import compiled_rules
+from iris.fileformats.pp import STASH
 from iris.fileformats.netcdf import Saver
 from iris.fileformats.netcdf import UnknownCellMethodWarning
 from iris.tests import mock
@@ -432,5 +435,112 @@ class TestPackedData(tests.IrisTest):
         self._multi_test('multi_packed_multi_dtype.cdl', multi_dtype=True)
 
 
+class CompiledRulesMixin(object):
+    # The compiled rules must translate each netCDF variable into the same
+    # cube as the PyKE rules, by triggering the same rules.
+    def _load(self, path, compiled):
+        rules = []
+
+        def pyke_stats(engine, cf_name):
+            rules.append((cf_name, sorted(engine.rule_triggered)))
+
+        with mock.patch('iris.fileformats.netcdf._pyke_stats',
+                        side_effect=pyke_stats):
+            if compiled:
+                with compiled_rules():
+                    cubes = iris.load_raw(path)
+            else:
+                cubes = iris.load_raw(path)
+        return cubes, rules
+
+    def assertParity(self, path):
+        expected_cubes, expected_rules = self._load(path, compiled=False)
+        cubes, rules = self._load(path, compiled=True)
+        self.assertEqual(rules, expected_rules)
+        self.assertEqual(cubes, expected_cubes)
+        for cube, expected_cube in zip(cubes, expected_cubes):
+            self.assertEqual(cube.coords(), expected_cube.coords())
+            self.assertEqual(cube.cell_measures(),
+                             expected_cube.cell_measures())
+
+
+class TestCompiledRules(CompiledRulesMixin, tests.IrisTest):
+    def _check_saved(self, cubes):
+        with self.temp_filename(suffix='.nc') as path:
+            iris.save(cubes, path)
+            self.assertParity(path)
+
+    def test_rotated_pole(self):
+        self._check_saved(stock.realistic_3d())
+
+    def test_shared_coordinates(self):
+        cube = stock.realistic_3d()
+        other = cube.copy()
+        other.rename('air_temperature')
+        self._check_saved(CubeList([cube, other]))
+
+    def test_hybrid_height(self):
+        self._check_saved(stock.hybrid_height())
+
+    def test_ocean_sigma_z(self):
+        self._check_saved(stock.ocean_sigma_z())
+
+    def test_multidim_coords(self):
+        self._check_saved(stock.simple_3d_w_multidim_coords())
+
+    def test_lat_lon_extras(self):
+        cube = stock.lat_lon_cube()
+        cube.attributes['STASH'] = STASH(1, 16, 203)
+        cube.attributes['ukmo__process_flags'] = ('one', 'two words')
+        cube.add_aux_coord(AuxCoord(['a', 'b', 'c'], long_name='region'), 0)
+        cube.add_cell_measure(CellMeasure(np.ones(cube.shape),
+                                          long_name='cell_area', units='m2',
+                                          measure='area'), (0, 1))
+        self._check_saved(cube)
+
+    def test_transverse_mercator(self):
+        cs = TransverseMercator(49, -2, 400000, -100000, 0.9996012717,
+                                GeogCS(6377563.396, 6356256.909))
+        cube = Cube(np.zeros((2, 3)), long_name='elevation', units='m')
+        cube.add_dim_coord(DimCoord([0.0, 1000.0],
+                                    standard_name='projection_y_coordinate',
+                                    units='m', coord_system=cs), 0)
+        cube.add_dim_coord(DimCoord([0.0, 1000.0, 2000.0],
+                                    standard_name='projection_x_coordinate',
+                                    units='m', coord_system=cs), 1)
+        self._check_saved(cube)
+
+    def test_no_coordinate_system(self):
+        cube = stock.simple_2d()
+        cube.add_aux_coord(DimCoord(1000.0, long_name='pressure', units='Pa'))
+        self._check_saved(cube)
+
+
+@tests.skip_data
+class TestCompiledRules_data(CompiledRulesMixin, tests.IrisTest):
+    def test(self):
+        for path in (('global', 'xyt', 'SMALL_hires_wind_u_for_ipcc4.nc'),
+                     ('global', 'xyt', 'SMALL_total_column_co2.nc'),
+                     ('global', 'xyz_t', 'GEMS_CO2_Apr2006.nc'),
+                     ('label_and_climate',
+                      'A1B-99999a-river-sep-2070-2099.nc'),
+                     ('label_and_climate', 'small_FC_167_mon_19601101.nc'),
+                     ('lambert_azimuthal_equal_area', 'euro_air_temp.nc'),
+                     ('lambert_conformal', 'test_lcc.nc'),
+                     ('mercator', 'toa_brightness_temperature.nc'),
+                     ('ORCA2', 'votemper.nc'),
+                     ('rotated', 'xy', 'rotPole_landAreaFraction.nc'),
+                     ('rotated', 'xyt', 'small_rotPole_precipitation.nc'),
+                     ('stereographic', 'toa_brightness_temperature.nc'),
+                     ('testing', 'cell_methods.nc'),
+                     ('testing', 'small_theta_colpex.nc'),
+                     ('testing', 'units.nc'),
+                     ('transverse_mercator',
+                      'projection_origin_attributes.nc'),
+                     ('transverse_mercator', 'tmean_1910_1910.nc'),
+                     ('unstructured_grid', 'theta_nodal_xios.nc')):
+            self.assertParity(tests.get_data_path(('NetCDF',) + path))
+
+
 if __name__ == "__main__":
     tests.main()
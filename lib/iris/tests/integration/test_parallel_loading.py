@@ -0,0 +1,130 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Integration tests for loading with :func:`iris.io.parallel_loading`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import iris
+from iris.coords import DimCoord
+from iris.fileformats.pp import STASH
+from iris.io import parallel_loading
+import iris.tests.stock as stock
+from iris.tests import mock
+
+
+class TestPPFiles(tests.IrisTest):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        cube = stock.lat_lon_cube()
+        cube.data = cube.data.astype('f4')
+        cube.rename('air_temperature')
+        cube.units = 'K'
+        cube.add_aux_coord(DimCoord(0, 'forecast_period', units='hours'))
+        self.filenames = []
+        for i_file in range(6):
+            cubes = []
+            for stash in (STASH(1, 0, 4), STASH(1, 0, 10)):
+                for i_time in range(3):
+                    time = i_file * 3 + i_time
+                    field_cube = cube.copy(cube.data + time)
+                    field_cube.attributes['STASH'] = stash
+                    field_cube.add_aux_coord(
+                        DimCoord(time, 'time',
+                                 units='hours since 1970-01-01'))
+                    cubes.append(field_cube)
+            filename = os.path.join(self.temp_dir,
+                                    'file{}.pp'.format(i_file))
+            iris.save(cubes, filename)
+            self.filenames.append(filename)
+
+    def _check_same(self, serial, parallel):
+        self.assertEqual(len(parallel), len(serial))
+        for parallel_cube, serial_cube in zip(parallel, serial):
+            self.assertEqual(parallel_cube, serial_cube)
+
+    def test_raw(self):
+        serial = iris.load_raw(self.filenames)
+        with parallel_loading(workers=3):
+            parallel = iris.load_raw(self.filenames)
+        self.assertEqual(len(serial), 36)
+        self._check_same(serial, parallel)
+
+    def test_merged(self):
+        constraint = iris.AttributeConstraint(STASH='m01s00i010')
+        serial = iris.load(self.filenames, constraint)
+        with parallel_loading(workers=3):
+            parallel = iris.load(self.filenames, constraint)
+        self.assertEqual(len(serial), 1)
+        self.assertEqual(serial[0].shape, (18, 3, 4))
+        self._check_same(serial, parallel)
+
+
+class TestCrossFileReferences(tests.IrisTest):
+    def _field(self, scale=1):
+        # Make a fake PPField, as in test_pp.TestVertical.
+        x, y = 4, 3
+        data = np.arange(12).reshape(y, x) * scale
+        core_data = mock.MagicMock(return_value=data)
+        field = mock.MagicMock(core_data=core_data,
+                               realised_dtype=data.dtype,
+                               lbcode=[1],
+                               lbnpt=x, lbrow=y, bzx=350, bdx=1.5,
+                               bzy=40, bdy=1.5, lbuser=[0] * 7,
+                               lbrsvd=[0] * 4)
+        field._x_coord_name = lambda: 'longitude'
+        field._y_coord_name = lambda: 'latitude'
+        field.coord_system = lambda: None
+        return field
+
+    def test_reference_in_other_file(self):
+        # A reference surface in one file is used by a field in another.
+        pressure_field = self._field(10)
+        pressure_field.stash = STASH(1, 0, 409)
+        pressure_field.lbuser[3] = 409
+        data_field = self._field()
+        data_field.configure_mock(lbvc=9, lblev=5, bhlev=0.1, bhrlev=0.05,
+                                  blev=0.9, brlev=0.85, brsvd=[0.95, 0.15])
+        fields = {'data.pp': [data_field], 'pressure.pp': [pressure_field]}
+
+        def load(filename, **kwargs):
+            return iter(fields[filename])
+
+        with mock.patch('iris.fileformats.pp.load', new=load), \
+                parallel_loading(workers=2):
+            pressure_cube, data_cube = iris.fileformats.pp.load_cubes(
+                ['data.pp', 'pressure.pp'])
+        self.assertEqual(pressure_cube.standard_name, 'surface_air_pressure')
+        factory, = data_cube.aux_factories
+        surface_coord = factory.dependencies['surface_air_pressure']
+        self.assertArrayEqual(surface_coord.points,
+                              np.arange(120, step=10).reshape(3, 4))
+
+
+if __name__ == "__main__":
+    tests.main()
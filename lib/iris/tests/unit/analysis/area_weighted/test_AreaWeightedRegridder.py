@@ -27,11 +27,15 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import iris.tests as tests
 
 import numpy as np
+import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
 from iris.analysis._area_weighted import AreaWeightedRegridder
 from iris.coord_systems import GeogCS
 from iris.coords import DimCoord
 from iris.cube import Cube
+from iris.experimental.regrid import \
+    regrid_area_weighted_rectilinear_src_and_grid as regrid
 from iris.tests import mock
 
 
@@ -69,18 +73,68 @@ class Test(tests.IrisTest):
         src.data += 10
 
         with mock.patch('iris.experimental.regrid.'
-                        'regrid_area_weighted_rectilinear_src_and_grid',
-                        return_value=mock.sentinel.result) as regrid:
+                        '_regrid_area_weighted_rectilinear_src_and_grid'
+                        '__prepare',
+                        return_value=mock.sentinel.info), \
+                mock.patch('iris.experimental.regrid.'
+                           '_regrid_area_weighted_rectilinear_src_and_grid'
+                           '__perform',
+                           return_value=mock.sentinel.result) as regrid:
             result = regridder(src)
 
         self.assertEqual(regrid.call_count, 1)
         _, args, kwargs = regrid.mock_calls[0]
 
-        self.assertEqual(args[0], src)
+        self.assertEqual(args, (src, mock.sentinel.info, mdtol))
+        self.assertEqual(kwargs, {})
+        self.assertIs(result, mock.sentinel.result)
+
+    def bounded_grids(self):
+        src, target = self.grids()
+        for cube in (src, target):
+            for coord in self.extract_grid(cube):
+                coord.guess_bounds()
+        return src, target
+
+    def test_prepared_once(self):
+        src_grid, target_grid = self.grids()
+        with mock.patch('iris.experimental.regrid.'
+                        '_regrid_area_weighted_rectilinear_src_and_grid'
+                        '__prepare',
+                        return_value=mock.sentinel.info) as prepare, \
+                mock.patch('iris.experimental.regrid.'
+                           '_regrid_area_weighted_rectilinear_src_and_grid'
+                           '__perform'):
+            regridder = AreaWeightedRegridder(src_grid, target_grid)
+            self.assertEqual(prepare.call_count, 0)
+            regridder(src_grid)
+            regridder(src_grid.copy())
+        self.assertEqual(prepare.call_count, 1)
+        _, args, _ = prepare.mock_calls[0]
+        self.assertEqual(args[0], src_grid)
         self.assertEqual(self.extract_grid(args[1]),
                          self.extract_grid(target_grid))
-        self.assertEqual(kwargs, {'mdtol': mdtol})
-        self.assertIs(result, mock.sentinel.result)
+        self.assertIs(regridder._regrid_info, mock.sentinel.info)
+
+    def test_unbounded_grid(self):
+        # A grid without bounds is only rejected when regridding.
+        src_grid, target_grid = self.grids()
+        regridder = AreaWeightedRegridder(src_grid, target_grid)
+        with self.assertRaisesRegexp(ValueError, 'contiguous bounds'):
+            regridder(src_grid)
+
+    def test_result(self):
+        # The result is the same as regridding with the experimental
+        # function, and is the same for real and lazy data.
+        src_grid, target_grid = self.bounded_grids()
+        regridder = AreaWeightedRegridder(src_grid, target_grid, mdtol=0.5)
+        src = src_grid.copy(ma.masked_less(src_grid.data * 1., 2))
+        expected = regrid(src, target_grid, mdtol=0.5)
+        self.assertMaskedArrayEqual(regridder(src).data, expected.data)
+        src.data = as_lazy_data(src.data)
+        result = regridder(src)
+        self.assertTrue(result.has_lazy_data())
+        self.assertMaskedArrayAlmostEqual(result.data, expected.data)
 
     def test_default(self):
         self.check_mdtol()
@@ -133,6 +133,17 @@ class TestApiExtras(tests.IrisTest):
         result = nn_ndinds(cube, sample_point)
         self.assertEqual(result, [(1, slice(None))])
 
+    def test_transposed_multidim_coords(self):
+        # Operate on 2d coords, mapped to the cube dimensions in reverse.
+        x_points = np.array([[1.0, 2.0, 3.0], [1.5, 2.5, 3.5]])
+        y_points = np.array([[10.0, 11.0, 12.0], [20.0, 21.0, 22.0]])
+        cube = Cube(np.zeros((2, 3)))
+        cube.add_aux_coord(AuxCoord(x_points.T, long_name='x'), (1, 0))
+        cube.add_aux_coord(AuxCoord(y_points.T, long_name='y'), (1, 0))
+        sample_points = [('x', [2.4, 3.6]), ('y', [21.2, 11.9])]
+        result = nn_ndinds(cube, sample_points)
+        self.assertEqual(result, [(1, 1), (0, 2)])
+
     def test_sample_dictionary(self):
         # Pass sample_point arg as a dictionary: this usage mode is deprecated.
         co_x = AuxCoord([1.0, 2.0, 3.0], long_name='x')
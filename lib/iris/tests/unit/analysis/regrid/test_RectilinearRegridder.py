@@ -26,6 +26,7 @@ import iris.tests as tests
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
 from iris.analysis._regrid import RectilinearRegridder as Regridder
 from iris.aux_factory import HybridHeightFactory
 from iris.coord_systems import GeogCS, OSGB
@@ -1189,6 +1190,141 @@ class Test___call____rotated_to_lat_lon(tests.IrisTest):
             self.assertCMLApproxData(result, cml)
 
 
+class Test___call____operator(tests.IrisTest):
+    def setUp(self):
+        src = lat_lon_cube()
+        src.data = src.data.astype(np.float64)
+        self.src = src
+        grid = lat_lon_cube()
+        for name in ('latitude', 'longitude'):
+            coord = grid.coord(name)
+            coord.points = coord.points + 0.5
+        self.grid = grid
+        # A 3d cube on the source grid.
+        data = np.stack([src.data, src.data * 2, src.data * 3])
+        cube = Cube(data)
+        cube.add_dim_coord(src.coord('latitude').copy(), 1)
+        cube.add_dim_coord(src.coord('longitude').copy(), 2)
+        self.cube = cube
+
+    def test_computed_once(self):
+        regridder = Regridder(self.src, self.grid, 'linear', 'nan')
+        with mock.patch.object(Regridder, '_sample_grid',
+                               side_effect=Regridder._sample_grid) as patch:
+            result1 = regridder(self.src)
+            result2 = regridder(self.src)
+        self.assertEqual(patch.call_count, 1)
+        self.assertArrayEqual(result1.data, result2.data)
+
+    def test_multidimensional(self):
+        for method in ('linear', 'nearest'):
+            regridder = Regridder(self.src, self.grid, method, 'nan')
+            expected = regridder(self.src).data
+            result = regridder(self.cube)
+            self.assertEqual(result.shape, (3, 3, 4))
+            for index in range(3):
+                self.assertArrayEqual(result.data[index],
+                                      expected * (index + 1))
+            cube = self.cube.copy()
+            cube.transpose([2, 0, 1])
+            result = regridder(cube)
+            self.assertArrayEqual(result.data.transpose([1, 2, 0]),
+                                  regridder(self.cube).data)
+
+    def test_save_load(self):
+        for method in ('linear', 'nearest'):
+            regridder = Regridder(self.src, self.grid, method, 'nan')
+            expected = regridder(self.cube)
+            with self.temp_filename('.npz') as filename:
+                regridder.save_operator(filename)
+                regridder = Regridder(self.src, self.grid, method, 'nan')
+                regridder.load_operator(filename)
+            with mock.patch.object(Regridder, '_sample_grid') as patch:
+                result = regridder(self.cube)
+            self.assertEqual(patch.call_count, 0)
+            self.assertArrayEqual(result.data, expected.data)
+
+    def test_load_mismatch(self):
+        regridder = Regridder(self.src, self.grid, 'linear', 'nan')
+        with self.temp_filename('.npz') as filename:
+            regridder.save_operator(filename)
+            regridder = Regridder(self.src, self.grid, 'nearest', 'nan')
+            emsg = 'not for the same grids and method'
+            with self.assertRaisesRegexp(ValueError, emsg):
+                regridder.load_operator(filename)
+
+    def test_load_mismatch__reversed_source(self):
+        regridder = Regridder(self.src[::-1], self.grid, 'linear', 'nan')
+        with self.temp_filename('.npz') as filename:
+            regridder.save_operator(filename)
+            regridder = Regridder(self.src, self.grid, 'linear', 'nan')
+            emsg = 'not for the same grids and method'
+            with self.assertRaisesRegexp(ValueError, emsg):
+                regridder.load_operator(filename)
+
+    def test_load_mismatch__shifted_grid(self):
+        regridder = Regridder(self.src, self.grid, 'linear', 'nan')
+        grid = self.grid.copy()
+        for name in ('latitude', 'longitude'):
+            coord = grid.coord(name)
+            coord.points = coord.points + 0.25
+        with self.temp_filename('.npz') as filename:
+            regridder.save_operator(filename)
+            regridder = Regridder(self.src, grid, 'linear', 'nan')
+            emsg = 'not for the same grids and method'
+            with self.assertRaisesRegexp(ValueError, emsg):
+                regridder.load_operator(filename)
+
+
+class Test___call____lazy(tests.IrisTest):
+    def setUp(self):
+        src = lat_lon_cube()
+        self.src = src
+        grid = lat_lon_cube()
+        for name in ('latitude', 'longitude'):
+            coord = grid.coord(name)
+            coord.points = coord.points + 0.5
+        self.grid = grid
+        # A masked 3d cube on the source grid.
+        data = np.stack([src.data, src.data * 2, src.data * 3])
+        data = ma.masked_array(data, mask=data % 5 == 0)
+        cube = Cube(data)
+        cube.add_dim_coord(src.coord('latitude').copy(), 1)
+        cube.add_dim_coord(src.coord('longitude').copy(), 2)
+        self.cube = cube
+
+    def _check_lazy_result(self, cube, modes):
+        lazy_data = as_lazy_data(cube.data, chunks=(1, 3, 4))
+        lazy_cube = cube.copy(data=lazy_data, dtype=cube.dtype)
+        for method in ('linear', 'nearest'):
+            for mode in modes:
+                regridder = Regridder(self.src, self.grid, method, mode)
+                expected = regridder(cube)
+                result = regridder(lazy_cube)
+                self.assertTrue(result.has_lazy_data())
+                self.assertEqual(result.lazy_data().chunks,
+                                 ((1, 1, 1), (3,), (4,)))
+                self.assertEqual(result.dtype, expected.dtype)
+                self.assertMaskedArrayEqual(result.data, expected.data)
+
+    def test_lazy_result(self):
+        self._check_lazy_result(self.cube, ('mask', 'nanmask'))
+
+    def test_lazy_result__extrapolate(self):
+        # Extrapolated values may depend on the values underlying masked
+        # points, which lazy data does not preserve.
+        cube = self.cube.copy(data=self.cube.data.data)
+        self._check_lazy_result(cube, ('mask', 'extrapolate'))
+
+    def test_error_mode(self):
+        lazy_data = as_lazy_data(self.cube.data)
+        lazy_cube = self.cube.copy(data=lazy_data, dtype=self.cube.dtype)
+        regridder = Regridder(self.src, self.grid, 'linear', 'error')
+        emsg = 'out of bounds'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            regridder(lazy_cube)
+
+
 @tests.skip_data
 class Test___call____NOP(tests.IrisTest):
     def setUp(self):
@@ -23,11 +23,14 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import COUNT
 import iris.cube
 from iris.coords import DimCoord
+from iris._lazy_data import (as_concrete_data, as_lazy_data,
+                             is_lazy_data)
 
 
 class Test_units_func(tests.IrisTest):
@@ -48,6 +51,30 @@ class Test_masked(tests.IrisTest):
         self.assertArrayEqual(cube.data, [2])
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def test(self):
+        data = np.array([[1, 2, 3, 4, 5], [5, 4, np.nan, 2, 1]])
+        array = as_lazy_data(data)
+        agg = COUNT.lazy_aggregate(array, axis=1, function=lambda x: x < 3)
+        self.assertTrue(is_lazy_data(agg))
+        self.assertArrayEqual(as_concrete_data(agg), [2, 2])
+
+    def test_masked_group(self):
+        data = np.array([[1, 2, 3], [np.nan, np.nan, np.nan]])
+        agg = COUNT.lazy_aggregate(as_lazy_data(data), axis=1,
+                                   function=lambda x: x < 3)
+        result = as_concrete_data(agg, nans_replacement=ma.masked)
+        expected = COUNT.aggregate(ma.masked_invalid(data), axis=1,
+                                   function=lambda x: x < 3)
+        self.assertMaskedArrayEqual(result, expected)
+        self.assertMaskedArrayEqual(result, ma.masked_array([2, 0], [0, 1]))
+
+    def test_not_callable(self):
+        array = as_lazy_data(np.arange(3.0))
+        with self.assertRaisesRegexp(ValueError, 'function must be a'):
+            COUNT.lazy_aggregate(array, axis=0, function=None)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(COUNT.name(), 'count')
@@ -0,0 +1,55 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :data:`iris.analysis.HMEAN` aggregator."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.analysis import HMEAN
+from iris._lazy_data import (as_concrete_data, as_lazy_data,
+                             is_lazy_data)
+
+
+class Test_lazy_aggregate(tests.IrisTest):
+    def test_1d(self):
+        array = as_lazy_data(np.array([1, 2, 4], dtype=np.float64))
+        hmean = HMEAN.lazy_aggregate(array, 0)
+        self.assertTrue(is_lazy_data(hmean))
+        self.assertAlmostEqual(as_concrete_data(hmean), 12.0 / 7)
+
+    def test_masked(self):
+        data = np.array([1, -5, 2, 0, 4], dtype=np.float64)
+        data[1:4:2] = np.nan
+        hmean = HMEAN.lazy_aggregate(as_lazy_data(data), 0)
+        self.assertAlmostEqual(as_concrete_data(hmean), 12.0 / 7)
+
+    def test_not_positive(self):
+        for value in (0, -1):
+            data = np.array([1, 2, value, 4], dtype=np.float64)
+            hmean = HMEAN.lazy_aggregate(as_lazy_data(data, chunks=2), 0)
+            with self.assertRaisesRegexp(ValueError, 'greater than zero'):
+                as_concrete_data(hmean)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -70,6 +70,25 @@ class Test_lazy_aggregate(tests.IrisTest):
         expected = np.mean(data, axis=collapse_axes)
         self.assertArrayAllClose(result, expected)
 
+    def test_weights(self):
+        weights = np.arange(1.0, 13.0).reshape(3, 4)
+        agg = MEAN.lazy_aggregate(self.array, axis=self.axis,
+                                  weights=weights)
+        masked_result = as_concrete_data(agg, nans_replacement=ma.masked)
+        masked_data = ma.masked_invalid(self.data)
+        expected = ma.average(masked_data, axis=self.axis, weights=weights)
+        self.assertMaskedArrayAlmostEqual(masked_result, expected)
+
+    def test_returned(self):
+        weights = np.arange(1.0, 13.0).reshape(3, 4)
+        agg, agg_weights = MEAN.lazy_aggregate(
+            self.array, axis=self.axis, weights=weights, returned=True)
+        masked_data = ma.masked_invalid(self.data)
+        _, expected_weights = ma.average(masked_data, axis=self.axis,
+                                         weights=weights, returned=True)
+        self.assertArrayAlmostEqual(as_concrete_data(agg_weights),
+                                    expected_weights)
+
 
 class Test_name(tests.IrisTest):
     def test(self):
@@ -27,6 +27,8 @@ import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import PERCENTILE
+from iris._lazy_data import (as_concrete_data, as_lazy_data,
+                             is_lazy_data)
 
 
 class Test_aggregate(tests.IrisTest):
@@ -111,6 +113,49 @@ class Test_aggregate(tests.IrisTest):
         self.assertArrayAlmostEqual(actual, expected)
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def test_missing_mandatory_kwarg(self):
+        emsg = "percentile aggregator requires .* keyword argument 'percent'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            PERCENTILE.lazy_aggregate(as_lazy_data(np.arange(3)), axis=0)
+
+    def test_2d_single(self):
+        shape = (2, 11)
+        data = np.arange(np.prod(shape)).reshape(shape)
+        actual = PERCENTILE.lazy_aggregate(as_lazy_data(data), axis=1,
+                                           percent=50)
+        self.assertTrue(is_lazy_data(actual))
+        self.assertArrayAlmostEqual(as_concrete_data(actual), [5, 16])
+
+    def test_masked_2d_multi(self):
+        shape = (3, 10)
+        data = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+        data[1, 1:7] = np.nan
+        percent = np.array([10, 50, 70, 80])
+        actual = PERCENTILE.lazy_aggregate(as_lazy_data(data), axis=1,
+                                           percent=percent)
+        expected = PERCENTILE.aggregate(
+            ma.masked_invalid(data), axis=1, percent=percent)
+        self.assertTupleEqual(actual.shape, (3, 4))
+        self.assertArrayAlmostEqual(as_concrete_data(actual), expected)
+
+    def test_multi_axis(self):
+        data = np.arange(24.0).reshape((2, 3, 4))
+        actual = PERCENTILE.lazy_aggregate(as_lazy_data(data), axis=(0, 2),
+                                           percent=50)
+        expected = PERCENTILE.aggregate(
+            data.transpose(1, 0, 2).reshape(3, 8), axis=1, percent=50)
+        self.assertArrayAlmostEqual(as_concrete_data(actual), expected)
+
+    def test_small_chunks(self):
+        # The result does not depend on the chunking of the source data.
+        data = np.arange(60.0).reshape((6, 10))
+        array = as_lazy_data(data, chunks=(2, 3))
+        actual = PERCENTILE.lazy_aggregate(array, axis=1, percent=[25, 75])
+        expected = PERCENTILE.aggregate(data, axis=1, percent=[25, 75])
+        self.assertArrayAlmostEqual(as_concrete_data(actual), expected)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(PERCENTILE.name(), 'percentile')
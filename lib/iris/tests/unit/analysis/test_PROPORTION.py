@@ -23,11 +23,14 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import PROPORTION
 import iris.cube
 from iris.coords import DimCoord
+from iris._lazy_data import (as_concrete_data, as_lazy_data,
+                             is_lazy_data)
 
 
 class Test_units_func(tests.IrisTest):
@@ -49,6 +52,19 @@ class Test_masked(tests.IrisTest):
         self.assertArrayEqual(cube.data, [0.5])
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def test(self):
+        data = np.array([[1, 2, 3, 4], [4, np.nan, 2, 1],
+                         [np.nan, np.nan, np.nan, np.nan]])
+        array = as_lazy_data(data)
+        agg = PROPORTION.lazy_aggregate(array, axis=1,
+                                        function=lambda x: x < 3)
+        self.assertTrue(is_lazy_data(agg))
+        result = as_concrete_data(agg, nans_replacement=ma.masked)
+        expected = ma.masked_array([0.5, 2.0 / 3, 0], mask=[0, 0, 1])
+        self.assertMaskedArrayAlmostEqual(result, expected)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(PROPORTION.name(), 'proportion')
@@ -27,6 +27,8 @@ import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import RMS
+from iris._lazy_data import (as_concrete_data, as_lazy_data,
+                             is_lazy_data)
 
 
 class Test_aggregate(tests.IrisTest):
@@ -88,6 +90,32 @@ class Test_aggregate(tests.IrisTest):
         self.assertAlmostEqual(rms, expected_rms)
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def test_1d(self):
+        array = as_lazy_data(np.array([5, 2, 6, 4], dtype=np.float64))
+        rms = RMS.lazy_aggregate(array, 0)
+        self.assertTrue(is_lazy_data(rms))
+        self.assertAlmostEqual(as_concrete_data(rms), 4.5)
+
+    def test_2d_weighted(self):
+        data = np.array([[4, 7, 10, 8], [14, 16, 20, 8]], dtype=np.float64)
+        weights = np.array([[1, 4, 3, 2], [2, 1, 1.5, 0.5]],
+                           dtype=np.float64)
+        rms = RMS.lazy_aggregate(as_lazy_data(data), 1, weights=weights)
+        self.assertArrayAlmostEqual(as_concrete_data(rms), [8.0, 16.0])
+
+    def test_masked(self):
+        data = np.array([5, 10, 2, 11, 6, 4], dtype=np.float64)
+        data[1:4:2] = np.nan
+        rms = RMS.lazy_aggregate(as_lazy_data(data), 0)
+        self.assertAlmostEqual(as_concrete_data(rms), 4.5)
+
+    def test_returned_unsupported(self):
+        array = as_lazy_data(np.arange(4.0))
+        with self.assertRaises(TypeError):
+            RMS.lazy_aggregate(array, 0, returned=True)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(RMS.name(), 'root_mean_square')
@@ -0,0 +1,95 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :data:`iris.analysis.SUM` aggregator."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.analysis import SUM
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
+
+
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12.0).reshape(3, 4)
+        self.data[1, 1:] = np.nan
+        self.data[2, :] = np.nan
+        self.array = as_lazy_data(self.data)
+
+    def test(self):
+        agg = SUM.lazy_aggregate(self.array, axis=1)
+        self.assertTrue(is_lazy_data(agg))
+        result = as_concrete_data(agg, nans_replacement=ma.masked)
+        expected = ma.masked_array([6.0, 4.0, 0.0], mask=[0, 0, 1])
+        self.assertMaskedArrayAlmostEqual(result, expected)
+
+    def test_mdtol(self):
+        agg = SUM.lazy_aggregate(self.array, axis=1, mdtol=0.5)
+        result = as_concrete_data(agg, nans_replacement=ma.masked)
+        expected = ma.masked_array([6.0, 0.0, 0.0], mask=[0, 1, 1])
+        self.assertMaskedArrayAlmostEqual(result, expected)
+
+    def test_weights(self):
+        weights = np.full((3, 4), 2.0)
+        agg = SUM.lazy_aggregate(self.array, axis=1, weights=weights)
+        result = as_concrete_data(agg, nans_replacement=ma.masked)
+        self.assertArrayAlmostEqual(result[:2], [12.0, 8.0])
+
+    def test_returned(self):
+        agg, weights = SUM.lazy_aggregate(self.array, axis=0, returned=True)
+        self.assertArrayAlmostEqual(as_concrete_data(weights), [2, 1, 1, 1])
+
+    def test_returned_weights(self):
+        weights = np.arange(1.0, 13.0).reshape(3, 4)
+        agg, wsum = SUM.lazy_aggregate(self.array, axis=0, weights=weights,
+                                       returned=True)
+        self.assertArrayAlmostEqual(as_concrete_data(wsum), [6, 2, 3, 4])
+
+    def test_returned_matches_real(self):
+        masked = ma.masked_invalid(self.data)
+        for weights in (None, np.arange(1.0, 13.0).reshape(3, 4)):
+            _, real = SUM.aggregate(masked, axis=0, weights=weights,
+                                    returned=True)
+            _, lazy = SUM.lazy_aggregate(self.array, axis=0,
+                                         weights=weights, returned=True)
+            self.assertArrayAlmostEqual(as_concrete_data(lazy), real)
+
+    def test_multi_axis(self):
+        data = np.arange(24.0).reshape((2, 3, 4))
+        agg = SUM.lazy_aggregate(as_lazy_data(data), axis=(0, 2))
+        self.assertArrayAlmostEqual(as_concrete_data(agg),
+                                    np.sum(data, axis=(0, 2)))
+
+    def test_weights_wrong_shape(self):
+        with self.assertRaises(TypeError):
+            SUM.lazy_aggregate(self.array, axis=1, weights=np.ones(4))
+
+
+class Test_name(tests.IrisTest):
+    def test(self):
+        self.assertEqual(SUM.name(), 'sum')
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -30,6 +30,7 @@ from contextlib import contextmanager
 
 import numpy as np
 
+from iris._lazy_data import as_lazy_data
 from iris.coords import AuxCoord, DimCoord
 from iris.coord_systems import GeogCS, RotatedGeogCS
 from iris.cube import Cube, CubeList
@@ -291,6 +292,30 @@ class Test__call__(MixinExampleSetup, tests.IrisTest):
         result = self._check_expected()
         self.assertEqual(result.coord(axis='x').units, 'radians')
 
+    def test_lazy_source(self):
+        # Check a lazy source gives a lazy result, regridded chunk by chunk.
+        src_z_cube = self.src_z_cube
+        src_z_cube.data = as_lazy_data(src_z_cube.data, chunks=(1, 4))
+        gridder = unn_gridder(self.src_cube, self.grid_cube)
+        result = gridder(src_z_cube)
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.lazy_data().chunks, ((1, 1, 1), (5,), (6,)))
+        self.assertArrayEqual(result.data, self.expected_data_zxy)
+
+    def test_lazy_multidimensional_xy(self):
+        # Check a lazy source with 2-dimensional X and Y coordinates.
+        co_x = self.src_cube.coord(axis='x')
+        co_y = self.src_cube.coord(axis='y')
+        new_src = Cube(as_lazy_data(self.src_cube.data.reshape((2, 2)),
+                                    chunks=(1, 1)))
+        new_x_co = AuxCoord(co_x.points.reshape((2, 2)),
+                            standard_name='longitude', units='degrees')
+        new_y_co = AuxCoord(co_y.points.reshape((2, 2)),
+                            standard_name='latitude', units='degrees')
+        new_src.add_aux_coord(new_x_co, (0, 1))
+        new_src.add_aux_coord(new_y_co, (0, 1))
+        self._check_expected(src_cube=new_src)
+
     def test_alternative_cs(self):
         # Check the result is just the same in a different coordinate system.
         cs = RotatedGeogCS(grid_north_pole_latitude=75.3,
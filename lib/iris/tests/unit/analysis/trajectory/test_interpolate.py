@@ -27,7 +27,10 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import iris.tests as tests
 
 import numpy as np
+import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
+from iris.analysis import Linear
 from iris.coords import AuxCoord, DimCoord
 import iris.tests.stock
 
@@ -181,5 +184,73 @@ class TestNearest(tests.IrisTest):
         self.assertEqual(result, expected)
 
 
+class TestLinear(tests.IrisTest):
+    # Test interpolation with 'linear' method, against the equivalent
+    # interpolation of the cube at each sample point in turn.
+    def setUp(self):
+        cube = iris.tests.stock.simple_3d()
+        for coord_name in ('longitude', 'latitude'):
+            coord = cube.coord(coord_name)
+            coord.points = coord.points.astype(float)
+        cube.add_aux_coord(AuxCoord([[11., 12., 13., 14.],
+                                     [21., 22., 23., 24.],
+                                     [31., 32., 33., 34.]],
+                                    long_name='aux_xy'),
+                           (1, 2))
+        self.test_cube = cube
+        # Include points beyond the source grid, to check extrapolation.
+        self.sample_points = [('latitude', [-90, 17.5, 55.3, 0, 97.2]),
+                              ('longitude', [-180, -131.3, 8.2, 135, 185.])]
+
+    def _expected(self, cube):
+        data = []
+        aux_points = []
+        for lat, lon in zip(*[values for _, values in self.sample_points]):
+            column = cube.interpolate([('latitude', lat),
+                                       ('longitude', lon)], Linear())
+            data.append(column.data)
+            aux_points.append(column.coord('aux_xy').points[0])
+        return np.array(data).T, np.array(aux_points)
+
+    def test_matches_pointwise(self):
+        cube = self.test_cube
+        result = interpolate(cube, self.sample_points)
+        expected_data, expected_aux = self._expected(cube)
+        self.assertEqual(result.shape, (2, 5))
+        self.assertArrayAllClose(result.data, expected_data)
+        self.assertArrayAllClose(result.coord('aux_xy').points, expected_aux)
+        self.assertArrayEqual(result.coord('latitude').points,
+                              self.sample_points[0][1])
+        self.assertArrayEqual(result.coord('longitude').points,
+                              self.sample_points[1][1])
+
+    def test_reversed_coord(self):
+        cube = self.test_cube[:, ::-1]
+        result = interpolate(cube, self.sample_points)
+        expected_data, _ = self._expected(cube)
+        self.assertArrayAllClose(result.data, expected_data)
+
+    def test_lazy(self):
+        cube = self.test_cube
+        expected = interpolate(cube, self.sample_points)
+        cube.data = as_lazy_data(cube.data.astype(float), chunks=(1, 3, 4))
+        result = interpolate(cube, self.sample_points)
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result, expected)
+
+    def test_lazy_masked(self):
+        cube = self.test_cube
+        data = ma.masked_array(cube.data.astype(float))
+        data[1, 1, 1] = ma.masked
+        cube.data = as_lazy_data(data)
+        sample_points = [('latitude', [0, 0, 0]),
+                         ('longitude', [-90, -45, 90])]
+        result = interpolate(cube, sample_points)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayEqual(ma.getmaskarray(result.data),
+                              [[False, False, False],
+                               [True, True, False]])
+
+
 if __name__ == "__main__":
     tests.main()
@@ -0,0 +1,106 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris._constraints.Range` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._constraints import Constraint, Range
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+
+
+class Test___call__(tests.IrisTest):
+    def test_default_inclusivity(self):
+        coord = DimCoord([1, 2, 3])
+        matches = [Range(1, 3)(cell) for cell in coord.cells()]
+        self.assertEqual(matches, [True, True, False])
+
+    def test_inclusivity(self):
+        coord = DimCoord([1, 2, 3])
+        rng = Range(1, 3, min_inclusive=False, max_inclusive=True)
+        matches = [rng(cell) for cell in coord.cells()]
+        self.assertEqual(matches, [False, True, True])
+
+    def test_open_limits(self):
+        coord = DimCoord([1, 2, 3])
+        self.assertEqual([Range(maximum=2)(cell) for cell in coord.cells()],
+                         [True, False, False])
+        self.assertEqual([Range(minimum=2)(cell) for cell in coord.cells()],
+                         [False, True, True])
+
+
+class Test_extract(tests.IrisTest):
+    # Constraining with a Range gives the same results as constraining with
+    # the equivalent callable.
+    def _check(self, coord, rng):
+        cube = Cube(np.arange(coord.shape[0]))
+        cube.add_aux_coord(coord, 0)
+        expected = Constraint(coord_values={'foo': lambda cell: rng(cell)})
+        expected_cim = expected._CIM_extract(cube)
+        self.assertIsNotNone(rng._match(coord))
+        result_cim = Constraint(foo=rng)._CIM_extract(cube)
+        self.assertArrayEqual(result_cim[0], expected_cim[0])
+
+    def _check_all(self, coord, minimum, maximum):
+        for min_inclusive in [True, False]:
+            for max_inclusive in [True, False]:
+                self._check(coord, Range(minimum, maximum,
+                                         min_inclusive=min_inclusive,
+                                         max_inclusive=max_inclusive))
+        self._check(coord, Range(minimum=minimum))
+        self._check(coord, Range(maximum=maximum))
+
+    def test_ascending(self):
+        coord = DimCoord(np.arange(10.0), long_name='foo')
+        self._check_all(coord, 2, 7)
+
+    def test_descending(self):
+        coord = DimCoord(np.arange(10.0)[::-1], long_name='foo')
+        self._check_all(coord, 2, 7)
+
+    def test_non_monotonic(self):
+        coord = AuxCoord([3, 1, 7, 2, 9, 3], long_name='foo')
+        self._check_all(coord, 2, 7)
+
+    def test_bounded(self):
+        coord = DimCoord(np.arange(10.0), long_name='foo')
+        coord.guess_bounds()
+        self._check_all(coord, 2, 7)
+
+    def test_bounded_limits_within_cells(self):
+        coord = DimCoord(np.arange(10.0), long_name='foo')
+        coord.guess_bounds()
+        self._check_all(coord, 2.2, 6.8)
+
+    def test_no_match(self):
+        coord = DimCoord(np.arange(10.0), long_name='foo')
+        self._check_all(coord, 20, 30)
+
+    def test_non_numeric_limits(self):
+        coord = AuxCoord(['a', 'b', 'c'], long_name='foo')
+        self.assertIsNone(Range('a', 'c')._match(coord))
+
+
+if __name__ == '__main__':
+    tests.main()
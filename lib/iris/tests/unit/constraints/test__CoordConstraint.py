@@ -0,0 +1,75 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris._constraints._CoordConstraint` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._constraints import _CoordConstraint
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+from iris.tests import mock
+
+
+class Test_extract(tests.IrisTest):
+    # Matching values without evaluating each cell gives the same results
+    # as evaluating each cell in turn.
+    def _check(self, coord, coord_thing, expected):
+        cube = Cube(np.arange(coord.shape[0]))
+        cube.add_aux_coord(coord, 0)
+        constraint = _CoordConstraint('foo', coord_thing)
+        with mock.patch('iris.coords.Coord.cells') as cells:
+            result = constraint.extract(cube)[0]
+        self.assertEqual(cells.call_count, 0)
+        self.assertArrayEqual(result, expected)
+        expected = constraint._match_cells(coord)
+        self.assertArrayEqual(result, expected)
+
+    def test_value(self):
+        coord = AuxCoord([3, 1, 7, 2, 9, 3], long_name='foo')
+        self._check(coord, 3, [True, False, False, False, False, True])
+
+    def test_values(self):
+        coord = AuxCoord([3, 1, 7, 2, 9, 3], long_name='foo')
+        self._check(coord, [9, 1, 4],
+                    [False, True, False, False, True, False])
+
+    def test_no_values(self):
+        coord = AuxCoord([3, 1, 7], long_name='foo')
+        self._check(coord, [], [False, False, False])
+
+    def test_bounded_values(self):
+        coord = DimCoord(np.arange(5.0), long_name='foo')
+        coord.guess_bounds()
+        self._check(coord, [1.2, 2.5], [False, True, True, True, False])
+
+    def test_string_values(self):
+        coord = AuxCoord(['a', 'b', 'c'], long_name='foo')
+        cube = Cube(np.arange(3))
+        cube.add_aux_coord(coord, 0)
+        result = _CoordConstraint('foo', ['a', 'c']).extract(cube)
+        self.assertArrayEqual(result[0], [True, False, True])
+
+
+if __name__ == '__main__':
+    tests.main()
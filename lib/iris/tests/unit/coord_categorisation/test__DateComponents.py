@@ -0,0 +1,115 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test class :class:`iris.coord_categorisation._DateComponents`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# import iris tests first so that some things can be initialised before
+# importing anything else
+import iris.tests as tests
+
+from cf_units import CALENDARS as calendars
+from cf_units import Unit
+import numpy as np
+
+import iris.coord_categorisation as ccat
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+from iris.tests import mock
+
+
+class Test___getitem__(tests.IrisTest):
+    def setUp(self):
+        # Irregular times, over several years either side of the origin.
+        self.points = np.concatenate([np.linspace(-20000, 30000, 997),
+                                      np.arange(-50, 50) / 7.0])
+
+    def check(self, coord, weekday=True):
+        components = ccat._DateComponents(coord)
+        dates = coord.units.num2date(coord.points.ravel())
+        names = ['year', 'month', 'day', 'hour', 'day_of_year']
+        if weekday:
+            names.append('weekday')
+        for name in names:
+            getter = ccat._DATE_GETTERS[name]
+            expected = np.array([getter(date) for date in dates])
+            msg = 'Component {} differs for units {}.'
+            self.assertArrayEqual(components[name],
+                                  expected.reshape(coord.shape),
+                                  err_msg=msg.format(name, coord.units))
+
+    def test_calendars(self):
+        for calendar in calendars:
+            # Skip the Julian calendar due to
+            # https://github.com/Unidata/netcdftime/issues/13
+            if calendar == 'julian':
+                continue
+            # Weekdays are only defined by the Gregorian calendars.
+            weekday = calendar in ('standard', 'gregorian',
+                                   'proleptic_gregorian')
+            for unit in ('hours since 1970-01-01 06:30:00',
+                         'days since 1850-02-28',
+                         'minutes since 2000-01-01'):
+                coord = AuxCoord(self.points,
+                                 units=Unit(unit, calendar=calendar))
+                self.check(coord, weekday)
+
+    def test_multidimensional(self):
+        coord = AuxCoord(self.points[:990].reshape(99, 10),
+                         units=Unit('days since 1970-01-01',
+                                    calendar='360_day'))
+        self.check(coord, weekday=False)
+
+    def test_arithmetic(self):
+        coord = AuxCoord(self.points, units='hours since 1970-01-01')
+        with mock.patch.object(Unit, 'num2date', autospec=True,
+                               side_effect=Unit.num2date) as num2date:
+            ccat._DateComponents(coord)['day_of_year']
+        # Only the origin is converted to a date.
+        self.assertEqual(num2date.call_count, 1)
+
+    def test_not_arithmetic(self):
+        # Dates before the start of the Gregorian calendar.
+        coord = AuxCoord(self.points, units='days since 1582-01-01')
+        self.assertIsNone(ccat._calendar_components(coord.points,
+                                                    coord.units))
+        self.check(coord, weekday=False)
+
+
+class Test__date_components(tests.IrisTest):
+    def test_reused(self):
+        cube = Cube(np.arange(100))
+        cube.add_dim_coord(DimCoord(np.arange(100.0),
+                                    standard_name='time',
+                                    units='hours since 2000-01-01'), 0)
+        with mock.patch('iris.coord_categorisation._DateComponents',
+                        side_effect=ccat._DateComponents) as patch:
+            ccat.add_year(cube, 'time')
+            ccat.add_month(cube, 'time')
+            ccat.add_season(cube, 'time')
+            self.assertEqual(patch.call_count, 1)
+            # A different coordinate has its own date components.
+            cube.coord('time').points = np.arange(100.0) + 1
+            ccat.add_hour(cube, 'time')
+            self.assertEqual(patch.call_count, 2)
+        self.assertArrayEqual(cube.coord('hour').points,
+                              (np.arange(100) + 1) % 24)
+
+
+if __name__ == '__main__':
+    tests.main()
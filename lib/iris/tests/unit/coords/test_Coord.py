@@ -118,6 +118,66 @@ class Test_nearest_neighbour_index__descending(tests.IrisTest):
         self._test_nearest_neighbour_index(target, bounds=True, circular=True)
 
 
+class Test_nearest_neighbour_indices(tests.IrisTest):
+    def setUp(self):
+        self.coord = DimCoord([0., 90., 180., 270.], units='degrees')
+        self.bounds = [[-20, 10], [10, 100], [100, 260], [260, 340]]
+        self.points = np.arange(-400, 400, 2.5)
+
+    def check(self, coord):
+        expected = [coord.nearest_neighbour_index(point)
+                    for point in self.points]
+        self.assertArrayEqual(coord.nearest_neighbour_indices(self.points),
+                              expected)
+
+    def test_equivalent(self):
+        reversed_bounds = [bounds[::-1] for bounds in self.bounds[::-1]]
+        for coord, coord_bounds in ((self.coord, self.bounds),
+                                    (self.coord[::-1], reversed_bounds)):
+            for bounds in (None, coord_bounds):
+                for circular in (False, True):
+                    coord.bounds = bounds
+                    coord.circular = circular
+                    self.check(coord)
+                    self.check(AuxCoord.from_coord(coord))
+
+    def test_equivalent_repeated_points(self):
+        self.check(AuxCoord([3, 1, 2, 1, 3, 0]))
+
+    def test_equivalent_overlapping_bounds(self):
+        self.coord.bounds = [[-20, 50], [10, 150], [100, 300], [260, 340]]
+        self.check(self.coord)
+
+    def test_shape(self):
+        result = self.coord.nearest_neighbour_indices([[-10, 100, 200],
+                                                       [30, 60, 370]])
+        self.assertArrayEqual(result, [[0, 1, 2], [0, 1, 3]])
+
+    def test_cached(self):
+        with mock.patch('iris.coords._NearestNeighbourSearch',
+                        side_effect=iris.coords._NearestNeighbourSearch) as \
+                patch:
+            self.coord.nearest_neighbour_indices(self.points)
+            self.coord.nearest_neighbour_index(45)
+            self.assertEqual(patch.call_count, 1)
+            self.coord.bounds = self.bounds
+            self.coord.nearest_neighbour_index(45)
+            self.assertEqual(patch.call_count, 2)
+            self.coord.circular = True
+            self.coord.nearest_neighbour_index(45)
+            self.assertEqual(patch.call_count, 3)
+
+    def test_not_numeric(self):
+        with self.assertRaises(TypeError):
+            self.coord.nearest_neighbour_indices(['a', 'b'])
+
+    def test_multidimensional(self):
+        coord = AuxCoord(np.arange(6).reshape(2, 3))
+        emsg = 'one-dimensional coordinates'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            coord.nearest_neighbour_indices([1, 2])
+
+
 class Test_guess_bounds(tests.IrisTest):
     def setUp(self):
         self.coord = DimCoord(np.array([-160, -120, 0, 30, 150, 170]),
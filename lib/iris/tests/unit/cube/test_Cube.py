@@ -24,12 +24,14 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import iris.tests as tests
 
 from itertools import permutations
+import pickle
 
 import numpy as np
 import numpy.ma as ma
 
 import iris.analysis
 import iris.aux_factory
+from iris.aux_factory import HybridHeightFactory
 import iris.coords
 import iris.exceptions
 from iris import FUTURE
@@ -175,6 +177,38 @@ class Test_collapsed__lazy(tests.IrisTest):
         self.assertTrue(cube_collapsed.has_lazy_data())
         self.assertArrayAllClose(cube_collapsed.data, 2.5)
 
+    def test_percentile_multi(self):
+        # The additional percentile dimension comes first, without realising
+        # the data.
+        cube_collapsed = self.cube.collapsed('x', iris.analysis.PERCENTILE,
+                                             percent=[0, 100])
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAlmostEqual(cube_collapsed.data,
+                                    [[0.0, 3.0], [2.0, 5.0]])
+
+    def test_peak(self):
+        cube_collapsed = self.cube.collapsed('x', iris.analysis.PEAK)
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAlmostEqual(cube_collapsed.data, [2.0, 5.0])
+
+    def test_weighted_sum_returned(self):
+        weights = np.array([[1.0, 0.0, 2.0], [0.5, 1.0, 1.0]])
+        cube_collapsed, collapsed_weights = self.cube.collapsed(
+            'x', iris.analysis.SUM, weights=weights, returned=True)
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAlmostEqual(cube_collapsed.data, [4.0, 10.5])
+        self.assertIsInstance(collapsed_weights, np.ndarray)
+        self.assertArrayAlmostEqual(collapsed_weights, [3.0, 2.5])
+
+    def test_weighted_mean_returned(self):
+        weights = np.array([[1.0, 0.0, 2.0], [0.5, 1.0, 1.0]])
+        cube_collapsed, collapsed_weights = self.cube.collapsed(
+            'x', MEAN, weights=weights, returned=True)
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAlmostEqual(cube_collapsed.data, [4.0 / 3, 4.2])
+        self.assertIsInstance(collapsed_weights, np.ndarray)
+        self.assertArrayAlmostEqual(collapsed_weights, [3.0, 2.5])
+
     def test_non_lazy_aggregator(self):
         # An aggregator which doesn't have a lazy function should still work.
         dummy_agg = Aggregator('custom_op',
@@ -371,6 +405,76 @@ class Test_aggregated_by(tests.IrisTest):
                          AuxCoord(['a|a', 'a'], long_name='bar'))
 
 
+class Test_aggregated_by__lazy(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(44.0).reshape(4, 11)
+        self.cube = Cube(as_lazy_data(self.data))
+        val_coord = AuxCoord([0, 0, 0, 1, 1, 2, 0, 0, 2, 0, 1],
+                             long_name="val")
+        self.cube.add_aux_coord(val_coord, 1)
+        self.expected = np.stack(
+            [self.data[:, [0, 1, 2, 6, 7, 9]].mean(axis=1),
+             self.data[:, [3, 4, 10]].mean(axis=1),
+             self.data[:, [5, 8]].mean(axis=1)], axis=1)
+
+    def test_mean(self):
+        result = self.cube.aggregated_by('val', MEAN)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, self.expected)
+
+    def test_percentile(self):
+        result = self.cube.aggregated_by('val', iris.analysis.PERCENTILE,
+                                         percent=[0, 100])
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.shape, (2, 4, 3))
+        self.assertArrayAlmostEqual(result.data[1, :, 2], self.data[:, 8])
+
+    def test_non_lazy_aggregator(self):
+        dummy_agg = Aggregator('custom_op',
+                               lambda x, axis=None: np.mean(x, axis=axis))
+        result = self.cube.aggregated_by('val', dummy_agg)
+        self.assertFalse(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, self.expected)
+
+
+class Test_aggregated_by__reduceat(tests.IrisTest):
+    # Aggregators which can be applied to all the groups at once give the
+    # same results as when applied to each group in turn.
+    def setUp(self):
+        self.data = np.arange(33, dtype=np.int32).reshape(3, 11) % 7
+        self.cube = Cube(self.data)
+        val_coord = AuxCoord([0, 0, 0, 1, 1, 2, 0, 0, 2, 0, 1],
+                             long_name="val")
+        self.cube.add_aux_coord(val_coord, 1)
+
+    def _check(self, aggregator):
+        result = self.cube.aggregated_by('val', aggregator)
+        # A custom aggregator, calling the same function, is applied to
+        # each group in turn.
+        each_agg = Aggregator(aggregator.cell_method, aggregator.call_func)
+        expected = self.cube.aggregated_by('val', each_agg)
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
+    def test_sum(self):
+        self._check(iris.analysis.SUM)
+
+    def test_mean(self):
+        self._check(MEAN)
+
+    def test_max(self):
+        self._check(iris.analysis.MAX)
+
+    def test_min(self):
+        self._check(iris.analysis.MIN)
+
+    def test_contiguous(self):
+        cube = Cube(np.arange(6.0))
+        cube.add_aux_coord(AuxCoord([0, 0, 1, 1, 1, 2], long_name='val'), 0)
+        result = cube.aggregated_by('val', iris.analysis.SUM)
+        self.assertArrayEqual(result.data, [1.0, 9.0, 5.0])
+
+
 class Test_rolling_window(tests.IrisTest):
     def setUp(self):
         self.cube = Cube(np.arange(6))
@@ -413,6 +517,69 @@ class Test_rolling_window(tests.IrisTest):
         self.assertMaskedArrayEqual(expected_result, res_cube.data)
 
 
+class Test_rolling_window__lazy(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12.0).reshape(2, 6)
+        self.cube = Cube(as_lazy_data(self.data))
+        val_coord = DimCoord([0, 1, 2, 3, 4, 5], long_name="val")
+        self.cube.add_dim_coord(val_coord, 1)
+
+    def test_mean(self):
+        result = self.cube.rolling_window('val', MEAN, 3)
+        self.assertTrue(self.cube.has_lazy_data())
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.shape, (2, 4))
+        expected = np.array([[1., 2., 3., 4.], [7., 8., 9., 10.]])
+        self.assertArrayAlmostEqual(result.data, expected)
+
+    def test_weighted_sum(self):
+        result = self.cube.rolling_window('val', iris.analysis.SUM, 2,
+                                          weights=np.array([1, 2]))
+        self.assertTrue(result.has_lazy_data())
+        expected = np.array([[2., 5., 8., 11., 14.],
+                             [20., 23., 26., 29., 32.]])
+        self.assertArrayAlmostEqual(result.data, expected)
+
+    def test_masked(self):
+        data = ma.masked_equal(self.data, 2.0)
+        cube = Cube(as_lazy_data(data))
+        cube.add_dim_coord(self.cube.coord('val'), 1)
+        result = cube.rolling_window('val', MEAN, 3, mdtol=0)
+        self.assertTrue(result.has_lazy_data())
+        expected = ma.array([[1., 2., 3., 4.], [7., 8., 9., 10.]],
+                            mask=[[True, True, True, False],
+                                  [False, False, False, False]])
+        self.assertMaskedArrayAlmostEqual(result.data, expected)
+
+    def test_window_too_long(self):
+        with self.assertRaisesRegexp(ValueError, '`window` is too long'):
+            self.cube.rolling_window('val', MEAN, 7)
+        self.assertTrue(self.cube.has_lazy_data())
+
+
+class Test_rolling_window__running_sum(tests.IrisTest):
+    # Aggregators evaluated with a running sum give the same results as
+    # when applied to each window in turn.
+    def setUp(self):
+        self.data = np.arange(24, dtype=np.int32).reshape(4, 6) % 5
+        self.cube = Cube(self.data)
+        val_coord = DimCoord([0, 1, 2, 3, 4, 5], long_name="val")
+        self.cube.add_dim_coord(val_coord, 1)
+
+    def _check(self, aggregator):
+        result = self.cube.rolling_window('val', aggregator, 3)
+        each_agg = Aggregator(aggregator.cell_method, aggregator.call_func)
+        expected = self.cube.rolling_window('val', each_agg, 3)
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
+    def test_sum(self):
+        self._check(iris.analysis.SUM)
+
+    def test_mean(self):
+        self._check(MEAN)
+
+
 class Test_slices_dim_order(tests.IrisTest):
     '''
     This class tests the capability of iris.cube.Cube.slices(), including its
@@ -2004,5 +2171,120 @@ class Test_transpose(tests.IrisTest):
             self.cube.transpose([1])
 
 
+class Test_derived_coords(tests.IrisTest):
+    def setUp(self):
+        cube = Cube(np.zeros((2, 3)))
+        self.delta = AuxCoord([1.0, 2.0], bounds=[[0.5, 1.5], [1.5, 2.5]],
+                              long_name='level_height', units='m')
+        self.sigma = AuxCoord([0.9, 0.8], long_name='sigma')
+        self.orography = AuxCoord([10.0, 20.0, 30.0],
+                                  standard_name='surface_altitude',
+                                  units='m')
+        cube.add_aux_coord(self.delta, 0)
+        cube.add_aux_coord(self.sigma, 0)
+        cube.add_aux_coord(self.orography, 1)
+        self.factory = HybridHeightFactory(self.delta, self.sigma,
+                                           self.orography)
+        cube.add_aux_factory(self.factory)
+        self.cube = cube
+
+    def _make_coord_patch(self):
+        return mock.patch.object(HybridHeightFactory, 'make_coord',
+                                 autospec=True,
+                                 side_effect=HybridHeightFactory.make_coord)
+
+    def _expected_points(self):
+        return (self.delta.points[:, np.newaxis] +
+                self.sigma.points[:, np.newaxis] * self.orography.points)
+
+    def _check_rebuilt(self, change):
+        self.cube.coord('altitude')
+        change()
+        with self._make_coord_patch() as make_coord:
+            coord = self.cube.coord('altitude')
+        self.assertEqual(make_coord.call_count, 1)
+        return coord
+
+    def test_cached(self):
+        with self._make_coord_patch() as make_coord:
+            coord = self.cube.coord('altitude')
+            self.cube.coords()
+            self.cube.derived_coords
+            self.cube.coord_dims(coord)
+        self.assertEqual(make_coord.call_count, 1)
+        self.assertTrue(coord.has_lazy_points())
+        self.assertTrue(coord.has_lazy_bounds())
+        self.assertArrayAlmostEqual(coord.points, self._expected_points())
+
+    def test_dependency_points_changed(self):
+        def change():
+            self.delta.points = [3.0, 4.0]
+        coord = self._check_rebuilt(change)
+        self.assertArrayAlmostEqual(coord.points, self._expected_points())
+
+    def test_dependency_bounds_changed(self):
+        def change():
+            self.delta.bounds = [[2.5, 3.5], [3.5, 4.5]]
+        coord = self._check_rebuilt(change)
+        expected = (self.delta.bounds[:, np.newaxis] +
+                    self.sigma.points[:, np.newaxis, np.newaxis] *
+                    self.orography.points[:, np.newaxis])
+        self.assertArrayAlmostEqual(coord.bounds, expected)
+
+    def test_dependency_dims_changed(self):
+        coord = self._check_rebuilt(lambda: self.cube.transpose())
+        self.assertEqual(coord.shape, (3, 2))
+        self.assertArrayAlmostEqual(coord.points, self._expected_points().T)
+
+    def test_factory_removed(self):
+        self.cube.coord('altitude')
+        self.cube.remove_aux_factory(self.factory)
+        self.assertEqual(self.cube._derived_coords_cache, {})
+        self.assertEqual(self.cube.coords('altitude'), [])
+
+    def test_factory_replaced(self):
+        def change():
+            self.cube.remove_aux_factory(self.factory)
+            self.cube.add_aux_factory(HybridHeightFactory(self.delta))
+        coord = self._check_rebuilt(change)
+        self.assertArrayAlmostEqual(coord.points, self.delta.points)
+
+    def test_independent_results(self):
+        coord = self.cube.coord('altitude')
+        coord.points = np.zeros((2, 3))
+        coord.rename('height')
+        other = self.cube.coord('altitude')
+        self.assertIsNot(other, coord)
+        self.assertArrayAlmostEqual(other.points, self._expected_points())
+
+    def test_real_coord_not_cached(self):
+        coord = AuxCoord(np.zeros((2, 3)), standard_name='altitude')
+        with mock.patch.object(HybridHeightFactory, 'make_coord',
+                               return_value=coord) as make_coord:
+            self.cube.coord('altitude')
+            self.cube.coord('altitude')
+        self.assertEqual(make_coord.call_count, 2)
+        self.assertEqual(self.cube._derived_coords_cache, {})
+
+    def test_pickle(self):
+        self.cube.coord('altitude')
+        self.assertEqual(self.cube.__getstate__()['_derived_coords_cache'],
+                         {})
+        cube = pickle.loads(pickle.dumps(self.cube))
+        self.assertEqual(cube._derived_coords_cache, {})
+        self.assertArrayAlmostEqual(cube.coord('altitude').points,
+                                    self._expected_points())
+
+    def test_deepcopy(self):
+        self.cube.coord('altitude')
+        cube = self.cube.copy()
+        [factory] = cube.aux_factories
+        cube.coord('altitude')
+        self.assertEqual(list(cube._derived_coords_cache), [id(factory)])
+        self.delta.points = [3.0, 4.0]
+        self.assertArrayAlmostEqual(cube.coord('altitude').points,
+                                    [[10.0, 19.0, 28.0], [10.0, 18.0, 26.0]])
+
+
 if __name__ == '__main__':
     tests.main()
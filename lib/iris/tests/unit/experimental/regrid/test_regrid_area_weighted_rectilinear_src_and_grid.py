@@ -30,6 +30,7 @@ import iris.tests as tests
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
 from iris.coords import DimCoord
 from iris.coord_systems import GeogCS
 from iris.cube import Cube
@@ -149,6 +150,14 @@ class TestMdtol(tests.IrisTest):
         res = regrid(src_cube, grid_cube, mdtol=0.4)
         self.assertEqual(ma.count_masked(res.data), 1)
 
+    def test_lazy(self):
+        expected = regrid(self.src_cube, self.grid_cube, mdtol=0.6)
+        self.src_cube.data = as_lazy_data(self.src_cube.data, chunks=(1, 1, 4))
+        res = regrid(self.src_cube, self.grid_cube, mdtol=0.6)
+        self.assertTrue(res.has_lazy_data())
+        self.assertEqual(res.shape, (7, 2, 9))
+        self.assertMaskedArrayAlmostEqual(res.data, expected.data)
+
 
 class TestWrapAround(tests.IrisTest):
     def test_float_tolerant_equality(self):
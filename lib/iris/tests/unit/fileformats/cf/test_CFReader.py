@@ -26,10 +26,13 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import threading
+
 import numpy as np
 
 import iris
-from iris.fileformats.cf import CFReader
+from iris.fileformats.cf import CFBoundaryVariable, CFReader
+from iris.fileformats._nc_pool import DatasetPool
 from iris.tests import mock
 
 
@@ -59,6 +62,12 @@ def netcdf_variable(name, dimensions, dtype, ancillary_variables=None,
 class Test_translate__global_attributes(tests.IrisTest):
 
     def setUp(self):
+        # Use a fresh dataset pool, so that mock datasets are not re-used.
+        self.pool = DatasetPool()
+        patch = mock.patch('iris.fileformats.cf.DATASET_POOL', self.pool)
+        patch.start()
+        self.addCleanup(patch.stop)
+
         ncvar = netcdf_variable('ncvar', 'height', np.float)
         ncattrs = mock.Mock(return_value=['dimensions'])
         getncattr = mock.Mock(return_value='something something_else')
@@ -73,9 +82,31 @@ class Test_translate__global_attributes(tests.IrisTest):
             self.assertEqual(global_attrs['dimensions'],
                              'something something_else')
 
+    def test_dataset_locked(self):
+        # The metadata of the pooled dataset is read while holding its lock,
+        # so that it cannot be read concurrently by another thread.
+        def ncattrs():
+            lock = self.pool.lock('dummy')
+            result = []
+            thread = threading.Thread(
+                target=lambda: result.append(lock.acquire(False)))
+            thread.start()
+            thread.join()
+            self.assertEqual(result, [False])
+            return ['dimensions']
+
+        self.dataset.ncattrs = ncattrs
+        with mock.patch('netCDF4.Dataset', return_value=self.dataset):
+            CFReader('dummy')
+
 
 class Test_translate__formula_terms(tests.IrisTest):
     def setUp(self):
+        # Use a fresh dataset pool, so that mock datasets are not re-used.
+        patch = mock.patch('iris.fileformats.cf.DATASET_POOL', DatasetPool())
+        patch.start()
+        self.addCleanup(patch.stop)
+
         self.delta = netcdf_variable('delta', 'height', np.float,
                                      bounds='delta_bnds')
         self.delta_bnds = netcdf_variable('delta_bnds', 'height bnds',
@@ -159,6 +190,11 @@ class Test_translate__formula_terms(tests.IrisTest):
 
 class Test_build_cf_groups__formula_terms(tests.IrisTest):
     def setUp(self):
+        # Use a fresh dataset pool, so that mock datasets are not re-used.
+        patch = mock.patch('iris.fileformats.cf.DATASET_POOL', DatasetPool())
+        patch.start()
+        self.addCleanup(patch.stop)
+
         self.delta = netcdf_variable('delta', 'height', np.float,
                                      bounds='delta_bnds')
         self.delta_bnds = netcdf_variable('delta_bnds', 'height bnds',
@@ -249,6 +285,18 @@ class Test_build_cf_groups__formula_terms(tests.IrisTest):
                 self.assertIs(aux_coord_group[name_bnds].cf_data,
                               getattr(self, name_bnds))
 
+    def test_identify_once(self):
+        # The references of each variable are identified once only, and
+        # reused to build the cf-groups.
+        identify = CFBoundaryVariable.identify
+        with mock.patch('netCDF4.Dataset', return_value=self.dataset), \
+                mock.patch.object(CFBoundaryVariable, 'identify',
+                                  wraps=identify) as patched:
+            cf_group = CFReader('dummy').cf_group
+        self.assertEqual(patched.call_count, len(self.variables))
+        self.assertEqual(set(cf_group['height'].cf_group.bounds),
+                         set(['height_bnds']))
+
     def test_future_promote_reference(self):
         with mock.patch('netCDF4.Dataset', return_value=self.dataset), \
                 iris.FUTURE.context(netcdf_promote=True):
@@ -98,9 +98,12 @@ class Test__extract_field__LBC_format(tests.IrisTest):
             open_func = 'builtins.open'
         else:
             open_func = '__builtin__.open'
-        with mock.patch('numpy.fromfile', return_value=[0]), \
+        headers = np.zeros(len(fields),
+                           dtype=[('longs', 'i8', (45,)),
+                                  ('floats', 'f8', (19,))])
+        with mock.patch('iris.fileformats._ff.FF2PP._lookup_headers',
+                        return_value=headers), \
                 mock.patch(open_func), \
-                mock.patch('struct.unpack_from', return_value=[4]), \
                 mock.patch('iris.fileformats.pp.make_pp_field',
                            side_effect=fields), \
                 mock.patch('iris.fileformats._ff.FF2PP._payload',
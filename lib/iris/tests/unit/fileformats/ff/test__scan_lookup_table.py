@@ -0,0 +1,80 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for :func:`iris.fileformat._ff._scan_lookup_table`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.fileformats._ff import _scan_lookup_table
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        context = self.temp_filename('.ff')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def _write_table(self, entries, word_depth=8, entry_depth=66,
+                     table_index=3):
+        # Write a LOOKUP table of entries with the given first words, and
+        # float words following the long words.
+        table = np.zeros((len(entries), entry_depth),
+                         dtype='>i{}'.format(word_depth))
+        table[:, 0] = entries
+        floats = table[:, 45:64].view('>f{}'.format(word_depth))
+        floats[:, 0] = np.array(entries) + 0.5
+        with open(self.path, 'wb') as fh:
+            fh.write(b'\0' * (table_index - 1) * word_depth)
+            fh.write(table.tobytes())
+
+    def test_entries(self):
+        self._write_table([1, 2, 3])
+        arrays, msg = _scan_lookup_table(self.path, 8, 3, 66, 3)
+        self.assertIsNone(msg)
+        headers = arrays['headers']
+        self.assertTrue(headers.dtype['longs'].isnative)
+        self.assertEqual(headers['longs'].shape, (3, 45))
+        self.assertArrayEqual(headers['longs'][:, 0], [1, 2, 3])
+        self.assertArrayEqual(headers['floats'][:, 0], [1.5, 2.5, 3.5])
+
+    def test_terminated(self):
+        self._write_table([1, 2, -99, 4])
+        arrays, _ = _scan_lookup_table(self.path, 8, 3, 66, 4)
+        self.assertArrayEqual(arrays['headers']['longs'][:, 0], [1, 2])
+
+    def test_32bit(self):
+        self._write_table([1, 2], word_depth=4, entry_depth=64,
+                          table_index=1)
+        arrays, _ = _scan_lookup_table(self.path, 4, 1, 64, 2)
+        headers = arrays['headers']
+        self.assertEqual(headers.dtype['longs'].base, np.dtype('i4'))
+        self.assertArrayEqual(headers['floats'][:, 0], [1.5, 2.5])
+
+    def test_short_file(self):
+        self._write_table([1, 2])
+        arrays, _ = _scan_lookup_table(self.path, 8, 3, 66, 5)
+        self.assertEqual(len(arrays['headers']), 2)
+
+
+if __name__ == "__main__":
+    tests.main()
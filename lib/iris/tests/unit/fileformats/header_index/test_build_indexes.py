@@ -0,0 +1,91 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the :func:`iris.fileformats._header_index.build_indexes`
+function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+from iris.fileformats._header_index import (CACHE_CONTROL, build_indexes,
+                                            main)
+import iris.fileformats.pp as pp
+from iris.tests import mock
+from iris.tests.unit.fileformats.pp import write_field
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        os.mkdir(os.path.join(self.data_dir, 'sub'))
+        self.pp_paths = [os.path.join(self.data_dir, 'a.pp'),
+                         os.path.join(self.data_dir, 'sub', 'b.pp')]
+        for path in self.pp_paths:
+            with open(path, 'wb') as fh:
+                write_field(fh)
+        with open(os.path.join(self.data_dir, 'notes.txt'), 'w') as fh:
+            fh.write('Not a PP file.')
+
+    def test_directory(self):
+        result = build_indexes(self.data_dir, cache_dir=self.cache_dir)
+        self.assertEqual(result, self.pp_paths)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        # Loading now uses the cached index.
+        with CACHE_CONTROL.context(self.cache_dir), \
+                mock.patch('iris.fileformats.pp._scan_fields') as scan:
+            fields = list(pp.load(self.pp_paths[1]))
+        self.assertEqual(scan.call_count, 0)
+        self.assertEqual(len(fields), 1)
+        self.assertEqual(fields[0].lbuser[3], 16004)
+
+    def test_file(self):
+        result = build_indexes([self.pp_paths[0]], cache_dir=self.cache_dir)
+        self.assertEqual(result, self.pp_paths[:1])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_missing_cache_dir(self):
+        cache_dir = os.path.join(self.cache_dir, 'missing')
+        build_indexes(self.data_dir, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_no_cache_dir(self):
+        with CACHE_CONTROL.context(None):
+            with self.assertRaisesRegexp(ValueError, 'No header index'):
+                build_indexes(self.data_dir)
+
+    def test_main(self):
+        with mock.patch('iris.fileformats._header_index.print') as mprint:
+            main(['--cache-dir', self.cache_dir, self.data_dir])
+        self.assertEqual(mprint.call_args_list,
+                         [mock.call(path) for path in self.pp_paths])
+
+
+if __name__ == "__main__":
+    tests.main()
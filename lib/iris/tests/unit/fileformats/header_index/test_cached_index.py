@@ -0,0 +1,152 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the :func:`iris.fileformats._header_index.cached_index`
+function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from iris.fileformats._header_index import CACHE_CONTROL, cached_index
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        with open(self.path, 'wb') as fh:
+            fh.write(b'content')
+        headers = np.zeros(3, dtype=[('longs', 'i4', (45,)),
+                                     ('floats', 'f4', (19,))])
+        headers['longs'][:, 0] = [1, 2, 3]
+        self.arrays = {'headers': headers, 'data_lens': np.arange(3)}
+        self.scan = mock.Mock(return_value=(self.arrays, 'A warning.'))
+
+    def cached_index(self, **params):
+        with CACHE_CONTROL.context(self.cache_dir):
+            return cached_index(self.path, 'pp', self.scan, **params)
+
+    def check_result(self, result):
+        arrays, message = result
+        self.assertEqual(sorted(arrays), ['data_lens', 'headers'])
+        self.assertEqual(arrays['headers'].dtype,
+                         self.arrays['headers'].dtype)
+        self.assertArrayEqual(arrays['headers']['longs'][:, 0], [1, 2, 3])
+        self.assertArrayEqual(arrays['data_lens'], [0, 1, 2])
+        self.assertEqual(message, 'A warning.')
+
+    def test_no_cache_dir(self):
+        with CACHE_CONTROL.context(None):
+            result = cached_index(self.path, 'pp', self.scan, option=1)
+        self.scan.assert_called_once_with(self.path, option=1)
+        self.assertEqual(result, (self.arrays, 'A warning.'))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_cached(self):
+        self.check_result(self.cached_index(option=True))
+        self.check_result(self.cached_index(option=True))
+        self.scan.assert_called_once_with(self.path, option=True)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_different_params(self):
+        self.cached_index(option=True)
+        self.cached_index(option=False)
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_different_kind(self):
+        self.cached_index()
+        with CACHE_CONTROL.context(self.cache_dir):
+            cached_index(self.path, 'ff', self.scan)
+        self.assertEqual(self.scan.call_count, 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_file_modified(self):
+        self.cached_index()
+        stat = os.stat(self.path)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 10))
+        self.check_result(self.cached_index())
+        self.assertEqual(self.scan.call_count, 2)
+        self.cached_index()
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_file_resized(self):
+        self.cached_index()
+        stat = os.stat(self.path)
+        with open(self.path, 'ab') as fh:
+            fh.write(b'more')
+        os.utime(self.path, (stat.st_atime, stat.st_mtime))
+        self.cached_index()
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_corrupt_cache(self):
+        self.cached_index()
+        cache_file, = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, cache_file), 'wb') as fh:
+            fh.write(b'corrupt')
+        self.check_result(self.cached_index())
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_missing_cache_dir(self):
+        missing_dir = os.path.join(self.cache_dir, 'missing', 'dir')
+        with CACHE_CONTROL.context(missing_dir):
+            self.check_result(cached_index(self.path, 'pp', self.scan))
+            self.check_result(cached_index(self.path, 'pp', self.scan))
+        self.assertEqual(self.scan.call_count, 1)
+        self.assertEqual(len(os.listdir(missing_dir)), 1)
+
+    def test_unwritable_cache(self):
+        # The cache directory cannot be created, as a file is in the way.
+        bad_dir = os.path.join(self.cache_dir, 'file', 'dir')
+        with open(os.path.join(self.cache_dir, 'file'), 'w'):
+            pass
+        with mock.patch('iris.fileformats._header_index._UNWRITABLE_DIRS',
+                        set()):
+            with mock.patch('warnings.warn') as warn:
+                with CACHE_CONTROL.context(bad_dir):
+                    result = cached_index(self.path, 'pp', self.scan)
+                    cached_index(self.path, 'pp', self.scan)
+        self.assertEqual(result, (self.arrays, 'A warning.'))
+        self.assertEqual(self.scan.call_count, 2)
+        self.assertEqual(warn.call_count, 1)
+        self.assertIn('Unable to write', warn.call_args[0][0])
+
+    def test_no_message(self):
+        self.scan.return_value = (self.arrays, None)
+        self.cached_index()
+        arrays, message = self.cached_index()
+        self.assertEqual(self.scan.call_count, 1)
+        self.assertIsNone(message)
+
+
+if __name__ == "__main__":
+    tests.main()
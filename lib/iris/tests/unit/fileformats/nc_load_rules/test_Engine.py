@@ -0,0 +1,119 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris.fileformats._nc_load_rules.Engine` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import re
+
+from iris.fileformats._nc_load_rules import (Engine, _RULE_BASE_PATH,
+                                             _RULE_NAMES)
+from iris.tests import mock
+
+
+class Test_helpers(tests.IrisTest):
+    def test_compiled_from_rule_base(self):
+        helpers = Engine().helpers
+        code = helpers.build_dimension_coordinate.__code__
+        self.assertEqual(code.co_filename, _RULE_BASE_PATH)
+        self.assertEqual(helpers.CF_VALUE_STD_NAME_GRID_LAT, 'grid_latitude')
+
+    def test_rule_base_line_numbers(self):
+        code = Engine().helpers.build_dimension_coordinate.__code__
+        with open(_RULE_BASE_PATH) as rule_base:
+            lines = rule_base.readlines()
+        self.assertIn('def build_dimension_coordinate(',
+                      lines[code.co_firstlineno - 1])
+
+    def test_shared(self):
+        self.assertIs(Engine().helpers, Engine().helpers)
+
+    def test_all_rules_translated(self):
+        # Every rule of the rule base, in order, is applied.
+        with open(_RULE_BASE_PATH) as rule_base:
+            names = [line.strip() for line in rule_base
+                     if re.match(r'fc_\w+\s*$', line)]
+        self.assertEqual(names[-1], 'fc_extras')
+        self.assertEqual(_RULE_NAMES, tuple(names[:-1]))
+
+
+class Test_add_case_specific_fact(tests.IrisTest):
+    def test_in_order(self):
+        engine = Engine()
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lon',))
+        self.assertEqual(engine.facts['coordinate'], [('lat',), ('lon',)])
+
+    def test_duplicate(self):
+        engine = Engine()
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        self.assertEqual(engine.facts['coordinate'], [('lat',)])
+
+    def test_reset(self):
+        engine = Engine()
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        engine.reset()
+        self.assertEqual(engine.facts['coordinate'], [])
+
+
+class Test_check(tests.IrisTest):
+    def setUp(self):
+        self.engine = Engine()
+        self.engine.helpers = mock.Mock()
+
+    def test_result(self):
+        self.engine.helpers.is_latitude.return_value = True
+        self.assertTrue(self.engine.check('is_latitude', 'lat'))
+        self.engine.helpers.is_latitude.assert_called_once_with(self.engine,
+                                                                'lat')
+
+    def test_cached(self):
+        # Each variable of the file is checked only once.
+        check = self.engine.helpers.is_latitude
+        for _ in range(3):
+            self.engine.check('is_latitude', 'lat')
+        self.engine.reset()
+        self.engine.check('is_latitude', 'lat')
+        self.assertEqual(check.call_count, 1)
+        self.engine.check('is_latitude', 'lon')
+        self.assertEqual(check.call_count, 2)
+
+    def test_extra_args(self):
+        check = self.engine.helpers.is_grid_mapping
+        check.side_effect = lambda engine, name, mapping: mapping == 'wanted'
+        self.assertTrue(self.engine.check('is_grid_mapping', 'gm', 'wanted'))
+        self.assertFalse(self.engine.check('is_grid_mapping', 'gm', 'other'))
+        self.assertEqual(check.call_count, 2)
+
+
+class Test_activate(tests.IrisTest):
+    def test(self):
+        engine = Engine()
+        target = 'iris.fileformats._nc_load_rules._apply_rules'
+        with mock.patch(target) as apply_rules:
+            engine.activate('fc_rules_cf')
+        apply_rules.assert_called_once_with(engine)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,244 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the :func:`iris.fileformats._nc_load_rules._apply_rules`
+function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris.fileformats._nc_load_rules import Engine, _apply_rules
+from iris.fileformats.pp import STASH
+from iris.tests import mock
+
+
+_CHECKS = ('is_latitude', 'is_longitude', 'is_projection_x_coordinate',
+           'is_projection_y_coordinate', 'is_time', 'is_time_period',
+           'is_rotated_latitude', 'is_rotated_longitude')
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        engine = Engine()
+        # Replace the rule base helpers with mocks, keeping the constants.
+        real_helpers = engine.helpers
+        helpers = mock.Mock(**{name: getattr(real_helpers, name)
+                               for name in dir(real_helpers)
+                               if name.startswith('CF_')})
+        self.classes = {}
+        for check in _CHECKS:
+            getattr(helpers, check).side_effect = self._checker(check)
+        self.mappings = {}
+        helpers.is_grid_mapping.side_effect = \
+            lambda engine, name, mapping: self.mappings[name] == mapping
+        helpers.has_supported_mercator_parameters.return_value = True
+        engine.helpers = helpers
+        self.helpers = helpers
+
+        self.variables = {}
+        self.cf_group = mock.MagicMock(coordinates={},
+                                       auxiliary_coordinates={}, labels={},
+                                       cell_measures={}, grid_mappings={})
+        self.cf_group.__getitem__.side_effect = self.variables.__getitem__
+        engine.cf_var = mock.Mock(spec=['cf_group'], cf_group=self.cf_group)
+        engine.cube = mock.Mock(attributes={})
+        engine.provides = {'coordinates': []}
+        engine.requires = {}
+        engine.rule_triggered = set()
+        self.engine = engine
+
+    def _checker(self, check):
+        def checker(engine, name):
+            return check in self.classes.get(name, ())
+        return checker
+
+    def _variable(self, group, fact, name, classes=(), **attributes):
+        variable = mock.Mock(spec=list(attributes), name=name, **attributes)
+        getattr(self.cf_group, group)[name] = variable
+        self.variables[name] = variable
+        self.classes[name] = classes
+        self.engine.add_case_specific_fact('facts_cf', fact, (name,))
+        return variable
+
+    def _coordinate(self, name, *classes):
+        return self._variable('coordinates', 'coordinate', name, classes)
+
+    def _aux_coordinate(self, name, *classes):
+        return self._variable('auxiliary_coordinates',
+                              'auxiliary_coordinate', name, classes)
+
+    def _grid_mapping(self, name, mapping):
+        self.mappings[name] = mapping
+        return self._variable('grid_mappings', 'grid_mapping', name)
+
+    def _assert_dim_coords(self, *calls):
+        self.assertEqual(
+            self.helpers.build_dimension_coordinate.call_args_list,
+            [mock.call(self.engine, variable, coord_name=coord_name,
+                       coord_system=coord_system)
+             for variable, coord_name, coord_system in calls])
+
+    def test_metadata(self):
+        _apply_rules(self.engine)
+        self.helpers.build_cube_metadata.assert_called_once_with(self.engine)
+        self.assertEqual(self.engine.rule_triggered, {'fc_default'})
+
+    def test_rotated_pole(self):
+        grid_mapping = self._grid_mapping('rotated_pole',
+                                          'rotated_latitude_longitude')
+        rlat = self._coordinate('rlat', 'is_latitude', 'is_rotated_latitude')
+        rlon = self._coordinate('rlon', 'is_longitude',
+                                'is_rotated_longitude')
+        _apply_rules(self.engine)
+        build = self.helpers.build_rotated_coordinate_system
+        build.assert_called_once_with(self.engine, grid_mapping)
+        cs = build.return_value
+        self.assertIs(self.engine.provides['coordinate_system'], cs)
+        self._assert_dim_coords((rlat, 'grid_latitude', cs),
+                                (rlon, 'grid_longitude', cs))
+        self.assertEqual(
+            self.engine.rule_triggered,
+            {'fc_default',
+             'fc_provides_grid_mapping_rotated_latitude_longitude',
+             'fc_provides_coordinate_latitude',
+             'fc_provides_coordinate_longitude',
+             'fc_build_coordinate_latitude_rotated',
+             'fc_build_coordinate_longitude_rotated'})
+
+    def test_latitude_longitude(self):
+        grid_mapping = self._grid_mapping('crs', 'latitude_longitude')
+        lat = self._coordinate('lat', 'is_latitude')
+        lon = self._coordinate('lon', 'is_longitude')
+        _apply_rules(self.engine)
+        build = self.helpers.build_coordinate_system
+        build.assert_called_once_with(grid_mapping)
+        cs = build.return_value
+        self._assert_dim_coords((lat, 'latitude', cs), (lon, 'longitude', cs))
+
+    def test_latitude_longitude_no_coordinate_system(self):
+        lat = self._coordinate('lat', 'is_latitude')
+        lon = self._coordinate('lon', 'is_longitude')
+        _apply_rules(self.engine)
+        self._assert_dim_coords((lat, 'latitude', None),
+                                (lon, 'longitude', None))
+        self.assertIn('fc_build_coordinate_latitude_nocs',
+                      self.engine.rule_triggered)
+
+    def test_latitude_unrotated_with_rotated_pole(self):
+        # As in the rule base, the coordinate is left out.
+        self._grid_mapping('rotated_pole', 'rotated_latitude_longitude')
+        self._coordinate('lat', 'is_latitude')
+        _apply_rules(self.engine)
+        self._assert_dim_coords()
+
+    def test_projection(self):
+        grid_mapping = self._grid_mapping('tm', 'transverse_mercator')
+        x = self._coordinate('x', 'is_projection_x_coordinate')
+        y = self._coordinate('y', 'is_projection_y_coordinate')
+        _apply_rules(self.engine)
+        build = self.helpers.build_transverse_mercator_coordinate_system
+        build.assert_called_once_with(self.engine, grid_mapping)
+        cs = build.return_value
+        self._assert_dim_coords((x, 'projection_x_coordinate', cs),
+                                (y, 'projection_y_coordinate', cs))
+
+    def test_unsupported_mercator(self):
+        self.helpers.has_supported_mercator_parameters.return_value = False
+        self._grid_mapping('merc', 'mercator')
+        self._coordinate('x', 'is_projection_x_coordinate')
+        _apply_rules(self.engine)
+        self.helpers.build_mercator_coordinate_system.assert_not_called()
+        self.assertNotIn('coordinate_system', self.engine.provides)
+        self._assert_dim_coords()
+
+    def test_time(self):
+        time = self._coordinate('time', 'is_time')
+        period = self._coordinate('forecast_period', 'is_time_period')
+        _apply_rules(self.engine)
+        self._assert_dim_coords((time, None, None), (period, None, None))
+
+    def test_default_coordinate(self):
+        height = self._coordinate('height')
+        _apply_rules(self.engine)
+        self.helpers.build_dimension_coordinate.assert_called_once_with(
+            self.engine, height)
+        self.assertIn(('coordinate', 'miscellaneous', 'height'),
+                      self.engine.facts['provides'])
+        self.assertIn('fc_default_coordinate', self.engine.rule_triggered)
+
+    def test_auxiliary_coordinates(self):
+        lat = self._aux_coordinate('lat', 'is_latitude')
+        rlon = self._aux_coordinate('rlon', 'is_longitude',
+                                    'is_rotated_longitude')
+        time = self._aux_coordinate('time', 'is_time')
+        height = self._aux_coordinate('height')
+        _apply_rules(self.engine)
+        self.assertEqual(
+            self.helpers.build_auxiliary_coordinate.call_args_list,
+            [mock.call(self.engine, time, coord_name=None),
+             mock.call(self.engine, lat, coord_name='latitude'),
+             mock.call(self.engine, rlon, coord_name='grid_longitude'),
+             mock.call(self.engine, height, coord_name=None)])
+
+    def test_label_and_cell_measure(self):
+        label = self._variable('labels', 'label', 'region')
+        measure = self._variable('cell_measures', 'cell_measure', 'area')
+        _apply_rules(self.engine)
+        self.helpers.build_auxiliary_coordinate.assert_called_once_with(
+            self.engine, label)
+        self.helpers.build_cell_measures.assert_called_once_with(
+            self.engine, measure)
+
+    def test_stash(self):
+        self.engine.cf_var = mock.Mock(spec=['cf_group', 'um_stash_source'],
+                                       cf_group=self.cf_group,
+                                       um_stash_source='m01s16i203')
+        _apply_rules(self.engine)
+        self.assertEqual(self.engine.cube.attributes,
+                         {'STASH': STASH(1, 16, 203)})
+
+    def test_process_flags(self):
+        self.engine.cf_var = mock.Mock(spec=['cf_group',
+                                             'ukmo__process_flags'],
+                                       cf_group=self.cf_group,
+                                       ukmo__process_flags='one two_words')
+        _apply_rules(self.engine)
+        self.assertEqual(self.engine.cube.attributes,
+                         {'ukmo__process_flags': ('one', 'two words')})
+
+    def test_formula(self):
+        self._variable('coordinates', 'formula_root', 'lev',
+                       standard_name='atmosphere_hybrid_height_coordinate')
+        for term in ('a', 'b', 'orog'):
+            self.engine.add_case_specific_fact(
+                'facts_cf', 'formula_term', (term + '_var', 'lev', term))
+        _apply_rules(self.engine)
+        self.assertEqual(self.engine.requires,
+                         {'formula_type':
+                          'atmosphere_hybrid_height_coordinate',
+                          'formula_terms': {'a': 'a_var', 'b': 'b_var',
+                                            'orog': 'orog_var'}})
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,151 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris.fileformats._nc_pool.DatasetPool` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+
+import netCDF4
+import numpy as np
+
+from iris.fileformats._nc_pool import DatasetPool
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, 'file{}.nc'.format(i))
+            self._write(path, i)
+            self.paths.append(path)
+        self.pool = DatasetPool(max_open=2)
+        self.addCleanup(self.pool.clear)
+
+    @staticmethod
+    def _write(path, value):
+        dataset = netCDF4.Dataset(path, 'w')
+        dataset.createDimension('x', 3)
+        var = dataset.createVariable('var', 'i4', ('x',))
+        var[:] = np.arange(3) + value
+        dataset.close()
+
+    def test_reuse(self):
+        with self.pool.dataset(self.paths[0]) as dataset:
+            first = dataset
+        with self.pool.dataset(self.paths[0]) as dataset:
+            self.assertIs(dataset, first)
+            self.assertArrayEqual(dataset.variables['var'][:], [0, 1, 2])
+        self.assertTrue(first.isopen())
+
+    def test_max_open(self):
+        datasets = []
+        for path in self.paths:
+            with self.pool.dataset(path) as dataset:
+                datasets.append(dataset)
+        self.assertEqual(len(self.pool), 2)
+        # The least recently used dataset has been closed.
+        self.assertFalse(datasets[0].isopen())
+        self.assertTrue(datasets[1].isopen())
+        self.assertTrue(datasets[2].isopen())
+
+    def test_in_use_not_closed(self):
+        held = self.pool.acquire(self.paths[0])
+        for path in self.paths[1:]:
+            with self.pool.dataset(path):
+                pass
+        self.assertTrue(held.isopen())
+        self.pool.release(self.paths[0])
+        self.assertEqual(len(self.pool), 2)
+
+    def test_release_closes_excess(self):
+        held = [self.pool.acquire(path) for path in self.paths]
+        self.assertEqual(len(self.pool), 3)
+        for path in self.paths:
+            self.pool.release(path)
+        self.assertEqual(len(self.pool), 2)
+        self.assertFalse(held[0].isopen())
+
+    def test_changed_file(self):
+        with self.pool.dataset(self.paths[0]) as dataset:
+            first = dataset
+        os.remove(self.paths[0])
+        self._write(self.paths[0], 10)
+        with self.pool.dataset(self.paths[0]) as dataset:
+            self.assertIsNot(dataset, first)
+            self.assertArrayEqual(dataset.variables['var'][:], [10, 11, 12])
+        self.assertFalse(first.isopen())
+
+    def test_discard(self):
+        with self.pool.dataset(self.paths[0]) as dataset:
+            pass
+        self.pool.discard(self.paths[0])
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(dataset.isopen())
+
+    def test_discard_in_use(self):
+        dataset = self.pool.acquire(self.paths[0])
+        with self.assertRaisesRegexp(IOError, 'currently open for reading'):
+            self.pool.discard(self.paths[0])
+        self.assertTrue(dataset.isopen())
+        self.pool.release(self.paths[0])
+
+    def test_lock(self):
+        with self.pool.dataset(self.paths[0]):
+            lock = self.pool.lock(self.paths[0])
+            # The lock is held by the dataset context of this thread.
+            result = []
+            thread = threading.Thread(
+                target=lambda: result.append(lock.acquire(False)))
+            thread.start()
+            thread.join()
+            self.assertEqual(result, [False])
+        with self.assertRaises(KeyError):
+            self.pool.lock(self.paths[1])
+
+    def test_fork(self):
+        with self.pool.dataset(self.paths[0]) as dataset:
+            first = dataset
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            with self.pool.dataset(self.paths[0]) as dataset:
+                self.assertIsNot(dataset, first)
+        # Datasets inherited from the parent process are left alone.
+        self.assertTrue(first.isopen())
+        first.close()
+
+    def test_pickle(self):
+        with self.pool.dataset(self.paths[0]):
+            pass
+        pool = pickle.loads(pickle.dumps(self.pool))
+        self.assertEqual(pool.max_open, 2)
+        self.assertEqual(len(pool), 0)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -28,6 +28,7 @@ import netCDF4 as nc
 import numpy as np
 
 import iris
+from iris._lazy_data import as_lazy_data
 from iris.coord_systems import (GeogCS, TransverseMercator, RotatedGeogCS,
                                 LambertConformal, Mercator, Stereographic,
                                 LambertAzimuthalEqualArea)
@@ -158,7 +159,7 @@ class Test_write(tests.IrisTest):
     def test_zlib(self):
         cube = self._simple_cube('>f4')
         with mock.patch('iris.fileformats.netcdf.netCDF4') as api:
-            with Saver('/dummy/path', 'NETCDF4') as saver:
+            with Saver(mock.Mock(), 'NETCDF4') as saver:
                 saver.write(cube, zlib=True)
         dataset = api.Dataset.return_value
         create_var_calls = mock.call.createVariable(
@@ -242,6 +243,59 @@ class Test_write(tests.IrisTest):
             self.assertEqual(res, 'something something_else')
 
 
+class Test_write__lazy(tests.IrisTest):
+    def _lazy_cube(self, var_name, chunks=(3, 4)):
+        data = as_lazy_data(np.arange(12.).reshape(3, 4), chunks=chunks)
+        return Cube(data, var_name=var_name)
+
+    def test_single_store(self):
+        cubes = [self._lazy_cube('foo'), self._lazy_cube('bar')]
+        stored = []
+
+        def store(sources, targets):
+            # The targets are only valid while the file is open.
+            stored.append((len(sources), [target.name for target in targets]))
+
+        with self.temp_filename('.nc') as nc_path:
+            with mock.patch('dask.array.store', side_effect=store):
+                with Saver(nc_path, 'NETCDF4') as saver:
+                    for cube in cubes:
+                        saver.write(cube)
+                    self.assertEqual(stored, [])
+        self.assertEqual(stored, [(2, ['foo', 'bar'])])
+
+    def test_data(self):
+        cubes = [self._lazy_cube('foo'), self._lazy_cube('bar')]
+        with self.temp_filename('.nc') as nc_path:
+            with Saver(nc_path, 'NETCDF4') as saver:
+                for cube in cubes:
+                    saver.write(cube)
+            ds = nc.Dataset(nc_path)
+            for cube in cubes:
+                self.assertArrayEqual(ds.variables[cube.var_name][:],
+                                      cube.data)
+            ds.close()
+
+    def test_no_store_on_error(self):
+        cube = self._lazy_cube('foo')
+        with self.temp_filename('.nc') as nc_path:
+            with mock.patch('dask.array.store') as store:
+                with self.assertRaises(ValueError):
+                    with Saver(nc_path, 'NETCDF4') as saver:
+                        saver.write(cube)
+                        raise ValueError()
+        self.assertEqual(store.call_count, 0)
+
+    def test_aligned_chunks(self):
+        cube = self._lazy_cube('foo', chunks=(3, 3))
+        with self.temp_filename('.nc') as nc_path:
+            with mock.patch('dask.array.store') as store:
+                with Saver(nc_path, 'NETCDF4') as saver:
+                    saver.write(cube, chunksizes=(1, 2))
+        (source,), _ = store.call_args[0]
+        self.assertEqual(source.chunks, ((3,), (2, 2)))
+
+
 class Test_write__valid_x_cube_attributes(tests.IrisTest):
     """Testing valid_range, valid_min and valid_max attributes."""
 
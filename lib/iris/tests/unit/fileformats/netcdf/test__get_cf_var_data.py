@@ -0,0 +1,118 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.netcdf._get_cf_var_data` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import netCDF4
+import numpy as np
+
+from iris._lazy_data import _MAX_CHUNK_SIZE
+import iris.fileformats.cf
+from iris.fileformats.netcdf import _get_cf_var_data, load_chunks
+from iris.tests import mock
+
+
+class Test__get_cf_var_data(tests.IrisTest):
+    def setUp(self):
+        self.filename = 'DUMMY'
+        self.shape = (300, 800, 900)
+        self.dimensions = ('time', 'latitude', 'longitude')
+        self.dtype = np.dtype('f4')
+
+    def _make(self, chunking, name='DUMMY_VAR'):
+        cf_data = mock.Mock(spec=netCDF4.Variable, _FillValue=None)
+        cf_data.chunking.return_value = chunking
+        cf_var = mock.MagicMock(spec=iris.fileformats.cf.CFVariable,
+                                cf_data=cf_data,
+                                cf_name=name,
+                                dimensions=self.dimensions,
+                                shape=self.shape)
+        return cf_var
+
+    def _chunksizes(self, lazy_data):
+        return tuple(dim_chunks[0] for dim_chunks in lazy_data.chunks)
+
+    def test_contiguous_reduces_outer_dims(self):
+        cf_var = self._make('contiguous')
+        lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        self.assertEqual(lazy_data.shape, self.shape)
+        self.assertEqual(self._chunksizes(lazy_data), (23, 800, 900))
+
+    def test_file_chunking(self):
+        chunks = [1, 400, 450]
+        cf_var = self._make(chunks)
+        lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        chunksizes = self._chunksizes(lazy_data)
+        # Whole multiples of the file chunks, within the limit.
+        self.assertEqual(chunksizes, (23, 800, 900))
+        self.assertLessEqual(np.prod(chunksizes), _MAX_CHUNK_SIZE)
+
+    def test_small_file_chunks_are_grown(self):
+        cf_var = self._make([1, 10, 10])
+        lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        chunksizes = self._chunksizes(lazy_data)
+        self.assertEqual(chunksizes[1:], (800, 900))
+        self.assertLessEqual(np.prod(chunksizes), _MAX_CHUNK_SIZE)
+
+    def test_load_chunks(self):
+        cf_var = self._make('contiguous')
+        with load_chunks({'time': 1, 'longitude': 300}):
+            lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        self.assertEqual(self._chunksizes(lazy_data), (1, 800, 300))
+
+    def test_load_chunks_full_dim(self):
+        cf_var = self._make('contiguous')
+        with load_chunks({'time': -1}):
+            lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        self.assertEqual(self._chunksizes(lazy_data), (300, 800, 900))
+
+    def test_load_chunks_var_names(self):
+        cf_var = self._make('contiguous')
+        other_var = self._make('contiguous', name='OTHER_VAR')
+        with load_chunks({'time': 1}, var_names='OTHER_VAR'):
+            lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+            other_data = _get_cf_var_data(other_var, self.filename,
+                                          self.dtype)
+        self.assertEqual(self._chunksizes(lazy_data), (23, 800, 900))
+        self.assertEqual(self._chunksizes(other_data), (1, 800, 900))
+
+    def test_load_chunks_nested(self):
+        cf_var = self._make('contiguous')
+        with load_chunks({'time': 1, 'latitude': 100}):
+            with load_chunks({'time': 2}):
+                lazy_data = _get_cf_var_data(cf_var, self.filename,
+                                             self.dtype)
+            outer_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        self.assertEqual(self._chunksizes(lazy_data), (2, 100, 900))
+        self.assertEqual(self._chunksizes(outer_data), (1, 100, 900))
+
+    def test_load_chunks_restored(self):
+        cf_var = self._make('contiguous')
+        with load_chunks({'time': 1}):
+            pass
+        lazy_data = _get_cf_var_data(cf_var, self.filename, self.dtype)
+        self.assertEqual(self._chunksizes(lazy_data), (23, 800, 900))
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -46,6 +46,7 @@ class TestFillValue(tests.IrisTest):
     def _make_cf_var(self, dtype):
         variable = mock.Mock(spec=netCDF4.Variable,
                              dtype=dtype)
+        variable.chunking.return_value = 'contiguous'
         cf_var = mock.MagicMock(spec=iris.fileformats.cf.CFVariable,
                                 cf_data=variable,
                                 cf_name='DUMMY_VAR',
@@ -141,9 +142,11 @@ class TestCoordAttributes(tests.IrisTest):
             cf_group[name] = mock.Mock(cf_attrs_unused=cf_attrs_unused)
         cf = mock.Mock(cf_group=cf_group)
 
+        cf_data = mock.Mock(_FillValue=None)
+        cf_data.chunking.return_value = 'contiguous'
         cf_var = mock.MagicMock(spec=iris.fileformats.cf.CFVariable,
                                 dtype=np.dtype('i4'),
-                                cf_data=mock.Mock(_FillValue=None),
+                                cf_data=cf_data,
                                 cf_name='DUMMY_VAR',
                                 cf_group=coords,
                                 shape=(1,))
@@ -207,9 +210,11 @@ class TestCubeAttributes(tests.IrisTest):
 
     def _make(self, attrs):
         cf_attrs_unused = mock.Mock(return_value=attrs)
+        cf_data = mock.Mock(_FillValue=None)
+        cf_data.chunking.return_value = 'contiguous'
         cf_var = mock.MagicMock(spec=iris.fileformats.cf.CFVariable,
                                 dtype=np.dtype('i4'),
-                                cf_data=mock.Mock(_FillValue=None),
+                                cf_data=cf_data,
                                 cf_name='DUMMY_VAR',
                                 cf_group=mock.Mock(),
                                 cf_attrs_unused=cf_attrs_unused,
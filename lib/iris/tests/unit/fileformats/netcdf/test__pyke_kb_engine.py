@@ -0,0 +1,45 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.netcdf._pyke_kb_engine` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import threading
+
+from iris.fileformats.netcdf import _pyke_kb_engine
+
+
+class Test(tests.IrisTest):
+    def test_reused(self):
+        self.assertIs(_pyke_kb_engine(), _pyke_kb_engine())
+
+    def test_separate_threads(self):
+        engines = []
+        thread = threading.Thread(
+            target=lambda: engines.append(_pyke_kb_engine()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(engines[0], _pyke_kb_engine())
+
+
+if __name__ == '__main__':
+    tests.main()
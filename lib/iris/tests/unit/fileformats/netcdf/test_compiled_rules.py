@@ -0,0 +1,97 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.netcdf.compiled_rules` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+import netCDF4
+import numpy as np
+
+from iris.fileformats._nc_load_rules import Engine
+from iris.fileformats.netcdf import _RULES_CONTROL, compiled_rules, load_cubes
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.paths = []
+        for i in range(2):
+            path = os.path.join(self.temp_dir, 'file{}.nc'.format(i))
+            self._write(path)
+            self.paths.append(path)
+        patcher = mock.patch('iris.fileformats.netcdf._pyke_kb_engine')
+        self.pyke_kb_engine = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _write(path):
+        dataset = netCDF4.Dataset(path, 'w')
+        dataset.createDimension('lat', 3)
+        lat = dataset.createVariable('lat', 'f8', ('lat',))
+        lat.units = 'degrees_north'
+        lat[:] = [-10, 0, 10]
+        for name in ('temp', 'rain'):
+            var = dataset.createVariable(name, 'f4', ('lat',))
+            var.units = 'K'
+            var[:] = np.arange(3)
+        dataset.close()
+
+    def test_compiled(self):
+        with compiled_rules():
+            cubes = list(load_cubes(self.paths[0]))
+        self.pyke_kb_engine.assert_not_called()
+        self.assertEqual(sorted(cube.var_name for cube in cubes),
+                         ['rain', 'temp'])
+        for cube in cubes:
+            coord = cube.coord('latitude')
+            self.assertEqual(cube.coord_dims(coord), (0,))
+            self.assertArrayEqual(coord.points, [-10, 0, 10])
+
+    def test_engine_per_file(self):
+        with compiled_rules():
+            with mock.patch('iris.fileformats._nc_load_rules.Engine',
+                            wraps=Engine) as engine:
+                list(load_cubes(self.paths))
+        self.assertEqual(engine.call_count, 2)
+
+    def test_default(self):
+        with mock.patch('iris.fileformats.netcdf._load_cube'), \
+                mock.patch('iris.fileformats.netcdf._load_aux_factory'):
+            list(load_cubes(self.paths[0]))
+        self.pyke_kb_engine.assert_called_once_with()
+
+    def test_restored(self):
+        with compiled_rules():
+            with compiled_rules():
+                self.assertTrue(_RULES_CONTROL.compiled)
+            self.assertTrue(_RULES_CONTROL.compiled)
+        self.assertFalse(_RULES_CONTROL.compiled)
+
+
+if __name__ == '__main__':
+    tests.main()
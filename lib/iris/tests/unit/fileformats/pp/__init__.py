@@ -18,3 +18,32 @@
 
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
+
+import struct
+
+import numpy as np
+
+import iris.fileformats.pp as pp
+
+
+def write_field(fh, lbuser4=16004, lblrec=None, lbrel=3, extra=b'',
+                little_ended=False):
+    # Write a PP field record of 2x3 float32 values to an open file.
+    endian = '<' if little_ended else '>'
+    data = np.arange(6, dtype='{}f4'.format(endian))
+    payload = data.tobytes() + extra
+    longs = np.zeros(pp.NUM_LONG_HEADERS, dtype='{}i4'.format(endian))
+    longs[[17, 18]] = 2, 3
+    longs[14] = len(payload) // 4 if lblrec is None else lblrec
+    longs[19] = len(extra) // 4
+    longs[21] = lbrel
+    longs[[38, 41, 44]] = 1, lbuser4, 1
+    floats = np.zeros(pp.NUM_FLOAT_HEADERS, dtype='{}f4'.format(endian))
+    floats[-2] = -1e30
+    word = struct.Struct('{}L'.format(endian)).pack
+    fh.write(word(pp.PP_HEADER_DEPTH))
+    fh.write(longs.tobytes() + floats.tobytes())
+    fh.write(word(pp.PP_HEADER_DEPTH))
+    fh.write(word(len(payload)))
+    fh.write(payload)
+    fh.write(word(len(payload)))
@@ -23,6 +23,8 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
+
 from iris.fileformats.pp import PPDataProxy, SplittableInt
 from iris.tests import mock
 
@@ -48,5 +50,59 @@ class Test_lbpack(tests.IrisTest):
         self.assertEqual(proxy.lbpack.n4, lbpack // 1000 % 10)
 
 
+class Test__getitem__unpacked(tests.IrisTest):
+    def setUp(self):
+        self.shape = (3, 4)
+        self.data = np.arange(12, dtype='>f4').reshape(self.shape)
+        self.mdi = -1e30
+        self.data[1, 2] = self.mdi
+        self.offset = 16
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        with open(self.path, 'wb') as fh:
+            fh.write(b'\x00' * self.offset)
+            fh.write(self.data.tobytes())
+            fh.write(b'\x00' * 8)
+
+    def _proxy(self, lbpack=0, src_dtype=np.dtype('>f4')):
+        data_len = self.data.size * src_dtype.itemsize
+        return PPDataProxy(self.shape, src_dtype, self.path, self.offset,
+                           data_len, lbpack, None, self.mdi, None)
+
+    def test_is_unpacked(self):
+        self.assertTrue(self._proxy().is_unpacked)
+
+    def test_packed(self):
+        self.assertFalse(self._proxy(lbpack=1).is_unpacked)
+        self.assertFalse(self._proxy(lbpack=120).is_unpacked)
+
+    def test_all(self):
+        result = self._proxy()[:]
+        expected = self.data.astype('f4')
+        expected[1, 2] = np.nan
+        self.assertEqual(result.dtype, np.dtype('f4'))
+        self.assertArrayEqual(result, expected)
+
+    def test_subset(self):
+        result = self._proxy()[1:, ::2]
+        self.assertArrayEqual(result, [[4, np.nan], [8, 10]])
+        self.assertTrue(result.flags.writeable)
+
+    def test_point(self):
+        result = self._proxy()[2, 3]
+        self.assertEqual(result.shape, ())
+        self.assertEqual(result, 11)
+
+    def test_int(self):
+        self.data = np.arange(12, dtype='>i4').reshape(self.shape)
+        with open(self.path, 'r+b') as fh:
+            fh.seek(self.offset)
+            fh.write(self.data.tobytes())
+        result = self._proxy(src_dtype=np.dtype('>i4'))[0]
+        self.assertEqual(result.dtype, np.dtype('f8'))
+        self.assertArrayEqual(result, [0, 1, 2, 3])
+
+
 if __name__ == '__main__':
     tests.main()
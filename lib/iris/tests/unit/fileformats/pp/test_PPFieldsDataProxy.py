@@ -0,0 +1,107 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.pp.PPFieldsDataProxy` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import pickle
+
+import numpy as np
+
+from iris.fileformats.pp import PPFieldsDataProxy
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        # Six big-endian 3x4 fields, each preceded by a 16-byte "header".
+        self.field_shape = (3, 4)
+        self.data = np.arange(72, dtype='>f4').reshape((6,) +
+                                                       self.field_shape)
+        self.mdi = -1e30
+        self.data[4, 1, 1] = self.mdi
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        offsets = []
+        with open(self.path, 'wb') as fh:
+            for field in self.data:
+                fh.write(b'\x00' * 16)
+                offsets.append(fh.tell())
+                fh.write(field.tobytes())
+        # Arrange the fields as a 2x3 array, in reverse file order.
+        self.offsets = np.array(offsets[::-1]).reshape((2, 3))
+        self.expected = self.data[::-1].astype('f4').reshape(
+            (2, 3) + self.field_shape)
+        self.expected[0, 1, 1, 1] = np.nan
+        self.proxy = PPFieldsDataProxy(self.offsets, self.mdi,
+                                       self.field_shape, np.dtype('>f4'),
+                                       self.path)
+
+    def test_shape(self):
+        self.assertEqual(self.proxy.shape, (2, 3, 3, 4))
+        self.assertEqual(self.proxy.ndim, 4)
+        self.assertEqual(self.proxy.dtype, np.dtype('f4'))
+
+    def test_all(self):
+        result = self.proxy[:]
+        self.assertEqual(result.dtype, np.dtype('f4'))
+        self.assertArrayEqual(result, self.expected)
+
+    def test_ellipsis(self):
+        result = self.proxy[..., 0]
+        self.assertArrayEqual(result, self.expected[..., 0])
+
+    def test_subset(self):
+        keys = (slice(None), slice(1, None), 1, slice(None, None, 2))
+        result = self.proxy[keys]
+        self.assertArrayEqual(result, self.expected[keys])
+
+    def test_single_field(self):
+        result = self.proxy[1, 2]
+        self.assertArrayEqual(result, self.expected[1, 2])
+
+    def test_point(self):
+        result = self.proxy[0, 1, 1, 1]
+        self.assertEqual(result.shape, ())
+        self.assertTrue(np.isnan(result))
+
+    def test_empty(self):
+        result = self.proxy[:, 3:]
+        self.assertEqual(result.shape, (2, 0, 3, 4))
+
+    def test_int(self):
+        data = np.arange(24, dtype='>i4')
+        with open(self.path, 'wb') as fh:
+            fh.write(data.tobytes())
+        proxy = PPFieldsDataProxy([0, 48], [-99, -99], (3, 4),
+                                  np.dtype('>i4'), self.path)
+        result = proxy[:]
+        self.assertEqual(result.dtype, np.dtype('f8'))
+        self.assertArrayEqual(result, data.reshape((2, 3, 4)))
+
+    def test_pickle(self):
+        proxy = pickle.loads(pickle.dumps(self.proxy))
+        self.assertArrayEqual(proxy[:], self.expected)
+
+
+if __name__ == '__main__':
+    tests.main()
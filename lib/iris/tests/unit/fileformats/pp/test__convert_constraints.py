@@ -23,9 +23,13 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
+
 import iris
 from iris.fileformats.pp import _convert_constraints
 from iris.fileformats.pp import STASH
+from iris.fileformats.pp import (_FieldIndex, _header_dtype, make_pp_field,
+                                 NUM_LONG_HEADERS, NUM_FLOAT_HEADERS)
 from iris.tests import mock
 
 
@@ -81,6 +85,18 @@ class Test_convert_constraints(tests.IrisTest):
         self.assertTrue(pp_filter(stcube4))
         self.assertTrue(pp_filter(stcube7))
 
+    def test_index_mask(self):
+        constraint = iris.AttributeConstraint(STASH='m01s03i236')
+        pp_filter = _convert_constraints(constraint)
+        index = mock.Mock()
+        index.stash_codes.return_value = (
+            [STASH.from_msi('m01s00i001'), STASH.from_msi('m01s00i004'),
+             STASH.from_msi('m01s00i030'), STASH.from_msi('m01s03i236')],
+            np.array([3, 1, 0, 1, 2, 3]))
+        mask = pp_filter.index_mask(index)
+        # Surface pressure and land-sea mask fields are always selected.
+        self.assertArrayEqual(mask, [True, False, True, False, True, True])
+
     def test_multiple_with_stash(self):
         constraints = [iris.Constraint('air_potential_temperature'),
                        iris.AttributeConstraint(STASH='m01s00i004')]
@@ -99,5 +115,95 @@ class Test_convert_constraints(tests.IrisTest):
         self.assertIsNone(pp_filter)
 
 
+def _header(lbhr=0, lbvc=65, lblev=1, lbrsvd4=0, item=16203):
+    # A release 3 header of a forecast field from a 2000-01-01 00:00 run.
+    longs = [0] * NUM_LONG_HEADERS
+    floats = [0.0] * NUM_FLOAT_HEADERS
+    longs[0:6] = [2000, 1, 1, lbhr, 0, 0]
+    longs[6:12] = [2000, 1, 1, 0, 0, 0]
+    longs[12] = 11
+    longs[13] = lbhr
+    longs[15] = 1
+    longs[21] = 3
+    longs[25] = lbvc
+    longs[32] = lblev
+    longs[36] = lbrsvd4
+    longs[41] = item
+    longs[44] = 1
+    return tuple(longs) + tuple(floats)
+
+
+def _index(headers):
+    records = np.zeros(len(headers), dtype=_header_dtype().newbyteorder('='))
+    for i_field, header in enumerate(headers):
+        records['longs'][i_field] = header[:NUM_LONG_HEADERS]
+        records['floats'][i_field] = header[NUM_LONG_HEADERS:]
+    n_fields = len(headers)
+    return _FieldIndex(None, records, np.zeros(n_fields), np.zeros(n_fields))
+
+
+class Test_convert_constraints__coords(tests.IrisTest):
+    def _check(self, constraints, headers, expected):
+        pp_filter = _convert_constraints(constraints)
+        result = [pp_filter(make_pp_field(header)) for header in headers]
+        self.assertEqual(result, expected)
+        mask = pp_filter.index_mask(_index(headers))
+        self.assertArrayEqual(mask, expected)
+
+    def test_model_level_number(self):
+        headers = [_header(lblev=lblev) for lblev in [1, 2, 3, 2]]
+        headers.append(_header(lbvc=8, lblev=2))
+        self._check(iris.Constraint(model_level_number=2), headers,
+                    [False, True, False, True, False])
+
+    def test_forecast_period_range(self):
+        headers = [_header(lbhr=lbhr) for lbhr in [0, 6, 12, 18]]
+        constraint = iris.Constraint(forecast_period=iris.Range(6, 12))
+        self._check(constraint, headers, [False, True, False, False])
+
+    def test_realization(self):
+        headers = [_header(lbrsvd4=lbrsvd4) for lbrsvd4 in [1, 2, 3]]
+        self._check(iris.Constraint(realization=[1, 3]), headers,
+                    [True, False, True])
+
+    def test_name_and_coord(self):
+        headers = [_header(lblev=lblev) for lblev in [1, 2]]
+        constraint = iris.Constraint('air_temperature', model_level_number=1)
+        self._check(constraint, headers, [True, False])
+
+    def test_stash_and_coord(self):
+        headers = [_header(lblev=1), _header(lblev=2),
+                   _header(lblev=1, item=16222)]
+        constraint = (iris.AttributeConstraint(STASH='m01s16i203') &
+                      iris.Constraint(model_level_number=1))
+        self._check(constraint, headers, [True, False, False])
+
+    def test_multiple(self):
+        headers = [_header(lblev=lblev) for lblev in [1, 2, 3]]
+        constraints = [iris.Constraint(model_level_number=1),
+                       iris.Constraint(model_level_number=3)]
+        self._check(constraints, headers, [True, False, True])
+
+    def test_reference_fields(self):
+        # Orography is always selected, as it is referenced by other fields.
+        headers = [_header(lblev=2), _header(lblev=2, item=33)]
+        self._check(iris.Constraint(model_level_number=1), headers,
+                    [False, True])
+
+    def test_other_coord(self):
+        constraint = iris.Constraint(latitude=0)
+        self.assertIsNone(_convert_constraints(constraint))
+
+    def test_multiple_with_other_coord(self):
+        constraints = [iris.Constraint(model_level_number=1),
+                       iris.Constraint(latitude=0)]
+        self.assertIsNone(_convert_constraints(constraints))
+
+    def test_no_coords(self):
+        # E.g. when a load callback may change the coordinates.
+        constraint = iris.Constraint(model_level_number=1)
+        self.assertIsNone(_convert_constraints(constraint, coords=False))
+
+
 if __name__ == "__main__":
     tests.main()
@@ -24,101 +24,103 @@ import six
 # importing anything else.
 import iris.tests as tests
 
-import contextlib
-import io
+import struct
 import warnings
 
 import numpy as np
 
 import iris.fileformats.pp as pp
 from iris.tests import mock
+from iris.tests.unit.fileformats.pp import write_field
 
 
 class Test(tests.IrisTest):
-    @contextlib.contextmanager
-    def mock_for_field_gen(self, fields):
-        side_effect_fields = list(fields)[:]
-
-        def make_pp_field_override(*args):
-            # Iterates over the fields passed to this context manager,
-            # until there are no more, upon which the np.fromfile
-            # returns an empty list and the while loop in load() is
-            # broken.
-            result = side_effect_fields.pop(0)
-            if not side_effect_fields:
-                np.fromfile.return_value = []
-            return result
-
-        if six.PY3:
-            open_func = 'builtins.open'
-        else:
-            open_func = '__builtin__.open'
-        with mock.patch('numpy.fromfile', return_value=[0]), \
-                mock.patch(open_func), \
-                mock.patch('struct.unpack_from', return_value=[4]), \
-                mock.patch('iris.fileformats.pp.make_pp_field',
-                           side_effect=make_pp_field_override):
-            yield
-
-    def gen_fields(self, fields):
-        with self.mock_for_field_gen(fields):
-            return list(pp._field_gen('mocked', 'mocked'))
+    def setUp(self):
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def test_deferred_bytes(self):
+        with open(self.path, 'wb') as fh:
+            write_field(fh)
+            write_field(fh, lbuser4=16203)
+        fields = list(pp._field_gen(self.path, read_data_bytes=False))
+        self.assertEqual(len(fields), 2)
+        self.assertEqual([field.lbuser[3] for field in fields],
+                         [16004, 16203])
+        header_record_len = pp.PP_HEADER_DEPTH + 3 * pp.PP_WORD_DEPTH
+        record_len = header_record_len + 24 + pp.PP_WORD_DEPTH
+        self.assertEqual(fields[0].data,
+                         (self.path, header_record_len, 24, np.dtype('>f4')))
+        self.assertEqual(fields[1].data,
+                         (self.path, record_len + header_record_len, 24,
+                          np.dtype('>f4')))
+
+    def test_read_data(self):
+        with open(self.path, 'wb') as fh:
+            write_field(fh)
+        field, = pp._field_gen(self.path, read_data_bytes=True)
+        expected = np.arange(6, dtype='>f4').tobytes()
+        self.assertEqual(field.data,
+                         pp.LoadedArrayBytes(expected, np.dtype('>f4')))
+
+    def test_little_ended(self):
+        with open(self.path, 'wb') as fh:
+            write_field(fh, little_ended=True)
+        field, = pp._field_gen(self.path, read_data_bytes=False,
+                               little_ended=True)
+        self.assertEqual(field.lbuser[3], 16004)
+        self.assertEqual(field.data[-1], np.dtype('<f4'))
+
+    def test_extra_data(self):
+        title = b'A title'.ljust(8, b'\x00')
+        extra = struct.pack('>L', 2 * 1000 + 10) + title
+        with open(self.path, 'wb') as fh:
+            write_field(fh, extra=extra)
+            write_field(fh)
+        fields = list(pp._field_gen(self.path, read_data_bytes=True))
+        self.assertEqual(len(fields), 2)
+        self.assertEqual(fields[0].field_title, 'A title')
+        self.assertEqual(len(fields[0].data.bytes), 24)
+
+    def test_pp_filter(self):
+        with open(self.path, 'wb') as fh:
+            write_field(fh, lbuser4=16004)
+            write_field(fh, lbuser4=16203)
+        pp_filter = mock.Mock(index_mask=lambda index: np.array([False,
+                                                                 True]))
+        fields = list(pp._field_gen(self.path, read_data_bytes=False,
+                                    pp_filter=pp_filter))
+        self.assertEqual([field.lbuser[3] for field in fields], [16203])
 
     def test_lblrec_invalid(self):
-        pp_field = mock.Mock(lblrec=2,
-                             lbext=0)
+        with open(self.path, 'wb') as fh:
+            write_field(fh)
+            write_field(fh, lblrec=2)
+            write_field(fh)
         with warnings.catch_warnings(record=True) as warn:
             warnings.simplefilter('always')
-            self.gen_fields([pp_field])
+            fields = list(pp._field_gen(self.path, read_data_bytes=False))
+        self.assertEqual(len(fields), 1)
         self.assertEqual(len(warn), 1)
         wmsg = ('LBLREC has a different value to the .* the header in the '
-                'file \(8 and 4\)\. Skipping .*')
+                'file \(8 and 24\)\. Skipping .*')
         six.assertRegex(self, str(warn[0].message), wmsg)
 
-    def test_read_headers_call(self):
-        # Checks that the two calls to np.fromfile are called in the
-        # expected way.
-        pp_field = mock.Mock(lblrec=1,
-                             lbext=0,
-                             lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen('mocked', read_data_bytes=False))
-            with open_fh as open_fh_ctx:
-                calls = [mock.call(open_fh_ctx, count=45, dtype='>i4'),
-                         mock.call(open_fh_ctx, count=19, dtype='>f4')]
-            np.fromfile.assert_has_calls(calls)
-        with open_fh as open_fh_ctx:
-            expected_deferred_bytes = ('mocked', open_fh_ctx.tell(),
-                                       4, np.dtype('>f4'))
-        self.assertEqual(pp_field.data, expected_deferred_bytes)
-
-    def test_read_data_call(self):
-        # Checks that data is read if read_data is True.
-        pp_field = mock.Mock(lblrec=1,
-                             lbext=0,
-                             lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen('mocked', read_data_bytes=True))
-        with open_fh as open_fh_ctx:
-            expected_loaded_bytes = pp.LoadedArrayBytes(open_fh_ctx.read(),
-                                                        np.dtype('>f4'))
-        self.assertEqual(pp_field.data, expected_loaded_bytes)
-
     def test_invalid_header_release(self):
         # Check that an unknown LBREL value just results in a warning
         # and the end of the file iteration instead of raising an error.
-        with self.temp_filename() as temp_path:
-            np.zeros(65, dtype='i4').tofile(temp_path)
-            generator = pp._field_gen(temp_path, False)
-            with mock.patch('warnings.warn') as warn:
-                with self.assertRaises(StopIteration):
-                    next(generator)
-            self.assertEqual(warn.call_count, 1)
-            self.assertIn('header release number', warn.call_args[0][0])
+        np.zeros(65, dtype='i4').tofile(self.path)
+        generator = pp._field_gen(self.path, False)
+        with mock.patch('warnings.warn') as warn:
+            with self.assertRaises(StopIteration):
+                next(generator)
+        self.assertEqual(warn.call_count, 1)
+        self.assertIn('header release number', warn.call_args[0][0])
+
+    def test_empty_file(self):
+        open(self.path, 'wb').close()
+        self.assertEqual(list(pp._field_gen(self.path, False)), [])
 
 
 if __name__ == "__main__":
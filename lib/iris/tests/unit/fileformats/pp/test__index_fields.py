@@ -0,0 +1,113 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.pp._index_fields` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from iris.fileformats._header_index import CACHE_CONTROL
+import iris.fileformats.pp as pp
+from iris.fileformats.pp import STASH
+from iris.tests import mock
+from iris.tests.unit.fileformats.pp import write_field
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        with open(self.path, 'wb') as fh:
+            for lbuser4 in (16004, 16203, 16004, 30):
+                write_field(fh, lbuser4=lbuser4)
+
+    def test_headers(self):
+        index = pp._index_fields(self.path)
+        self.assertEqual(len(index), 4)
+        self.assertTrue(index.headers.dtype['longs'].isnative)
+        self.assertArrayEqual(index.lbuser[:, 3], [16004, 16203, 16004, 30])
+        self.assertArrayEqual(index.headers['longs'][:, 21], 3)
+        self.assertArrayEqual(index.headers['floats'][:, -2], -1e30)
+
+    def test_payloads(self):
+        index = pp._index_fields(self.path)
+        record_len = pp.PP_HEADER_DEPTH + 4 * pp.PP_WORD_DEPTH + 24
+        self.assertArrayEqual(index.data_offsets,
+                              np.arange(4) * record_len + 268)
+        self.assertArrayEqual(index.data_lens, 24)
+
+    def test_little_ended(self):
+        with open(self.path, 'wb') as fh:
+            write_field(fh, little_ended=True)
+        index = pp._index_fields(self.path, little_ended=True)
+        self.assertArrayEqual(index.lbuser[:, 3], [16004])
+        self.assertTrue(index.little_ended)
+
+    def test_subset(self):
+        index = pp._index_fields(self.path)[np.array([False, True, False,
+                                                      True])]
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.filename, self.path)
+        self.assertArrayEqual(index.lbuser[:, 3], [16203, 30])
+        self.assertEqual(len(list(index.fields(False))), 2)
+
+    def test_stash_codes(self):
+        index = pp._index_fields(self.path)
+        stashes, inverse = index.stash_codes()
+        self.assertEqual(stashes, [STASH(1, 0, 30), STASH(1, 16, 4),
+                                   STASH(1, 16, 203)])
+        self.assertArrayEqual(inverse, [1, 2, 1, 0])
+
+
+class Test_cached(tests.IrisTest):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        with open(self.path, 'wb') as fh:
+            write_field(fh)
+            write_field(fh, lbrel=0)
+
+    def test_cached(self):
+        with CACHE_CONTROL.context(self.cache_dir):
+            index = pp._index_fields(self.path)
+            with mock.patch('iris.fileformats.pp._scan_fields') as scan, \
+                    mock.patch('warnings.warn') as warn:
+                cached = pp._index_fields(self.path)
+        self.assertEqual(scan.call_count, 0)
+        self.assertEqual(len(cached), 1)
+        self.assertArrayEqual(cached.headers, index.headers)
+        self.assertArrayEqual(cached.data_offsets, index.data_offsets)
+        self.assertArrayEqual(cached.data_lens, index.data_lens)
+        # Any warning about the file is repeated.
+        self.assertEqual(warn.call_count, 1)
+        self.assertIn('header release number', warn.call_args[0][0])
+
+
+if __name__ == "__main__":
+    tests.main()
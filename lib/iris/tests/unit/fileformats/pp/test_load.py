@@ -42,7 +42,29 @@ class Test_load(tests.IrisTest):
 
         interpret.assert_called_once_with(extract_result)
         field_gen.assert_called_once_with('mock', read_data_bytes=True,
-                                          little_ended=False)
+                                          little_ended=False,
+                                          pp_filter=None)
+
+    def test_pp_filter(self):
+        # Check that the filter is passed to the field generator, and also
+        # applied to the resulting fields.
+        fields = [mock.Mock(lbuser4=1), mock.Mock(lbuser4=2)]
+        interpret_patch = mock.patch('iris.fileformats.pp._interpret_fields',
+                                     autospec=True,
+                                     return_value=iter(fields))
+        field_gen_patch = mock.patch('iris.fileformats.pp._field_gen',
+                                     autospec=True)
+
+        def pp_filter(field):
+            return field.lbuser4 == 2
+
+        with interpret_patch, field_gen_patch as field_gen:
+            result = list(pp.load('mock', pp_filter=pp_filter))
+
+        field_gen.assert_called_once_with('mock', read_data_bytes=False,
+                                          little_ended=False,
+                                          pp_filter=pp_filter)
+        self.assertEqual(result, fields[1:])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for :class:`iris.fileformats.pp_rules._CachingConverter`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.fileformats.pp import (make_pp_field, NUM_LONG_HEADERS,
+                                 NUM_FLOAT_HEADERS)
+from iris.fileformats.pp_rules import _CachingConverter, convert
+
+
+def _field(t1=(2000, 1, 1, 0), t2=(2000, 1, 1, 0), lbtim=11, lbft=0,
+           lbvc=65, lblev=1, blev=0.0, lbrsvd4=0, lbuser5=0, item=16203):
+    # A release 3 field on a global 2x2 degree grid.
+    longs = [0] * NUM_LONG_HEADERS
+    floats = [0.0] * NUM_FLOAT_HEADERS
+    longs[0:4] = t1
+    longs[6:10] = t2
+    longs[12] = lbtim
+    longs[13] = lbft
+    longs[15] = 1
+    longs[17] = 90
+    longs[18] = 180
+    longs[21] = 3
+    longs[25] = lbvc
+    longs[32] = lblev
+    longs[36] = lbrsvd4
+    longs[41] = item
+    longs[42] = lbuser5
+    longs[44] = 1
+    floats[6] = blev
+    floats[10] = 90.0
+    floats[13:17] = [-91.0, 2.0, -2.0, 2.0]
+    floats[17] = -1.0e30
+    floats[18] = 1.0
+    return make_pp_field(tuple(longs) + tuple(floats))
+
+
+class Test___call__(tests.IrisTest):
+    def _check(self, fields):
+        converter = _CachingConverter()
+        for field in fields:
+            self.assertEqual(converter(field), convert(field))
+
+    def test_times_and_levels(self):
+        fields = [_field(t1=(2000, 1, 1, hour), lbft=hour, lblev=level)
+                  for hour in [0, 6, 12] for level in [1, 2, 3]]
+        self._check(fields + fields)
+
+    def test_years(self):
+        fields = [_field(t1=(year, 1, 1, 0), t2=(year, 1, 1, 0))
+                  for year in [2000, 2001]]
+        self._check(fields + fields)
+
+    def test_vertical_coordinate_types_and_levels(self):
+        # Height and pressure levels, at the same level numbers.
+        fields = [_field(lbvc=lbvc, blev=blev)
+                  for lbvc in [1, 8] for blev in [10.0, 20.0]]
+        self._check(fields + fields)
+
+    def test_realizations(self):
+        fields = [_field(lbrsvd4=realization) for realization in [1, 2]]
+        self._check(fields + fields)
+
+    def test_pseudo_levels(self):
+        fields = [_field(lbuser5=pseudo_level) for pseudo_level in [1, 2]]
+        self._check(fields + fields)
+
+    def test_realizations_and_pseudo_levels(self):
+        fields = [_field(lbrsvd4=realization, lbuser5=pseudo_level)
+                  for realization in [0, 1, 2] for pseudo_level in [0, 1, 2]]
+        self._check(fields + fields)
+
+    def test_phenomena(self):
+        fields = [_field(item=item, lblev=level)
+                  for item in [16203, 16222, 33] for level in [1, 2]]
+        self._check(fields + fields)
+
+    def test_seasons(self):
+        # The season of a seasonal mean depends on its dates.
+        djf = _field(t1=(2000, 12, 1, 0), t2=(2001, 3, 1, 0), lbtim=31)
+        mam = _field(t1=(2001, 3, 1, 0), t2=(2001, 6, 1, 0), lbtim=31)
+        self._check([djf, mam])
+
+    def test_new_coords(self):
+        converter = _CachingConverter()
+        result1 = converter(_field())
+        result2 = converter(_field())
+        self.assertEqual(result1, result2)
+        coords1 = [coord for coord, _ in result1.dim_coords_and_dims +
+                   result1.aux_coords_and_dims]
+        coords2 = [coord for coord, _ in result2.dim_coords_and_dims +
+                   result2.aux_coords_and_dims]
+        for coord1, coord2 in zip(coords1, coords2):
+            self.assertIsNot(coord1, coord2)
+        self.assertIsNot(result1.attributes, result2.attributes)
+
+    def test_extra_data(self):
+        field = _field()
+        field.x = field.bzx + field.bdx * (1 + np.arange(field.lbnpt))
+        self._check([_field(), field])
+
+
+class Test__other_key(tests.IrisTest):
+    def test_times_and_levels(self):
+        converter = _CachingConverter()
+        key = converter._other_key(_field())
+        self.assertIsNotNone(key)
+        self.assertEqual(
+            converter._other_key(_field(t1=(2000, 1, 1, 6), lbft=6,
+                                        lblev=2, blev=10.0)),
+            key)
+
+    def test_phenomena(self):
+        converter = _CachingConverter()
+        self.assertNotEqual(converter._other_key(_field(item=16222)),
+                            converter._other_key(_field()))
+
+    def test_extra_data(self):
+        field = _field()
+        field.x = field.bzx + field.bdx * (1 + np.arange(field.lbnpt))
+        self.assertIsNone(_CachingConverter()._other_key(field))
+
+
+class Test__parts(tests.IrisTest):
+    def test_shared(self):
+        converter = _CachingConverter()
+        parts1 = converter._parts(_field(lblev=1))
+        parts2 = converter._parts(_field(lblev=2))
+        time1, vertical1, realization1, pseudo1, other1 = parts1
+        time2, vertical2, realization2, pseudo2, other2 = parts2
+        self.assertIs(time1, time2)
+        self.assertIsNot(vertical1, vertical2)
+        self.assertIs(realization1, realization2)
+        self.assertIs(pseudo1, pseudo2)
+        self.assertIs(other1, other2)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -53,7 +53,8 @@ class TestBoundsVertexDim(tests.IrisTest):
             cube=mock.Mock(),
             cf_var=mock.Mock(dimensions=('foo', 'bar')),
             filename='DUMMY',
-            provides=dict(coordinates=[]))
+            provides=dict(coordinates=[]),
+            cf_var_arrays={})
 
         # Create patch for deferred loading that prevents attempted
         # file access. This assumes that self.cf_bounds_var is
@@ -180,6 +181,59 @@ class TestBoundsVertexDim(tests.IrisTest):
             self.assertEqual(self.engine.provides['coordinates'],
                              expected_list)
 
+    def test_transposed_bounds_lazy(self):
+        bounds = np.arange(24).reshape(4, 2, 3)
+        self.cf_bounds_var = mock.Mock(
+            dimensions=('nv', 'foo', 'bar'),
+            cf_name='wibble_bnds',
+            shape=bounds.shape,
+            dtype=bounds.dtype,
+            __getitem__=lambda self, key: bounds[key])
+
+        get_cf_bounds_var_patch = mock.patch(
+            'iris.fileformats._pyke_rules.compiled_krb.'
+            'fc_rules_cf_fc.get_cf_bounds_var',
+            return_value=self.cf_bounds_var)
+
+        with self.deferred_load_patch, get_cf_bounds_var_patch:
+            build_auxiliary_coordinate(self.engine, self.cf_coord_var)
+
+            coord, _ = self.engine.cube.add_aux_coord.call_args[0]
+            self.assertTrue(coord.has_lazy_points())
+            self.assertTrue(coord.has_lazy_bounds())
+            self.assertArrayEqual(coord.bounds,
+                                  np.rollaxis(bounds, 0, bounds.ndim))
+
+
+class TestSharedArrays(tests.IrisTest):
+    def test_arrays_shared_between_cubes(self):
+        # Coordinates built for different cubes of the same file share the
+        # same lazy arrays.
+        cf_coord_var = mock.Mock(dimensions=('foo',), cf_name='wibble',
+                                 standard_name=None, long_name='wibble',
+                                 units='m', shape=(3,),
+                                 dtype=np.dtype('f8'))
+        engine = mock.Mock(cf_var=mock.Mock(dimensions=('foo',)),
+                           filename='DUMMY',
+                           provides=dict(coordinates=[]),
+                           cf_var_arrays={})
+        get_cf_bounds_var_patch = mock.patch(
+            'iris.fileformats._pyke_rules.compiled_krb.'
+            'fc_rules_cf_fc.get_cf_bounds_var',
+            return_value=None)
+
+        coords = []
+        with get_cf_bounds_var_patch:
+            for _ in range(2):
+                engine.cube = mock.Mock()
+                build_auxiliary_coordinate(engine, cf_coord_var)
+                coord, _ = engine.cube.add_aux_coord.call_args[0]
+                coords.append(coord)
+
+        self.assertTrue(coords[0].has_lazy_points())
+        self.assertIsNot(coords[0], coords[1])
+        self.assertIs(coords[0].core_points(), coords[1].core_points())
+
 
 if __name__ == '__main__':
     tests.main()
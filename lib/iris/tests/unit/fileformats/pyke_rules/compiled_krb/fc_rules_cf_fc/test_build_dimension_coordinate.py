@@ -31,6 +31,7 @@ import warnings
 
 import numpy as np
 
+from iris.coord_systems import GeogCS
 from iris.coords import AuxCoord, DimCoord
 from iris.fileformats._pyke_rules.compiled_krb.fc_rules_cf_fc import \
     build_dimension_coordinate
@@ -44,7 +45,8 @@ class RulesTestMixin(object):
             cube=mock.Mock(),
             cf_var=mock.Mock(dimensions=('foo', 'bar')),
             filename='DUMMY',
-            provides=dict(coordinates=[]))
+            provides=dict(coordinates=[]),
+            cf_dim_coords={})
 
         # Create patch for deferred loading that prevents attempted
         # file access. This assumes that self.cf_coord_var and
@@ -402,5 +404,55 @@ class TestCircularScalar(tests.IrisTest, RulesTestMixin):
         self._assert_circular(False)
 
 
+class TestSharedCoords(tests.IrisTest, RulesTestMixin):
+    # Test the reuse of coordinates between the cubes of a file.
+    def setUp(self):
+        # Call parent setUp explicitly, because of how unittests work.
+        RulesTestMixin.setUp(self)
+
+        points = np.arange(6)
+        self.cf_coord_var = mock.Mock(
+            dimensions=('foo',),
+            cf_name='wibble',
+            standard_name=None,
+            long_name='wibble',
+            units='m',
+            shape=points.shape,
+            dtype=points.dtype,
+            __getitem__=mock.Mock(side_effect=lambda key: points[key]))
+        self.cf_bounds_var = None
+
+    def _build(self, coord_system=None):
+        self.engine.cube = mock.Mock()
+        with self.deferred_load_patch, self.get_cf_bounds_var_patch:
+            build_dimension_coordinate(self.engine, self.cf_coord_var,
+                                       coord_system=coord_system)
+        coord, dims = self.engine.cube.add_dim_coord.call_args[0]
+        self.assertEqual(dims, [0])
+        return coord
+
+    def test_reused(self):
+        coord = self._build()
+        other = self._build()
+        self.assertEqual(self.cf_coord_var.__getitem__.call_count, 1)
+        self.assertEqual(coord, other)
+        self.assertIsNot(coord, other)
+        self.assertEqual(len(self.engine.provides['coordinates']), 2)
+        self.assertIs(self.engine.provides['coordinates'][1][0], other)
+
+    def test_unaffected_by_changes(self):
+        coord = self._build()
+        coord.long_name = 'changed'
+        other = self._build()
+        self.assertEqual(other.long_name, 'wibble')
+
+    def test_different_coord_system(self):
+        self._build()
+        coord_system = GeogCS(6371229.0)
+        coord = self._build(coord_system=coord_system)
+        self.assertEqual(self.cf_coord_var.__getitem__.call_count, 2)
+        self.assertEqual(coord.coord_system, coord_system)
+
+
 if __name__ == '__main__':
     tests.main()
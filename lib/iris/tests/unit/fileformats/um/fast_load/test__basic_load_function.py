@@ -0,0 +1,68 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the function
+:func:`iris.fileformats.um._fast_load._basic_load_function`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris.fileformats.um._fast_load import _basic_load_function
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.fields = mock.sentinel.fields
+        self.group = self.patch(
+            'iris.fileformats.um._fast_load_structured_fields.'
+            'group_structured_fields',
+            return_value=mock.sentinel.groups)
+        self.get_file_spec = self.patch(
+            'iris.fileformats.FORMAT_AGENT.get_file_spec')
+
+    def test_fields_loader(self):
+        fields_loader = mock.Mock(return_value=self.fields)
+        result = _basic_load_function('file', pp_filter=mock.sentinel.filter,
+                                      fields_loader=fields_loader,
+                                      read_data=True)
+        self.assertIs(result, mock.sentinel.groups)
+        fields_loader.assert_called_once_with(
+            'file', pp_filter=mock.sentinel.filter, read_data=True)
+        self.group.assert_called_once_with(self.fields)
+        # The file format is not identified again.
+        self.assertEqual(self.get_file_spec.call_count, 0)
+
+    def test_no_fields_loader(self):
+        self.get_file_spec.return_value = mock.Mock()
+        self.get_file_spec.return_value.name = 'UM Post Processing file (PP)'
+        pp_load = self.patch('iris.fileformats.pp.load',
+                             return_value=self.fields)
+        result = _basic_load_function('file')
+        self.assertIs(result, mock.sentinel.groups)
+        self.get_file_spec.assert_called_once_with('file')
+        pp_load.assert_called_once_with('file', pp_filter=None)
+
+
+if __name__ == '__main__':
+    tests.main()
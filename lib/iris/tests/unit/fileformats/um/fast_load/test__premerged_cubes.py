@@ -0,0 +1,79 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the function
+:func:`iris.fileformats.um._fast_load._premerged_cubes`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris.cube import Cube
+from iris.fileformats.um._fast_load import (_premerged_cubes,
+                                            _raw_structured_loading,
+                                            STRUCTURED_LOAD_CONTROLS)
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.merged = Cube(0, long_name='merged')
+        self.unmerged = [Cube(1, long_name='merged'),
+                         Cube(2, long_name='merged')]
+        self.other = Cube(3, long_name='other')
+
+    def _load(self, cubes):
+        # Load the cubes as a format handler which returns a merged cube.
+        premerged_cubes = STRUCTURED_LOAD_CONTROLS.premerged_cubes
+        self.assertIsNotNone(premerged_cubes)
+        premerged_cubes[id(self.merged)] = lambda: self.unmerged
+        for cube in cubes:
+            yield cube
+
+    def test_merged(self):
+        result = _premerged_cubes(self._load([self.other, self.merged]))
+        self.assertEqual(result, [self.other, self.merged])
+        self.assertIsNone(STRUCTURED_LOAD_CONTROLS.premerged_cubes)
+
+    def test_clash(self):
+        # A cube from another format handler might merge with the cubes
+        # merged by the UM file loads.
+        clashing = Cube(4, long_name='merged')
+        result = _premerged_cubes(
+            self._load([self.other, self.merged, clashing]))
+        self.assertEqual(result,
+                         [self.other] + self.unmerged + [clashing])
+
+    def test_other_attributes(self):
+        other = Cube(4, long_name='merged', attributes={'source': 'other'})
+        result = _premerged_cubes(self._load([self.merged, other]))
+        self.assertEqual(result, [self.merged, other])
+
+    def test_raw(self):
+        cubes = iter([self.merged])
+        with _raw_structured_loading():
+            result = _premerged_cubes(cubes)
+        self.assertIs(result, cubes)
+        self.assertIsNone(STRUCTURED_LOAD_CONTROLS.premerged_cubes)
+
+
+if __name__ == '__main__':
+    tests.main()
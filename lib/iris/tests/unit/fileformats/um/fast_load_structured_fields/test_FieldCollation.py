@@ -104,6 +104,45 @@ class Test_data(tests.IrisTest):
         self.assertArrayEqual(result, expected)
 
 
+class Test_data__unpacked_fields(tests.IrisTest):
+    # Fields with unpacked payloads in one file are read as a single array.
+    def setUp(self):
+        context = self.temp_filename('.pp')
+        self.path = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def _make_fields(self):
+        fields = []
+        with open(self.path, 'wb') as fh:
+            for i, (lbyr, lbyrd) in enumerate([(2013, 2000), (2014, 2000),
+                                               (2013, 2001), (2014, 2001)]):
+                field = _make_field(lbyr=lbyr, lbyrd=lbyrd)
+                field.bmdi = -1e30
+                data = np.arange(6, dtype='>f4') + 10 * i
+                field.data = (self.path, fh.tell(), data.nbytes,
+                              data.dtype)
+                fh.write(data.tobytes())
+                iris.fileformats.pp._create_field_data(field, (2, 3), None)
+                fields.append(field)
+        return fields
+
+    def test_stacked_proxy(self):
+        collation = FieldCollation(self._make_fields())
+        data = collation.data
+        self.assertEqual(data.shape, (2, 2, 2, 3))
+        proxies = [value for value in data.dask.values()
+                   if isinstance(value, iris.fileformats.pp.PPFieldsDataProxy)]
+        self.assertEqual(len(proxies), 1)
+        self.assertArrayEqual(data[:, :, 0, 0], [[0, 10], [20, 30]])
+        self.assertArrayEqual(data[1, 1], [[30, 31, 32], [33, 34, 35]])
+
+    def test_replaced_data(self):
+        fields = self._make_fields()
+        fields[0].data = _make_data(7)[:2, :3]
+        collation = FieldCollation(fields)
+        self.assertArrayEqual(collation.data[:, :, 0, 0], [[7, 10], [20, 30]])
+
+
 class Test_element_arrays_and_dims(tests.IrisTest):
     def test_single_field(self):
         field = _make_field(2013)
@@ -0,0 +1,100 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.io.format_picker.FormatAgent` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+
+from iris.io.format_picker import (FormatAgent, FormatSpecification,
+                                   MagicNumber)
+from iris.tests import mock
+
+
+class Test_get_file_spec(tests.IrisTest):
+    def setUp(self):
+        self.spec_a = FormatSpecification('A', MagicNumber(4), 0x41414141)
+        self.spec_b = FormatSpecification('B', MagicNumber(4), 0x42424242)
+        self.agent = FormatAgent([self.spec_a, self.spec_b])
+
+    def _get_file_spec(self, filename):
+        # Identify a file, recording how many times it was opened.
+        with mock.patch.object(self.agent, 'get_spec',
+                               wraps=self.agent.get_spec) as get_spec:
+            spec = self.agent.get_file_spec(filename)
+        return spec, get_spec.call_count
+
+    def test_identify(self):
+        with self.temp_filename() as filename:
+            with open(filename, 'wb') as fh:
+                fh.write(b'BBBB')
+            self.assertEqual(self._get_file_spec(filename), (self.spec_b, 1))
+
+    def test_remembered(self):
+        with self.temp_filename() as filename:
+            with open(filename, 'wb') as fh:
+                fh.write(b'AAAA')
+            self.assertEqual(self._get_file_spec(filename), (self.spec_a, 1))
+            self.assertEqual(self._get_file_spec(filename), (self.spec_a, 0))
+
+    def test_changed_file(self):
+        with self.temp_filename() as filename:
+            with open(filename, 'wb') as fh:
+                fh.write(b'AAAA')
+            self.agent.get_file_spec(filename)
+            with open(filename, 'wb') as fh:
+                fh.write(b'BBBBBBBB')
+            self.assertEqual(self._get_file_spec(filename), (self.spec_b, 1))
+
+    def test_max_cached_files(self):
+        self.agent.max_cached_files = 1
+        with self.temp_filename() as filename_1, \
+                self.temp_filename() as filename_2:
+            for filename in (filename_1, filename_2):
+                with open(filename, 'wb') as fh:
+                    fh.write(b'AAAA')
+                self.agent.get_file_spec(filename)
+            self.assertEqual(self._get_file_spec(filename_2), (self.spec_a, 0))
+            self.assertEqual(self._get_file_spec(filename_1), (self.spec_a, 1))
+
+    def test_add_spec_forgets(self):
+        with self.temp_filename() as filename:
+            with open(filename, 'wb') as fh:
+                fh.write(b'AAAA')
+            self.agent.get_file_spec(filename)
+            self.agent.add_spec(
+                FormatSpecification('C', MagicNumber(4), 0x41414141,
+                                    priority=10))
+            spec, n_opened = self._get_file_spec(filename)
+            self.assertEqual((spec.name, n_opened), ('C', 1))
+
+    def test_relative_path(self):
+        with self.temp_filename() as filename:
+            with open(filename, 'wb') as fh:
+                fh.write(b'AAAA')
+            self.agent.get_file_spec(filename)
+            relative = os.path.relpath(filename)
+            self.assertEqual(self._get_file_spec(relative), (self.spec_a, 0))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,112 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.io._chain_files` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import threading
+import time
+
+import iris
+from iris.fileformats.um._fast_load import STRUCTURED_LOAD_CONTROLS
+from iris.io import _chain_files, parallel_loading
+
+
+def _items(filename):
+    # Make later files quicker, so that they finish first.
+    time.sleep(0.01 * (5 - int(filename)))
+    return [(filename, i, threading.current_thread().name)
+            for i in range(3)]
+
+
+class Test_serial(tests.IrisTest):
+    def test_order(self):
+        result = list(_chain_files(_items, ['1', '2']))
+        self.assertEqual([item[:2] for item in result],
+                         [('1', 0), ('1', 1), ('1', 2),
+                          ('2', 0), ('2', 1), ('2', 2)])
+        self.assertEqual(set(item[2] for item in result),
+                         set([threading.current_thread().name]))
+
+    def test_lazy(self):
+        calls = []
+
+        def function(filename):
+            calls.append(filename)
+            yield filename
+
+        result = _chain_files(function, ['1', '2'])
+        self.assertEqual(next(result), '1')
+        self.assertEqual(calls, ['1'])
+
+
+class Test_parallel(tests.IrisTest):
+    def test_order(self):
+        filenames = [str(i) for i in range(5)]
+        with parallel_loading(workers=3):
+            result = list(_chain_files(_items, filenames))
+        self.assertEqual([item[:2] for item in result],
+                         [(filename, i) for filename in filenames
+                          for i in range(3)])
+        self.assertNotIn(threading.current_thread().name,
+                         set(item[2] for item in result))
+
+    def test_controls(self):
+        # Thread-specific load controls are copied into the worker threads.
+        def function(filename):
+            return [(iris.FUTURE.netcdf_promote,
+                     STRUCTURED_LOAD_CONTROLS.loads_use_structured)]
+
+        with parallel_loading(workers=2), \
+                iris.FUTURE.context(netcdf_promote=True), \
+                STRUCTURED_LOAD_CONTROLS.context(loads_use_structured=True):
+            result = list(_chain_files(function, ['1', '2']))
+        self.assertEqual(result, [(True, True), (True, True)])
+
+    def test_error(self):
+        def function(filename):
+            if filename == '2':
+                raise ValueError('Bad file.')
+            return [filename]
+
+        with parallel_loading(workers=2):
+            result = _chain_files(function, ['1', '2', '3'])
+            self.assertEqual(next(result), '1')
+            with self.assertRaisesRegexp(ValueError, 'Bad file.'):
+                next(result)
+
+
+class Test_parallel_loading(tests.IrisTest):
+    def test_workers(self):
+        control = iris.io._PARALLEL_LOAD_CONTROL
+        self.assertIsNone(control.workers)
+        with parallel_loading(workers=3):
+            self.assertEqual(control.workers, 3)
+        self.assertIsNone(control.workers)
+
+    def test_default_workers(self):
+        with parallel_loading():
+            self.assertGreaterEqual(iris.io._PARALLEL_LOAD_CONTROL.workers, 1)
+
+
+if __name__ == "__main__":
+    tests.main()
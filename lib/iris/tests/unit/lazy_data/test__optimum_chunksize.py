@@ -0,0 +1,69 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test the function :func:`iris._lazy data._optimum_chunksize`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris._lazy_data import _optimum_chunksize
+
+
+class Test__optimum_chunksize(tests.IrisTest):
+    def test_within_limit(self):
+        result = _optimum_chunksize((1, 10, 20), (5, 10, 20), limit=1000)
+        self.assertEqual(result, (5, 10, 20))
+
+    def test_whole_shape_fits(self):
+        result = _optimum_chunksize((5, 10, 20), (5, 10, 20), limit=1000)
+        self.assertEqual(result, (5, 10, 20))
+
+    def test_reduce_outer_first(self):
+        result = _optimum_chunksize((100, 10, 20), (100, 10, 20), limit=1000)
+        self.assertEqual(result, (5, 10, 20))
+
+    def test_reduce_several_dims(self):
+        result = _optimum_chunksize((4, 10, 100), (4, 10, 100), limit=250)
+        self.assertEqual(result, (1, 2, 100))
+
+    def test_expand_inner_first(self):
+        result = _optimum_chunksize((1, 1, 10), (8, 10, 100), limit=400)
+        self.assertEqual(result, (1, 4, 100))
+
+    def test_expand_keeps_alignment(self):
+        # Growth is by whole multiples of the initial chunk.
+        result = _optimum_chunksize((1, 3), (10, 10), limit=8)
+        self.assertEqual(result, (1, 6))
+
+    def test_clip_to_shape(self):
+        result = _optimum_chunksize((10, 50), (4, 20), limit=1000)
+        self.assertEqual(result, (4, 20))
+
+    def test_zero_length(self):
+        result = _optimum_chunksize((1, 10), (0, 10), limit=1000)
+        self.assertEqual(result, (0, 10))
+
+    def test_scalar(self):
+        result = _optimum_chunksize((), (), limit=1000)
+        self.assertEqual(result, ())
+
+
+if __name__ == '__main__':
+    tests.main()
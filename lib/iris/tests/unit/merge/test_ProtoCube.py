@@ -30,6 +30,7 @@ import numpy as np
 import numpy.ma as ma
 
 import iris
+from iris._lazy_data import as_lazy_data
 from iris._merge import ProtoCube
 from iris.aux_factory import HybridHeightFactory, HybridPressureFactory
 from iris.coords import DimCoord, AuxCoord
@@ -540,5 +541,76 @@ class Test_register__CoordSig_aux(_MergeTest_coordprops_vect, tests.IrisTest):
         self.cube2 = self.cube1.copy()
 
 
+class Test_merge__data(tests.IrisTest):
+    def _cubes(self, lazy):
+        cubes = []
+        for i in range(2):
+            for j in range(3):
+                data = ma.masked_array([i, j], mask=[i == j, False],
+                                       dtype='i4')
+                cube = iris.cube.Cube(data, long_name='thing')
+                if lazy and i == j == 1:
+                    cube = cube.copy(data=as_lazy_data(data), dtype='i4')
+                cube.add_aux_coord(DimCoord(i, long_name='a'))
+                cube.add_aux_coord(DimCoord(j, long_name='b'))
+                cubes.append(cube)
+        return cubes
+
+    def _merge(self, cubes):
+        proto_cube = ProtoCube(cubes[0])
+        for cube in cubes[1:]:
+            proto_cube.register(cube)
+        [result] = proto_cube.merge()
+        return result
+
+    def test_concrete(self):
+        result = self._merge(self._cubes(lazy=False))
+        self.assertFalse(result.has_lazy_data())
+        self.assertEqual(result.shape, (2, 3, 2))
+        self.assertEqual(result.dtype, np.dtype('i4'))
+        self.assertMaskedArrayEqual(result.data,
+                                    self._merge(self._cubes(lazy=True)).data)
+        self.assertArrayEqual(ma.getmaskarray(result.data)[..., 0],
+                              [[True, False, False], [False, True, False]])
+        self.assertArrayEqual(result.data[1, 2], [1, 2])
+
+    def test_concrete_unmasked(self):
+        cubes = self._merge(self._cubes(lazy=False))[0].slices_over('b')
+        result = self._merge(list(cubes)[1:])
+        self.assertFalse(ma.isMaskedArray(result.data))
+        self.assertEqual(result.dtype, np.dtype('i4'))
+
+
+class Test__register_scalars(tests.IrisTest):
+    def _cubes(self):
+        cubes = []
+        for value in [1, 2, 3]:
+            cube = example_cube()
+            cube.add_aux_coord(DimCoord(value, long_name='a'))
+            cube.add_aux_coord(AuxCoord(value * 10, long_name='b'))
+            cubes.append(cube)
+        return cubes
+
+    def test_merge(self):
+        cubes = self._cubes()
+        expected = ProtoCube(cubes[0])
+        result = ProtoCube(cubes[0])
+        for cube in cubes[1:]:
+            self.assertTrue(expected.register(cube))
+            payload = result._extract_coord_payload(cube)
+            self.assertTrue(result._register_scalars(payload.scalar,
+                                                     cube.core_data()))
+        self.assertEqual(result.merge(), expected.merge())
+
+    def test_mismatch(self):
+        cube1, cube2, _ = self._cubes()
+        cube2.remove_coord('b')
+        proto_cube = ProtoCube(cube1)
+        payload = proto_cube._extract_coord_payload(cube2)
+        self.assertFalse(proto_cube._register_scalars(payload.scalar,
+                                                      cube2.core_data()))
+        self.assertEqual(len(proto_cube._skeletons), 1)
+
+
 if __name__ == "__main__":
     tests.main()
@@ -0,0 +1,84 @@
+# (C) British Crown Copyright 2014 - 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the :func:`iris._merge._derive_relation_matrix_from_codes`
+function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris._merge import (build_indexes, derive_relation_matrix,
+                         _derive_relation_matrix_from_codes,
+                         _factorise_scalar_values)
+
+
+class Test(tests.IrisTest):
+    def _check(self, scalar_values):
+        codes_by_name, values_by_name = \
+            _factorise_scalar_values(scalar_values)
+        result = _derive_relation_matrix_from_codes(codes_by_name,
+                                                    values_by_name)
+        positions = [dict(enumerate(values)) for values in scalar_values]
+        expected = derive_relation_matrix(build_indexes(positions))
+        self.assertEqual(result, expected)
+        return result
+
+    def test_separable(self):
+        scalar_values = [(t, z, 'a') for t in range(3) for z in range(4)]
+        result = self._check(scalar_values)
+        self.assertEqual(result[0].separable, set([1, 2]))
+        self.assertEqual(result[0].inseparable, set())
+
+    def test_inseparable(self):
+        scalar_values = [(0, 10, 100), (1, 10, 200), (2, 20, 300)]
+        result = self._check(scalar_values)
+        self.assertEqual(result[0].separable, set())
+        self.assertEqual(result[0].inseparable, set([1, 2]))
+
+    def test_incomplete(self):
+        scalar_values = [(0, 0), (0, 1), (1, 0)]
+        result = self._check(scalar_values)
+        self.assertEqual(result[0].inseparable, set([1]))
+
+    def test_functional(self):
+        scalar_values = [(t, t * 2, z) for t in range(3) for z in range(2)]
+        result = self._check(scalar_values)
+        self.assertEqual(result[0].separable, set([2]))
+        self.assertEqual(result[0].inseparable, set([1]))
+
+    def test_no_scalars(self):
+        result = self._check([(), ()])
+        self.assertEqual(result, {})
+
+
+class Test__factorise_scalar_values(tests.IrisTest):
+    def test_codes(self):
+        codes_by_name, values_by_name = \
+            _factorise_scalar_values([(5, 'a'), (3, 'a'), (5, 'b')])
+        self.assertArrayEqual(codes_by_name[0], [0, 1, 0])
+        self.assertArrayEqual(codes_by_name[1], [0, 0, 1])
+        self.assertEqual(values_by_name, {0: [5, 3], 1: ['a', 'b']})
+
+
+if __name__ == "__main__":
+    tests.main()
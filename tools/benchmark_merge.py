@@ -0,0 +1,94 @@
+# (C) British Crown Copyright 2017, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Time the merge of a large number of synthetic single-field cubes.
+
+Each source cube is a small 2d field with scalar "time", "forecast_period",
+"model_level_number" and "realization" coordinates, as typically loaded
+from a PP or FieldsFile archive.
+
+Usage:
+
+    python benchmark_merge.py [--cubes N] [--lazy] [--repeat R]
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import argparse
+import timeit
+
+import numpy as np
+
+import iris
+from iris._lazy_data import as_lazy_data
+from iris.coords import DimCoord
+from iris.cube import Cube, CubeList
+
+
+def synthetic_cubes(n_cubes, lazy=False):
+    """
+    Return a :class:`iris.cube.CubeList` of at least `n_cubes` single-field
+    cubes, which merge into a single 6d cube.
+
+    """
+    n_levels = 10
+    n_members = 10
+    n_times = max(1, int(np.ceil(n_cubes / (n_levels * n_members))))
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    template = Cube(data, standard_name='air_temperature', units='K')
+    template.add_dim_coord(DimCoord(np.arange(3.), 'latitude',
+                                    units='degrees'), 0)
+    template.add_dim_coord(DimCoord(np.arange(4.), 'longitude',
+                                    units='degrees'), 1)
+
+    cubes = CubeList()
+    for time in range(n_times):
+        for level in range(n_levels):
+            for member in range(n_members):
+                cube = template.copy(as_lazy_data(data) if lazy else data)
+                cube.add_aux_coord(DimCoord(time, 'time',
+                                            units='hours since 1970-01-01'))
+                cube.add_aux_coord(DimCoord(time % 6, 'forecast_period',
+                                            units='hours'))
+                cube.add_aux_coord(DimCoord(level,
+                                            long_name='model_level_number'))
+                cube.add_aux_coord(DimCoord(member, 'realization'))
+                cubes.append(cube)
+    return cubes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--cubes', type=int, default=100000,
+                        help='number of source cubes (default %(default)s)')
+    parser.add_argument('--lazy', action='store_true',
+                        help='give the source cubes lazy data')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timings (default %(default)s)')
+    args = parser.parse_args()
+
+    cubes = synthetic_cubes(args.cubes, lazy=args.lazy)
+    times = timeit.repeat(cubes.merge_cube, repeat=args.repeat, number=1)
+    result = cubes.merge_cube()
+    print('Merged {} cubes into {}'.format(len(cubes), result.summary(True)))
+    print('Best of {}: {:.3f}s'.format(args.repeat, min(times)))
+
+
+if __name__ == '__main__':
+    main()